@@ -47,45 +47,102 @@ Usage:
             print(chunk.content, end="")
 """
 
-from .agent_config import AgentConfig
-from .backend.claude import ClaudeBackend
-from .backend.gemini import GeminiBackend
-from .backend.grok import GrokBackend
-from .backend.inference import InferenceBackend
-from .backend.lmstudio import LMStudioBackend
-
-# Import main classes for convenience
-from .backend.response import ResponseBackend
-from .chat_agent import (
-    ChatAgent,
-    ConfigurableAgent,
-    SingleAgent,
-    create_computational_agent,
-    create_expert_agent,
-    create_research_agent,
-    create_simple_agent,
-)
-
-# LiteLLM integration
-#
-# LiteLLM integration
-#
-# NOTE:
-# Some environments (including restricted sandboxes / CI hardening) may forbid
-# reading system CA bundle locations during module import. `litellm` currently
-# initializes an HTTP client + SSL context at import-time, which can raise
-# PermissionError and prevent *any* MassGen import (and therefore pytest
-# collection). Treat LiteLLM as an optional integration and fail soft.
-try:
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_config import AgentConfig
+    from .backend.claude import ClaudeBackend
+    from .backend.gemini import GeminiBackend
+    from .backend.grok import GrokBackend
+    from .backend.inference import InferenceBackend
+    from .backend.lmstudio import LMStudioBackend
+    from .backend.response import ResponseBackend
+    from .chat_agent import (
+        ChatAgent,
+        ConfigurableAgent,
+        SingleAgent,
+        create_computational_agent,
+        create_expert_agent,
+        create_research_agent,
+        create_simple_agent,
+    )
     from .litellm_provider import MassGenLLM, register_with_litellm
+    from .message_templates import MessageTemplates, get_templates
+    from .orchestrator import Orchestrator, create_orchestrator
+
+# Public names are resolved on first attribute access (PEP 562) so that
+# ``import massgen`` and ``massgen --help`` do not import every backend SDK,
+# the orchestrator and LiteLLM up front. Maps public name -> (module, attribute).
+_LAZY_IMPORTS = {
+    # Batch API
+    "run_batch": (".batch", "run_batch"),
+    # Backends
+    "ResponseBackend": (".backend.response", "ResponseBackend"),
+    "ClaudeBackend": (".backend.claude", "ClaudeBackend"),
+    "GeminiBackend": (".backend.gemini", "GeminiBackend"),
+    "GrokBackend": (".backend.grok", "GrokBackend"),
+    "LMStudioBackend": (".backend.lmstudio", "LMStudioBackend"),
+    "InferenceBackend": (".backend.inference", "InferenceBackend"),
+    # Agents
+    "ChatAgent": (".chat_agent", "ChatAgent"),
+    "SingleAgent": (".chat_agent", "SingleAgent"),
+    "ConfigurableAgent": (".chat_agent", "ConfigurableAgent"),
+    "create_simple_agent": (".chat_agent", "create_simple_agent"),
+    "create_expert_agent": (".chat_agent", "create_expert_agent"),
+    "create_research_agent": (".chat_agent", "create_research_agent"),
+    "create_computational_agent": (".chat_agent", "create_computational_agent"),
+    # Orchestrator
+    "Orchestrator": (".orchestrator", "Orchestrator"),
+    "create_orchestrator": (".orchestrator", "create_orchestrator"),
+    # Configuration
+    "AgentConfig": (".agent_config", "AgentConfig"),
+    "MessageTemplates": (".message_templates", "MessageTemplates"),
+    "get_templates": (".message_templates", "get_templates"),
+}
+
+# LiteLLM integration names, resolved together by _load_litellm_integration()
+_LITELLM_NAMES = ("MassGenLLM", "register_with_litellm", "LITELLM_AVAILABLE")
+
+
+def _load_litellm_integration() -> None:
+    """Import the LiteLLM provider and cache its public names on the package.
+
+    NOTE:
+    Some environments (including restricted sandboxes / CI hardening) may forbid
+    reading system CA bundle locations during module import. `litellm` currently
+    initializes an HTTP client + SSL context at import-time, which can raise
+    PermissionError and prevent *any* MassGen import (and therefore pytest
+    collection). Treat LiteLLM as an optional integration and fail soft.
+    """
+    try:
+        from .litellm_provider import MassGenLLM, register_with_litellm
+
+        available = True
+    except Exception:  # pragma: no cover - environment-specific import side effects
+        MassGenLLM = None  # type: ignore[assignment]
+        register_with_litellm = None  # type: ignore[assignment]
+        available = False
+    globals().update(MassGenLLM=MassGenLLM, register_with_litellm=register_with_litellm, LITELLM_AVAILABLE=available)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public MassGen names on first access (PEP 562)."""
+    if name in _LITELLM_NAMES:
+        _load_litellm_integration()
+        return globals()[name]
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
-    LITELLM_AVAILABLE = True
-except Exception:  # pragma: no cover - environment-specific import side effects
-    MassGenLLM = None  # type: ignore[assignment]
-    register_with_litellm = None  # type: ignore[assignment]
-    LITELLM_AVAILABLE = False
-from .message_templates import MessageTemplates, get_templates
-from .orchestrator import Orchestrator, create_orchestrator
 
 __version__ = "0.1.51"
 __author__ = "MassGen Contributors"
@@ -593,6 +650,7 @@ __all__ = [
     # Python API
     "run",
     "build_config",
+    "run_batch",
     # Backends
     "ResponseBackend",
     "ClaudeBackend",
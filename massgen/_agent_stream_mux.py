@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Multiplex agent chunk streams into one queue for the coordination loop.
+
+Each agent stream gets a long-lived pump task that pulls chunks and puts them
+on a shared bounded ``asyncio.Queue``; the coordination loop consumes batches
+from that queue. This replaces creating a task per chunk and waiting on all
+of them with ``asyncio.wait(FIRST_COMPLETED)``.
+
+- Fairness/backpressure: a pump stops pulling once ``max_pending_per_agent``
+  of its chunks are waiting to be consumed, so a fast agent cannot fill the
+  shared queue and its stream is never far ahead of the consumer.
+- Terminal chunks (result, error, done, external tool calls) stop the pump:
+  the consumer closes or replaces the stream after them, and the stream must
+  still be suspended at that yield when it does.
+- Detaching an agent cancels its pump and drops its queued chunks.
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+DEFAULT_MAX_PENDING_PER_AGENT = 32
+DEFAULT_MAX_QUEUE_SIZE = 256
+DEFAULT_MAX_BATCH = 64
+
+TERMINAL_CHUNK_TYPES = frozenset({"result", "error", "done", "external_tool_calls"})
+
+
+class _AgentPump:
+    __slots__ = ("agent_id", "stream", "task", "pending", "resume")
+
+    def __init__(self, agent_id: str, stream: AsyncGenerator[tuple, None]):
+        self.agent_id = agent_id
+        self.stream = stream
+        self.task: Optional[asyncio.Task] = None
+        self.pending = 0
+        self.resume = asyncio.Event()
+
+
+class AgentStreamMultiplexer:
+    """Pump agent streams into a shared queue.
+
+    Args:
+        next_chunk: Coroutine function returning the next chunk tuple of a
+            stream; must turn stream exhaustion and errors into chunks
+            (e.g. ``("done", None)`` / ``("error", message)``)
+        tasks: Optional dict to register pump tasks in (agent_id -> task), so
+            existing cleanup code can cancel them
+        max_pending_per_agent: Unconsumed chunks allowed per agent before
+            its pump pauses
+        max_queue_size: Bound of the shared queue
+    """
+
+    def __init__(
+        self,
+        next_chunk: Callable[[AsyncGenerator[tuple, None]], Awaitable[tuple]],
+        tasks: Optional[Dict[str, asyncio.Task]] = None,
+        max_pending_per_agent: int = DEFAULT_MAX_PENDING_PER_AGENT,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        if max_pending_per_agent < 1:
+            raise ValueError("max_pending_per_agent must be at least 1")
+        self._next_chunk = next_chunk
+        self.tasks = tasks if tasks is not None else {}
+        self.max_pending_per_agent = max_pending_per_agent
+        self._queue: "asyncio.Queue[Tuple[_AgentPump, tuple]]" = asyncio.Queue(maxsize=max_queue_size)
+        self._pumps: Dict[str, _AgentPump] = {}
+
+    def attach(self, agent_id: str, stream: AsyncGenerator[tuple, None]) -> None:
+        """Start pumping an agent stream.
+
+        Args:
+            agent_id: Agent the stream belongs to
+            stream: Agent chunk stream
+        """
+        if agent_id in self._pumps:
+            raise ValueError(f"Agent {agent_id} already has an attached stream")
+        pump = _AgentPump(agent_id, stream)
+        pump.task = asyncio.create_task(self._pump(pump))
+        self._pumps[agent_id] = pump
+        self.tasks[agent_id] = pump.task
+
+    def is_attached(self, agent_id: str) -> bool:
+        """Whether the agent has a pump (running or finished but not detached)."""
+        return agent_id in self._pumps
+
+    async def detach(self, agent_id: str) -> None:
+        """Stop pumping an agent stream and drop its queued chunks.
+
+        Does not close the stream itself.
+
+        Args:
+            agent_id: Agent to detach
+        """
+        pump = self._pumps.pop(agent_id, None)
+        if pump is None:
+            return
+        if self.tasks.get(agent_id) is pump.task:
+            del self.tasks[agent_id]
+        if not pump.task.done():
+            pump.task.cancel()
+            try:
+                await pump.task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def next_batch(self, max_items: int = DEFAULT_MAX_BATCH, timeout: Optional[float] = None) -> List[Tuple[str, tuple]]:
+        """Wait for at least one chunk and return all queued chunks (up to ``max_items``).
+
+        Chunks of each agent are returned in stream order.
+
+        Args:
+            max_items: Maximum chunks to return
+            timeout: Seconds to wait for the first chunk (None = wait indefinitely)
+
+        Returns:
+            List of (agent_id, chunk_tuple); empty if the timeout expired first
+        """
+        queue = self._queue
+        if timeout is None:
+            items = [await queue.get()]
+        else:
+            try:
+                items = [await asyncio.wait_for(queue.get(), timeout)]
+            except asyncio.TimeoutError:
+                return []
+        while len(items) < max_items and not queue.empty():
+            items.append(queue.get_nowait())
+
+        batch = []
+        for pump, chunk in items:
+            pump.pending -= 1
+            if not pump.resume.is_set():
+                pump.resume.set()
+            # Chunks from a detached (or replaced) stream are stale
+            if self._pumps.get(pump.agent_id) is pump:
+                batch.append((pump.agent_id, chunk))
+        return batch
+
+    async def _pump(self, pump: _AgentPump) -> None:
+        queue = self._queue
+        next_chunk = self._next_chunk
+        limit = self.max_pending_per_agent
+        while True:
+            while pump.pending >= limit:
+                pump.resume.clear()
+                await pump.resume.wait()
+            try:
+                chunk: Any = await next_chunk(pump.stream)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[AgentStreamMultiplexer] Pump for {pump.agent_id} failed: {e}")
+                chunk = ("error", str(e))
+            pump.pending += 1
+            await queue.put((pump, chunk))
+            if chunk[0] in TERMINAL_CHUNK_TYPES:
+                return
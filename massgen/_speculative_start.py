@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""Speculative early start of agents on peers' in-progress answers.
+
+Agents normally only see a peer's work once it calls ``new_answer``: agents
+waiting under ``defer_voting_until_all_answered`` sit idle, and agents that
+evaluate early are restarted when the answer lands. With speculative start,
+a peer still drafting its first answer shares the content streamed so far in
+its round as a provisional answer, once the draft is at least ``min_chars``
+long and has not grown for ``stable_seconds``. Waiting agents start with the
+provisional answer in their context instead of idling.
+
+When the peer's final answer arrives it is compared with the provisional
+answer each speculative agent was given. If every provisional answer is at
+least ``similarity_threshold`` similar to the final one, the speculative work
+is kept (votes stay recorded, no restart); otherwise it is discarded and the
+agent restarts through the normal new-answer path. Speculation built on a
+peer whose round ends without an answer is discarded too.
+
+Drafts are accumulated from the agent's streamed content chunks rather than
+the backend streaming buffer, which also carries tool call logs and reasoning.
+"""
+
+import difflib
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .agent_config import SpeculativeStartConfig
+
+OUTCOME_MATCHED = "matched"
+OUTCOME_DIVERGED = "diverged"
+OUTCOME_SUPERSEDED = "superseded"  # An answer the agent had no provisional version of arrived
+OUTCOME_NO_ANSWER = "no_answer"  # The source's round ended without an answer
+
+
+def answer_similarity(provisional: str, final: str) -> float:
+    """Word-level similarity ratio (0-1) between a provisional and a final answer."""
+    provisional_words = provisional.split()
+    final_words = final.split()
+    if provisional_words == final_words:
+        return 1.0
+    if not provisional_words or not final_words:
+        return 0.0
+    return difflib.SequenceMatcher(None, provisional_words, final_words, autojunk=False).ratio()
+
+
+@dataclass
+class SpeculationOutcome:
+    """How one speculative start ended."""
+
+    agent_id: str
+    kept: bool
+    reason: str
+    similarities: Dict[str, Optional[float]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Draft:
+    parts: List[str] = field(default_factory=list)
+    length: int = 0
+    last_growth: float = 0.0
+
+
+@dataclass
+class _Speculation:
+    provisional: Dict[str, str]
+    similarities: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
+class SpeculativeStartTracker:
+    """Track agents' in-progress drafts and the speculative starts built on them.
+
+    Args:
+        config: Speculative start settings
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(self, config: SpeculativeStartConfig, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._drafts: Dict[str, _Draft] = {}
+        self._speculations: Dict[str, _Speculation] = {}
+        self.started = 0
+        self.outcomes: List[SpeculationOutcome] = []
+
+    def reset(self) -> None:
+        """Forget drafts and open speculations (counters and outcomes are kept)."""
+        self._drafts.clear()
+        self._speculations.clear()
+
+    # ------------------------------------------------------------------
+    # Drafts
+    # ------------------------------------------------------------------
+
+    def start_round(self, agent_id: str) -> None:
+        """Start a fresh draft for an agent beginning a new round."""
+        self._drafts[agent_id] = _Draft(last_growth=self._clock())
+
+    def observe(self, agent_id: str, text: str) -> None:
+        """Append streamed content to an agent's draft."""
+        if not text:
+            return
+        draft = self._drafts.setdefault(agent_id, _Draft())
+        draft.parts.append(text)
+        draft.length += len(text)
+        draft.last_growth = self._clock()
+
+    def seconds_until_ready(self, agent_id: str) -> Optional[float]:
+        """Seconds until the agent's draft is stable enough to share.
+
+        Returns:
+            0.0 when ready, remaining stability wait when long enough, None while
+            the draft is shorter than ``min_chars`` (only new content can change that)
+        """
+        draft = self._drafts.get(agent_id)
+        if draft is None or draft.length < self.config.min_chars:
+            return None
+        return max(0.0, self.config.stable_seconds - (self._clock() - draft.last_growth))
+
+    def provisional_answer(self, agent_id: str) -> Optional[str]:
+        """The agent's draft if it is ready to be shared, else None."""
+        if self.seconds_until_ready(agent_id) != 0.0:
+            return None
+        text = "".join(self._drafts[agent_id].parts).strip()
+        return text or None
+
+    # ------------------------------------------------------------------
+    # Speculations
+    # ------------------------------------------------------------------
+
+    def begin(self, agent_id: str, provisional_answers: Dict[str, str]) -> None:
+        """Record that an agent starts with provisional answers in its context.
+
+        A restart of an agent that is already speculating replaces its provisional
+        answers without counting as a new speculative start.
+        """
+        if agent_id not in self._speculations:
+            self.started += 1
+        self._speculations[agent_id] = _Speculation(provisional=dict(provisional_answers))
+
+    def end(self, agent_id: str) -> None:
+        """Drop an agent's speculation without an outcome (it restarted or answered itself)."""
+        self._speculations.pop(agent_id, None)
+
+    def is_speculating(self, agent_id: str) -> bool:
+        return agent_id in self._speculations
+
+    def provisional_answers_for(self, agent_id: str) -> Dict[str, str]:
+        """Provisional answers the agent started from whose final versions have not arrived yet."""
+        speculation = self._speculations.get(agent_id)
+        return dict(speculation.provisional) if speculation else {}
+
+    def covers(self, agent_id: str, source_agent_ids: Iterable[str]) -> bool:
+        """Whether the agent has provisional answers for all of the given sources."""
+        speculation = self._speculations.get(agent_id)
+        if speculation is None:
+            return False
+        return all(source_id in speculation.provisional for source_id in source_agent_ids if source_id != agent_id)
+
+    def resolve(self, answers: Dict[str, str]) -> Tuple[Dict[str, List[str]], Set[str]]:
+        """Compare newly submitted answers with the provisional ones agents started from.
+
+        Args:
+            answers: Answers submitted in this coordination step (agent_id -> content)
+
+        Returns:
+            Tuple of (kept, discarded): agents whose work survives these answers
+            mapped to the sources that are now final for them, and agents whose
+            speculative work must be discarded
+        """
+        kept: Dict[str, List[str]] = {}
+        discarded: Set[str] = set()
+        for agent_id, speculation in list(self._speculations.items()):
+            if agent_id in answers:
+                # The agent's own new answer supersedes its speculative work
+                del self._speculations[agent_id]
+                continue
+
+            sources = [source_id for source_id in answers if source_id != agent_id]
+            if not sources:
+                continue
+            if any(source_id not in speculation.provisional for source_id in sources):
+                self._finish(agent_id, kept=False, reason=OUTCOME_SUPERSEDED)
+                discarded.add(agent_id)
+                continue
+
+            for source_id in sources:
+                speculation.similarities[source_id] = round(answer_similarity(speculation.provisional[source_id], answers[source_id]), 3)
+            if any(speculation.similarities[source_id] < self.config.similarity_threshold for source_id in sources):
+                self._finish(agent_id, kept=False, reason=OUTCOME_DIVERGED)
+                discarded.add(agent_id)
+                continue
+
+            kept[agent_id] = sources
+            for source_id in sources:
+                del speculation.provisional[source_id]
+            if not speculation.provisional:
+                self._finish(agent_id, kept=True, reason=OUTCOME_MATCHED)
+        return kept, discarded
+
+    def invalidate_source(self, source_agent_id: str) -> Set[str]:
+        """Discard speculations built on an agent whose round ended without an answer.
+
+        Returns:
+            Agents whose speculative work must be discarded
+        """
+        discarded = {agent_id for agent_id, speculation in self._speculations.items() if source_agent_id in speculation.provisional}
+        for agent_id in discarded:
+            self._speculations[agent_id].similarities[source_agent_id] = None
+            self._finish(agent_id, kept=False, reason=OUTCOME_NO_ANSWER)
+        return discarded
+
+    def _finish(self, agent_id: str, kept: bool, reason: str) -> None:
+        speculation = self._speculations.pop(agent_id)
+        self.outcomes.append(SpeculationOutcome(agent_id=agent_id, kept=kept, reason=reason, similarities=speculation.similarities))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and outcomes for metrics."""
+        kept = sum(1 for outcome in self.outcomes if outcome.kept)
+        return {
+            "started": self.started,
+            "kept": kept,
+            "discarded": len(self.outcomes) - kept,
+            "pending": len(self._speculations),
+            "outcomes": [outcome.to_dict() for outcome in self.outcomes],
+        }
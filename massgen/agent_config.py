@@ -9,7 +9,7 @@ deprecated patterns. Update to reflect current backend architecture.
 
 import logging
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .persona_generator import PersonaGeneratorConfig
@@ -41,6 +41,37 @@ class TimeoutConfig:
     round_timeout_grace_seconds: int = 120  # Grace period before hard block
 
 
+@dataclass
+class SpeculativeStartConfig:
+    """Configuration for speculative early start of agents waiting on peers.
+
+    When enabled, a peer's in-progress first answer is shared as provisional
+    context once it is long enough and has stopped growing, so waiting agents
+    can start evaluating it before ``new_answer`` arrives. Speculative work is
+    kept only if the final answer is similar enough to the provisional one.
+
+    Args:
+        enabled: Enable speculative early start (default: False)
+        min_chars: Minimum provisional answer length before it is shared
+        stable_seconds: Seconds the provisional answer must stop growing before it is shared
+        similarity_threshold: Minimum similarity (0-1) between provisional and final answer
+                              for speculative votes/work to be kept
+    """
+
+    enabled: bool = False
+    min_chars: int = 400
+    stable_seconds: float = 3.0
+    similarity_threshold: float = 0.85
+
+    def __post_init__(self):
+        if self.min_chars < 1:
+            raise ValueError(f"speculative_start.min_chars must be at least 1, got {self.min_chars}")
+        if self.stable_seconds < 0:
+            raise ValueError(f"speculative_start.stable_seconds must be non-negative, got {self.stable_seconds}")
+        if not 0.0 <= self.similarity_threshold <= 1.0:
+            raise ValueError(f"speculative_start.similarity_threshold must be between 0 and 1, got {self.similarity_threshold}")
+
+
 @dataclass
 class CoordinationConfig:
     """Configuration for coordination behavior in MassGen.
@@ -257,6 +288,7 @@ class AgentConfig:
         fairness_enabled: Enable fairness controls across all coordination modes (default: True)
         fairness_lead_cap_answers: Maximum allowed lead in answer revisions over slowest active peer
         max_midstream_injections_per_round: Maximum unseen source updates injected per agent per round
+        speculative_start: Speculative early start of agents on peers' in-progress answers (opt-in)
     """
 
     # Core backend configuration (includes tool enablement)
@@ -286,6 +318,9 @@ class AgentConfig:
     # Coordination behavior configuration
     coordination_config: CoordinationConfig = field(default_factory=CoordinationConfig)
 
+    # Speculative early start on in-progress answers (disabled by default)
+    speculative_start: SpeculativeStartConfig = field(default_factory=SpeculativeStartConfig)
+
     # Debug/test mode - skip coordination rounds and go straight to final presentation
     skip_coordination_rounds: bool = False
 
@@ -994,6 +1029,8 @@ class AgentConfig:
             "drift_conflict_policy": self.coordination_config.drift_conflict_policy,
         }
 
+        result["speculative_start"] = asdict(self.speculative_start)
+
         # Handle debug fields
         result["debug_final_answer"] = self.debug_final_answer
 
@@ -1042,6 +1079,8 @@ class AgentConfig:
         if coordination_data:
             coordination_config = CoordinationConfig(**coordination_data)
 
+        speculative_start = SpeculativeStartConfig(**data.get("speculative_start", {}))
+
         # Handle debug fields
         debug_final_answer = data.get("debug_final_answer")
 
@@ -1068,6 +1107,7 @@ class AgentConfig:
             max_midstream_injections_per_round=max_midstream_injections_per_round,
             timeout_config=timeout_config,
             coordination_config=coordination_config,
+            speculative_start=speculative_start,
         )
         config.debug_final_answer = debug_final_answer
 
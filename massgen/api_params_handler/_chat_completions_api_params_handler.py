@@ -168,8 +168,13 @@ class ChatCompletionsAPIParamsHandler(APIParamsHandlerBase):
         This prevents 400 wrong_api_format errors.
         """
         try:
+            # Position of the last tool message answering each tool_call_id
+            last_result_index: Dict[Any, int] = {}
+            for i, msg in enumerate(messages):
+                if msg.get("role") == "tool":
+                    last_result_index[msg.get("tool_call_id")] = i
+
             sanitized: List[Dict[str, Any]] = []
-            len(messages)
             for i, msg in enumerate(messages):
                 if msg.get("role") == "assistant" and "tool_calls" in msg:
                     tool_calls = msg.get("tool_calls") or []
@@ -179,8 +184,7 @@ class ChatCompletionsAPIParamsHandler(APIParamsHandlerBase):
                         if not tc_id:
                             continue
                         # Does a later tool message reference this id?
-                        has_match = any((m.get("role") == "tool" and m.get("tool_call_id") == tc_id) for m in messages[i + 1 :])
-                        if has_match:
+                        if last_result_index.get(tc_id, -1) > i:
                             # Normalize arguments to string
                             fn = dict(tc.get("function", {}))
                             fn["arguments"] = self.formatter._serialize_tool_arguments(fn.get("arguments"))
@@ -18,29 +18,71 @@ TODO:
 - Check if we indeed need to pass agent_id & session_id to backends
 """
 
-from .base import LLMBackend, StreamChunk, TokenUsage
-from .chat_completions import ChatCompletionsBackend
-from .claude import ClaudeBackend
-
-# from .claude_code_cli import ClaudeCodeCLIBackend  # File removed
-from .claude_code import ClaudeCodeBackend
-from .cli_base import CLIBackend
-from .codex import CodexBackend
-from .gemini import GeminiBackend
-from .grok import GrokBackend
-from .lmstudio import LMStudioBackend
-from .response import ResponseBackend
-
-# from .gemini_cli import GeminiCLIBackend
-
-# Azure OpenAI backend (optional)
-try:
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .azure_openai import AzureOpenAIBackend
+    from .base import LLMBackend, StreamChunk, TokenUsage
+    from .chat_completions import ChatCompletionsBackend
+    from .claude import ClaudeBackend
+    from .claude_code import ClaudeCodeBackend
+    from .cli_base import CLIBackend
+    from .codex import CodexBackend
+    from .gemini import GeminiBackend
+    from .grok import GrokBackend
+    from .lmstudio import LMStudioBackend
+    from .response import ResponseBackend
+
+# Backend classes are imported on first attribute access (PEP 562) so that
+# importing one backend module does not pull in every provider SDK.
+# Maps public name -> submodule.
+_LAZY_IMPORTS = {
+    "LLMBackend": ".base",
+    "StreamChunk": ".base",
+    "TokenUsage": ".base",
+    "ChatCompletionsBackend": ".chat_completions",
+    "ClaudeBackend": ".claude",
+    # "ClaudeCodeCLIBackend": ".claude_code_cli",  # File removed
+    "ClaudeCodeBackend": ".claude_code",
+    "CLIBackend": ".cli_base",
+    "CodexBackend": ".codex",
+    "GeminiBackend": ".gemini",
+    "GrokBackend": ".grok",
+    "LMStudioBackend": ".lmstudio",
+    "ResponseBackend": ".response",
+    # "GeminiCLIBackend": ".gemini_cli",
+}
+
+
+def _load_azure_openai() -> None:
+    """Import the optional Azure OpenAI backend and cache the result on the package."""
+    try:
+        from .azure_openai import AzureOpenAIBackend
+
+        available = True
+    except ImportError:
+        AzureOpenAIBackend = None
+        available = False
+    globals().update(AzureOpenAIBackend=AzureOpenAIBackend, AZURE_OPENAI_AVAILABLE=available)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import backend classes on first access (PEP 562)."""
+    if name in ("AzureOpenAIBackend", "AZURE_OPENAI_AVAILABLE"):
+        _load_azure_openai()
+        return globals()[name]
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
-    AZURE_OPENAI_AVAILABLE = True
-except ImportError:
-    AZURE_OPENAI_AVAILABLE = False
-    AzureOpenAIBackend = None
 
 __all__ = [
     "LLMBackend",
@@ -56,8 +98,6 @@ __all__ = [
     "ClaudeCodeBackend",
     "CodexBackend",
     # "GeminiCLIBackend",
+    # Optional; resolves to None when the Azure SDK is unavailable
+    "AzureOpenAIBackend",
 ]
-
-# Add Azure OpenAI if available
-if AZURE_OPENAI_AVAILABLE:
-    __all__.append("AzureOpenAIBackend")
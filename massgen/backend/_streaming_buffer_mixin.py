@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from loguru import logger
 
+from ..utils.text_buffer import TextBuffer
+
 if TYPE_CHECKING:
     from ..execution_trace import ExecutionTraceWriter
 
@@ -61,7 +63,9 @@ class StreamingBufferMixin:
         inheritance list for correct Method Resolution Order (MRO).
     """
 
-    _streaming_buffer: str = ""
+    # Deltas are accumulated in a TextBuffer (appending to a str attribute is quadratic);
+    # _streaming_buffer exposes the joined text
+    _streaming_text: Optional[TextBuffer] = None
     _in_reasoning_block: bool = False
     _execution_trace: Optional["ExecutionTraceWriter"] = None
 
@@ -72,10 +76,27 @@ class StreamingBufferMixin:
         to ensure proper MRO chain.
         """
         super().__init__(*args, **kwargs)
-        self._streaming_buffer = ""
+        self._streaming_text = TextBuffer()
         self._in_reasoning_block = False
         self._execution_trace = None
 
+    @property
+    def _streaming_buffer(self) -> str:
+        """Accumulated buffer content as a string."""
+        return self._streaming_text.getvalue() if self._streaming_text is not None else ""
+
+    @_streaming_buffer.setter
+    def _streaming_buffer(self, value: str) -> None:
+        if self._streaming_text is not None:
+            self._streaming_text.close()
+        self._streaming_text = TextBuffer(value)
+
+    def _streaming_text_buffer(self) -> TextBuffer:
+        """Return the buffer, creating it if __init__ did not run."""
+        if self._streaming_text is None:
+            self._streaming_text = TextBuffer()
+        return self._streaming_text
+
     def _clear_streaming_buffer(
         self,
         *,
@@ -96,7 +117,7 @@ class StreamingBufferMixin:
                 - agent_id: Agent identifier for trace initialization
         """
         if not _compression_retry:
-            self._streaming_buffer = ""
+            self._streaming_text_buffer().clear()
             self._in_reasoning_block = False
 
             # Always create a fresh execution trace when clearing buffer (new answer/restart)
@@ -116,8 +137,8 @@ class StreamingBufferMixin:
         Args:
             agent_id: Optional agent identifier for the filename
         """
-        logger.debug(f"[StreamingBuffer] _finalize_streaming_buffer called, agent={agent_id}, buffer_len={len(self._streaming_buffer)}")
-        if self._streaming_buffer:
+        logger.debug(f"[StreamingBuffer] _finalize_streaming_buffer called, agent={agent_id}, buffer_len={len(self._streaming_text_buffer())}")
+        if self._streaming_text_buffer():
             self._save_streaming_buffer(agent_id=agent_id)
 
     def _append_to_streaming_buffer(self, content: str) -> None:
@@ -128,7 +149,7 @@ class StreamingBufferMixin:
         """
         if content:
             self._in_reasoning_block = False  # End reasoning block when regular content comes
-            self._streaming_buffer += content
+            self._streaming_text_buffer().append(content)
 
     def _append_tool_call_to_buffer(
         self,
@@ -174,7 +195,7 @@ class StreamingBufferMixin:
                 args_str = str(args)
 
             self._in_reasoning_block = False  # End reasoning block when tool call comes
-            self._streaming_buffer += f"\n\n[Tool Call: {name}({args_str})]"
+            self._streaming_text_buffer().append(f"\n\n[Tool Call: {name}({args_str})]")
 
     def _append_tool_to_buffer(
         self,
@@ -197,7 +218,7 @@ class StreamingBufferMixin:
 
         self._in_reasoning_block = False  # End reasoning block when tool result comes
         prefix = "Tool Error" if is_error else "Tool"
-        self._streaming_buffer += f"\n\n[{prefix}: {tool_name}]\n{result_text}"
+        self._streaming_text_buffer().append(f"\n\n[{prefix}: {tool_name}]\n{result_text}")
 
     def _append_reasoning_to_buffer(self, reasoning_text: str) -> None:
         """Append reasoning/thinking content to the streaming buffer.
@@ -212,13 +233,14 @@ class StreamingBufferMixin:
             if self._execution_trace:
                 self._execution_trace.add_reasoning(content=reasoning_text)
 
+            buffer = self._streaming_text_buffer()
             # Only add header if this is start of reasoning block
             if not self._in_reasoning_block:
-                if self._streaming_buffer and not self._streaming_buffer.endswith("\n"):
-                    self._streaming_buffer += "\n"
-                self._streaming_buffer += "\n[Reasoning]\n"
+                if buffer and not buffer.endswith("\n"):
+                    buffer.append("\n")
+                buffer.append("\n[Reasoning]\n")
                 self._in_reasoning_block = True
-            self._streaming_buffer += reasoning_text
+            buffer.append(reasoning_text)
 
     def _get_streaming_buffer(self) -> Optional[str]:
         """Get buffer content for compression, or None if empty.
@@ -226,7 +248,8 @@ class StreamingBufferMixin:
         Returns:
             Buffer content string or None if empty
         """
-        return self._streaming_buffer if self._streaming_buffer else None
+        buffer = self._streaming_text_buffer()
+        return buffer.getvalue() if buffer else None
 
     def _save_streaming_buffer(self, agent_id: Optional[str] = None) -> None:
         """Save the streaming buffer to a file if saving is enabled.
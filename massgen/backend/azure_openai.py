@@ -17,6 +17,7 @@ from ..logger_config import (
     log_stream_chunk,
 )
 from .base import FilesystemSupport, LLMBackend, StreamChunk
+from .http_clients import SharedHTTPClients
 
 
 class AzureOpenAIBackend(LLMBackend):
@@ -113,6 +114,7 @@ class AzureOpenAIBackend(LLMBackend):
                 self.client = AsyncOpenAI(
                     base_url=azure_endpoint,
                     api_key=self.api_key,
+                    http_client=SharedHTTPClients.get(self.get_provider_name(), azure_endpoint, self.api_key),
                 )
             else:
                 # Use Azure-specific client for traditional Azure OpenAI endpoints
@@ -131,6 +133,7 @@ class AzureOpenAIBackend(LLMBackend):
                     api_version=api_version,
                     azure_endpoint=azure_endpoint,
                     api_key=self.api_key,
+                    http_client=SharedHTTPClients.get(self.get_provider_name(), azure_endpoint, self.api_key),
                 )
 
             # Get deployment name from model parameter
@@ -11,7 +11,7 @@ import re
 import time
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
@@ -57,9 +57,12 @@ def get_multimodal_tool_definitions() -> List[Dict[str, Any]]:
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
-    """Standardized chunk format for streaming responses."""
+    """Standardized chunk format for streaming responses.
+
+    Slotted: one is allocated per streamed token, and most fields stay None.
+    """
 
     type: str  # "content", "tool_calls", "complete_message", "complete_response", "done",
     # "error", "agent_status", "reasoning", "reasoning_done", "reasoning_summary",
@@ -90,6 +93,27 @@ class StreamChunk:
     # Display flag - reserved for future use (not yet consumed by any handler)
     display: bool = True
 
+    def attributed_to(self, source: Optional[str], chunk_type: Optional[str] = None) -> "StreamChunk":
+        """Return this chunk attributed to ``source`` (and typed ``chunk_type``).
+
+        Backends create a fresh chunk per yield, so an unattributed chunk is
+        tagged in place and forwarded without copying; a chunk already
+        attributed to a different source is copied.
+
+        Args:
+            source: Source identifier to attribute the chunk to
+            chunk_type: Optional normalized type string to store
+
+        Returns:
+            This chunk, or a copy with the new source/type
+        """
+        chunk_type = self.type if chunk_type is None else chunk_type
+        if self.source is None or self.source == source:
+            self.source = source
+            self.type = chunk_type
+            return self
+        return replace(self, source=source, type=chunk_type)
+
 
 class LLMBackend(ABC):
     """Abstract base class for LLM providers."""
@@ -625,6 +625,17 @@ BACKEND_CAPABILITIES: Dict[str, BackendCapabilities] = {
         env_var="UI_TARS_API_KEY",
         notes="OpenAI-compatible API via HuggingFace Inference Endpoints. UI-TARS-1.5-7B model for GUI automation with vision and reasoning. Requires UI_TARS_ENDPOINT environment variable.",
     ),
+    "replay": BackendCapabilities(
+        backend_type="replay",
+        provider_name="Replay (recorded streams)",
+        supported_capabilities=set(),
+        builtin_tools=[],
+        filesystem_support="none",
+        models=["replay"],
+        default_model="replay",
+        env_var=None,
+        notes="Offline replay of cassettes recorded from real providers (mode: record). Used for deterministic runs and `massgen bench`.",
+    ),
 }
 
 
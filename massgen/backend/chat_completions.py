@@ -20,7 +20,7 @@ Supported Providers and Environment Variables:
 from __future__ import annotations
 
 # Standard library imports
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
 # Third-party imports
 from openai import AsyncOpenAI
@@ -30,6 +30,7 @@ from ..formatter import ChatCompletionsFormatter
 from ..logger_config import log_backend_agent_message, log_stream_chunk, logger
 from ..stream_chunk import ChunkType
 from ..structured_logging import trace_llm_api_call
+from ..utils.text_buffer import TextBuffer
 
 # Local imports
 from ._constants import configure_openrouter_extra_body
@@ -41,6 +42,7 @@ from .base_with_custom_tool_and_mcp import (
     CustomToolChunk,
     ToolExecutionConfig,
 )
+from .http_clients import SharedHTTPClients
 
 
 class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
@@ -64,7 +66,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
 
         # Track interrupted streams for token estimation
         # When a stream is cancelled (e.g., in multi-agent restart), we need to estimate tokens
-        self._interrupted_stream_content: str = ""
+        self._interrupted_stream_content: Union[str, TextBuffer] = ""
         self._interrupted_stream_model: str = ""
         self._interrupted_stream_messages: List[Dict[str, Any]] = []  # Track input for estimation
         self._stream_usage_received: bool = True  # True = no pending estimation needed
@@ -81,7 +83,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
             # Estimate tokens for the interrupted stream
             # Use tracked messages for input estimation, content for output estimation
             messages = self._interrupted_stream_messages or []
-            content = self._interrupted_stream_content or ""
+            content = str(self._interrupted_stream_content or "")
             model = self._interrupted_stream_model or "gpt-4o"
 
             if messages or content:
@@ -315,7 +317,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
         captured_function_calls = []
         current_tool_calls = {}
         response_completed = False
-        content = ""
+        content = TextBuffer()
         finish_reason_received = None  # Track finish reason to know when to expect usage
         usage_received_this_request = False  # Track if API returned usage for this specific request
         # Track reasoning_details for OpenRouter Gemini models
@@ -401,7 +403,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
                             if reasoning_chunk:
                                 yield reasoning_chunk
                             content_chunk = delta.content
-                            content += content_chunk
+                            content.append(content_chunk)
                             # Track content in streaming buffer for compression recovery
                             self._append_to_streaming_buffer(content_chunk)
                             yield StreamChunk(type="content", content=content_chunk)
@@ -510,7 +512,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
             if not usage_received_this_request and content:
                 self._estimate_token_usage(
                     current_messages,
-                    content,
+                    content.getvalue(),
                     all_params.get("model", "unknown"),
                 )
             self.end_api_call_timing(success=True)
@@ -582,9 +584,10 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
 
                 # Add assistant message with all tool calls
                 if all_tool_calls:
+                    content_text = content.getvalue().strip()
                     assistant_message = {
                         "role": "assistant",
-                        "content": content.strip() if content.strip() else None,
+                        "content": content_text if content_text else None,
                         "tool_calls": all_tool_calls,
                     }
                     # Preserve reasoning_details for OpenRouter Gemini models
@@ -770,7 +773,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
         # We only reset content tracking here, not messages.
         self._interrupted_stream_content = ""
 
-        content = ""
+        content = TextBuffer()
         current_tool_calls = {}
         search_sources_used = 0
         provider_name = self.get_provider_name()
@@ -861,10 +864,10 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
                             if reasoning_chunk:
                                 yield reasoning_chunk
                             content_chunk = delta.content
-                            content += content_chunk
+                            content.append(content_chunk)
                             # Track content in streaming buffer for compression recovery
                             self._append_to_streaming_buffer(content_chunk)
-                            # Track content for interrupted stream estimation
+                            # Track content for interrupted stream estimation (shares the buffer, no copy)
                             self._interrupted_stream_content = content
                             log_backend_agent_message(
                                 agent_id or "default",
@@ -942,7 +945,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
 
                             complete_message = {
                                 "role": "assistant",
-                                "content": content.strip(),
+                                "content": content.getvalue().strip(),
                                 "tool_calls": final_tool_calls,
                             }
                             # Preserve reasoning_details for OpenRouter Gemini models
@@ -978,7 +981,7 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
                             # Return final message
                             complete_message = {
                                 "role": "assistant",
-                                "content": content.strip(),
+                                "content": content.getvalue().strip(),
                             }
                             yield StreamChunk(
                                 type="complete_message",
@@ -1125,7 +1128,8 @@ class ChatCompletionsBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
 
         all_params = {**self.config, **kwargs}
         base_url = all_params.get("base_url", "https://api.openai.com/v1")
-        client = openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url)
+        http_client = SharedHTTPClients.get(self.get_provider_name(), base_url, self.api_key)
+        client = openai.AsyncOpenAI(api_key=self.api_key, base_url=base_url, http_client=http_client)
         # Instrument client for Logfire observability if enabled
         try:
             from massgen.structured_logging import get_tracer, is_observability_enabled
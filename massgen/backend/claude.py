@@ -45,6 +45,7 @@ from .base_with_custom_tool_and_mcp import (
     ToolExecutionConfig,
     UploadFileError,
 )
+from .http_clients import SharedHTTPClients
 
 
 class ClaudeBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
@@ -1692,7 +1693,8 @@ class ClaudeBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
         super().reset_token_usage()
 
     def _create_client(self, **kwargs):
-        client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        http_client = SharedHTTPClients.get(self.get_provider_name(), None, self.api_key)
+        client = anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http_client)
         # Instrument client for Logfire observability if enabled
         try:
             from massgen.structured_logging import get_tracer, is_observability_enabled
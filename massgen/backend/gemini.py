@@ -51,6 +51,7 @@ from .gemini_utils import (
     PostEvaluationResponse,
     VoteOnlyCoordinationResponse,
 )
+from .http_clients import SharedHTTPClients
 from .rate_limiter import GlobalRateLimiter
 
 
@@ -583,8 +584,13 @@ class GeminiBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
                 # For post-evaluation, modify prompt to use structured output
                 full_content = self.formatter.build_post_evaluation_prompt(full_content)
 
-            # Create Gemini client
-            client = genai.Client(api_key=self.api_key)
+            # Create Gemini client (pooled httpx transport when this google-genai version accepts one)
+            client_kwargs = {}
+            if "httpx_async_client" in types.HttpOptions.model_fields:
+                http_client = SharedHTTPClients.get(self.get_provider_name(), None, self.api_key)
+                if http_client is not None:
+                    client_kwargs["http_options"] = types.HttpOptions(httpx_async_client=http_client)
+            client = genai.Client(api_key=self.api_key, **client_kwargs)
 
             # Setup builtin tools via API params handler
             builtin_tools = self.api_params_handler.get_provider_tools(all_params)
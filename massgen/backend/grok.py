@@ -26,6 +26,7 @@ from openai import AsyncOpenAI
 
 from ..logger_config import log_stream_chunk
 from .chat_completions import ChatCompletionsBackend
+from .http_clients import SharedHTTPClients
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,8 @@ class GrokBackend(ChatCompletionsBackend):
         """Create OpenAI client configured for xAI's Grok API."""
         import openai
 
-        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        http_client = SharedHTTPClients.get(self.get_provider_name(), self.base_url, self.api_key)
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, http_client=http_client)
 
     def _customize_api_params(
         self,
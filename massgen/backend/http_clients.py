@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide registry of pooled HTTP clients for provider SDKs.
+
+Provider SDK clients (``openai.AsyncOpenAI``, ``anthropic.AsyncAnthropic``,
+``google.genai.Client``) each create their own httpx connection pool. Backends
+build a new SDK client per stream, so every agent, round and subagent paid for
+fresh TCP and TLS handshakes. Backends now pass a shared ``httpx.AsyncClient``
+from this registry to their SDK clients instead; the SDK wrapper stays cheap
+and per call, the connections are reused.
+
+Clients are keyed by (provider, base_url, api key hash) and by event loop,
+since httpx connections cannot move between loops (``asyncio.run`` per
+benchmark run, per CLI turn, ...). SDK ``close()`` calls are ignored on shared
+clients; they are closed when the last orchestrator using them finishes
+(``acquire``/``release``) or by ``close_all``.
+
+Usage:
+    http_client = SharedHTTPClients.get("openai", base_url, api_key)
+    client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..logger_config import logger
+
+# SDK defaults are 1000/100 per client; one shared pool per provider endpoint needs
+# room for many concurrent agents but should not hold hundreds of idle sockets.
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 50
+# Agents often think for tens of seconds between calls; keep connections warm across that gap
+KEEPALIVE_EXPIRY = 120.0
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse counters for one provider endpoint."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["reused_requests"] = max(0, self.requests - self.connections_opened)
+        data["reuse_ratio"] = round(data["reused_requests"] / self.requests, 3) if self.requests else 0.0
+        return data
+
+
+class _SharedAsyncClient(httpx.AsyncClient):
+    """httpx client that ignores ``aclose()`` from the SDK wrappers sharing it."""
+
+    async def aclose(self) -> None:
+        pass
+
+    async def _close_shared(self) -> None:
+        await super().aclose()
+
+
+class SharedHTTPClients:
+    """
+    Registry of pooled httpx clients shared by all backends in the process.
+
+    Counters are cumulative for the process and keyed by "provider host".
+    """
+
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, str], _SharedAsyncClient]]" = weakref.WeakKeyDictionary()
+    _stats: Dict[str, ConnectionStats] = {}
+    _users = 0
+    _http2: Optional[bool] = None
+
+    @classmethod
+    def get(cls, provider: str, base_url: Optional[str], api_key: Optional[str]) -> Optional[httpx.AsyncClient]:
+        """Get or create the shared client for a provider endpoint.
+
+        Args:
+            provider: Provider name (e.g. "openai", "claude")
+            base_url: API base URL ("" for the SDK default)
+            api_key: API key; only a hash is kept, so clients for different keys never mix
+
+        Returns:
+            Shared httpx.AsyncClient, or None outside a running event loop (SDK builds its own)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+        key = (provider, base_url or "", key_hash)
+        clients = cls._clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = clients[key] = cls._create(provider, base_url)
+        return client
+
+    @classmethod
+    def _create(cls, provider: str, base_url: Optional[str]) -> _SharedAsyncClient:
+        if cls._http2 is None:
+            cls._http2 = _http2_available()
+        host = urlsplit(base_url).netloc if base_url else "default"
+        stats = cls._stats.setdefault(f"{provider} {host}", ConnectionStats())
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+            elif event_name == "http2.send_request_headers.started":
+                stats.http2_requests += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        logger.debug(f"[SharedHTTPClients] New pooled client for {provider} {host} (http2={cls._http2})")
+        # No client-level timeout: the SDKs apply their own defaults when the client's is httpx's default
+        return _SharedAsyncClient(
+            http2=cls._http2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={"request": [on_request]},
+        )
+
+    @classmethod
+    def acquire(cls) -> None:
+        """Register a user (an orchestrator run); clients stay open until every user releases."""
+        cls._users += 1
+
+    @classmethod
+    async def release(cls) -> None:
+        """Unregister a user; the last one out closes the current loop's clients."""
+        cls._users = max(0, cls._users - 1)
+        if cls._users == 0:
+            await cls.close_all()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the shared clients bound to the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        clients = cls._clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client._close_shared()
+            except Exception as e:
+                logger.debug(f"[SharedHTTPClients] Error closing client: {e}")
+        if clients:
+            logger.debug(f"[SharedHTTPClients] Closed {len(clients)} pooled clients")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Connection reuse counters per "provider host", for metrics."""
+        return {name: stats.to_dict() for name, stats in cls._stats.items()}
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all clients and counters (useful for testing)."""
+        cls._clients = weakref.WeakKeyDictionary()
+        cls._stats.clear()
+        cls._users = 0
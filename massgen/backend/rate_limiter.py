@@ -12,6 +12,7 @@ from collections import deque
 from typing import Any, Dict, Optional
 
 from ..logger_config import logger
+from ..profiling import RATE_LIMIT_WAIT, profile_span
 
 
 class RateLimiter:
@@ -78,7 +79,8 @@ class RateLimiter:
                     logger.info(
                         f"[RateLimiter] Rate limit reached ({len(self.request_times)}/{self.max_requests} " f"requests in {self.time_window}s window). Waiting {wait_time:.2f}s...",
                     )
-                    await asyncio.sleep(wait_time)
+                    with profile_span("rate_limit_wait", RATE_LIMIT_WAIT, limiter="requests"):
+                        await asyncio.sleep(wait_time)
 
                     # After waiting, remove the oldest request
                     current_time = time.time()
@@ -227,7 +229,8 @@ class MultiRateLimiter:
                 logger.info(
                     f"[MultiRateLimiter] Rate limit reached: {reason_str}. " f"Waiting {max_wait_time:.2f}s...",
                 )
-                await asyncio.sleep(max_wait_time)
+                with profile_span("rate_limit_wait", RATE_LIMIT_WAIT, limiter=reason_str):
+                    await asyncio.sleep(max_wait_time)
 
                 # After waiting, clean up old records
                 current_time = time.time()
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+Deterministic record/replay backend for offline runs and benchmarking.
+
+A cassette is a JSONL file holding the streams of a sequence of backend calls:
+
+    {"massgen_cassette": 1, "provider": "claude", "model": "claude-sonnet-4-5"}
+    {"call": 0, "t": 0.412, "chunk": {"type": "content", "content": "Hello"}}
+    {"call": 0, "t": 0.455, "chunk": {"type": "tool_calls", "tool_calls": [...]}}
+    {"call": 0, "t": 0.460, "end": true, "usage": {"input_tokens": 812, "output_tokens": 35}}
+
+``t`` is the offset from the start of the call. ``CassetteRecorder`` tees the
+streams of a real backend into a cassette; ``ReplayBackend`` replays one call
+per ``stream_with_tools`` invocation with the recorded chunk timings (scaled by
+``time_scale``), tool calls and token usage, without any network access.
+
+YAML usage::
+
+    backend:
+      type: replay
+      cassette: cassettes/agent_a.jsonl
+      time_scale: 0.1            # 10x faster than recorded; 0 = no delays
+
+    # Record a real provider into a cassette:
+    backend:
+      type: replay
+      mode: record
+      cassette: cassettes/agent_a.jsonl
+      record_backend:
+        type: claude
+        model: claude-sonnet-4-5
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+
+from ..logger_config import logger
+from .base import FilesystemSupport, LLMBackend, StreamChunk
+
+CASSETTE_VERSION = 1
+
+_CHUNK_FIELDS = tuple(f.name for f in fields(StreamChunk))
+_CHUNK_DEFAULTS = {f.name: f.default for f in fields(StreamChunk)}
+_USAGE_FIELDS = ("input_tokens", "output_tokens", "reasoning_tokens", "cached_input_tokens", "cache_creation_tokens")
+
+
+def chunk_to_record(chunk: Any) -> Dict[str, Any]:
+    """Serialize a stream chunk to a JSON-compatible dict of its non-default fields.
+
+    Args:
+        chunk: StreamChunk (or any chunk exposing the same attributes)
+
+    Returns:
+        Dict of field name to value
+    """
+    record: Dict[str, Any] = {}
+    for name in _CHUNK_FIELDS:
+        value = getattr(chunk, name, None)
+        if value is None or value == _CHUNK_DEFAULTS[name]:
+            continue
+        if name == "type" and not isinstance(value, str):
+            value = getattr(value, "value", str(value))
+        record[name] = value
+    record.setdefault("type", "content")
+    return record
+
+
+def record_to_chunk(record: Dict[str, Any]) -> StreamChunk:
+    """Rebuild a StreamChunk from a cassette record (unknown fields are ignored)."""
+    return StreamChunk(**{name: value for name, value in record.items() if name in _CHUNK_DEFAULTS})
+
+
+@dataclass
+class CassetteCall:
+    """One recorded ``stream_with_tools`` call."""
+
+    chunks: List[Tuple[float, Dict[str, Any]]] = field(default_factory=list)  # (offset seconds, chunk record)
+    duration: float = 0.0
+    usage: Optional[Dict[str, int]] = None
+
+
+@dataclass
+class Cassette:
+    """Recorded backend calls plus header metadata."""
+
+    calls: List[CassetteCall] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """Load a cassette from a JSONL file.
+
+        Args:
+            path: Cassette file path
+
+        Returns:
+            Loaded Cassette
+
+        Raises:
+            ValueError: If the file is not a cassette
+        """
+        cassette = cls()
+        calls: Dict[int, CassetteCall] = {}
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if "massgen_cassette" in entry:
+                    cassette.metadata = {k: v for k, v in entry.items() if k != "massgen_cassette"}
+                    continue
+                if "call" not in entry:
+                    raise ValueError(f"{path}:{line_number}: not a cassette entry")
+                call = calls.setdefault(int(entry["call"]), CassetteCall())
+                if entry.get("end"):
+                    call.duration = float(entry.get("t", 0.0))
+                    call.usage = entry.get("usage")
+                else:
+                    call.chunks.append((float(entry.get("t", 0.0)), entry["chunk"]))
+        cassette.calls = [calls[index] for index in sorted(calls)]
+        return cassette
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the cassette to a JSONL file."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_header_line(self.metadata))
+            for index, call in enumerate(self.calls):
+                f.write(_call_lines(index, call))
+
+
+def _header_line(metadata: Dict[str, Any]) -> str:
+    return json.dumps({"massgen_cassette": CASSETTE_VERSION, **metadata}) + "\n"
+
+
+def _call_lines(index: int, call: CassetteCall) -> str:
+    lines = [json.dumps({"call": index, "t": round(offset, 6), "chunk": record}, default=str) for offset, record in call.chunks]
+    end: Dict[str, Any] = {"call": index, "t": round(call.duration, 6), "end": True}
+    if call.usage:
+        end["usage"] = call.usage
+    lines.append(json.dumps(end))
+    return "\n".join(lines) + "\n"
+
+
+class CassetteRecorder:
+    """Records the streams of a real backend into a cassette file.
+
+    ``attach`` wraps the backend's ``stream_with_tools`` on the instance, so the
+    backend keeps its type and every other behavior. Each call is appended to
+    the file when its stream ends, so an interrupted run keeps completed calls.
+
+    Args:
+        path: Cassette file to (over)write
+        metadata: Extra header fields (provider and model are filled in on attach)
+    """
+
+    def __init__(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.metadata = dict(metadata or {})
+        self.calls_recorded = 0
+
+    def attach(self, backend: LLMBackend) -> LLMBackend:
+        """Start recording ``backend`` and return it.
+
+        Args:
+            backend: Backend whose streams are recorded
+
+        Returns:
+            The same backend instance
+        """
+        self.metadata.setdefault("provider", backend.get_provider_name())
+        model = backend.config.get("model")
+        if model:
+            self.metadata.setdefault("model", model)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(_header_line(self.metadata), encoding="utf-8")
+
+        stream_with_tools = backend.stream_with_tools
+
+        async def recording_stream(messages: List[Dict[str, Any]], tools: List[Dict[str, Any]], **kwargs) -> AsyncGenerator[StreamChunk, None]:
+            usage_before = _usage_snapshot(backend)
+            call = CassetteCall()
+            start = time.perf_counter()
+            try:
+                async for chunk in stream_with_tools(messages, tools, **kwargs):
+                    call.chunks.append((time.perf_counter() - start, chunk_to_record(chunk)))
+                    yield chunk
+            finally:
+                call.duration = time.perf_counter() - start
+                usage_after = _usage_snapshot(backend)
+                call.usage = {name: usage_after[name] - usage_before[name] for name in _USAGE_FIELDS if usage_after[name] != usage_before[name]} or None
+                self._append(call)
+
+        backend.stream_with_tools = recording_stream
+        logger.info(f"[CassetteRecorder] Recording {self.metadata.get('provider')} streams to {self.path}")
+        return backend
+
+    def _append(self, call: CassetteCall) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(_call_lines(self.calls_recorded, call))
+        self.calls_recorded += 1
+
+
+def _usage_snapshot(backend: LLMBackend) -> Dict[str, int]:
+    usage = backend.token_usage
+    return {name: getattr(usage, name, 0) for name in _USAGE_FIELDS}
+
+
+class ReplayBackend(LLMBackend):
+    """Backend that replays recorded streams from a cassette.
+
+    Each ``stream_with_tools`` call replays the next recorded call, sleeping
+    so chunks arrive at their recorded offsets multiplied by ``time_scale``,
+    and adds the recorded token usage. Message contents are not matched
+    against the recording; replay is purely sequential.
+
+    Args:
+        cassette: Cassette file path or a loaded Cassette
+        time_scale: Multiplier for recorded delays (1.0 = recorded pace,
+            0 = no delays)
+        on_exhausted: What to do after the last recorded call: "loop" starts
+            over, "repeat_last" replays the last call, "error" yields an error
+        api_key: Unused; accepted for config compatibility
+        **kwargs: Base backend configuration
+    """
+
+    EXHAUSTED_POLICIES = ("loop", "repeat_last", "error")
+
+    def __init__(
+        self,
+        cassette: Union[str, Path, Cassette, None] = None,
+        time_scale: float = 1.0,
+        on_exhausted: str = "loop",
+        api_key: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(api_key=api_key, **kwargs)
+        if cassette is None:
+            raise ValueError("ReplayBackend requires a 'cassette' path")
+        if on_exhausted not in self.EXHAUSTED_POLICIES:
+            raise ValueError(f"on_exhausted must be one of {', '.join(self.EXHAUSTED_POLICIES)}, got '{on_exhausted}'")
+        if time_scale < 0:
+            raise ValueError("time_scale must be >= 0")
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        if not self.cassette.calls:
+            raise ValueError("Cassette contains no recorded calls")
+        self.time_scale = float(time_scale)
+        self.on_exhausted = on_exhausted
+        self.calls_replayed = 0
+        self.config.setdefault("model", self.cassette.metadata.get("model", "replay"))
+
+    def get_provider_name(self) -> str:
+        """Get provider name."""
+        return "Replay"
+
+    def get_filesystem_support(self) -> FilesystemSupport:
+        """Replayed streams never touch the filesystem."""
+        return FilesystemSupport.NONE
+
+    def _next_call(self) -> Optional[CassetteCall]:
+        calls = self.cassette.calls
+        index = self.calls_replayed
+        if index >= len(calls):
+            if self.on_exhausted == "error":
+                return None
+            index = index % len(calls) if self.on_exhausted == "loop" else len(calls) - 1
+        self.calls_replayed += 1
+        return calls[index]
+
+    async def stream_with_tools(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]], **kwargs) -> AsyncGenerator[StreamChunk, None]:
+        """Replay the next recorded call.
+
+        Args:
+            messages: Conversation messages (not matched against the recording)
+            tools: Available tools (ignored)
+            **kwargs: Additional parameters (ignored)
+
+        Yields:
+            StreamChunk: Recorded chunks
+        """
+        call = self._next_call()
+        if call is None:
+            yield StreamChunk(type="error", error=f"Replay cassette exhausted after {self.calls_replayed} calls")
+            yield StreamChunk(type="done")
+            return
+
+        model = self.config.get("model", "replay")
+        self.start_api_call_timing(model)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        scale = self.time_scale
+        first_token = True
+        for offset, record in call.chunks:
+            if scale:
+                # Schedule against the call start so sleep overhead does not accumulate
+                delay = start + offset * scale - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if first_token and record.get("type") == "content":
+                self.record_first_token()
+                first_token = False
+            yield record_to_chunk(record)
+        if scale:
+            delay = start + call.duration * scale - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        if call.usage:
+            for name, value in call.usage.items():
+                if name in _USAGE_FIELDS:
+                    setattr(self.token_usage, name, getattr(self.token_usage, name) + int(value))
+        self.end_api_call_timing(success=True)
@@ -34,6 +34,7 @@ from .base_with_custom_tool_and_mcp import (
     ToolExecutionConfig,
     UploadFileError,
 )
+from .http_clients import SharedHTTPClients
 
 
 class ResponseBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
@@ -1560,7 +1561,8 @@ class ResponseBackend(StreamingBufferMixin, CustomToolAndMCPBackend):
         return tool_result_message.get("output", "")
 
     def _create_client(self, **kwargs) -> AsyncOpenAI:
-        return openai.AsyncOpenAI(api_key=self.api_key)
+        http_client = SharedHTTPClients.get(self.get_provider_name(), None, self.api_key)
+        return openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
 
     def _convert_to_dict(self, obj) -> Dict[str, Any]:
         """Convert any object to dictionary with multiple fallback methods."""
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""Run many questions in one process with bounded concurrency and resumable checkpoints."""
+
+from massgen.batch.questions import BatchCheckpoint, BatchQuestion, load_questions
+from massgen.batch.runner import (
+    BatchReport,
+    BatchResult,
+    BatchRunner,
+    batch_command,
+    run_batch,
+    summarize,
+)
+
+__all__ = [
+    "BatchCheckpoint",
+    "BatchQuestion",
+    "BatchReport",
+    "BatchResult",
+    "BatchRunner",
+    "batch_command",
+    "load_questions",
+    "run_batch",
+    "summarize",
+]
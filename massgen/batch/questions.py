@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Question files and result checkpoints for batch runs.
+
+A questions file is JSONL: each line is either a JSON string (the question) or
+an object with the question under ``question``, ``query`` or ``prompt``, an
+optional ``id`` and any other fields, which are carried through to the results
+as metadata. Questions without an ``id`` are numbered by their position in the
+file (``q00001``, ...), so ids stay stable across resumed runs as long as the
+file is only appended to.
+
+The checkpoint is also JSONL, with one result record appended per finished
+question. It is the resume point and the final output of a batch run.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+_QUERY_KEYS = ("question", "query", "prompt")
+
+
+@dataclass
+class BatchQuestion:
+    """One question in a batch."""
+
+    id: str
+    query: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_questions(path: Union[str, Path]) -> List[BatchQuestion]:
+    """Load questions from a JSONL file.
+
+    Args:
+        path: Path to the questions file
+
+    Returns:
+        Questions in file order
+
+    Raises:
+        ValueError: If a line is not valid JSON, has no question, or reuses an id
+    """
+    questions: List[BatchQuestion] = []
+    seen = set()
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+
+            if isinstance(record, str):
+                record = {"question": record}
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_number}: expected a string or an object")
+            query_key = next((key for key in _QUERY_KEYS if isinstance(record.get(key), str) and record[key].strip()), None)
+            if query_key is None:
+                raise ValueError(f"{path}:{line_number}: no question (use one of: {', '.join(_QUERY_KEYS)})")
+
+            question_id = str(record["id"]) if record.get("id") is not None else f"q{len(questions) + 1:05d}"
+            if question_id in seen:
+                raise ValueError(f"{path}:{line_number}: duplicate question id '{question_id}'")
+            seen.add(question_id)
+            metadata = {key: value for key, value in record.items() if key not in ("id", query_key)}
+            questions.append(BatchQuestion(id=question_id, query=record[query_key], metadata=metadata))
+    return questions
+
+
+class BatchCheckpoint:
+    """Append-only JSONL file of per-question results."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load recorded results, keeping the latest record per question id.
+
+        A truncated last line (from an interrupted run) is ignored.
+
+        Returns:
+            Question id -> result record
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return records
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and "id" in record:
+                    records[str(record["id"])] = record
+        return records
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one result record and flush it to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""
+Batch runner: many questions, one process, bounded concurrency.
+
+Each question gets fresh agents and its own orchestrator (agent state is
+per-conversation), but everything process-wide is paid once and shared: the
+imports and config parsing, provider rate limiters (``GlobalRateLimiter`` keys
+them by provider), and anything else backends keep in module-level registries.
+Per-question log directories are scoped with ``scoped_log_session`` so
+concurrent orchestrators don't write into each other's status files, and
+snapshot/temporary workspace paths are suffixed with the question id.
+
+Usage:
+    questions = load_questions("questions.jsonl")
+    runner = BatchRunner(config, concurrency=8, checkpoint_path="results.jsonl")
+    report = await runner.run(questions)
+    print(report.summary["latency_seconds"]["p95"])
+"""
+
+import asyncio
+import copy
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..logger_config import logger
+from .questions import BatchCheckpoint, BatchQuestion, load_questions
+
+STATUS_SUCCESS = "success"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+# Summary is written next to the checkpoint: results.jsonl -> results.summary.json
+SUMMARY_SUFFIX = ".summary.json"
+
+# Orchestrator paths that are shared by default and must be unique per concurrent question
+_PER_QUESTION_PATHS = ("snapshot_storage", "agent_temporary_workspace")
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one question."""
+
+    id: str
+    query: str
+    status: str
+    answer: str = ""
+    latency_seconds: float = 0.0
+    started_at: float = 0.0
+    error: Optional[str] = None
+    selected_agent: Optional[str] = None
+    log_directory: Optional[str] = None
+    usage: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Checkpoint record for this result."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchResult":
+        """Rebuild a result from a checkpoint record (unknown keys are ignored)."""
+        known = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        return cls(**known)
+
+
+@dataclass
+class BatchReport:
+    """Results of a batch run plus throughput and latency summary."""
+
+    results: List[BatchResult]
+    summary: Dict[str, Any]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(results: List[BatchResult], wall_seconds: float, resumed: int = 0) -> Dict[str, Any]:
+    """Throughput, latency percentiles and usage totals for a batch.
+
+    Args:
+        results: Results of every question in the batch (including resumed ones)
+        wall_seconds: Wall time of this run
+        resumed: Number of results taken from the checkpoint instead of run
+
+    Returns:
+        Summary dict (latencies in seconds, cost in USD)
+    """
+    ran = results[resumed:] if resumed else results
+    latencies = [result.latency_seconds for result in ran]
+    succeeded = sum(1 for result in results if result.status == STATUS_SUCCESS)
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "resumed": resumed,
+        "ran": len(ran),
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_minute": round(len(ran) / wall_seconds * 60, 2) if wall_seconds > 0 else 0.0,
+        "latency_seconds": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 0.50), 3),
+            "p90": round(_percentile(latencies, 0.90), 3),
+            "p95": round(_percentile(latencies, 0.95), 3),
+            "p99": round(_percentile(latencies, 0.99), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "usage": {
+            "input_tokens": sum(result.usage.get("input_tokens", 0) for result in results),
+            "output_tokens": sum(result.usage.get("output_tokens", 0) for result in results),
+            "estimated_cost": round(sum(result.usage.get("estimated_cost", 0.0) for result in results), 6),
+        },
+    }
+
+
+def _agent_usage(agents: Dict[str, Any]) -> Dict[str, Any]:
+    input_tokens = output_tokens = 0
+    estimated_cost = 0.0
+    for agent in agents.values():
+        usage = getattr(getattr(agent, "backend", None), "token_usage", None)
+        if usage:
+            input_tokens += usage.input_tokens
+            output_tokens += usage.output_tokens
+            estimated_cost += usage.estimated_cost
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens, "estimated_cost": round(estimated_cost, 6)}
+
+
+async def _cleanup_agents(agents: Dict[str, Any]) -> None:
+    """Release workspaces and MCP connections held by a question's agents."""
+    for agent_id, agent in agents.items():
+        backend = getattr(agent, "backend", None)
+        if backend is None:
+            continue
+        if getattr(backend, "filesystem_manager", None):
+            try:
+                backend.filesystem_manager.cleanup()
+            except Exception as e:
+                logger.debug(f"[BatchRunner] Filesystem cleanup failed for {agent_id}: {e}")
+        if hasattr(backend, "__aexit__"):
+            try:
+                await backend.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"[BatchRunner] Backend cleanup failed for {agent_id}: {e}")
+
+
+class BatchRunner:
+    """Run many questions concurrently against one config, with checkpoint/resume."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        concurrency: int = 4,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        log_dir: Optional[Union[str, Path]] = None,
+        timeout: Optional[float] = None,
+        enable_rate_limit: bool = False,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+    ):
+        """
+        Args:
+            config: Loaded MassGen config (``agents`` + optional ``orchestrator``); never mutated
+            concurrency: Maximum number of questions in flight
+            checkpoint_path: JSONL file results are appended to; existing successful results are skipped
+            log_dir: Directory for per-question logs (defaults to ``batch/`` under the session log root)
+            timeout: Per-question timeout in seconds (None for no limit)
+            enable_rate_limit: Enable provider rate limiting, shared across all questions
+            on_result: Callback invoked with each result as it finishes
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.config = config
+        self.concurrency = concurrency
+        self.checkpoint = BatchCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.log_dir = Path(log_dir) if log_dir else None
+        self.timeout = timeout
+        self.enable_rate_limit = enable_rate_limit
+        self.on_result = on_result
+
+    def _question_log_dir(self, question: BatchQuestion) -> Path:
+        if self.log_dir is None:
+            from ..logger_config import get_log_session_root
+
+            self.log_dir = get_log_session_root() / "batch"
+        return self.log_dir / question.id / "turn_1" / "attempt_1"
+
+    def _question_config(self, question: BatchQuestion) -> Dict[str, Any]:
+        config = copy.deepcopy(self.config)
+        orchestrator_cfg = config.setdefault("orchestrator", {})
+        for key in _PER_QUESTION_PATHS:
+            if orchestrator_cfg.get(key):
+                orchestrator_cfg[key] = str(Path(orchestrator_cfg[key]) / f"batch_{question.id}")
+        return config
+
+    async def _execute(self, question: BatchQuestion) -> BatchResult:
+        """Run one question through the same path as ``massgen.run()``."""
+        from ..cli import create_agents_from_config, run_single_question
+
+        config = self._question_config(question)
+        orchestrator_cfg = config["orchestrator"]
+        agents = create_agents_from_config(config, orchestrator_cfg, enable_rate_limit=self.enable_rate_limit)
+        try:
+            response = await run_single_question(
+                question.query,
+                agents,
+                {"display_type": "none", "logging_enabled": False},
+                session_id=f"batch_{question.id}",
+                return_metadata=True,
+                # Results live in the checkpoint; don't leave a resumable session per question in the cwd
+                persist_session=False,
+                orchestrator=orchestrator_cfg,
+            )
+        finally:
+            usage = _agent_usage(agents)
+            await _cleanup_agents(agents)
+
+        coordination = response.get("coordination_result") or {}
+        return BatchResult(
+            id=question.id,
+            query=question.query,
+            status=STATUS_SUCCESS,
+            answer=response.get("answer") or "",
+            selected_agent=coordination.get("selected_agent"),
+            usage=usage,
+            metadata=question.metadata,
+        )
+
+    async def _run_question(self, question: BatchQuestion, semaphore: asyncio.Semaphore) -> BatchResult:
+        from ..logger_config import scoped_log_session
+
+        async with semaphore:
+            started_at = time.time()
+            start = time.perf_counter()
+            log_dir = self._question_log_dir(question)
+            try:
+                with scoped_log_session(log_dir):
+                    result = await asyncio.wait_for(self._execute(question), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                result = BatchResult(question.id, question.query, STATUS_TIMEOUT, error=f"Timed out after {self.timeout}s", metadata=question.metadata)
+            except Exception as e:
+                logger.warning(f"[BatchRunner] Question {question.id} failed: {e}")
+                result = BatchResult(question.id, question.query, STATUS_ERROR, error=f"{type(e).__name__}: {e}", metadata=question.metadata)
+            result.started_at = started_at
+            result.latency_seconds = round(time.perf_counter() - start, 3)
+            result.log_directory = str(log_dir.parent.parent)
+
+        if self.checkpoint is not None:
+            self.checkpoint.append(result.to_dict())
+        if self.on_result is not None:
+            self.on_result(result)
+        return result
+
+    async def run(self, questions: List[BatchQuestion]) -> BatchReport:
+        """Run questions, skipping those already answered successfully in the checkpoint.
+
+        Args:
+            questions: Questions to run
+
+        Returns:
+            BatchReport with results in question order and the summary
+        """
+        done: Dict[str, BatchResult] = {}
+        if self.checkpoint is not None:
+            for question_id, record in self.checkpoint.load().items():
+                if record.get("status") == STATUS_SUCCESS:
+                    done[question_id] = BatchResult.from_dict(record)
+        pending = [question for question in questions if question.id not in done]
+        resumed = [done[question.id] for question in questions if question.id in done]
+        if resumed:
+            logger.info(f"[BatchRunner] Resuming: {len(resumed)} answered, {len(pending)} remaining")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.perf_counter()
+        ran = await asyncio.gather(*(self._run_question(question, semaphore) for question in pending))
+        wall_seconds = time.perf_counter() - start
+
+        by_id = {result.id: result for result in [*resumed, *ran]}
+        ordered = [by_id[question.id] for question in questions]
+        # summarize() treats the first `resumed` results as not run in this invocation
+        summary = summarize([*resumed, *ran], wall_seconds, resumed=len(resumed))
+        if self.checkpoint is not None:
+            summary["checkpoint"] = str(self.checkpoint.path)
+            summary_path = self.checkpoint.path.with_name(f"{self.checkpoint.path.stem}{SUMMARY_SUFFIX}")
+            summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        logger.info(
+            f"[BatchRunner] {summary['succeeded']}/{summary['total']} succeeded in {summary['wall_seconds']}s " f"({summary['throughput_per_minute']}/min, p95 {summary['latency_seconds']['p95']}s)",
+        )
+        return BatchReport(results=ordered, summary=summary)
+
+
+async def run_batch(
+    questions: Union[str, Path, List[Union[str, BatchQuestion]]],
+    config: Optional[str] = None,
+    config_dict: Optional[Dict[str, Any]] = None,
+    concurrency: int = 4,
+    checkpoint: Optional[Union[str, Path]] = None,
+    timeout: Optional[float] = None,
+    enable_rate_limit: bool = False,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+) -> BatchReport:
+    """Run many questions concurrently (Python API for ``massgen batch``).
+
+    Args:
+        questions: JSONL path, or a list of question strings / BatchQuestion
+        config: Config file path or @examples/NAME
+        config_dict: Pre-built config dict (e.g. from ``massgen.build_config()``)
+        concurrency: Maximum number of questions in flight
+        checkpoint: JSONL results file; rerunning with the same file resumes
+        timeout: Per-question timeout in seconds
+        enable_rate_limit: Enable provider rate limiting, shared across questions
+        on_result: Callback invoked with each result as it finishes
+
+    Returns:
+        BatchReport with per-question results and the summary
+
+    Examples:
+        >>> report = await massgen.run_batch("questions.jsonl", config="@examples/basic_multi", concurrency=8)
+        >>> report.summary["throughput_per_minute"]
+    """
+    from ..logger_config import setup_logging
+
+    if config_dict is None:
+        if not config:
+            raise ValueError("Specify config= or config_dict=")
+        from ..cli import load_config_file, resolve_config_path
+
+        resolved_path = resolve_config_path(config)
+        if resolved_path is None:
+            raise ValueError(f"Could not resolve config path: {config}")
+        config_dict, _ = load_config_file(str(resolved_path))
+
+    if isinstance(questions, (str, Path)):
+        batch = load_questions(questions)
+    else:
+        batch = [question if isinstance(question, BatchQuestion) else BatchQuestion(id=f"q{index:05d}", query=question) for index, question in enumerate(questions, start=1)]
+
+    setup_logging(debug=False)
+    runner = BatchRunner(config_dict, concurrency=concurrency, checkpoint_path=checkpoint, timeout=timeout, enable_rate_limit=enable_rate_limit, on_result=on_result)
+    return await runner.run(batch)
+
+
+def _print_report(console, report: BatchReport) -> None:
+    from rich.table import Table
+
+    summary = report.summary
+    latency = summary["latency_seconds"]
+    table = Table(title=f"Batch: {summary['succeeded']}/{summary['total']} succeeded", show_header=True)
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Ran / resumed", f"{summary['ran']} / {summary['resumed']}")
+    table.add_row("Wall time", f"{summary['wall_seconds']:.1f}s")
+    table.add_row("Throughput", f"{summary['throughput_per_minute']:.2f} questions/min")
+    for name in ("mean", "p50", "p90", "p95", "p99", "max"):
+        table.add_row(f"Latency {name}", f"{latency[name]:.2f}s")
+    table.add_row("Tokens in / out", f"{summary['usage']['input_tokens']:,} / {summary['usage']['output_tokens']:,}")
+    table.add_row("Estimated cost", f"${summary['usage']['estimated_cost']:.4f}")
+    console.print(table)
+
+    failures = [result for result in report.results if result.status != STATUS_SUCCESS]
+    for result in failures[:10]:
+        console.print(f"[red]{result.id}[/red] {result.status}: {result.error}")
+    if len(failures) > 10:
+        console.print(f"[dim]... and {len(failures) - 10} more failures (see checkpoint)[/dim]")
+
+
+def batch_command(args) -> int:
+    """Handle the batch subcommand.
+
+    Args:
+        args: Parsed command line arguments with:
+            - questions: Path to the questions JSONL file
+            - config: Config file path or @examples/NAME (or None)
+            - model: Single-agent model when no config is given (or None)
+            - concurrency: Maximum questions in flight
+            - checkpoint: Results JSONL path (or None for batch_results.jsonl in the log session)
+            - timeout: Per-question timeout in seconds (or None)
+            - rate_limit: Enable provider rate limiting
+            - json: Output the summary as JSON
+
+    Returns:
+        Exit code (0 when every question succeeded, 1 otherwise)
+    """
+    from rich.console import Console
+
+    from ..cli import create_simple_config, load_config_file, resolve_config_path
+    from ..logger_config import get_log_session_root, setup_logging
+    from ..utils import get_backend_type_from_model
+
+    console = Console(stderr=bool(getattr(args, "json", False)))
+    if args.concurrency < 1:
+        console.print("[red]Error:[/red] --concurrency must be >= 1")
+        return 1
+    try:
+        questions = load_questions(args.questions)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error:[/red] Cannot load questions: {e}")
+        return 1
+    if not questions:
+        console.print(f"[yellow]No questions in {args.questions}[/yellow]")
+        return 0
+
+    if args.model and not args.config:
+        config = create_simple_config(backend_type=get_backend_type_from_model(model=args.model), model=args.model)
+    else:
+        resolved_path = resolve_config_path(args.config)
+        if resolved_path is None:
+            console.print("[red]Error:[/red] No config found. Pass --config or --model.")
+            return 1
+        config, _ = load_config_file(str(resolved_path))
+
+    setup_logging(debug=False)
+    session_root = get_log_session_root()
+    checkpoint = Path(args.checkpoint) if args.checkpoint else session_root / "batch_results.jsonl"
+
+    def on_result(result: BatchResult) -> None:
+        style = "green" if result.status == STATUS_SUCCESS else "red"
+        console.print(f"[{style}]{result.status:>7}[/{style}] {result.id} ({result.latency_seconds:.1f}s)")
+
+    runner = BatchRunner(
+        config,
+        concurrency=args.concurrency,
+        checkpoint_path=checkpoint,
+        log_dir=session_root / "batch",
+        timeout=args.timeout,
+        enable_rate_limit=args.rate_limit,
+        on_result=on_result,
+    )
+    console.print(f"[bold]Running {len(questions)} questions[/bold] (concurrency {args.concurrency}, checkpoint {checkpoint})")
+    report = asyncio.run(runner.run(questions))
+
+    if getattr(args, "json", False):
+        print(json.dumps(report.summary, indent=2))
+    else:
+        _print_report(console, report)
+        console.print(f"[dim]Results: {checkpoint}[/dim]")
+    return 0 if report.summary["failed"] == 0 else 1
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Offline benchmarking of coordination runs over the replay backend."""
+
+from massgen.bench.metrics import ResourceMonitor, RunMetrics
+from massgen.bench.runner import bench_command, run_scenario
+from massgen.bench.scenarios import (
+    SCENARIOS,
+    BenchScenario,
+    build_cassette,
+    build_orchestrator,
+)
+
+__all__ = [
+    "BenchScenario",
+    "ResourceMonitor",
+    "RunMetrics",
+    "SCENARIOS",
+    "bench_command",
+    "build_cassette",
+    "build_orchestrator",
+    "run_scenario",
+]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Process resource and event-loop lag measurement for benchmark runs.
+
+``ResourceMonitor`` is an async context manager: it samples CPU time, RSS and
+I/O counters at entry and exit, and runs a probe task that sleeps for
+``interval`` seconds and records how late it wakes up. The lateness is the
+event-loop lag: time the loop spent running other callbacks without yielding.
+
+RSS and I/O come from ``psutil`` when it is installed, otherwise from
+``/proc/self`` (Linux) and ``resource.getrusage``; unavailable values are None.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class RunMetrics:
+    """Resource usage of one benchmark run."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    loop_lag_mean_ms: float = 0.0
+    loop_lag_p95_ms: float = 0.0
+    loop_lag_max_ms: float = 0.0
+    rss_start_mb: Optional[float] = None
+    rss_end_mb: Optional[float] = None
+    rss_peak_mb: Optional[float] = None
+    io_read_bytes: Optional[int] = None
+    io_write_bytes: Optional[int] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU seconds per wall second (above 1.0 means several busy threads)."""
+        return self.cpu_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable dict."""
+        data = asdict(self)
+        data["cpu_utilization"] = round(self.cpu_utilization, 4)
+        return data
+
+
+def _psutil_process() -> Any:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process()
+
+
+def current_rss_bytes(process: Any = None) -> Optional[int]:
+    """Current resident set size in bytes, or None if unavailable.
+
+    Args:
+        process: Optional psutil.Process to query
+    """
+    if process is not None:
+        return process.memory_info().rss
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of the process in bytes, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def io_counters(process: Any = None) -> Tuple[Optional[int], Optional[int]]:
+    """Bytes read and written by the process (including cached I/O).
+
+    Args:
+        process: Optional psutil.Process to query
+
+    Returns:
+        (read_bytes, write_bytes), each None if unavailable
+    """
+    if process is not None and hasattr(process, "io_counters"):
+        try:
+            counters = process.io_counters()
+            return getattr(counters, "read_chars", counters.read_bytes), getattr(counters, "write_chars", counters.write_bytes)
+        except Exception:
+            pass
+    try:
+        values = {}
+        with open("/proc/self/io", encoding="ascii") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                values[key.strip()] = int(value)
+        return values.get("rchar"), values.get("wchar")
+    except (OSError, ValueError):
+        return None, None
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / (1024 * 1024), 2)
+
+
+class ResourceMonitor:
+    """Measure wall time, CPU, RSS, I/O and event-loop lag around a block.
+
+    Args:
+        interval: Lag probe sleep interval in seconds
+
+    Usage::
+
+        async with ResourceMonitor() as monitor:
+            await run()
+        print(monitor.metrics.loop_lag_max_ms)
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.metrics = RunMetrics()
+        self._lags: List[float] = []
+        self._rss_peak: Optional[int] = None
+        self._process = None
+        self._probe: Optional[asyncio.Task] = None
+        self._start_wall = 0.0
+        self._start_cpu = 0.0
+        self._start_io: Tuple[Optional[int], Optional[int]] = (None, None)
+
+    async def __aenter__(self) -> "ResourceMonitor":
+        self._process = _psutil_process()
+        rss = current_rss_bytes(self._process)
+        self.metrics.rss_start_mb = _mb(rss)
+        self._rss_peak = rss
+        self._start_io = io_counters(self._process)
+        self._start_cpu = time.process_time()
+        self._start_wall = time.perf_counter()
+        self._probe = asyncio.create_task(self._probe_loop())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        wall = time.perf_counter() - self._start_wall
+        cpu = time.process_time() - self._start_cpu
+        if self._probe is not None:
+            self._probe.cancel()
+            try:
+                await self._probe
+            except asyncio.CancelledError:
+                pass
+
+        metrics = self.metrics
+        metrics.wall_seconds = round(wall, 6)
+        metrics.cpu_seconds = round(cpu, 6)
+        if self._lags:
+            metrics.loop_lag_mean_ms = round(sum(self._lags) / len(self._lags) * 1000, 3)
+            metrics.loop_lag_p95_ms = round(_percentile(self._lags, 0.95) * 1000, 3)
+            metrics.loop_lag_max_ms = round(max(self._lags) * 1000, 3)
+
+        rss = current_rss_bytes(self._process)
+        metrics.rss_end_mb = _mb(rss)
+        peaks = [value for value in (self._rss_peak, rss) if value is not None]
+        metrics.rss_peak_mb = _mb(max(peaks)) if peaks else _mb(peak_rss_bytes())
+
+        read_end, write_end = io_counters(self._process)
+        read_start, write_start = self._start_io
+        if read_end is not None and read_start is not None:
+            metrics.io_read_bytes = read_end - read_start
+        if write_end is not None and write_start is not None:
+            metrics.io_write_bytes = write_end - write_start
+
+    async def _probe_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.interval
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self._lags.append(max(0.0, loop.time() - expected))
+            rss = current_rss_bytes(self._process)
+            if rss is not None and (self._rss_peak is None or rss > self._rss_peak):
+                self._rss_peak = rss
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""``massgen bench``: run replay scenarios and report resource usage.
+
+Each run builds a fresh orchestrator over replay backends, drives a full
+``chat()`` (coordination, voting and final presentation) with production
+logging into a scratch log directory, and reports wall time, CPU, event-loop
+lag, RSS and I/O bytes. No network access or API keys are needed.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from ..backend.replay import Cassette
+from .metrics import ResourceMonitor, RunMetrics
+from .scenarios import SCENARIOS, BenchScenario, build_orchestrator
+
+BENCH_TASK = "Summarize the trade-offs between the proposed approaches and recommend one."
+
+
+async def run_scenario(
+    scenario: BenchScenario,
+    time_scale: float = 0.0,
+    cassettes: Optional[List[Cassette]] = None,
+    probe_interval: float = 0.01,
+) -> RunMetrics:
+    """Run one scenario end to end and measure it.
+
+    Logging must already be set up by the caller (``bench_command`` routes it
+    into a scratch directory).
+
+    Args:
+        scenario: Scenario to run
+        time_scale: Replay time scale (0 = no recorded delays)
+        cassettes: Recorded cassettes to replay instead of synthetic ones
+        probe_interval: Event-loop lag probe interval in seconds
+
+    Returns:
+        RunMetrics with chunk, call and token counts in ``extra``
+    """
+    orchestrator = build_orchestrator(scenario, time_scale=time_scale, cassettes=cassettes)
+    chunks = 0
+    async with ResourceMonitor(interval=probe_interval) as monitor:
+        async for _ in orchestrator.chat([{"role": "user", "content": BENCH_TASK}]):
+            chunks += 1
+
+    backends = [agent.backend for agent in orchestrator.agents.values()]
+    monitor.metrics.extra = {
+        "chunks": chunks,
+        "backend_calls": sum(backend.calls_replayed for backend in backends),
+        "input_tokens": sum(backend.token_usage.input_tokens for backend in backends),
+        "output_tokens": sum(backend.token_usage.output_tokens for backend in backends),
+        "winner": getattr(orchestrator, "_selected_agent", None),
+    }
+    return monitor.metrics
+
+
+def _summarize(runs: List[RunMetrics]) -> Dict[str, Any]:
+    """Median of each numeric metric across runs."""
+    summary: Dict[str, Any] = {}
+    for key, value in runs[0].to_dict().items():
+        if key == "extra":
+            continue
+        values = [run.to_dict()[key] for run in runs]
+        if all(isinstance(v, (int, float)) for v in values):
+            summary[key] = statistics.median(values)
+        else:
+            summary[key] = value
+    summary["extra"] = runs[-1].extra
+    return summary
+
+
+def _format(value: Any, digits: int = 3) -> str:
+    if value is None:
+        return "n/a"
+    if isinstance(value, float):
+        return f"{value:.{digits}f}"
+    return str(value)
+
+
+_REPORT_ROWS = (
+    ("Wall time (s)", lambda d: _format(d["wall_seconds"])),
+    ("CPU time (s)", lambda d: _format(d["cpu_seconds"])),
+    ("CPU utilization (%)", lambda d: _format(d["cpu_utilization"] * 100, 1)),
+    ("Loop lag mean (ms)", lambda d: _format(d["loop_lag_mean_ms"], 2)),
+    ("Loop lag p95 (ms)", lambda d: _format(d["loop_lag_p95_ms"], 2)),
+    ("Loop lag max (ms)", lambda d: _format(d["loop_lag_max_ms"], 2)),
+    ("RSS end (MB)", lambda d: _format(d["rss_end_mb"], 1)),
+    ("RSS peak (MB)", lambda d: _format(d["rss_peak_mb"], 1)),
+    ("I/O read (KB)", lambda d: _format(None if d["io_read_bytes"] is None else d["io_read_bytes"] / 1024, 1)),
+    ("I/O write (KB)", lambda d: _format(None if d["io_write_bytes"] is None else d["io_write_bytes"] / 1024, 1)),
+    ("Chunks", lambda d: _format(d["extra"].get("chunks"))),
+    ("Backend calls", lambda d: _format(d["extra"].get("backend_calls"))),
+)
+
+
+def _print_report(console: Console, scenario: BenchScenario, runs: List[RunMetrics], time_scale: float) -> None:
+    console.print(f"[bold]massgen bench: {scenario.name}[/bold] ({scenario.agents} agents x {scenario.rounds} rounds x {scenario.tool_calls} tool calls, time_scale={time_scale:g})")
+    columns = [run.to_dict() for run in runs]
+    table = Table()
+    table.add_column("Metric")
+    for index in range(1, len(runs) + 1):
+        table.add_column(f"Run {index}", justify="right")
+    if len(runs) > 1:
+        columns.append(_summarize(runs))
+        table.add_column("Median", justify="right", style="bold")
+    for label, render in _REPORT_ROWS:
+        table.add_row(label, *(render(data) for data in columns))
+    console.print(table)
+
+
+def bench_command(args) -> int:
+    """Handle the bench subcommand.
+
+    Args:
+        args: Parsed command line arguments with:
+            - scenario: Preset name (see ``SCENARIOS``)
+            - agents / rounds / tool_calls / content_chunks: Overrides (or None)
+            - cassette: Recorded cassette paths (or None for synthetic ones)
+            - time_scale: Replay time scale
+            - repeat: Number of measured runs
+            - warmup: Number of unmeasured runs before them
+            - log_dir: Directory to keep run logs in (scratch dir when None)
+            - json: Output results as JSON
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    console = Console(stderr=bool(getattr(args, "json", False)))
+    scenario = SCENARIOS.get(args.scenario)
+    if scenario is None:
+        console.print(f"[red]Error:[/red] Unknown scenario '{args.scenario}'. Choose from: {', '.join(SCENARIOS)}")
+        return 1
+
+    overrides = {name: getattr(args, name) for name in ("agents", "rounds", "tool_calls", "content_chunks") if getattr(args, name, None) is not None}
+    if overrides:
+        scenario = replace(scenario, name=f"{scenario.name}*", **overrides)
+    if scenario.agents < 1 or scenario.rounds < 1 or scenario.tool_calls < 0 or args.repeat < 1 or args.warmup < 0:
+        console.print("[red]Error:[/red] agents, rounds and repeat must be >= 1; tool-calls and warmup must be >= 0")
+        return 1
+
+    cassettes = None
+    if args.cassette:
+        try:
+            cassettes = [Cassette.load(path) for path in args.cassette]
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] Cannot load cassette: {e}")
+            return 1
+
+    from .. import logger_config
+
+    scratch_dir = None
+    log_base = args.log_dir
+    if log_base is None:
+        scratch_dir = tempfile.mkdtemp(prefix="massgen_bench_")
+        log_base = scratch_dir
+    previous_log_base = os.environ.get("MASSGEN_LOG_BASE_DIR")
+    os.environ["MASSGEN_LOG_BASE_DIR"] = str(Path(log_base).expanduser())
+
+    runs: List[RunMetrics] = []
+    try:
+        # Warmup runs absorb one-time costs (imports, tokenizer and pricing setup)
+        for index in range(args.warmup + args.repeat):
+            logger_config.reset_logging_session()
+            logger_config.setup_logging(debug=False)
+            metrics = asyncio.run(run_scenario(scenario, time_scale=args.time_scale, cassettes=cassettes))
+            if index >= args.warmup:
+                runs.append(metrics)
+    finally:
+        if previous_log_base is None:
+            os.environ.pop("MASSGEN_LOG_BASE_DIR", None)
+        else:
+            os.environ["MASSGEN_LOG_BASE_DIR"] = previous_log_base
+        if scratch_dir:
+            logger_config.logger.remove()
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    if getattr(args, "json", False):
+        payload = {
+            "scenario": scenario.to_dict(),
+            "time_scale": args.time_scale,
+            "warmup": args.warmup,
+            "cassettes": [str(path) for path in args.cassette or []],
+            "runs": [run.to_dict() for run in runs],
+            "median": _summarize(runs),
+        }
+        print(json.dumps(payload, indent=2))
+    else:
+        _print_report(console, scenario, runs, args.time_scale)
+        if args.log_dir:
+            console.print(f"[dim]Logs kept in {args.log_dir}[/dim]")
+    return 0
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Standard benchmark scenarios built on the replay backend.
+
+A scenario is N agents x M answer rounds x K tool calls per backend call.
+Each agent gets a synthetic cassette shaped like a real tool-using provider
+stream: per call, K custom tool executions (called / arguments / completed
+status chunks), then ``content_chunks`` content deltas, then a workflow tool
+call. The first M calls submit ``new_answer``; later calls vote for the
+first agent, so coordination converges after the answer rounds.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from ..backend.replay import Cassette, CassetteCall
+
+
+@dataclass(frozen=True)
+class BenchScenario:
+    """Shape and pacing of a synthetic coordination run.
+
+    Args:
+        name: Scenario name
+        agents: Number of agents (N)
+        rounds: Answer rounds per agent (M)
+        tool_calls: Tool calls per backend call (K)
+        content_chunks: Content deltas per backend call
+        chunk_interval: Seconds between recorded content deltas
+        tool_latency: Recorded seconds per tool execution
+        input_tokens: Recorded input tokens per call
+        output_tokens: Recorded output tokens per call
+    """
+
+    name: str = "custom"
+    agents: int = 3
+    rounds: int = 2
+    tool_calls: int = 3
+    content_chunks: int = 50
+    chunk_interval: float = 0.02
+    tool_latency: float = 0.2
+    input_tokens: int = 2000
+    output_tokens: int = 200
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the scenario fields as a dict."""
+        return asdict(self)
+
+
+SCENARIOS: Dict[str, BenchScenario] = {
+    "small": BenchScenario(name="small", agents=2, rounds=1, tool_calls=0, content_chunks=20),
+    "default": BenchScenario(name="default", agents=3, rounds=2, tool_calls=3),
+    "tools": BenchScenario(name="tools", agents=3, rounds=2, tool_calls=20),
+    "large": BenchScenario(name="large", agents=5, rounds=3, tool_calls=10, content_chunks=200),
+}
+
+
+def agent_ids(count: int) -> List[str]:
+    """Agent ids used by scenarios: agent_a, agent_b, ..."""
+    return [f"agent_{chr(ord('a') + i)}" if i < 26 else f"agent_{i}" for i in range(count)]
+
+
+def _scenario_call(scenario: BenchScenario, agent_id: str, index: int, vote_for: str) -> CassetteCall:
+    call = CassetteCall(usage={"input_tokens": scenario.input_tokens, "output_tokens": scenario.output_tokens})
+    offset = 0.0
+    for k in range(scenario.tool_calls):
+        name = f"bench_tool_{k}"
+        call_id = f"{agent_id}_{index}_{k}"
+        source = f"custom_{name}"
+        offset += 0.001
+        call.chunks.append((offset, {"type": "custom_tool_status", "status": "custom_tool_called", "content": f"🔧 [Custom Tool] Calling {name}...", "source": source, "tool_call_id": call_id}))
+        call.chunks.append(
+            (
+                offset,
+                {
+                    "type": "custom_tool_status",
+                    "status": "function_call",
+                    "content": f'Arguments for Calling {name}: {{"step": {k}}}',
+                    "source": source,
+                    "tool_call_id": call_id,
+                    "display": False,
+                },
+            ),
+        )
+        offset += scenario.tool_latency
+        call.chunks.append((offset, {"type": "custom_tool_status", "status": "custom_tool_response", "content": f"✅ [Custom Tool] {name} completed", "source": source, "tool_call_id": call_id}))
+
+    for j in range(scenario.content_chunks):
+        offset += scenario.chunk_interval
+        call.chunks.append((offset, {"type": "content", "content": f"{agent_id} token {j} "}))
+
+    if index < scenario.rounds:
+        workflow_call = {"name": "new_answer", "arguments": {"content": f"{agent_id} answer for round {index + 1}"}}
+    else:
+        workflow_call = {"name": "vote", "arguments": {"agent_id": vote_for, "reason": "Most complete answer"}}
+    workflow_call = {"id": f"{agent_id}_{index}_workflow", "type": "function", "function": workflow_call}
+    call.chunks.append((offset, {"type": "tool_calls", "tool_calls": [workflow_call]}))
+    call.chunks.append((offset, {"type": "done"}))
+    call.duration = offset
+    return call
+
+
+def build_cassette(scenario: BenchScenario, agent_id: str, vote_for: str = "agent_a") -> Cassette:
+    """Build the synthetic cassette for one agent.
+
+    Args:
+        scenario: Scenario shape
+        agent_id: Agent the cassette is for
+        vote_for: Agent voted for after the answer rounds
+
+    Returns:
+        Cassette with ``rounds`` answer calls followed by one vote call
+    """
+    calls = [_scenario_call(scenario, agent_id, index, vote_for) for index in range(scenario.rounds + 1)]
+    return Cassette(calls=calls, metadata={"provider": "bench", "model": "bench", "scenario": scenario.name})
+
+
+def build_orchestrator(
+    scenario: BenchScenario,
+    time_scale: float = 0.0,
+    cassettes: Optional[List[Cassette]] = None,
+) -> Any:
+    """Build an Orchestrator whose agents replay scenario (or recorded) cassettes.
+
+    Args:
+        scenario: Scenario shape (``agents``, and ``rounds`` for synthetic cassettes)
+        time_scale: Replay time scale (0 = no recorded delays)
+        cassettes: Recorded cassettes assigned to agents round-robin; synthetic
+            cassettes are built when omitted
+
+    Returns:
+        Orchestrator ready for ``chat()``
+    """
+    from ..agent_config import AgentConfig
+    from ..backend.replay import ReplayBackend
+    from ..chat_agent import SingleAgent
+    from ..orchestrator import Orchestrator
+
+    ids = agent_ids(scenario.agents)
+    agents = {}
+    for i, agent_id in enumerate(ids):
+        cassette = cassettes[i % len(cassettes)] if cassettes else build_cassette(scenario, agent_id, vote_for=ids[0])
+        backend = ReplayBackend(cassette=cassette, time_scale=time_scale, on_exhausted="repeat_last")
+        agents[agent_id] = SingleAgent(backend=backend, agent_id=agent_id, system_message=f"You are {agent_id}.")
+
+    config = AgentConfig()
+    if not cassettes:
+        config.max_new_answers_per_agent = scenario.rounds
+    return Orchestrator(agents=agents, config=config)
@@ -18,6 +18,7 @@ from .logger_config import log_streaming_debug, logger
 from .memory import ConversationMemory, PersistentMemoryBase
 from .stream_chunk import ChunkType
 from .utils import CoordinationStage
+from .utils.text_buffer import TextBuffer
 
 if TYPE_CHECKING:
     pass
@@ -220,11 +221,16 @@ class SingleAgent(ChatAgent):
         # Track current turn's full context (for shadow agents to access)
         # This captures everything streamed in the current turn, not just text content
         # Cleared at the start of each turn
-        self._current_turn_content = ""  # Text content
+        self._current_turn_text = TextBuffer()  # Text content (read via _current_turn_content)
         self._current_turn_tool_calls = []  # Tool calls made
         self._current_turn_reasoning = []  # Reasoning/thinking (if enabled)
         self._current_turn_mcp_calls = []  # MCP tool calls with args/results
 
+    @property
+    def _current_turn_content(self) -> str:
+        """Text content streamed so far in the current turn."""
+        return self._current_turn_text.getvalue()
+
     @staticmethod
     def _sanitize_messages_for_openai(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -277,6 +283,8 @@ class SingleAgent(ChatAgent):
             String representation of chunk type (e.g., "content", "tool_calls")
         """
         chunk_type = chunk.type
+        if type(chunk_type) is str:
+            return chunk_type
 
         if isinstance(chunk_type, ChunkType):
             return chunk_type.value
@@ -285,13 +293,14 @@ class SingleAgent(ChatAgent):
 
     async def _process_stream(self, backend_stream, tools: List[Dict[str, Any]] = None) -> AsyncGenerator[StreamChunk, None]:
         """Common streaming logic for processing backend responses."""
-        assistant_response = ""
         tool_calls = []
         complete_message = None
         messages_to_record = []
 
-        # Clear current turn context at start of stream processing (for shadow agents)
-        self._current_turn_content = ""
+        # Clear current turn context at start of stream processing (for shadow agents).
+        # Content chunks are forwarded as-is; their text is accumulated once, in this
+        # buffer, which also backs the assistant response recorded to memory.
+        turn_text = self._current_turn_text = TextBuffer()
         self._current_turn_tool_calls = []
         self._current_turn_reasoning = []
         self._current_turn_mcp_calls = []
@@ -305,9 +314,7 @@ class SingleAgent(ChatAgent):
             async for chunk in backend_stream:
                 chunk_type = self._get_chunk_type_value(chunk)
                 if chunk_type == "content":
-                    assistant_response += chunk.content
-                    # Also track for shadow agents to access
-                    self._current_turn_content += chunk.content
+                    turn_text.append(chunk.content)
                     yield chunk
                 elif chunk_type == "tool_calls":
                     chunk_tool_calls = getattr(chunk, "tool_calls", []) or []
@@ -427,6 +434,7 @@ class SingleAgent(ChatAgent):
                                 yield StreamChunk(type="tool_calls", tool_calls=response_tool_calls)
                     # Complete response is for internal use - don't yield it
                 elif chunk_type == "done":
+                    assistant_response = turn_text.getvalue()
                     # Debug: Log what we have before assembling
                     logger.debug(f"🔍 [done] assistant_response length: {len(assistant_response)}")
 
@@ -24,6 +24,7 @@ Usage examples:
 import argparse
 import asyncio
 import copy
+import functools
 import json
 import os
 import re
@@ -41,47 +42,30 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
 )
 
 if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.styles import Style
+    from rich.console import Console
+
     from .agent_config import CoordinationConfig
+    from .chat_agent import ConfigurableAgent, SingleAgent
+    from .dspy_paraphraser import QuestionParaphraser
+    from .frontend.coordination_ui import CoordinationUI
     from .plan_storage import PlanSession
 
-import questionary
+# Heavy dependencies (backends, orchestrator, UI toolkits, DSPy) are imported
+# inside the functions that use them so ``massgen --help`` and one-shot
+# subprocesses do not pay for the whole package at startup.
 import yaml
 from dotenv import load_dotenv
-from prompt_toolkit import PromptSession
-from prompt_toolkit.formatted_text import ANSI
-from prompt_toolkit.patch_stdout import patch_stdout
-from prompt_toolkit.styles import Style
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from .agent_config import AgentConfig, TimeoutConfig
-from .backend.azure_openai import AzureOpenAIBackend
-from .backend.chat_completions import ChatCompletionsBackend
-from .backend.claude import ClaudeBackend
-from .backend.claude_code import ClaudeCodeBackend
-from .backend.codex import CodexBackend
-from .backend.gemini import GeminiBackend
-from .backend.grok import GrokBackend
-from .backend.inference import InferenceBackend
-from .backend.lmstudio import LMStudioBackend
-from .backend.response import ResponseBackend
-from .chat_agent import ConfigurableAgent, SingleAgent
-from .config_builder import ConfigBuilder
-from .dspy_paraphraser import (
-    QuestionParaphraser,
-    create_dspy_lm_from_backend_config,
-    is_dspy_available,
-)
-from .frontend.coordination_ui import CoordinationUI
+
+from .agent_config import AgentConfig, SpeculativeStartConfig, TimeoutConfig
 from .logger_config import _DEBUG_MODE, logger, save_execution_metadata, setup_logging
-from .orchestrator import Orchestrator
-from .path_handling import AtPathCompleter
 from .utils import get_backend_type_from_model
 
 # Session storage is internal state management - HARDCODED, NOT CONFIGURABLE
@@ -321,25 +305,33 @@ EXIT_EXECUTION_ERROR = 2  # Agent failure, API error, or execution error
 EXIT_TIMEOUT = 3  # Orchestrator or agent timeout
 EXIT_INTERRUPTED = 4  # KeyboardInterrupt (Ctrl+C)
 
-# Custom questionary style for polished selection interface
-MASSGEN_QUESTIONARY_STYLE = Style(
-    [
-        ("qmark", "fg:#00d7ff bold"),  # Bright cyan question mark
-        ("question", "fg:#ffffff bold"),  # White question text
-        ("answer", "fg:#00d7ff bold"),  # Bright cyan answer
-        ("pointer", "fg:#00d7ff bold"),  # Bright cyan pointer (▸)
-        ("highlighted", "fg:#00d7ff bold"),  # Bright cyan highlighted option
-        ("selected", "fg:#00ff87"),  # Bright green selected
-        ("separator", "fg:#6c6c6c"),  # Gray separators
-        ("instruction", "fg:#808080"),  # Gray instructions
-        ("text", "fg:#ffffff"),  # White text
-        ("disabled", "fg:#6c6c6c italic"),  # Gray disabled
-    ],
-)
+# Custom questionary style rules for polished selection interface
+MASSGEN_QUESTIONARY_STYLE_RULES = [
+    ("qmark", "fg:#00d7ff bold"),  # Bright cyan question mark
+    ("question", "fg:#ffffff bold"),  # White question text
+    ("answer", "fg:#00d7ff bold"),  # Bright cyan answer
+    ("pointer", "fg:#00d7ff bold"),  # Bright cyan pointer (▸)
+    ("highlighted", "fg:#00d7ff bold"),  # Bright cyan highlighted option
+    ("selected", "fg:#00ff87"),  # Bright green selected
+    ("separator", "fg:#6c6c6c"),  # Gray separators
+    ("instruction", "fg:#808080"),  # Gray instructions
+    ("text", "fg:#ffffff"),  # White text
+    ("disabled", "fg:#6c6c6c italic"),  # Gray disabled
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_questionary_style() -> "Style":
+    """Build the questionary style on first use (prompt_toolkit is imported lazily)."""
+    from prompt_toolkit.styles import Style
 
+    return Style(MASSGEN_QUESTIONARY_STYLE_RULES)
 
-def _build_coordination_ui(ui_config: Dict[str, Any]) -> CoordinationUI:
+
+def _build_coordination_ui(ui_config: Dict[str, Any]) -> "CoordinationUI":
     """Create a CoordinationUI with display_kwargs passthrough (incl. theme)."""
+    from .frontend.coordination_ui import CoordinationUI
+
     display_kwargs = dict(ui_config.get("display_kwargs", {}) or {})
     theme = ui_config.get("theme")
     if theme is not None and "theme" not in display_kwargs:
@@ -1027,11 +1019,15 @@ USER'S ORGANIZATION REQUEST:
 
 
 # Global PromptSession instance (reused across prompts for better terminal handling)
-_prompt_session: Optional[PromptSession] = None
+_prompt_session: Optional["PromptSession"] = None
 
 
-def _get_prompt_session() -> PromptSession:
+def _get_prompt_session() -> "PromptSession":
     """Get or create the PromptSession instance with AtPathCompleter."""
+    from prompt_toolkit import PromptSession
+
+    from .path_handling import AtPathCompleter
+
     global _prompt_session
     if _prompt_session is None:
         _prompt_session = PromptSession(
@@ -1056,6 +1052,9 @@ async def read_multiline_input_async(
         enable_path_completion: Whether to enable @path autocomplete
         use_ansi_prompt: If True, interpret prompt as ANSI-formatted text
     """
+    from prompt_toolkit.formatted_text import ANSI
+    from prompt_toolkit.patch_stdout import patch_stdout
+
     try:
         session = _get_prompt_session()
         # Wrap prompt in ANSI() if it contains escape codes
@@ -1423,6 +1422,7 @@ def create_backend(backend_type: str, **kwargs) -> Any:
     - claude: Anthropic Claude (requires ANTHROPIC_API_KEY)
     - gemini: Google Gemini (requires GOOGLE_API_KEY or GEMINI_API_KEY)
     - chatcompletion: OpenAI-compatible providers (auto-detects API key based on base_url)
+    - replay: Replays recorded provider streams from a cassette (offline, no API key)
 
     Supported backend with external dependencies:
     - ag2/autogen: AG2 (AutoGen) framework agents
@@ -1459,6 +1459,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 _api_key_error_message("OpenAI", "OPENAI_API_KEY", config_path),
             )
+        from .backend.response import ResponseBackend
+
         return ResponseBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "grok":
@@ -1467,6 +1469,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 _api_key_error_message("Grok", "XAI_API_KEY", config_path),
             )
+        from .backend.grok import GrokBackend
+
         return GrokBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "claude":
@@ -1475,6 +1479,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 _api_key_error_message("Claude", "ANTHROPIC_API_KEY", config_path),
             )
+        from .backend.claude import ClaudeBackend
+
         return ClaudeBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "gemini":
@@ -1483,6 +1489,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 _api_key_error_message("Gemini", "GOOGLE_API_KEY", config_path),
             )
+        from .backend.gemini import GeminiBackend
+
         return GeminiBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "chatcompletion":
@@ -1570,6 +1578,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
                         "Qwen API key not found. Set QWEN_API_KEY environment variable.\n" "You can add it to a .env file in:\n" "  - Current directory: .env\n" "  - Global config: ~/.massgen/.env",
                     )
 
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "zai":
@@ -1580,6 +1590,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 "ZAI API key not found. Set ZAI_API_KEY environment variable.\n" "You can add it to a .env file in:\n" "  - Current directory: .env\n" "  - Global config: ~/.massgen/.env",
             )
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "cerebras":
@@ -1591,6 +1603,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.cerebras.ai/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "together":
@@ -1602,6 +1616,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.together.xyz/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "fireworks":
@@ -1617,6 +1633,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.fireworks.ai/inference/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "groq":
@@ -1628,6 +1646,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.groq.com/openai/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "openrouter":
@@ -1639,6 +1659,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://openrouter.ai/api/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "moonshot":
@@ -1650,6 +1672,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.moonshot.cn/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "nebius":
@@ -1665,6 +1689,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://api.studio.nebius.ai/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "poe":
@@ -1675,6 +1701,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
                 _api_key_error_message("POE", "POE_API_KEY", config_path),
             )
         # base_url must be provided in config as it's platform-specific
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "qwen":
@@ -1686,18 +1714,26 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             )
         if "base_url" not in kwargs:
             kwargs["base_url"] = "https://dashscope-intl.aliyuncs.com/compatible-mode/v1"
+        from .backend.chat_completions import ChatCompletionsBackend
+
         return ChatCompletionsBackend(api_key=api_key, **kwargs)
 
     elif backend_type == "lmstudio":
         # LM Studio local server (OpenAI-compatible). Defaults handled by backend.
+        from .backend.lmstudio import LMStudioBackend
+
         return LMStudioBackend(**kwargs)
 
     elif backend_type == "vllm":
         # vLLM local server (OpenAI-compatible). Defaults handled by backend.
+        from .backend.inference import InferenceBackend
+
         return InferenceBackend(backend_type="vllm", **kwargs)
 
     elif backend_type == "sglang":
         # SGLang local server (OpenAI-compatible). Defaults handled by backend.
+        from .backend.inference import InferenceBackend
+
         return InferenceBackend(backend_type="sglang", **kwargs)
 
     elif backend_type == "claude_code":
@@ -1712,6 +1748,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
                 "claude-code-sdk not found. Install with: pip install claude-code-sdk",
             )
 
+        from .backend.claude_code import ClaudeCodeBackend
+
         return ClaudeCodeBackend(**kwargs)
 
     elif backend_type == "codex":
@@ -1719,6 +1757,8 @@ def create_backend(backend_type: str, **kwargs) -> Any:
         # Authentication: API key (OPENAI_API_KEY) or ChatGPT OAuth
         # Requires: npm install -g @openai/codex
 
+        from .backend.codex import CodexBackend
+
         return CodexBackend(**kwargs)
 
     elif backend_type == "azure_openai":
@@ -1736,8 +1776,37 @@ def create_backend(backend_type: str, **kwargs) -> Any:
             raise ConfigurationError(
                 "Azure OpenAI endpoint not found. Set AZURE_OPENAI_ENDPOINT or provide base_url in config.",
             )
+        from .backend.azure_openai import AzureOpenAIBackend
+
         return AzureOpenAIBackend(**kwargs)
 
+    elif backend_type == "replay":
+        # Offline replay of recorded provider streams, or recording of a real backend
+        from .backend.replay import CassetteRecorder, ReplayBackend
+
+        mode = kwargs.pop("mode", "replay")
+        cassette = kwargs.pop("cassette", None)
+        if not cassette:
+            raise ConfigurationError("Replay backend requires a 'cassette' path")
+        if mode == "replay":
+            try:
+                return ReplayBackend(cassette=cassette, **kwargs)
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(f"Cannot load replay cassette '{cassette}': {e}")
+        if mode != "record":
+            raise ConfigurationError(f"Replay backend mode must be 'replay' or 'record', got '{mode}'")
+
+        record_config = dict(kwargs.get("record_backend") or {})
+        record_type = record_config.pop("type", None)
+        if not record_type:
+            raise ConfigurationError("Replay backend in record mode requires 'record_backend' with a 'type'")
+        if "agent_id" in kwargs:
+            record_config.setdefault("agent_id", kwargs["agent_id"])
+        if config_path:
+            record_config["_config_path"] = config_path
+        backend = create_backend(record_type, **record_config)
+        return CassetteRecorder(cassette, metadata={"provider": record_type}).attach(backend)
+
     else:
         raise ConfigurationError(f"Unsupported backend type: {backend_type}")
 
@@ -1752,7 +1821,7 @@ def create_agents_from_config(
     filesystem_session_id: Optional[str] = None,
     session_storage_base: Optional[str] = None,
     progress_callback: Optional[Callable[[str, str], None]] = None,
-) -> Dict[str, ConfigurableAgent]:
+) -> Dict[str, "ConfigurableAgent"]:
     """Create agents from configuration.
 
     TIMING: This function is instrumented for performance analysis.
@@ -1770,6 +1839,8 @@ def create_agents_from_config(
                              Required with filesystem_session_id for session pre-mounting.
         progress_callback: Optional callback for progress updates (status, detail).
     """
+    from .chat_agent import ConfigurableAgent
+
     agents = {}
 
     agent_entries = [config["agent"]] if "agent" in config else config.get("agents", None)
@@ -1783,10 +1854,9 @@ def create_agents_from_config(
     # ONE client can be used by multiple mem0 instances safely
     shared_qdrant_client = None
     global_memory_config = config.get("memory", {})
-    if global_memory_config.get("enabled", False) and global_memory_config.get(
-        "persistent_memory",
-        {},
-    ).get("enabled", False):
+    global_pm_config = global_memory_config.get("persistent_memory", {})
+    # The embedded vector store runs in-process and shares collections itself
+    if global_memory_config.get("enabled", False) and global_pm_config.get("enabled", False) and global_pm_config.get("vector_store") != "embedded":
         try:
             from qdrant_client import QdrantClient
 
@@ -2150,8 +2220,31 @@ def create_agents_from_config(
                             embedding_cfg["api_key"] = os.getenv("AZURE_OPENAI_API_KEY")
                         # Add more providers as needed
 
+                    if pm_config.get("vector_store") == "embedded":
+                        # In-process vector store (no Qdrant server or file lock)
+                        from .memory._embedded_vector_store import (
+                            embedded_vector_store_config,
+                            resolve_store_path,
+                        )
+
+                        vector_store_path = resolve_store_path(pm_config.get("path"), pm_config.get("memory_dir")) if on_disk else None
+                        persistent_memory = PersistentMemory(
+                            agent_name=agent_name,
+                            session_name=session_name,
+                            llm_config=llm_cfg,  # Use native mem0 LLM
+                            embedding_config=embedding_cfg,  # Use native mem0 embedder
+                            vector_store_config=embedded_vector_store_config(path=vector_store_path),
+                            debug=debug,  # Enable memory debug mode if --debug flag used
+                            on_disk=on_disk,
+                        )
+                        logger.info(
+                            f"💾 Persistent memory created for {agent_config.agent_id} "
+                            f"(agent_name={agent_name}, session={session_name or 'cross-session'}, "
+                            f"llm={llm_cfg.get('provider')}/{llm_cfg.get('model')}, "
+                            f"embedder={embedding_cfg.get('provider')}/{embedding_cfg.get('model')}, embedded_vector_store={vector_store_path or 'in-memory'})",
+                        )
                     # Use shared Qdrant client if available
-                    if shared_qdrant_client:
+                    elif shared_qdrant_client:
                         persistent_memory = PersistentMemory(
                             agent_name=agent_name,
                             session_name=session_name,
@@ -2252,13 +2345,19 @@ def create_dspy_paraphraser_from_config(
     config: Dict[str, Any],
     *,
     config_path: Optional[str] = None,
-) -> Optional[QuestionParaphraser]:
+) -> Optional["QuestionParaphraser"]:
     """Instantiate DSPy paraphraser from orchestrator configuration.
 
     Returns:
         QuestionParaphraser instance when DSPy is enabled and properly configured; otherwise None.
     """
 
+    from .dspy_paraphraser import (
+        QuestionParaphraser,
+        create_dspy_lm_from_backend_config,
+        is_dspy_available,
+    )
+
     orchestrator_cfg = config.get("orchestrator", {}) if isinstance(config, dict) else {}
     dspy_cfg = orchestrator_cfg.get("dspy") if isinstance(orchestrator_cfg, dict) else None
 
@@ -2778,7 +2877,7 @@ async def handle_session_persistence(
 
 async def run_question_with_history(
     question: str,
-    agents: Dict[str, SingleAgent],
+    agents: Dict[str, "SingleAgent"],
     ui_config: Dict[str, Any],
     history: List[Dict[str, Any]],
     session_info: Dict[str, Any],
@@ -2790,6 +2889,8 @@ async def run_question_with_history(
         tuple: (response_text, session_id, turn_number, was_cancelled)
             - was_cancelled: True if user cancelled with Ctrl+C (partial progress may be saved)
     """
+    from .orchestrator import Orchestrator
+
     # Build messages including history
     messages = history.copy()
     messages.append({"role": "user", "content": question})
@@ -2839,6 +2940,8 @@ async def run_question_with_history(
         orchestrator_config.fairness_lead_cap_answers = orchestrator_cfg["fairness_lead_cap_answers"]
     if "max_midstream_injections_per_round" in orchestrator_cfg:
         orchestrator_config.max_midstream_injections_per_round = orchestrator_cfg["max_midstream_injections_per_round"]
+    if "speculative_start" in orchestrator_cfg:
+        orchestrator_config.speculative_start = SpeculativeStartConfig(**orchestrator_cfg["speculative_start"])
 
     # Get context sharing parameters
     snapshot_storage = orchestrator_cfg.get("snapshot_storage")
@@ -3277,11 +3380,12 @@ async def run_question_with_history(
 
 async def run_single_question(
     question: str,
-    agents: Dict[str, SingleAgent],
+    agents: Dict[str, "SingleAgent"],
     ui_config: Dict[str, Any],
     session_id: Optional[str] = None,
     restore_session_if_exists: bool = False,
     return_metadata: bool = False,
+    persist_session: bool = True,
     **kwargs,
 ):
     """Run MassGen with a single question.
@@ -3293,12 +3397,15 @@ async def run_single_question(
         session_id: Optional session ID for persistence
         restore_session_if_exists: If True, attempt to restore previous session data
         return_metadata: If True, return dict with answer and orchestrator data
+        persist_session: If False, don't save or register the run under .massgen/sessions
         **kwargs: Additional arguments
 
     Returns:
         str: The final response text (when return_metadata=False)
         dict: Dict with 'answer' and 'coordination_result' (when return_metadata=True)
     """
+    from .orchestrator import Orchestrator
+
     # Generate session_id if not provided (needed for memory archiving)
     if not session_id:
         session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -3537,6 +3644,8 @@ async def run_single_question(
             orchestrator_config.fairness_lead_cap_answers = orchestrator_cfg["fairness_lead_cap_answers"]
         if "max_midstream_injections_per_round" in orchestrator_cfg:
             orchestrator_config.max_midstream_injections_per_round = orchestrator_cfg["max_midstream_injections_per_round"]
+        if "speculative_start" in orchestrator_cfg:
+            orchestrator_config.speculative_start = SpeculativeStartConfig(**orchestrator_cfg["speculative_start"])
 
         # Get context sharing parameters
         snapshot_storage = orchestrator_cfg.get("snapshot_storage")
@@ -3710,7 +3819,7 @@ async def run_single_question(
             logger.warning(f"Failed to copy final results to turn root: {e}")
 
         # Handle session persistence for single-question runs
-        if session_id:
+        if session_id and persist_session:
             try:
                 from massgen.logger_config import get_log_session_root
 
@@ -4148,6 +4257,11 @@ def interactive_config_selector() -> Optional[str]:
     Returns:
         Path to selected config file, or None if cancelled
     """
+    import questionary
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Create console instance for rich output
     selector_console = Console()
 
@@ -4271,7 +4385,7 @@ def interactive_config_selector() -> Optional[str]:
         choices=choices,
         use_shortcuts=True,
         use_arrow_keys=True,
-        style=MASSGEN_QUESTIONARY_STYLE,
+        style=_get_questionary_style(),
         pointer="▸",
     ).ask()
 
@@ -4292,7 +4406,7 @@ def interactive_config_selector() -> Optional[str]:
 
 def _select_package_example(
     examples: List[Tuple[str, Path]],
-    console: Console,
+    console: "Console",
 ) -> Optional[str]:
     """Show hierarchical navigation for package examples.
 
@@ -4303,6 +4417,10 @@ def _select_package_example(
     Returns:
         Path to selected config, or None if cancelled/back
     """
+    import questionary
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Organize examples by category (first directory in path)
     categories = {}
     for display_name, path in examples:
@@ -4397,7 +4515,7 @@ def _select_package_example(
         choices=category_choices,
         use_shortcuts=True,
         use_arrow_keys=True,
-        style=MASSGEN_QUESTIONARY_STYLE,
+        style=_get_questionary_style(),
         pointer="▸",
     ).ask()
 
@@ -4469,7 +4587,7 @@ def _select_package_example(
         use_arrow_keys=True,
         use_search_filter=use_search_filter,
         use_jk_keys=not use_search_filter,
-        style=MASSGEN_QUESTIONARY_STYLE,
+        style=_get_questionary_style(),
         pointer="▸",
     ).ask()
 
@@ -5100,9 +5218,11 @@ def should_run_builder() -> bool:
 def _list_all_turns(
     session_id: Optional[str],
     current_turn: int,
-    console: Console,
+    console: "Console",
 ) -> None:
     """List all turns in the current session."""
+    from rich.table import Table
+
     if not session_id:
         console.print("[yellow]No active session. Complete a turn first.[/yellow]")
         return
@@ -5189,6 +5309,9 @@ def _show_turn_inspection(
     full inspection capabilities including agent outputs, system status,
     and coordination events.
     """
+    from rich.console import Console
+    from rich.panel import Panel
+
     console = Console()
     session_dir = Path(SESSION_STORAGE) / session_id
     turn_dir = session_dir / f"turn_{turn_number}"
@@ -5497,6 +5620,9 @@ def _show_turn_inspection(
 
 def print_help_messages():
     """Display help messages using Rich for better formatting."""
+    from rich.console import Console
+    from rich.panel import Panel
+
     rich_console = Console()
 
     help_content = """[dim]💬  Type your questions below
@@ -5514,7 +5640,7 @@ def print_help_messages():
 
 
 async def run_textual_interactive_mode(
-    agents: Dict[str, SingleAgent],
+    agents: Dict[str, "SingleAgent"],
     ui_config: Dict[str, Any],
     original_config: Dict[str, Any] = None,
     orchestrator_cfg: Dict[str, Any] = None,
@@ -6074,6 +6200,8 @@ async def run_textual_interactive_mode(
                     orchestrator_config.fairness_lead_cap_answers = orchestrator_cfg["fairness_lead_cap_answers"]
                 if "max_midstream_injections_per_round" in orchestrator_cfg:
                     orchestrator_config.max_midstream_injections_per_round = orchestrator_cfg["max_midstream_injections_per_round"]
+                if "speculative_start" in orchestrator_cfg:
+                    orchestrator_config.speculative_start = SpeculativeStartConfig(**orchestrator_cfg["speculative_start"])
                 if orchestrator_cfg.get("skip_coordination_rounds", False):
                     orchestrator_config.skip_coordination_rounds = True
                 if orchestrator_cfg.get("debug_final_answer"):
@@ -6669,7 +6797,7 @@ async def run_textual_interactive_mode(
 
 
 async def run_interactive_mode(
-    agents: Optional[Dict[str, SingleAgent]],
+    agents: Optional[Dict[str, "SingleAgent"]],
     ui_config: Dict[str, Any],
     original_config: Dict[str, Any] = None,
     orchestrator_cfg: Dict[str, Any] = None,
@@ -6695,6 +6823,10 @@ async def run_interactive_mode(
         session_storage_base: Base directory for session storage (for Docker mounts)
     """
 
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Textual-first mode: Launch TUI immediately without Rich terminal output
     # The TUI will handle ASCII art, session config, input, and multi-turn loop
     display_type = ui_config.get("display_type", "textual_terminal")
@@ -7597,6 +7729,7 @@ async def _execute_plan_phase(
     plan_session: "PlanSession",
     question: str,
     automation: bool = False,
+    max_parallel_chunks: int = 1,
 ) -> Tuple[str, Dict[str, Any]]:
     """
     Internal: Execute a plan (Phase 2) and collect results (Phase 3).
@@ -7609,26 +7742,40 @@ async def _execute_plan_phase(
         plan_session: PlanSession with frozen plan
         question: Task description
         automation: Whether in automation mode
+        max_parallel_chunks: Maximum chunks to execute concurrently. Chunks run
+            as soon as the chunks they depend on finish; each concurrent lane
+            gets its own agents and workspaces, and finished chunk output is
+            merged between lanes.
 
     Returns:
         Tuple of (final_answer, diff_dict)
     """
     import copy as _copy
+    import time
 
     from rich.console import Console
 
-    from .logger_config import get_log_session_root
+    from .logger_config import (
+        get_log_session_dir,
+        get_log_session_root,
+        scoped_log_session,
+    )
     from .plan_execution import (
         PlanValidationError,
         build_execution_prompt,
+        build_lane_config,
+        combine_chunk_answers,
         evaluate_chunk_progress,
         get_next_pending_chunk,
         initialize_chunk_execution_state,
         load_frozen_plan,
         mark_session_resumable,
+        merge_chunk_workspace,
         prepare_plan_execution_config,
         record_chunk_checkpoint,
+        run_chunk_dag,
         setup_agent_workspaces_for_execution,
+        summarize_chunk_timing,
         validate_chunked_plan,
     )
 
@@ -7695,6 +7842,8 @@ async def _execute_plan_phase(
 
     def _read_chunk_plan_from_agent(agent_obj: Any) -> Optional[Dict[str, Any]]:
         """Read the operational tasks/plan.json produced by an execution turn."""
+        from massgen.mcp_tools.planning.plan_store import load_plan_data
+
         if not (hasattr(agent_obj.backend, "filesystem_manager") and agent_obj.backend.filesystem_manager):
             return None
         workspace = Path(agent_obj.backend.filesystem_manager.cwd)
@@ -7703,7 +7852,7 @@ async def _execute_plan_phase(
             if not candidate.exists():
                 continue
             try:
-                payload = json.loads(candidate.read_text())
+                payload = load_plan_data(candidate)
             except json.JSONDecodeError:
                 continue
             if isinstance(payload, dict) and isinstance(payload.get("tasks"), list):
@@ -7732,167 +7881,259 @@ async def _execute_plan_phase(
                 except (TypeError, ValueError):
                     continue
 
-    final_answer = ""
-    coordination_result: Dict[str, Any] = {}
+    # Latest run_single_question result of each chunk
+    chunk_results: Dict[str, Dict[str, Any]] = {}
+    running_chunks: Set[str] = set()
+    parallel = max_parallel_chunks > 1
+    lane_agents: Dict[int, Dict[str, Any]] = {0: agents}
+    integration_dir = plan_session.plan_dir / "integration"
+    # Concurrent lanes can't share a live terminal display or log session directory,
+    # so they run silently (progress is printed per chunk) and log under lane_N/.
+    lane_ui_config = {**ui_config, "display_type": "silent"} if parallel else ui_config
+    lane_log_root = get_log_session_dir() if parallel else None
+
+    def _running_in_order() -> List[str]:
+        return [chunk for chunk in chunk_order if chunk in running_chunks]
+
+    def _resume_pointer(metadata: Any) -> Optional[str]:
+        """The chunk to report as current: the first one still running, else the next pending one."""
+        running = _running_in_order()
+        return running[0] if running else get_next_pending_chunk(metadata)
+
+    def _execution_state(current_chunk: Optional[str], reason: str) -> Dict[str, Any]:
+        return {
+            "marked_at": datetime.now().isoformat(),
+            "current_chunk": current_chunk,
+            "running_chunks": _running_in_order(),
+            "reason": reason,
+            "retry_counts": dict(retry_counts),
+        }
 
-    try:
-        while True:
-            current_metadata = plan_session.load_metadata()
-            active_chunk = current_metadata.current_chunk or get_next_pending_chunk(
-                current_metadata,
+    def _agents_for_lane(lane: int) -> Dict[str, Any]:
+        """Lane 0 reuses the primary agents; other lanes get their own agents and workspaces."""
+        if lane not in lane_agents:
+            lane_agents[lane] = create_agents_from_config(
+                build_lane_config(exec_config, lane),
+                orchestrator_cfg,
+                memory_session_id=f"plan_exec_{plan_session.plan_id}_lane{lane}",
             )
-            if not active_chunk:
-                break
+        return lane_agents[lane]
 
-            attempt = retry_counts.get(active_chunk, 0) + 1
+    def _agent_workspaces(chunk_agents: Dict[str, Any]) -> List[Path]:
+        return [Path(agent.backend.filesystem_manager.cwd) for agent in chunk_agents.values() if getattr(agent.backend, "filesystem_manager", None)]
 
-            current_metadata.status = "executing"
-            current_metadata.current_chunk = active_chunk
-            current_metadata.resumable_state = {
-                "marked_at": datetime.now().isoformat(),
-                "current_chunk": active_chunk,
-                "reason": "in_progress",
-                "retry_counts": dict(retry_counts),
-            }
+    async def _run_chunk(active_chunk: str, lane: int) -> bool:
+        """Run one attempt of a chunk on a lane. Returns True once the chunk is done (completed or skipped)."""
+        running_chunks.add(active_chunk)
+        if lane_log_root is None:
+            chunk_done = await _run_chunk_attempt(active_chunk, lane)
+        else:
+            with scoped_log_session(lane_log_root / f"lane_{lane}"):
+                chunk_done = await _run_chunk_attempt(active_chunk, lane)
+        # Left in the set when the attempt raises, so the resumable state lists it as interrupted
+        running_chunks.discard(active_chunk)
+
+        current_metadata = plan_session.load_metadata()
+        if current_metadata.status == "executing" and isinstance(current_metadata.resumable_state, dict):
+            current_metadata.resumable_state["running_chunks"] = _running_in_order()
             plan_session.save_metadata(current_metadata)
-            plan_session.log_event(
-                "chunk_started",
-                {"chunk": active_chunk, "attempt": attempt},
-            )
+        return chunk_done
 
-            task_count = setup_agent_workspaces_for_execution(
-                agents,
-                plan_session,
-                active_chunk=active_chunk,
-            )
-            if task_count == 0:
-                raise RuntimeError(
-                    f"No executable tasks found for chunk '{active_chunk}'",
-                )
+    async def _run_chunk_attempt(active_chunk: str, lane: int) -> bool:
+        """Execute a chunk on a lane's agents and checkpoint the outcome."""
+        chunk_agents = _agents_for_lane(lane)
 
-            console.print(
-                f"[bold cyan]Chunk {active_chunk}[/bold cyan] " f"[dim](attempt {attempt}, {task_count} tasks)[/dim]",
-            )
+        attempt = retry_counts.get(active_chunk, 0) + 1
 
-            execution_prompt = build_execution_prompt(
-                question,
-                active_chunk=active_chunk,
-                chunk_order=chunk_order,
-            )
+        current_metadata = plan_session.load_metadata()
+        current_metadata.status = "executing"
+        current_metadata.current_chunk = _resume_pointer(current_metadata)
+        current_metadata.resumable_state = _execution_state(current_metadata.current_chunk, "in_progress")
+        plan_session.save_metadata(current_metadata)
+        plan_session.log_event(
+            "chunk_started",
+            {"chunk": active_chunk, "attempt": attempt},
+        )
 
-            result = await run_single_question(
-                execution_prompt,
-                agents,
-                ui_config,
-                return_metadata=True,
-                orchestrator=orchestrator_cfg,
+        if parallel and integration_dir.exists():
+            # Start from the merged output of every chunk finished so far
+            for workspace in _agent_workspaces(chunk_agents):
+                merge_chunk_workspace(integration_dir, workspace)
+
+        started_at = datetime.now().isoformat()
+        started = time.monotonic()
+        task_count = setup_agent_workspaces_for_execution(
+            chunk_agents,
+            plan_session,
+            active_chunk=active_chunk,
+        )
+        if task_count == 0:
+            raise RuntimeError(
+                f"No executable tasks found for chunk '{active_chunk}'",
             )
 
-            if result.get("answer"):
-                final_answer = result["answer"]
-            coordination_result = result.get("coordination_result", {}) or {}
-
-            winner_id = coordination_result.get("selected_agent")
-            chunk_plan_data: Optional[Dict[str, Any]] = None
-            if winner_id and winner_id in agents:
-                chunk_plan_data = _read_chunk_plan_from_agent(agents[winner_id])
-            if chunk_plan_data is None:
-                # Fallback: use the first readable agent plan.
-                for agent in agents.values():
-                    chunk_plan_data = _read_chunk_plan_from_agent(agent)
-                    if chunk_plan_data:
-                        break
+        lane_label = f", lane {lane}" if parallel else ""
+        console.print(
+            f"[bold cyan]Chunk {active_chunk}[/bold cyan] " f"[dim](attempt {attempt}, {task_count} tasks{lane_label})[/dim]",
+        )
 
-            chunk_tasks = chunk_plan_data.get("tasks", []) if chunk_plan_data else []
-            progress = evaluate_chunk_progress(chunk_tasks)
-            if chunk_tasks:
-                _merge_chunk_updates(working_plan_data, chunk_tasks)
-                working_plan_file.write_text(json.dumps(working_plan_data, indent=2))
-
-            if bool(coordination_result.get("is_orchestrator_timeout")):
-                timeout_reason = str(
-                    coordination_result.get("timeout_reason") or "Time limit exceeded",
-                ).strip()
-                timeout_msg = f"Chunk '{active_chunk}' timed out: {timeout_reason}"
-                updated_metadata = record_chunk_checkpoint(
-                    plan_session,
-                    chunk=active_chunk,
-                    status="timed_out",
-                    attempt=attempt,
-                    progress=progress,
-                    error_message=timeout_msg,
-                )
-                updated_metadata.completed_chunks = updated_metadata.completed_chunks or []
-                if active_chunk not in updated_metadata.completed_chunks:
-                    # Treat timeout as skipped for chunk-to-chunk progression.
-                    updated_metadata.completed_chunks.append(active_chunk)
-                updated_metadata.current_chunk = get_next_pending_chunk(updated_metadata)
-                if updated_metadata.current_chunk is None:
-                    updated_metadata.status = "completed"
-                    updated_metadata.resumable_state = None
-                    console.print(
-                        f"[yellow]Chunk {active_chunk} timed out and was skipped[/yellow] " "[dim](no remaining chunks)[/dim]",
-                    )
-                else:
-                    updated_metadata.status = "executing"
-                    updated_metadata.resumable_state = {
-                        "marked_at": datetime.now().isoformat(),
-                        "current_chunk": updated_metadata.current_chunk,
-                        "reason": f"chunk_timeout_skipped: {active_chunk}",
-                        "retry_counts": dict(retry_counts),
-                    }
-                    console.print(
-                        f"[yellow]Chunk {active_chunk} timed out and was skipped[/yellow] " f"[dim]→ next: {updated_metadata.current_chunk}[/dim]",
-                    )
-                plan_session.save_metadata(updated_metadata)
-                retry_counts[active_chunk] = 0
-                continue
+        execution_prompt = build_execution_prompt(
+            question,
+            active_chunk=active_chunk,
+            chunk_order=chunk_order,
+        )
 
-            if progress["is_complete"]:
-                retry_counts[active_chunk] = 0
-                updated_metadata = record_chunk_checkpoint(
-                    plan_session,
-                    chunk=active_chunk,
-                    status="completed",
-                    attempt=attempt,
-                    progress=progress,
+        result = await run_single_question(
+            execution_prompt,
+            chunk_agents,
+            lane_ui_config,
+            return_metadata=True,
+            orchestrator=orchestrator_cfg,
+        )
+
+        timing = {"started_at": started_at, "duration_seconds": time.monotonic() - started, "lane": lane}
+
+        chunk_results[active_chunk] = result
+        coordination_result = result.get("coordination_result", {}) or {}
+
+        winner_id = coordination_result.get("selected_agent")
+        chunk_plan_data: Optional[Dict[str, Any]] = None
+        source_agent = chunk_agents.get(winner_id) if winner_id else None
+        if source_agent is not None:
+            chunk_plan_data = _read_chunk_plan_from_agent(source_agent)
+        if chunk_plan_data is None:
+            # Fallback: use the first readable agent plan.
+            for agent in chunk_agents.values():
+                chunk_plan_data = _read_chunk_plan_from_agent(agent)
+                if chunk_plan_data:
+                    source_agent = agent
+                    break
+
+        chunk_tasks = chunk_plan_data.get("tasks", []) if chunk_plan_data else []
+        progress = evaluate_chunk_progress(chunk_tasks)
+        if chunk_tasks:
+            _merge_chunk_updates(working_plan_data, chunk_tasks)
+            working_plan_file.write_text(json.dumps(working_plan_data, indent=2))
+
+        chunk_timed_out = bool(coordination_result.get("is_orchestrator_timeout"))
+        if parallel and source_agent is not None and (chunk_timed_out or progress["is_complete"]):
+            # Publish this chunk's output for downstream chunks on other lanes
+            for workspace in _agent_workspaces({"source": source_agent}):
+                merge_chunk_workspace(workspace, integration_dir)
+
+        if chunk_timed_out:
+            timeout_reason = str(
+                coordination_result.get("timeout_reason") or "Time limit exceeded",
+            ).strip()
+            timeout_msg = f"Chunk '{active_chunk}' timed out: {timeout_reason}"
+            updated_metadata = record_chunk_checkpoint(
+                plan_session,
+                chunk=active_chunk,
+                status="timed_out",
+                attempt=attempt,
+                progress=progress,
+                timing=timing,
+                error_message=timeout_msg,
+            )
+            updated_metadata.completed_chunks = updated_metadata.completed_chunks or []
+            if active_chunk not in updated_metadata.completed_chunks:
+                # Treat timeout as skipped for chunk-to-chunk progression.
+                updated_metadata.completed_chunks.append(active_chunk)
+            running_chunks.discard(active_chunk)
+            updated_metadata.current_chunk = _resume_pointer(updated_metadata)
+            if updated_metadata.current_chunk is None:
+                updated_metadata.status = "completed"
+                updated_metadata.resumable_state = None
+                console.print(
+                    f"[yellow]Chunk {active_chunk} timed out and was skipped[/yellow] " "[dim](no remaining chunks)[/dim]",
                 )
-                next_chunk = updated_metadata.current_chunk
-                if next_chunk:
-                    console.print(
-                        f"[green]✓ Completed chunk {active_chunk}[/green] " f"[dim]→ next: {next_chunk}[/dim]",
-                    )
-                else:
-                    console.print(
-                        f"[green]✓ Completed final chunk {active_chunk}[/green]",
-                    )
             else:
-                retry_counts[active_chunk] = retry_counts.get(active_chunk, 0) + 1
-                exhausted = not progress["made_progress"] and retry_counts[active_chunk] > retry_budget_per_chunk
-                if exhausted:
-                    error_msg = f"Chunk '{active_chunk}' exhausted retry budget " f"({retry_budget_per_chunk}) without progress"
-                    record_chunk_checkpoint(
-                        plan_session,
-                        chunk=active_chunk,
-                        status="failed",
-                        attempt=attempt,
-                        progress=progress,
-                        error_message=error_msg,
-                    )
-                    raise RuntimeError(error_msg)
+                updated_metadata.status = "executing"
+                updated_metadata.resumable_state = _execution_state(updated_metadata.current_chunk, f"chunk_timeout_skipped: {active_chunk}")
+                next_label = "" if parallel else f" [dim]→ next: {updated_metadata.current_chunk}[/dim]"
+                console.print(
+                    f"[yellow]Chunk {active_chunk} timed out and was skipped[/yellow]{next_label}",
+                )
+            plan_session.save_metadata(updated_metadata)
+            retry_counts[active_chunk] = 0
+            return True
 
+        if progress["is_complete"]:
+            retry_counts[active_chunk] = 0
+            updated_metadata = record_chunk_checkpoint(
+                plan_session,
+                chunk=active_chunk,
+                status="completed",
+                attempt=attempt,
+                progress=progress,
+                timing=timing,
+            )
+            next_chunk = updated_metadata.current_chunk
+            if parallel:
+                console.print(f"[green]✓ Completed chunk {active_chunk}[/green]")
+            elif next_chunk:
+                console.print(
+                    f"[green]✓ Completed chunk {active_chunk}[/green] " f"[dim]→ next: {next_chunk}[/dim]",
+                )
+            else:
+                console.print(
+                    f"[green]✓ Completed final chunk {active_chunk}[/green]",
+                )
+            return True
+        else:
+            retry_counts[active_chunk] = retry_counts.get(active_chunk, 0) + 1
+            exhausted = not progress["made_progress"] and retry_counts[active_chunk] > retry_budget_per_chunk
+            if exhausted:
+                error_msg = f"Chunk '{active_chunk}' exhausted retry budget " f"({retry_budget_per_chunk}) without progress"
                 record_chunk_checkpoint(
                     plan_session,
                     chunk=active_chunk,
-                    status="incomplete",
+                    status="failed",
                     attempt=attempt,
                     progress=progress,
+                    timing=timing,
+                    error_message=error_msg,
                 )
-                console.print(
-                    f"[yellow]Chunk {active_chunk} incomplete[/yellow] "
-                    f"[dim](completed {progress['completed_count']}/{progress['total_tasks']}, "
-                    f"retry {retry_counts[active_chunk]}/{retry_budget_per_chunk})[/dim]",
+                raise RuntimeError(error_msg)
+
+            record_chunk_checkpoint(
+                plan_session,
+                chunk=active_chunk,
+                status="incomplete",
+                attempt=attempt,
+                progress=progress,
+                timing=timing,
+            )
+            console.print(
+                f"[yellow]Chunk {active_chunk} incomplete[/yellow] "
+                f"[dim](completed {progress['completed_count']}/{progress['total_tasks']}, "
+                f"retry {retry_counts[active_chunk]}/{retry_budget_per_chunk})[/dim]",
+            )
+            return False
+
+    try:
+        if parallel:
+            console.print(f"[dim]Running up to {max_parallel_chunks} independent chunks concurrently[/dim]")
+            current_metadata = plan_session.load_metadata()
+            await run_chunk_dag(
+                chunk_order,
+                current_metadata.chunk_dependencies or {},
+                _run_chunk,
+                completed=current_metadata.completed_chunks or [],
+                max_parallel=max_parallel_chunks,
+            )
+            if integration_dir.exists():
+                for workspace in _agent_workspaces(agents):
+                    merge_chunk_workspace(integration_dir, workspace)
+        else:
+            while True:
+                current_metadata = plan_session.load_metadata()
+                active_chunk = current_metadata.current_chunk or get_next_pending_chunk(
+                    current_metadata,
                 )
+                if not active_chunk:
+                    break
+                await _run_chunk(active_chunk, 0)
     except KeyboardInterrupt:
         current_metadata = plan_session.load_metadata()
         mark_session_resumable(
@@ -7900,6 +8141,7 @@ async def _execute_plan_phase(
             current_chunk=current_metadata.current_chunk,
             reason="interrupted_by_user",
             retry_counts=retry_counts,
+            running_chunks=_running_in_order() if parallel else None,
         )
         raise
     except Exception as e:
@@ -7910,9 +8152,21 @@ async def _execute_plan_phase(
                 current_chunk=current_metadata.current_chunk,
                 reason=f"execution_error: {e}",
                 retry_counts=retry_counts,
+                running_chunks=_running_in_order() if parallel else None,
             )
         raise
 
+    # Collect per-chunk results; the session id comes from the last chunk in plan order
+    answers = {chunk: result["answer"] for chunk, result in chunk_results.items() if result.get("answer")}
+    if parallel:
+        final_answer = combine_chunk_answers(chunk_order, plan_session.load_metadata().chunk_dependencies or {}, answers)
+    else:
+        final_answer = next((answers[chunk] for chunk in reversed(chunk_order) if chunk in answers), "")
+    coordination_result: Dict[str, Any] = next(
+        (chunk_results[chunk].get("coordination_result") or {} for chunk in reversed(chunk_order) if chunk in chunk_results),
+        {},
+    )
+
     # ========== Collection & Reporting ==========
     console.print("\n[bold blue]═══ COLLECTION ═══[/bold blue]")
 
@@ -7936,6 +8190,11 @@ async def _execute_plan_phase(
     # Print adherence summary
     adherence = 100 - diff.get("divergence_score", 0) * 100
     console.print(f"\n[green]Plan Adherence: {adherence:.1f}%[/green]")
+    chunk_timing = summarize_chunk_timing(metadata)
+    if chunk_timing:
+        console.print(
+            f"[dim]Chunk time: {chunk_timing['total_chunk_seconds']:.1f}s total, " f"critical path {chunk_timing['critical_path_seconds']:.1f}s ({' → '.join(chunk_timing['critical_path'])})[/dim]",
+        )
     console.print(f"Plan stored at: {plan_session.plan_dir}")
 
     if diff.get("tasks_added"):
@@ -7953,6 +8212,7 @@ async def run_execute_plan(
     plan_path: str,
     question: Optional[str] = None,
     automation: bool = False,
+    max_parallel_chunks: int = 1,
 ) -> Tuple[str, Any]:
     """
     Execute an existing plan (skips planning phase).
@@ -7962,6 +8222,7 @@ async def run_execute_plan(
         plan_path: Path to plan directory, plan ID, or "latest"
         question: Optional task description override
         automation: Whether in automation mode
+        max_parallel_chunks: Maximum independent chunks to execute concurrently
 
     Returns:
         Tuple of (final_answer, plan_session)
@@ -8006,6 +8267,7 @@ async def run_execute_plan(
         plan_session=plan_session,
         question=question,
         automation=automation,
+        max_parallel_chunks=max_parallel_chunks,
     )
 
     return final_answer, plan_session
@@ -8021,6 +8283,7 @@ async def run_plan_and_execute(
     automation: bool = False,
     debug: bool = False,
     config_path: Optional[str] = None,
+    max_parallel_chunks: int = 1,
 ) -> Tuple[str, Any]:
     """
     Run full plan-and-execute workflow:
@@ -8037,6 +8300,7 @@ async def run_plan_and_execute(
         automation: Whether in automation mode
         debug: Debug mode flag
         config_path: Path to config file (for subprocess)
+        max_parallel_chunks: Maximum independent chunks to execute concurrently
 
     Returns:
         Tuple of (final_answer, plan_session)
@@ -8225,6 +8489,7 @@ async def run_plan_and_execute(
         plan_session=plan_session,
         question=question,
         automation=automation,
+        max_parallel_chunks=max_parallel_chunks,
     )
 
     return final_answer, plan_session
@@ -8310,6 +8575,7 @@ async def main(args):
 
     # Track config path for error messages
     resolved_path = None
+    sampling_profiler = None
 
     try:
         # Load or create configuration
@@ -8498,6 +8764,15 @@ async def main(args):
         # Update config with timeout settings
         config["timeout_settings"] = timeout_settings
 
+        # Start the sampling profiler if requested (--sample-profile or profiling.sampling)
+        profiling_cfg = config.get("profiling") or {}
+        if getattr(args, "sample_profile", False) or profiling_cfg.get("sampling"):
+            from .logger_config import get_log_session_root
+            from .profiling import SamplingProfiler
+
+            sampling_profiler = SamplingProfiler.from_config(get_log_session_root(), profiling_cfg)
+            sampling_profiler.start()
+
         # Handle --plan mode: auto-configure for task planning
         if getattr(args, "plan", False):
             # Ensure orchestrator section exists
@@ -8828,6 +9103,7 @@ async def main(args):
                 automation=args.automation,
                 debug=args.debug,
                 config_path=str(resolved_path) if resolved_path else None,
+                max_parallel_chunks=getattr(args, "max_parallel_chunks", 1) or 1,
             )
 
             # Print results
@@ -8860,6 +9136,7 @@ async def main(args):
                     plan_path=args.execute_plan,
                     question=args.question,  # Optional override
                     automation=args.automation,
+                    max_parallel_chunks=getattr(args, "max_parallel_chunks", 1) or 1,
                 )
 
                 # Print results
@@ -9076,6 +9353,9 @@ async def main(args):
     except Exception as e:
         print(f"❌ Error: {e}", flush=True)
         sys.exit(EXIT_EXECUTION_ERROR)
+    finally:
+        if sampling_profiler is not None:
+            sampling_profiler.stop()
 
 
 def cli_main():
@@ -9129,6 +9409,18 @@ def cli_main():
         )
         tools_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
+        # logs latency
+        latency_parser = logs_subparsers.add_parser(
+            "latency",
+            help="Display per-round latency breakdown and critical path",
+        )
+        latency_parser.add_argument(
+            "--log-dir",
+            type=str,
+            help="Path to specific log directory",
+        )
+        latency_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
         # logs list
         list_parser = logs_subparsers.add_parser("list", help="List recent runs")
         list_parser.add_argument(
@@ -9338,6 +9630,72 @@ def cli_main():
         export_args = export_parser.parse_args(sys.argv[2:])
         sys.exit(export_command(export_args))
 
+    # Handle 'bench' subcommand (offline replay benchmarks)
+    if len(sys.argv) >= 2 and sys.argv[1] == "bench":
+        from .bench import SCENARIOS, bench_command
+
+        bench_parser = argparse.ArgumentParser(
+            prog="massgen bench",
+            description="Benchmark coordination offline with replay backends (N agents x M rounds x K tool calls)",
+        )
+        bench_parser.add_argument(
+            "--scenario",
+            default="default",
+            choices=list(SCENARIOS),
+            help="Scenario preset (default: default)",
+        )
+        bench_parser.add_argument("--agents", type=int, default=None, help="Override number of agents (N)")
+        bench_parser.add_argument("--rounds", type=int, default=None, help="Override answer rounds per agent (M)")
+        bench_parser.add_argument("--tool-calls", type=int, default=None, help="Override tool calls per backend call (K)")
+        bench_parser.add_argument("--content-chunks", type=int, default=None, help="Override content deltas per backend call")
+        bench_parser.add_argument(
+            "--cassette",
+            action="append",
+            default=None,
+            help="Recorded cassette to replay (repeatable; assigned to agents round-robin)",
+        )
+        bench_parser.add_argument(
+            "--time-scale",
+            type=float,
+            default=0.0,
+            help="Multiplier for recorded delays: 0 = no delays (default), 1 = recorded pace",
+        )
+        bench_parser.add_argument("--repeat", type=int, default=3, help="Number of measured runs (default: 3)")
+        bench_parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs before the measured ones (default: 1)")
+        bench_parser.add_argument(
+            "--log-dir",
+            default=None,
+            help="Keep run logs under this directory (default: scratch directory, removed afterwards)",
+        )
+        bench_parser.add_argument("--json", action="store_true", help="Output results as JSON")
+
+        bench_args = bench_parser.parse_args(sys.argv[2:])
+        sys.exit(bench_command(bench_args))
+
+    # Handle 'batch' subcommand for running a file of questions concurrently
+    if len(sys.argv) >= 2 and sys.argv[1] == "batch":
+        from .batch import batch_command
+
+        batch_parser = argparse.ArgumentParser(
+            prog="massgen batch",
+            description="Run every question in a JSONL file through one config, several at a time, with resumable results",
+        )
+        batch_parser.add_argument("questions", help='JSONL file: one question string or {"id", "question", ...} object per line')
+        batch_parser.add_argument("--config", default=None, help="Config file path or @examples/NAME")
+        batch_parser.add_argument("--model", default=None, help="Single-agent model to use when no --config is given")
+        batch_parser.add_argument("--concurrency", type=int, default=4, help="Maximum questions in flight (default: 4)")
+        batch_parser.add_argument(
+            "--checkpoint",
+            default=None,
+            help="Results JSONL; rerunning with the same file skips questions already answered (default: batch_results.jsonl in the log session)",
+        )
+        batch_parser.add_argument("--timeout", type=float, default=None, help="Per-question timeout in seconds")
+        batch_parser.add_argument("--rate-limit", action="store_true", help="Enable provider rate limiting (shared across all questions)")
+        batch_parser.add_argument("--json", action="store_true", help="Output the summary as JSON")
+
+        batch_args = batch_parser.parse_args(sys.argv[2:])
+        sys.exit(batch_command(batch_args))
+
     # Handle 'shares' subcommand for managing shared sessions
     if len(sys.argv) >= 2 and sys.argv[1] == "shares":
         from rich.console import Console
@@ -9518,6 +9876,11 @@ Environment Variables:
         action="store_true",
         help="Enable Logfire observability for structured tracing of LLM calls, tool executions, and orchestration",
     )
+    parser.add_argument(
+        "--sample-profile",
+        action="store_true",
+        help="Sample Python stacks during the run and log event-loop blocks; writes profile.collapsed, profile.speedscope.json and loop_blocks.json to the session log directory",
+    )
     parser.add_argument(
         "--web",
         action="store_true",
@@ -9601,6 +9964,14 @@ Environment Variables:
         "or plan ID (e.g., 20260115_173113_836955) or 'latest' for most recent plan. "
         "Skips planning phase and runs execution directly from the frozen plan.",
     )
+    parser.add_argument(
+        "--max-parallel-chunks",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --plan-and-execute or --execute-plan, run up to N plan chunks concurrently when their tasks do not depend on each other. "
+        "Each concurrent chunk runs on its own copy of the agents. Default: 1 (sequential).",
+    )
     parser.add_argument(
         "--no-session-registry",
         action="store_true",
@@ -10070,6 +10441,8 @@ Environment Variables:
         except ImportError as e:
             logger.warning(f"TUI not available, falling back to CLI setup: {e}")
             # Fallback to CLI-based setup
+            from .config_builder import ConfigBuilder
+
             builder = ConfigBuilder()
             api_keys = builder.interactive_api_key_setup()
 
@@ -10228,6 +10601,8 @@ Environment Variables:
             return
 
         try:
+            from .config_builder import ConfigBuilder
+
             builder = ConfigBuilder()
             success = builder.generate_config_programmatic(
                 output_path=args.generate_config,
@@ -10268,6 +10643,8 @@ Environment Variables:
         except Exception as e:
             logger.warning(f"TUI not available, falling back to CLI quickstart: {e}")
             # Fallback to CLI-based quickstart
+            from .config_builder import ConfigBuilder
+
             builder = ConfigBuilder()
             result = builder.run_quickstart()
 
@@ -10343,6 +10720,8 @@ Environment Variables:
 
     # Launch interactive config builder if requested
     if args.init:
+        from .config_builder import ConfigBuilder
+
         builder = ConfigBuilder()
         result = builder.run()
 
@@ -10434,6 +10813,8 @@ Environment Variables:
 
             except ImportError:
                 # Fallback to CLI-based first-run flow
+                from .config_builder import ConfigBuilder
+
                 builder = ConfigBuilder(default_mode=True)
                 existing_api_keys = builder.detect_api_keys()
                 cloud_providers = ["openai", "anthropic", "gemini", "grok", "azure_openai"]
@@ -124,6 +124,10 @@ class ConfigBuilder:
         providers = {}
 
         for backend_type, caps in BACKEND_CAPABILITIES.items():
+            # Replay needs a recorded cassette, so it is not offered by the wizard
+            if backend_type == "replay":
+                continue
+
             # Build supports list, handling filesystem specially
             supports = list(caps.supported_capabilities)
 
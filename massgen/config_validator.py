@@ -963,6 +963,30 @@ class ConfigValidator:
                                             "Use a value like 300 (seconds)",
                                         )
 
+                # Validate subagent_orchestrator.execution_mode if present
+                subagent_orchestrator = coordination.get("subagent_orchestrator")
+                if isinstance(subagent_orchestrator, dict) and "execution_mode" in subagent_orchestrator:
+                    from .subagent.models import SUBAGENT_EXECUTION_MODES
+
+                    execution_mode = subagent_orchestrator["execution_mode"]
+                    if execution_mode not in SUBAGENT_EXECUTION_MODES:
+                        result.add_error(
+                            f"Invalid subagent_orchestrator.execution_mode: '{execution_mode}'",
+                            f"{location}.coordination.subagent_orchestrator.execution_mode",
+                            f"Use one of: {', '.join(SUBAGENT_EXECUTION_MODES)}",
+                        )
+
+                # Validate zygote worker pool sizing if present
+                if isinstance(subagent_orchestrator, dict):
+                    for field_name in ("zygote_pool_size", "zygote_max_tasks_per_worker"):
+                        value = subagent_orchestrator.get(field_name)
+                        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                            result.add_error(
+                                f"'{field_name}' must be a positive integer",
+                                f"{location}.coordination.subagent_orchestrator.{field_name}",
+                                "Use a value like 4",
+                            )
+
                 # Validate write_mode if present
                 if "write_mode" in coordination:
                     write_mode = coordination["write_mode"]
@@ -1056,6 +1080,9 @@ class ConfigValidator:
                     "Use a positive integer like 1 or 2",
                 )
 
+        if "speculative_start" in orchestrator_config:
+            self._validate_speculative_start(orchestrator_config["speculative_start"], f"{location}.speculative_start", result)
+
         # Validate timeout if present
         if "timeout" in orchestrator_config:
             timeout = orchestrator_config["timeout"]
@@ -1095,6 +1122,56 @@ class ConfigValidator:
                             "Use 'true' or 'false'",
                         )
 
+    def _validate_speculative_start(self, speculative_config: Any, location: str, result: ValidationResult) -> None:
+        """Validate orchestrator speculative_start settings."""
+        if not isinstance(speculative_config, dict):
+            result.add_error(
+                f"'speculative_start' must be a dictionary, got {type(speculative_config).__name__}",
+                location,
+                "Use 'enabled: true' with optional min_chars, stable_seconds, similarity_threshold",
+            )
+            return
+
+        valid_keys = {"enabled", "min_chars", "stable_seconds", "similarity_threshold"}
+        for key in speculative_config:
+            if key not in valid_keys:
+                result.add_error(
+                    f"Unknown speculative_start option '{key}'",
+                    f"{location}.{key}",
+                    f"Valid options: {', '.join(sorted(valid_keys))}",
+                )
+
+        if "enabled" in speculative_config and not isinstance(speculative_config["enabled"], bool):
+            result.add_error(
+                f"'enabled' must be a boolean, got {type(speculative_config['enabled']).__name__}",
+                f"{location}.enabled",
+                "Use true or false",
+            )
+
+        min_chars = speculative_config.get("min_chars")
+        if min_chars is not None and (isinstance(min_chars, bool) or not isinstance(min_chars, int) or min_chars < 1):
+            result.add_error(
+                "'min_chars' must be a positive integer",
+                f"{location}.min_chars",
+                "Use a value like 400",
+            )
+
+        stable_seconds = speculative_config.get("stable_seconds")
+        if stable_seconds is not None and (isinstance(stable_seconds, bool) or not isinstance(stable_seconds, (int, float)) or stable_seconds < 0):
+            result.add_error(
+                "'stable_seconds' must be a non-negative number",
+                f"{location}.stable_seconds",
+                "Use a value like 3",
+            )
+
+        threshold = speculative_config.get("similarity_threshold")
+        if threshold is not None and (isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not 0 <= threshold <= 1):
+            result.add_error(
+                "'similarity_threshold' must be a number between 0 and 1",
+                f"{location}.similarity_threshold",
+                "Use a value like 0.85",
+            )
+
     def _validate_ui(self, ui_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate UI configuration (Level 6)."""
         location = "ui"
@@ -1197,7 +1274,16 @@ class ConfigValidator:
                         result.add_error(
                             f"'vector_store' must be a string, got {type(vector_store).__name__}",
                             f"{location}.persistent_memory.vector_store",
-                            "Use 'qdrant' or other vector store name",
+                            "Use 'qdrant' or 'embedded' (in-process store, no server needed)",
+                        )
+
+                # Validate storage locations if present
+                for field_name in ["path", "memory_dir"]:
+                    if field_name in persist_memory and not isinstance(persist_memory[field_name], str):
+                        result.add_error(
+                            f"'{field_name}' must be a string, got {type(persist_memory[field_name]).__name__}",
+                            f"{location}.persistent_memory.{field_name}",
+                            "Use a directory path",
                         )
 
                 # Validate llm config if present
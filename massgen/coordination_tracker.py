@@ -11,6 +11,7 @@ without trying to infer or manage state transitions. The orchestrator tells
 us exactly what occurred and when.
 """
 
+import copy
 import json
 import time
 from dataclasses import dataclass
@@ -18,7 +19,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .logger_config import logger
+from .logger_config import get_event_emitter, logger
 from .structured_logging import (
     log_agent_answer,
     log_agent_restart,
@@ -60,6 +61,80 @@ class EventType(str, Enum):
     HUMAN_BROADCAST_RESPONSE = "human_broadcast_response"
 
 
+# Status publication timing (seconds)
+STATUS_REFRESH_INTERVAL = 2.0  # Re-check a clean tracker for token/tool counter drift
+STATUS_FILE_DEBOUNCE_SECONDS = 2.0  # Minimum interval between status.json rewrites
+
+# Events that move coordination to a new phase or round. They are published and
+# written to status.json on the next status tick, bypassing the debounce window.
+_STATUS_TRANSITION_EVENTS = frozenset(
+    {
+        EventType.ITERATION_START,
+        EventType.ITERATION_END,
+        EventType.RESTART_COMPLETED,
+        EventType.FINAL_AGENT_SELECTED,
+        EventType.FINAL_ROUND_START,
+        EventType.FINAL_ANSWER,
+        EventType.SESSION_END,
+    },
+)
+
+# Status fields that change on every build without reflecting a state change
+_VOLATILE_STATUS_PATHS = {("meta", "last_updated"), ("meta", "elapsed_seconds")}
+
+
+def diff_status(previous: Dict[str, Any], current: Dict[str, Any], _path: tuple = ()) -> Dict[str, Any]:
+    """Compute an incremental delta between two status snapshots.
+
+    Nested dicts are diffed recursively; any other changed value (including
+    lists) is replaced wholesale. Keys missing from ``current`` map to None.
+
+    Args:
+        previous: Last published status
+        current: Newly built status
+
+    Returns:
+        Delta dict (empty when nothing but volatile timing fields changed)
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in current.items():
+        path = _path + (key,)
+        if path in _VOLATILE_STATUS_PATHS:
+            continue
+        if key not in previous:
+            delta[key] = value
+            continue
+        old_value = previous[key]
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            nested = diff_status(old_value, value, path)
+            if nested:
+                delta[key] = nested
+        elif value != old_value:
+            delta[key] = value
+    for key in previous:
+        if key not in current and _path + (key,) not in _VOLATILE_STATUS_PATHS:
+            delta[key] = None
+    return delta
+
+
+def apply_status_delta(status: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a ``diff_status`` delta to a status dict in place.
+
+    Args:
+        status: Status dict to update
+        delta: Delta produced by ``diff_status``
+
+    Returns:
+        The updated status dict
+    """
+    for key, value in delta.items():
+        if isinstance(value, dict) and isinstance(status.get(key), dict):
+            apply_status_delta(status[key], value)
+        else:
+            status[key] = copy.deepcopy(value)
+    return status
+
+
 ACTION_TO_EVENT = {
     ActionType.ERROR: EventType.AGENT_ERROR,
     ActionType.TIMEOUT: EventType.AGENT_TIMEOUT,
@@ -192,6 +267,17 @@ class CoordinationTracker:
         # Enforcement observability - track workflow enforcement events per agent
         self.enforcement_events: Dict[str, List[Dict[str, Any]]] = {}
 
+        # Status publication - dirty tracking for push-based status deltas
+        self._status_generation: int = 0  # Bumped by every recorded event
+        self._status_transition_pending: bool = False  # Phase/round changed since the last publication
+        self._published_generation: int = -1
+        self._published_status: Optional[Dict[str, Any]] = None
+        self._status_seq: int = 0
+        self._last_status_build: float = 0.0
+        self._status_file_dirty: bool = False
+        self._status_file_urgent: bool = False
+        self._last_status_file_write: float = 0.0
+
     def _make_snapshot_path(self, kind: str, agent_id: str, timestamp: str) -> str:
         """Generate standardized snapshot paths.
 
@@ -418,6 +504,7 @@ class CoordinationTracker:
     def set_user_prompt(self, prompt: str):
         """Set or update the user prompt."""
         self.user_prompt = prompt
+        self.mark_status_dirty()
 
     def change_status(self, agent_id: str, new_status: AgentStatus):
         """Record when an agent changes status."""
@@ -1000,6 +1087,7 @@ class CoordinationTracker:
             context=context,
         )
         self.events.append(event)
+        self.mark_status_dirty(transition=event_type in _STATUS_TRANSITION_EVENTS)
 
     def _end_session(self):
         """Mark the end of the coordination session."""
@@ -1042,19 +1130,18 @@ class CoordinationTracker:
             "agent_count": len(self.agent_ids),
         }
 
-    def save_status_file(self, log_dir: Path, orchestrator=None):
-        """Save current coordination status to status.json for real-time monitoring.
-
-        This file is continuously updated during coordination to provide real-time
-        status monitoring for automation tools and LLM agents.
+    def build_status_snapshot(self, log_dir: Path, orchestrator=None) -> Optional[Dict[str, Any]]:
+        """Build the full coordination status (the status.json payload).
 
         Args:
-            log_dir: Directory to save the status file
+            log_dir: Session log directory (used for session ID and absolute paths)
             orchestrator: Optional orchestrator reference for accessing agent states
+
+        Returns:
+            Status dictionary, or None if it could not be built
         """
         try:
             log_dir = Path(log_dir)
-            status_file = log_dir / "status.json"
 
             # Calculate elapsed time
             elapsed = (time.time() - self.start_time) if self.start_time else 0
@@ -1464,17 +1551,144 @@ class CoordinationTracker:
                 },
             }
 
-            # Write atomically: write to temp file, then rename
-            temp_file = status_file.with_suffix(".json.tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(status_data, f, indent=2, default=str)
+            return status_data
+
+        except Exception as e:
+            logger.warning(f"Failed to build status snapshot: {e}", exc_info=True)
+            return None
 
-            # Atomic rename
-            if status_file:
-                temp_file.replace(status_file)
+    def _write_status_file(self, log_dir: Path, status_data: Dict[str, Any]) -> None:
+        """Write status.json atomically (temp file + rename)."""
+        status_file = Path(log_dir) / "status.json"
+        temp_file = status_file.with_suffix(".json.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(status_data, f, indent=2, default=str)
+        temp_file.replace(status_file)
+
+    def save_status_file(self, log_dir: Path, orchestrator=None):
+        """Save current coordination status to status.json immediately.
 
+        Used at coordination milestones; the background status task publishes
+        deltas and writes the file on a debounced schedule instead (see
+        ``publish_status`` and ``flush_status_file``).
+
+        Args:
+            log_dir: Directory to save the status file
+            orchestrator: Optional orchestrator reference for accessing agent states
+        """
+        status_data = self.build_status_snapshot(log_dir, orchestrator)
+        if status_data is None:
+            return
+        try:
+            self._write_status_file(log_dir, status_data)
+        except Exception as e:
+            logger.warning(f"Failed to save status file: {e}", exc_info=True)
+
+    def mark_status_dirty(self, transition: bool = False) -> None:
+        """Flag that coordination state changed outside of tracked events.
+
+        Args:
+            transition: The change moves coordination to a new phase or round
+                (or ends it), so status.json is rewritten without waiting for
+                the debounce window
+        """
+        self._status_generation += 1
+        if transition:
+            self._status_transition_pending = True
+
+    def publish_status(
+        self,
+        log_dir: Path,
+        orchestrator=None,
+        refresh_interval: float = STATUS_REFRESH_INTERVAL,
+        force: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Publish an incremental status delta if coordination state changed.
+
+        The snapshot is only rebuilt when the tracker is dirty (a coordination
+        event was recorded or ``mark_status_dirty`` was called) or when
+        ``refresh_interval`` has elapsed, which picks up token/tool counters that
+        backends update without tracker events. Phase and round transitions
+        also make the next ``flush_status_file`` call skip its debounce. The delta against the last
+        published snapshot is emitted as a ``status_delta`` event on the event
+        pipe (events.jsonl, and stdout for ``--stream-events`` subprocesses).
+
+        Args:
+            log_dir: Session log directory
+            orchestrator: Optional orchestrator reference for accessing agent states
+            refresh_interval: Seconds after which a clean tracker is re-checked
+            force: Rebuild and diff regardless of dirty state
+
+        Returns:
+            The published delta (the full snapshot for the first publication),
+            or None if nothing changed
+        """
+        now = time.time()
+        generation = self._status_generation
+        transition = self._status_transition_pending
+        if not force and not transition and generation == self._published_generation and now - self._last_status_build < refresh_interval:
+            return None
+        self._status_transition_pending = False
+
+        snapshot = self.build_status_snapshot(log_dir, orchestrator)
+        self._last_status_build = now
+        if snapshot is None:
+            return None
+        self._published_generation = generation
+
+        previous = self._published_status
+        delta = snapshot if previous is None else diff_status(previous, snapshot)
+        if not delta:
+            return None
+        if previous is not None:
+            # Timing fields never trigger a publication but ride along with one
+            for section, key in _VOLATILE_STATUS_PATHS:
+                if key in snapshot.get(section, {}):
+                    delta.setdefault(section, {})[key] = snapshot[section][key]
+
+        self._published_status = snapshot
+        self._status_seq += 1
+        self._status_file_dirty = True
+        self._status_file_urgent = self._status_file_urgent or transition
+
+        emitter = get_event_emitter()
+        if emitter:
+            emitter.emit_status_delta(seq=self._status_seq, delta=delta, full=previous is None)
+        return delta
+
+    def flush_status_file(self, log_dir: Path, min_interval: float = STATUS_FILE_DEBOUNCE_SECONDS, force: bool = False) -> bool:
+        """Write the last published status to status.json on a debounced schedule.
+
+        Args:
+            log_dir: Directory to save the status file
+            min_interval: Minimum seconds between writes
+            force: Write even if nothing changed or the debounce window is open.
+                A published phase/round transition is written regardless of
+                the debounce window.
+
+        Returns:
+            True if the file was written
+        """
+        if self._published_status is None:
+            return False
+        now = time.time()
+        if not force and (not self._status_file_dirty or (not self._status_file_urgent and now - self._last_status_file_write < min_interval)):
+            return False
+
+        status_data = self._published_status
+        meta = status_data.get("meta", {})
+        meta["last_updated"] = now
+        if self.start_time:
+            meta["elapsed_seconds"] = round(now - self.start_time, 3)
+        try:
+            self._write_status_file(log_dir, status_data)
         except Exception as e:
             logger.warning(f"Failed to save status file: {e}", exc_info=True)
+            return False
+        self._status_file_dirty = False
+        self._status_file_urgent = False
+        self._last_status_file_write = now
+        return True
 
     def save_coordination_logs(self, log_dir):
         """Save all coordination data and create timeline visualization.
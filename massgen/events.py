@@ -9,7 +9,9 @@ This module provides a structured event system that:
 
 Event Schema:
 - All events are JSON objects with timestamp, event_type, and event-specific data
-- Events are appended atomically to events.jsonl
+- Events are buffered briefly and appended to events.jsonl in whole lines
+- A sidecar index (events.jsonl.idx) maps event type/agent/round to byte
+  offsets so readers can seek straight to the events they need
 - Events can be read/streamed for live display or post-hoc analysis
 
 See the ``EventType`` class for the full list of event types.
@@ -17,17 +19,142 @@ See the ``EventType`` class for the full list of event types.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import bisect
+import heapq
 import json
+import logging
 import threading
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+_logger = logging.getLogger(__name__)
 
 # Type for event listeners
 EventListener = Callable[["MassGenEvent"], None]
 
+# Index entry: (byte offset, length, event_type, agent_id, round_number)
+IndexEntry = Tuple[int, int, str, Optional[str], int]
+
+# Maximum time (seconds) an emitted event waits in the write buffer
+DEFAULT_FLUSH_INTERVAL = 0.2
+# Buffered bytes that force an immediate flush regardless of the interval
+_MAX_BUFFERED_BYTES = 1 << 20
+INDEX_SUFFIX = ".idx"
+COMPRESSED_SUFFIX = ".zst"
+_SEGMENT_CACHE_SIZE = 8
+
+
+def _import_zstd():
+    """Import zstandard lazily; it is only needed for compressed event logs."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def index_path_for(file_path: Union[str, Path]) -> Path:
+    """Return the sidecar index path for an events file."""
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + INDEX_SUFFIX)
+
+
+def resolve_events_file(file_path: Union[str, Path]) -> Optional[Path]:
+    """Return the events file at ``file_path``, falling back to its compressed form.
+
+    Emitters configured with ``compression="zstd"`` only write
+    ``events.jsonl.zst``, so callers looking for ``events.jsonl`` should
+    resolve it through this function.
+
+    Args:
+        file_path: Path to events.jsonl (or events.jsonl.zst)
+
+    Returns:
+        The existing plain or compressed events file, or None if neither exists
+    """
+    file_path = Path(file_path)
+    if file_path.exists():
+        return file_path
+    if file_path.suffix != COMPRESSED_SUFFIX:
+        compressed = file_path.with_name(file_path.name + COMPRESSED_SUFFIX)
+        if compressed.exists():
+            return compressed
+    return None
+
+
+def _read_index(index_path: Path, position: int = 0) -> Tuple[List[IndexEntry], List[Tuple[int, int, int, int]], int]:
+    """Read complete index records written after ``position``.
+
+    Returns:
+        Tuple of (event entries, compressed segments, new position)
+    """
+    entries: List[IndexEntry] = []
+    segments: List[Tuple[int, int, int, int]] = []
+    try:
+        with open(index_path, "rb") as f:
+            f.seek(position)
+            data = f.read()
+    except OSError:
+        return entries, segments, position
+
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            segments.append(tuple(record["segment"]))
+        else:
+            entries.append(tuple(record))
+    return entries, segments, position + end
+
+
+# Flush notifications for in-process tails (EventReader.stream/astream)
+_flush_condition = threading.Condition()
+_flush_generation = 0
+_async_waiters: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+_live_emitters: "weakref.WeakSet[EventEmitter]" = weakref.WeakSet()
+
+
+def _notify_flushed() -> None:
+    global _flush_generation
+    with _flush_condition:
+        _flush_generation += 1
+        _flush_condition.notify_all()
+        waiters = list(_async_waiters.values())
+    for loop, wakeup in waiters:
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # Loop already closed
+
+
+@atexit.register
+def _flush_live_emitters() -> None:
+    for emitter in list(_live_emitters):
+        emitter.flush()
+
 
 @dataclass
 class MassGenEvent:
@@ -100,6 +227,7 @@ class EventType:
     # Status events
     STATUS = "status"
     BACKEND_STATUS = "backend_status"
+    STATUS_DELTA = "status_delta"  # Incremental coordination status (status.json delta)
 
     # Coordination events
     ROUND_START = "round_start"
@@ -148,7 +276,16 @@ class EventEmitter:
     """Writes structured events to events.jsonl.
 
     Thread-safe, append-only event logging that supplements streaming_debug.log.
-    Events are written atomically to ensure file integrity.
+    Events are buffered and written in whole lines: the first event after an
+    idle period is written immediately, and events arriving in a burst are
+    written together at most ``flush_interval`` seconds later. Every flush
+    also appends ``[offset, length, event_type, agent_id, round_number]``
+    records to the ``events.jsonl.idx`` sidecar used by ``EventReader``.
+
+    With ``compression="zstd"`` (requires the ``zstandard`` package) each
+    flush is written as one zstd frame to ``events.jsonl.zst`` and the index
+    also records the frame boundaries. Index offsets always refer to the
+    uncompressed stream.
 
     Usage:
         emitter = EventEmitter("/path/to/log/dir")
@@ -156,18 +293,44 @@ class EventEmitter:
         emitter.emit_tool_complete("tool_123", "read_file", "file contents", 0.5)
     """
 
-    def __init__(self, log_dir: Optional[Union[str, Path]] = None):
+    def __init__(
+        self,
+        log_dir: Optional[Union[str, Path]] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        compression: Optional[str] = None,
+    ):
         """Initialize the event emitter.
 
         Args:
             log_dir: Directory to write events.jsonl. If None, events are
                     not written to file (useful for testing or when
                     log directory is not yet initialized).
+            flush_interval: Maximum seconds an event stays buffered before
+                    it is written. 0 writes every event immediately.
+            compression: None for plain JSONL, or "zstd" for zstd-framed segments
+
+        Raises:
+            ValueError: If the compression format is not supported
         """
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported events compression: {compression!r}")
+        if compression and _import_zstd() is None:
+            _logger.warning("[EventEmitter] zstandard is not installed; writing uncompressed events.jsonl")
+            compression = None
+
         self._log_dir = Path(log_dir) if log_dir else None
         self._file_path: Optional[Path] = None
         self._file_handle = None
-        self._lock = threading.Lock()
+        self._index_handle = None
+        self._compressor = None
+        self._compression = compression
+        self._flush_interval = flush_interval
+        self._pending: List[Tuple[bytes, str, Optional[str], int]] = []
+        self._pending_bytes = 0
+        self._offset = 0
+        self._last_flush = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
         self._listeners: List[EventListener] = []
         self._current_agent_id: Optional[str] = None
         self._current_round_numbers: Dict[str, int] = {}
@@ -176,14 +339,24 @@ class EventEmitter:
         # Initialize file if log_dir provided
         if self._log_dir:
             self._init_file()
+        _live_emitters.add(self)
 
     def _init_file(self) -> None:
-        """Initialize the events.jsonl file."""
+        """Initialize the events file and its index sidecar."""
         if self._log_dir:
             self._log_dir.mkdir(parents=True, exist_ok=True)
-            self._file_path = self._log_dir / "events.jsonl"
-            # Open file in append mode with line buffering
-            self._file_handle = open(self._file_path, "a", encoding="utf-8", buffering=1)
+            name = "events.jsonl" + (COMPRESSED_SUFFIX if self._compression else "")
+            self._file_path = self._log_dir / name
+            self._file_handle = open(self._file_path, "ab")
+            index_path = index_path_for(self._file_path)
+            if self._compression:
+                self._compressor = _import_zstd().ZstdCompressor()
+                # Continue logical offsets after segments already in the file
+                _, segments, _ = _read_index(index_path)
+                self._offset = sum(segment[3] for segment in segments)
+            else:
+                self._offset = self._file_handle.tell()
+            self._index_handle = open(index_path, "ab")
 
     def set_log_dir(self, log_dir: Union[str, Path]) -> None:
         """Update the log directory (e.g., when attempt changes).
@@ -192,11 +365,7 @@ class EventEmitter:
             log_dir: New directory for events.jsonl
         """
         with self._lock:
-            # Close existing file handle
-            if self._file_handle:
-                self._file_handle.close()
-                self._file_handle = None
-
+            self._close_files()
             self._log_dir = Path(log_dir)
             self._init_file()
 
@@ -239,25 +408,25 @@ class EventEmitter:
         Args:
             event: The event to emit
         """
-        # Write to file
+        # Buffer for the file; flushed now if the buffer has been idle, else by a timer
         with self._lock:
             if self._file_handle:
-                try:
-                    self._file_handle.write(event.to_json() + "\n")
-                    self._file_handle.flush()
-                except Exception as e:
-                    import logging as _logging
-
-                    _logging.getLogger(__name__).debug("EventEmitter file write failed: %s", e)
+                line = (event.to_json() + "\n").encode("utf-8")
+                self._pending.append((line, event.event_type, event.agent_id, event.round_number))
+                self._pending_bytes += len(line)
+                if self._flush_interval <= 0 or self._pending_bytes >= _MAX_BUFFERED_BYTES or time.monotonic() - self._last_flush >= self._flush_interval:
+                    self._flush_locked()
+                elif self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
 
         # Notify listeners (copy to avoid concurrent modification)
         for listener in list(self._listeners):
             try:
                 listener(event)
             except Exception as e:
-                import logging as _logging
-
-                _logging.getLogger(__name__).debug("Event listener %s failed: %s", listener, e)
+                _logger.debug("Event listener %s failed: %s", listener, e)
 
     def emit_raw(self, event_type: str, **kwargs: Any) -> None:
         """Emit an event with automatic timestamp and context.
@@ -397,6 +566,21 @@ class EventEmitter:
             agent_id=agent_id,
         )
 
+    def emit_status_delta(self, seq: int, delta: Dict[str, Any], full: bool = False) -> None:
+        """Emit an incremental coordination status update.
+
+        Args:
+            seq: Monotonic publication sequence number
+            delta: Changed status fields (nested dicts are partial)
+            full: True when ``delta`` is a complete snapshot
+        """
+        self.emit_raw(
+            EventType.STATUS_DELTA,
+            seq=seq,
+            delta=delta,
+            full=full,
+        )
+
     def emit_round_start(self, round_number: int, agent_id: Optional[str] = None) -> None:
         """Emit a round start event.
 
@@ -748,26 +932,83 @@ class EventEmitter:
             agent_answer_summary=agent_answer_summary or {},
         )
 
-    def close(self) -> None:
-        """Close the event file handle."""
+    def flush(self) -> None:
+        """Write any buffered events to the events file and index."""
         with self._lock:
-            if self._file_handle:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+        if not self._file_handle:
+            return
+
+        data = b"".join(line for line, _, _, _ in pending)
+        index_lines = []
+        offset = self._offset
+        for line, event_type, agent_id, round_number in pending:
+            index_lines.append(json.dumps([offset, len(line), event_type, agent_id, round_number]) + "\n")
+            offset += len(line)
+        try:
+            if self._compressor is not None:
+                frame = self._compressor.compress(data)
+                frame_offset = self._file_handle.tell()
+                self._file_handle.write(frame)
+                index_lines.insert(0, json.dumps({"segment": [frame_offset, len(frame), self._offset, len(data)]}) + "\n")
+            else:
+                self._file_handle.write(data)
+            self._file_handle.flush()
+            # Index after data, so readers never see offsets past the end of the file
+            self._index_handle.write("".join(index_lines).encode("utf-8"))
+            self._index_handle.flush()
+            self._offset = offset
+        except Exception as e:
+            _logger.debug("[EventEmitter] File write failed: %s", e)
+        _notify_flushed()
+
+    def _close_files(self) -> None:
+        self._flush_locked()
+        for handle in (self._file_handle, self._index_handle):
+            if handle:
                 try:
-                    self._file_handle.close()
+                    handle.close()
                 except Exception:
                     pass
-                self._file_handle = None
+        self._file_handle = None
+        self._index_handle = None
+        self._compressor = None
+
+    def close(self) -> None:
+        """Flush buffered events and close the event file handles."""
+        with self._lock:
+            self._close_files()
 
     @property
     def file_path(self) -> Optional[Path]:
-        """Get the path to the events.jsonl file."""
+        """Get the path to the events file (events.jsonl or events.jsonl.zst)."""
         return self._file_path
 
 
 class EventReader:
     """Reads events from events.jsonl file.
 
-    Supports both batch reading and live streaming of events.
+    Supports both batch reading and live streaming of events. Positions are
+    byte offsets into the uncompressed event stream, and only complete lines
+    are consumed, so a reader never sees half of an event that is still
+    being written.
+
+    Filters go through an in-memory index loaded incrementally from the
+    ``events.jsonl.idx`` sidecar (or built by scanning files written without
+    one) and only parse the events they return. ``events.jsonl.zst`` files
+    are read through the segment table in the index. Keep a reader around
+    when polling the same file: each refresh only parses index records
+    written since the previous one.
 
     Usage:
         reader = EventReader("/path/to/events.jsonl")
@@ -785,14 +1026,157 @@ class EventReader:
         """Initialize the event reader.
 
         Args:
-            file_path: Path to events.jsonl file
+            file_path: Path to events.jsonl file (or events.jsonl.zst). If the
+                plain file does not exist but a compressed one does, the
+                compressed file is read.
         """
         self._file_path = Path(file_path)
         self._last_position = 0
+        self._index_position = 0
+        self._indexed_end = 0
+        self._entries: List[IndexEntry] = []
+        self._by_type: Dict[str, List[IndexEntry]] = {}
+        self._segments: List[Tuple[int, int, int, int]] = []
+        self._segment_starts: List[int] = []
+        self._segment_cache: "OrderedDict[int, bytes]" = OrderedDict()
+
+    @property
+    def _path(self) -> Path:
+        return resolve_events_file(self._file_path) or self._file_path
+
+    @property
+    def _compressed(self) -> bool:
+        return self._path.suffix == COMPRESSED_SUFFIX
 
     def exists(self) -> bool:
         """Check if the events file exists."""
-        return self._file_path.exists()
+        return self._path.exists()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _add_entry(self, entry: IndexEntry) -> None:
+        self._entries.append(entry)
+        self._by_type.setdefault(entry[2], []).append(entry)
+        self._indexed_end = entry[0] + entry[1]
+
+    def _scan_plain(self, start: int, stop: Optional[int] = None) -> None:
+        """Index complete lines of a plain events file between two offsets."""
+        try:
+            with open(self._path, "rb") as f:
+                f.seek(start)
+                data = f.read() if stop is None else f.read(stop - start)
+        except OSError:
+            return
+        offset = start
+        for line in data[: data.rfind(b"\n") + 1].splitlines(keepends=True):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                    self._add_entry((offset, len(line), record.get("event_type"), record.get("agent_id"), record.get("round_number", 0)))
+                except (ValueError, AttributeError):
+                    pass  # Skip malformed lines
+            offset += len(line)
+        self._indexed_end = max(self._indexed_end, offset)
+
+    def refresh_index(self) -> None:
+        """Load index records written since the last refresh."""
+        entries, segments, self._index_position = _read_index(index_path_for(self._path), self._index_position)
+        for segment in segments:
+            self._segments.append(segment)
+            self._segment_starts.append(segment[2])
+        for entry in entries:
+            if entry[0] < self._indexed_end:
+                continue  # Already indexed by scanning
+            if entry[0] > self._indexed_end and not self._compressed:
+                # Lines written before the index existed
+                self._scan_plain(self._indexed_end, entry[0])
+            self._add_entry(entry)
+        if not self._compressed and self._logical_end() > self._indexed_end:
+            self._scan_plain(self._indexed_end)
+
+    def _logical_end(self) -> int:
+        if self._compressed:
+            return self._segments[-1][2] + self._segments[-1][3] if self._segments else 0
+        try:
+            return self._path.stat().st_size
+        except OSError:
+            return 0
+
+    def _segment_data(self, position: int) -> bytes:
+        data = self._segment_cache.get(position)
+        if data is None:
+            frame_offset, frame_length, _, _ = self._segments[position]
+            with open(self._path, "rb") as f:
+                f.seek(frame_offset)
+                data = _import_zstd().ZstdDecompressor().decompress(f.read(frame_length))
+            self._segment_cache[position] = data
+            if len(self._segment_cache) > _SEGMENT_CACHE_SIZE:
+                self._segment_cache.popitem(last=False)
+        else:
+            self._segment_cache.move_to_end(position)
+        return data
+
+    def _read_range(self, start: int, end: Optional[int] = None) -> bytes:
+        """Read bytes of the uncompressed event stream."""
+        if not self._compressed:
+            try:
+                with open(self._path, "rb") as f:
+                    f.seek(start)
+                    return f.read() if end is None else f.read(end - start)
+            except OSError:
+                return b""
+
+        if _import_zstd() is None:
+            _logger.warning("[EventReader] zstandard is required to read %s", self._path)
+            return b""
+        end = self._logical_end() if end is None else end
+        parts = []
+        position = max(bisect.bisect_right(self._segment_starts, start) - 1, 0)
+        while start < end and position < len(self._segments):
+            segment_start = self._segments[position][2]
+            data = self._segment_data(position)
+            parts.append(data[start - segment_start : end - segment_start])
+            start = segment_start + len(data)
+            position += 1
+        return b"".join(parts)
+
+    def _read_entries(self, entries: List[IndexEntry]) -> bytes:
+        """Read the lines of indexed events, merging adjacent entries into one read."""
+        ranges: List[List[int]] = []
+        for offset, length, _, _, _ in entries:
+            if ranges and ranges[-1][1] == offset:
+                ranges[-1][1] = offset + length
+            else:
+                ranges.append([offset, offset + length])
+        if self._compressed:
+            return b"".join(self._read_range(start, end) for start, end in ranges)
+
+        parts = []
+        try:
+            with open(self._path, "rb") as f:
+                for start, end in ranges:
+                    f.seek(start)
+                    parts.append(f.read(end - start))
+        except OSError:
+            return b""
+        return b"".join(parts)
+
+    @staticmethod
+    def _parse_lines(data: bytes) -> List[MassGenEvent]:
+        events = []
+        for line in data.splitlines():
+            if line.strip():
+                try:
+                    events.append(MassGenEvent.from_json(line.decode("utf-8", errors="replace")))
+                except (json.JSONDecodeError, TypeError):
+                    continue  # Skip malformed lines
+        return events
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
 
     def read_all(self) -> List[MassGenEvent]:
         """Read all events from the file.
@@ -800,20 +1184,7 @@ class EventReader:
         Returns:
             List of all events in the file
         """
-        events = []
-        if not self._file_path.exists():
-            return events
-
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(MassGenEvent.from_json(line))
-                    except json.JSONDecodeError:
-                        continue  # Skip malformed lines
-            self._last_position = f.tell()
-
+        events, self._last_position = self.read_since(0)
         return events
 
     def read_since(self, position: int = 0) -> tuple[List[MassGenEvent], int]:
@@ -825,24 +1196,13 @@ class EventReader:
         Returns:
             Tuple of (events list, new position)
         """
-        events = []
-        new_position = position
-
-        if not self._file_path.exists():
-            return events, new_position
-
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            f.seek(position)
-            for line in f:
-                line_stripped = line.strip()
-                if line_stripped:
-                    try:
-                        events.append(MassGenEvent.from_json(line_stripped))
-                    except json.JSONDecodeError:
-                        continue
-            new_position = f.tell()
-
-        return events, new_position
+        if not self.exists():
+            return [], position
+        if self._compressed:
+            self.refresh_index()
+        data = self._read_range(position)
+        complete = data.rfind(b"\n") + 1
+        return self._parse_lines(data[:complete]), position + complete
 
     def get_new_events(self) -> List[MassGenEvent]:
         """Get events added since last read.
@@ -857,19 +1217,119 @@ class EventReader:
     def stream(self, poll_interval: float = 0.5) -> Generator[MassGenEvent, None, None]:
         """Stream events as they are written (blocking generator).
 
+        Wakes up as soon as an emitter in this process flushes; writes from
+        other processes are picked up within ``poll_interval``.
+
         Args:
-            poll_interval: How often to check for new events (seconds)
+            poll_interval: Maximum time to wait for new events (seconds)
 
         Yields:
             New events as they are written
         """
         while True:
+            generation = _flush_generation
             events = self.get_new_events()
             for event in events:
                 yield event
 
             if not events:
-                time.sleep(poll_interval)
+                with _flush_condition:
+                    _flush_condition.wait_for(lambda: _flush_generation != generation, timeout=poll_interval)
+
+    async def astream(self, poll_interval: float = 0.5) -> AsyncGenerator[MassGenEvent, None]:
+        """Stream events as they are written without blocking the event loop.
+
+        Wakes up when an emitter in this process flushes, or (with the
+        optional ``watchfiles`` package) when another process writes to the
+        file. Otherwise checks for new events every ``poll_interval``.
+
+        Args:
+            poll_interval: Maximum time to wait for new events (seconds)
+
+        Yields:
+            New events as they are written
+        """
+        wakeup = asyncio.Event()
+        key = id(wakeup)
+        with _flush_condition:
+            _async_waiters[key] = (asyncio.get_running_loop(), wakeup)
+        watcher = self._start_file_watcher(wakeup)
+        try:
+            while True:
+                wakeup.clear()
+                events = self.get_new_events()
+                for event in events:
+                    yield event
+
+                if not events:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            with _flush_condition:
+                _async_waiters.pop(key, None)
+            if watcher is not None:
+                watcher.cancel()
+
+    def _start_file_watcher(self, wakeup: asyncio.Event) -> Optional[asyncio.Task]:
+        """Watch the events file for writes from other processes (inotify/FSEvents)."""
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            return None
+        directory = self._file_path.parent
+        if not directory.is_dir():
+            return None
+        names = {self._file_path.name, self._file_path.name + COMPRESSED_SUFFIX}
+
+        async def watch() -> None:
+            try:
+                async for _ in awatch(directory, watch_filter=lambda _change, path: Path(path).name in names, debounce=200, step=20):
+                    wakeup.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _logger.debug("[EventReader] File watcher stopped: %s", e)
+
+        return asyncio.create_task(watch())
+
+    def filter_events(
+        self,
+        event_types: Optional[List[str]] = None,
+        agent_id: Optional[str] = None,
+        round_number: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[MassGenEvent]:
+        """Read events matching the given criteria, using the index to seek to them.
+
+        Args:
+            event_types: Event types to include (None for all)
+            agent_id: Only include events from this agent
+            round_number: Only include events from this round
+            limit: Only return the last ``limit`` matching events
+
+        Returns:
+            Matching events in file order
+        """
+        if not self.exists():
+            return []
+        self.refresh_index()
+        if limit is not None and limit <= 0:
+            return []
+        # Walk the index newest-first so a limit stops the scan early
+        if event_types is None:
+            candidates: Any = reversed(self._entries)
+        else:
+            candidates = heapq.merge(*(reversed(self._by_type.get(t, [])) for t in set(event_types)), reverse=True)
+        matches: List[IndexEntry] = []
+        for entry in candidates:
+            if (agent_id is None or entry[3] == agent_id) and (round_number is None or entry[4] == round_number):
+                matches.append(entry)
+                if limit is not None and len(matches) >= limit:
+                    break
+        matches.reverse()
+        return self._parse_lines(self._read_entries(matches))
 
     def filter_by_type(self, event_types: List[str]) -> List[MassGenEvent]:
         """Read events filtered by type.
@@ -880,7 +1340,7 @@ class EventReader:
         Returns:
             Filtered list of events
         """
-        return [e for e in self.read_all() if e.event_type in event_types]
+        return self.filter_events(event_types=event_types)
 
     def filter_by_agent(self, agent_id: str) -> List[MassGenEvent]:
         """Read events filtered by agent.
@@ -891,7 +1351,7 @@ class EventReader:
         Returns:
             Events from the specified agent
         """
-        return [e for e in self.read_all() if e.agent_id == agent_id]
+        return self.filter_events(agent_id=agent_id)
 
     def get_tools_summary(self) -> List[Dict[str, Any]]:
         """Get a summary of all tool calls.
@@ -899,11 +1359,11 @@ class EventReader:
         Returns:
             List of tool call summaries with name, args, result, duration
         """
-        all_events = self.read_all()
+        tool_events = self.filter_events(event_types=[EventType.TOOL_START, EventType.TOOL_COMPLETE])
         tool_starts: Dict[str, MassGenEvent] = {}
         summaries = []
 
-        for event in all_events:
+        for event in tool_events:
             if event.event_type == EventType.TOOL_START:
                 tool_id = event.data.get("tool_id")
                 if tool_id:
@@ -932,28 +1392,58 @@ class EventReader:
 
     def skip_to_end(self) -> None:
         """Skip to the end of the file (ignore existing events)."""
-        if self._file_path.exists():
-            self._last_position = self._file_path.stat().st_size
+        if self.exists():
+            if self._compressed:
+                self.refresh_index()
+            self._last_position = self._logical_end()
 
 
 # Global event emitter instance (initialized by logger_config.py)
 _global_emitter: Optional[EventEmitter] = None
 
+# Task-scoped emitter override. In-process subagents run a child orchestrator
+# on the parent's event loop; scoping the emitter to the child's asyncio task
+# keeps its events out of the parent's events.jsonl.
+_scoped_emitter: ContextVar[Optional[EventEmitter]] = ContextVar("massgen_scoped_event_emitter", default=None)
+
+
+def get_scoped_event_emitter() -> Optional[EventEmitter]:
+    """Get the event emitter scoped to the current task context, if any."""
+    return _scoped_emitter.get()
+
+
+@contextmanager
+def scoped_event_emitter(emitter: EventEmitter) -> Iterator[EventEmitter]:
+    """Route events emitted in the current context (and tasks it spawns) to ``emitter``.
+
+    Args:
+        emitter: The EventEmitter that should receive events inside the block
+
+    Yields:
+        The scoped emitter
+    """
+    token = _scoped_emitter.set(emitter)
+    try:
+        yield emitter
+    finally:
+        _scoped_emitter.reset(token)
+
 
 def get_event_emitter() -> Optional[EventEmitter]:
-    """Get the global event emitter instance.
+    """Get the active event emitter instance.
 
     Returns:
-        The global EventEmitter, or None if not initialized
+        The task-scoped EventEmitter if one is active, otherwise the global
+        EventEmitter, or None if not initialized
     """
-    return _global_emitter
+    return _scoped_emitter.get() or _global_emitter
 
 
-def set_event_emitter(emitter: EventEmitter) -> None:
+def set_event_emitter(emitter: Optional[EventEmitter]) -> None:
     """Set the global event emitter instance.
 
     Args:
-        emitter: The EventEmitter to use globally
+        emitter: The EventEmitter to use globally (None to clear it)
     """
     global _global_emitter
     _global_emitter = emitter
@@ -966,8 +1456,9 @@ def emit_event(event_type: str, **kwargs: Any) -> None:
         event_type: Type of event
         **kwargs: Event data
     """
-    if _global_emitter:
-        _global_emitter.emit_raw(event_type, **kwargs)
+    emitter = get_event_emitter()
+    if emitter:
+        emitter.emit_raw(event_type, **kwargs)
 
 
 # Export public API
@@ -976,7 +1467,11 @@ __all__ = [
     "EventType",
     "EventEmitter",
     "EventReader",
+    "DEFAULT_FLUSH_INTERVAL",
+    "index_path_for",
     "get_event_emitter",
+    "get_scoped_event_emitter",
+    "scoped_event_emitter",
     "set_event_emitter",
     "emit_event",
 ]
@@ -19,6 +19,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .utils.text_buffer import TextBuffer
+
 
 class EntryType(Enum):
     """Types of trace entries."""
@@ -67,6 +69,9 @@ class ExecutionTraceWriter:
     _active_reasoning_entry: Optional[TraceEntry] = field(default=None, repr=False)
     # Track active content entry to accumulate streaming tokens
     _active_content_entry: Optional[TraceEntry] = field(default=None, repr=False)
+    # Streaming tokens of the active entries; joined into the entry when it is closed
+    _active_reasoning_text: Optional[TextBuffer] = field(default=None, repr=False)
+    _active_content_text: Optional[TextBuffer] = field(default=None, repr=False)
 
     def start_round(self, round_num: int, answer_label: str) -> None:
         """Mark the start of a new round/answer.
@@ -137,7 +142,7 @@ class ExecutionTraceWriter:
 
         if self._active_reasoning_entry is not None:
             # Accumulate into existing reasoning entry
-            self._active_reasoning_entry.content["reasoning"] += content
+            self._active_reasoning_text.append(content)
         else:
             # Start new reasoning entry
             self._active_reasoning_entry = TraceEntry(
@@ -145,6 +150,7 @@ class ExecutionTraceWriter:
                 timestamp=datetime.now(),
                 content={"reasoning": content},
             )
+            self._active_reasoning_text = TextBuffer(content)
             self.entries.append(self._active_reasoning_entry)
 
     def finalize_reasoning(self) -> None:
@@ -153,7 +159,11 @@ class ExecutionTraceWriter:
         Call this when reasoning is complete (e.g., when switching to
         content output or tool calls).
         """
+        if self._active_reasoning_entry is not None:
+            self._active_reasoning_entry.content["reasoning"] = self._active_reasoning_text.getvalue()
+            self._active_reasoning_text.close()
         self._active_reasoning_entry = None
+        self._active_reasoning_text = None
 
     def add_content(self, content: str) -> None:
         """Record model text output (distinct from internal reasoning).
@@ -173,7 +183,7 @@ class ExecutionTraceWriter:
 
         if self._active_content_entry is not None:
             # Accumulate into existing content entry
-            self._active_content_entry.content["text"] += content
+            self._active_content_text.append(content)
         else:
             # Start new content entry
             self._active_content_entry = TraceEntry(
@@ -181,6 +191,7 @@ class ExecutionTraceWriter:
                 timestamp=datetime.now(),
                 content={"text": content},
             )
+            self._active_content_text = TextBuffer(content)
             self.entries.append(self._active_content_entry)
 
     def finalize_content(self) -> None:
@@ -189,7 +200,11 @@ class ExecutionTraceWriter:
         Call this when content output is complete (e.g., when switching to
         tool calls or reasoning).
         """
+        if self._active_content_entry is not None:
+            self._active_content_entry.content["text"] = self._active_content_text.getvalue()
+            self._active_content_text.close()
         self._active_content_entry = None
+        self._active_content_text = None
 
     def add_answer(self, answer_label: str, content: str) -> None:
         """Record an answer submission.
@@ -23,6 +23,8 @@ from typing import Any, Dict, List, Optional
 
 from ..logger_config import get_log_session_dir, logger
 from ..mcp_tools.client import HookType
+from ..mcp_tools.planning.plan_store import compact_plan_log
+from ..profiling import SNAPSHOT, profiled
 from . import _code_execution_server as ce_module
 from . import _workspace_tools_server as wc_module
 from ._base import Permission
@@ -1860,6 +1862,7 @@ class FilesystemManager:
         self.path_permission_manager.context_write_access_enabled = True
         logger.info("[FilesystemManager] Context write access enabled - agent can now modify files with write permissions")
 
+    @profiled("save_snapshot", SNAPSHOT)
     async def save_snapshot(self, timestamp: Optional[str] = None, is_final: bool = False) -> None:
         """
         Save a snapshot of the workspace. Always saves to snapshot_storage if available (keeping only most recent).
@@ -1874,6 +1877,10 @@ class FilesystemManager:
         """
         logger.info(f"[FilesystemManager.save_snapshot] Called for agent_id={self.agent_id}, is_final={is_final}, snapshot_storage={self.snapshot_storage}")
 
+        # Fold pending task plan changes into tasks/plan.json so the snapshot holds the round's final plan
+        if compact_plan_log(Path(self.cwd) / "tasks" / "plan.json"):
+            logger.debug("[FilesystemManager.save_snapshot] Compacted task plan change log")
+
         # Auto-commit any changes before taking snapshot (if git is enabled)
         if self.use_two_tier_workspace:
             commit_prefix = "[FINAL]" if is_final else "[SNAPSHOT]"
@@ -2103,6 +2110,7 @@ class FilesystemManager:
             except Exception:
                 pass
 
+    @profiled("copy_snapshots", SNAPSHOT)
     async def copy_snapshots_to_temp_workspace(self, all_snapshots: Dict[str, Path], agent_mapping: Dict[str, str]) -> Optional[Path]:
         """
         Copy snapshots from multiple agents to temporary workspace for context sharing.
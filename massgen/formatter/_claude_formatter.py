@@ -36,73 +36,83 @@ class ClaudeFormatter(FormatterBase):
         converted_messages = []
         system_message = ""
 
-        for message in messages:
-            if message.get("role") == "system":
+        for kind, converted in self._convert_messages(messages, self._format_message):
+            if kind == "system":
                 # Extract system message for top-level parameter
-                system_message = message.get("content", "")
-            elif message.get("role") == "tool":
-                # Chat Completions tool message -> Claude tool result
-                converted_messages.append(
+                system_message = converted
+            elif kind == "message":
+                converted_messages.append(converted)
+
+        return converted_messages, system_message
+
+    def _format_message(self, message: Dict[str, Any]) -> Tuple[str, Any]:
+        """
+        Convert a single message to Claude's format.
+
+        Returns:
+            tuple: ("system", system content), ("message", converted message) or ("skip", None)
+        """
+        if message.get("role") == "system":
+            return "system", message.get("content", "")
+        elif message.get("role") == "tool":
+            # Chat Completions tool message -> Claude tool result
+            return "message", {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": message.get("tool_call_id"),
-                                "content": message.get("content", ""),
-                            },
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": message.get("tool_call_id"),
+                        "content": message.get("content", ""),
                     },
-                )
-            elif message.get("type") == "function_call_output":
-                # Response API tool message -> Claude tool result
-                converted_messages.append(
+                ],
+            }
+        elif message.get("type") == "function_call_output":
+            # Response API tool message -> Claude tool result
+            return "message", {
+                "role": "user",
+                "content": [
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": message.get("call_id"),
-                                "content": message.get("output", ""),
-                            },
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": message.get("call_id"),
+                        "content": message.get("output", ""),
+                    },
+                ],
+            }
+        elif message.get("role") == "assistant" and "tool_calls" in message:
+            # Assistant message with tool calls - convert to Claude format
+            content = []
+
+            # Add text content if present
+            if message.get("content"):
+                content.append({"type": "text", "text": message["content"]})
+
+            # Convert tool calls to Claude tool use format
+            for tool_call in message["tool_calls"]:
+                tool_name = self.extract_tool_name(tool_call)
+                tool_args = self.extract_tool_arguments(tool_call)
+                tool_id = self.extract_tool_call_id(tool_call)
+
+                content.append(
+                    {
+                        "type": "tool_use",
+                        "id": tool_id,
+                        "name": tool_name,
+                        "input": tool_args,
                     },
                 )
-            elif message.get("role") == "assistant" and "tool_calls" in message:
-                # Assistant message with tool calls - convert to Claude format
-                content = []
 
-                # Add text content if present
-                if message.get("content"):
-                    content.append({"type": "text", "text": message["content"]})
-
-                # Convert tool calls to Claude tool use format
-                for tool_call in message["tool_calls"]:
-                    tool_name = self.extract_tool_name(tool_call)
-                    tool_args = self.extract_tool_arguments(tool_call)
-                    tool_id = self.extract_tool_call_id(tool_call)
-
-                    content.append(
-                        {
-                            "type": "tool_use",
-                            "id": tool_id,
-                            "name": tool_name,
-                            "input": tool_args,
-                        },
-                    )
-
-                converted_messages.append({"role": "assistant", "content": content})
-            elif message.get("role") in ["user", "assistant"]:
-                # Keep user and assistant messages, skip system
-                converted_message = dict(message)
-                if isinstance(converted_message.get("content"), str):
-                    # Claude expects content to be text for simple messages
-                    pass
-                elif isinstance(converted_message.get("content"), list):
-                    converted_message = self._convert_multimodal_content(converted_message)
-                converted_messages.append(converted_message)
-
-        return converted_messages, system_message
+            return "message", {"role": "assistant", "content": content}
+        elif message.get("role") in ["user", "assistant"]:
+            # Keep user and assistant messages, skip system
+            converted_message = dict(message)
+            if isinstance(converted_message.get("content"), str):
+                # Claude expects content to be text for simple messages
+                pass
+            elif isinstance(converted_message.get("content"), list):
+                converted_message = self._convert_multimodal_content(converted_message)
+            return "message", converted_message
+
+        return "skip", None
 
     def _convert_multimodal_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize multimodal content blocks to Claude's nested source structure."""
@@ -7,7 +7,9 @@ Provides common functionality for building API parameters across different backe
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ._message_cache import MessageConversionCache
 
 
 class FormatterBase(ABC):
@@ -21,6 +23,34 @@ class FormatterBase(ABC):
         """
         return None
 
+    @property
+    def message_cache(self) -> MessageConversionCache:
+        """Per-message conversion cache reused across ``format_messages`` calls."""
+        cache = self.__dict__.get("_message_cache")
+        if cache is None:
+            cache = self._message_cache = MessageConversionCache()
+        return cache
+
+    def _convert_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        converter: Callable[..., Any],
+        variants: Optional[List[Hashable]] = None,
+    ) -> List[Any]:
+        """Convert messages one by one through the conversion cache.
+
+        Args:
+            messages: Messages to convert
+            converter: Single-message conversion. It must depend only on the
+                message (and its variant, which it receives as a second
+                argument when ``variants`` is given)
+            variants: Optional extra cache key component per message
+
+        Returns:
+            Converted messages in order
+        """
+        return self.message_cache.convert_many(messages, converter, variants)
+
     @abstractmethod
     def format_messages(
         self,
@@ -24,7 +24,7 @@ class GeminiFormatter(FormatterBase):
         - Assistant => "Assistant: {content}"
         - Tool => "Tool Result: {content}"
         """
-        conversation_content = ""
+        conversation_lines = []
         system_message = ""
 
         for msg in messages:
@@ -32,19 +32,17 @@ class GeminiFormatter(FormatterBase):
             if role == "system":
                 system_message = msg.get("content", "")
             elif role == "user":
-                conversation_content += f"User: {msg.get('content', '')}\n"
+                conversation_lines.append(f"User: {msg.get('content', '')}\n")
             elif role == "assistant":
-                conversation_content += f"Assistant: {msg.get('content', '')}\n"
+                conversation_lines.append(f"Assistant: {msg.get('content', '')}\n")
             elif role == "tool":
                 tool_output = msg.get("content", "")
-                conversation_content += f"Tool Result: {tool_output}\n"
+                conversation_lines.append(f"Tool Result: {tool_output}\n")
 
-        # Combine system message and conversation
-        full_content = ""
+        # Combine system message and conversation (joined once rather than re-copied per message)
         if system_message:
-            full_content += f"{system_message}\n\n"
-        full_content += conversation_content
-        return full_content
+            conversation_lines.insert(0, f"{system_message}\n\n")
+        return "".join(conversation_lines)
 
     def format_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
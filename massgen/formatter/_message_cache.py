@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Per-message conversion cache shared by the formatters.
+
+Backends re-format the whole conversation before every API call, but in a
+tool loop only the last few messages are new. ``MessageConversionCache``
+memoizes each message's conversion at two levels:
+
+- by identity: the same dict object whose snapshot still matches. The
+  snapshot lists every nested dict/list with its keys and items, so in-place
+  edits at any depth (e.g. a tool_result appended to a message's content
+  list) miss. Unchanged items are the same objects, so comparing it is cheap
+- by content: a frozen (tuple) copy of the message that shares its string
+  objects, so equal copies of a message (e.g. ones re-created by sanitizers)
+  still hit. Building it is a shallow walk with no serialization
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from itertools import repeat
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 4096
+
+_MISSING = object()
+# Closes a container in a snapshot
+_END = object()
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        raise _Unhashable()
+    # Keep True/1/1.0 apart; they compare equal but serialize differently
+    return (type(value), value)
+
+
+def message_key(message: Dict[str, Any]) -> Optional[Hashable]:
+    """Build the structural cache key for a message.
+
+    Args:
+        message: Message dict
+
+    Returns:
+        Hashable key, or None if the message contains unhashable leaf values
+    """
+    try:
+        return _freeze(message)
+    except _Unhashable:
+        return None
+
+
+def _snapshot(value: Any, out: List[Any]) -> List[Any]:
+    """Flatten a message's containers, keys and leaves into ``out``."""
+    out.append(value)
+    if type(value) is dict:
+        for key, item in value.items():
+            out.append(key)
+            if type(item) is dict or type(item) is list:
+                _snapshot(item, out)
+            else:
+                out.append(item)
+    else:
+        for item in value:
+            if type(item) is dict or type(item) is list:
+                _snapshot(item, out)
+            else:
+                out.append(item)
+    out.append(_END)
+    return out
+
+
+def _copy_result(result: Any) -> Any:
+    # Callers may assign keys on the returned messages (e.g. stripping
+    # whitespace); give them their own top-level dicts
+    cls = type(result)
+    if cls is dict:
+        return result.copy()
+    if cls is list:
+        return [item.copy() if type(item) is dict else item for item in result]
+    if cls is tuple:
+        return tuple([_copy_result(item) for item in result])
+    return result
+
+
+class MessageConversionCache:
+    """LRU cache of per-message conversions.
+
+    Args:
+        max_entries: Maximum number of cached conversions
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Any]" = OrderedDict()
+        # (id(message), variant) -> (snapshot, result); the snapshot holds the
+        # message and everything in it, which keeps their ids from being reused
+        self._by_identity: "OrderedDict[Tuple[int, Hashable], Tuple[List[Any], Any]]" = OrderedDict()
+
+    def convert(self, message: Dict[str, Any], converter: Callable[[Dict[str, Any]], Any], variant: Hashable = None) -> Any:
+        """Return the conversion of ``message``, computing it on a miss.
+
+        Args:
+            message: Message to convert
+            converter: Function converting a single message
+            variant: Extra key component for conversions that depend on
+                more than the message itself (e.g. whether a tool call has an output)
+
+        Returns:
+            The converted message (top-level dicts are copies)
+        """
+        return self.convert_many([message], lambda item, _variant: converter(item), [variant])[0]
+
+    def convert_many(
+        self,
+        messages: List[Dict[str, Any]],
+        converter: Callable[[Dict[str, Any]], Any],
+        variants: Optional[List[Hashable]] = None,
+    ) -> List[Any]:
+        """Convert a list of messages, computing only the ones not cached.
+
+        Args:
+            messages: Messages to convert
+            converter: Function converting a single message; receives the
+                message and, when ``variants`` is given, its variant
+            variants: Optional extra key component per message
+
+        Returns:
+            Converted messages in order (top-level dicts are copies)
+        """
+        by_identity = self._by_identity
+        pass_variant = variants is not None
+        hits = 0
+        results = []
+        for message, variant in zip(messages, variants if pass_variant else repeat(None)):
+            identity = (id(message), variant)
+            snapshot = _snapshot(message, [])
+            entry = by_identity.get(identity)
+            # Identity hits skip the LRU bump; entries are still evicted oldest-inserted first
+            if entry is not None and entry[0] == snapshot:
+                hits += 1
+                results.append(_copy_result(entry[1]))
+                continue
+
+            result = self._lookup(message, variant, converter, pass_variant)
+            by_identity[identity] = (snapshot, result)
+            if len(by_identity) > self.max_entries:
+                by_identity.popitem(last=False)
+            results.append(_copy_result(result))
+        self.hits += hits
+        return results
+
+    def _lookup(self, message: Dict[str, Any], variant: Hashable, converter: Callable[..., Any], pass_variant: bool) -> Any:
+        key = message_key(message)
+        if key is not None:
+            result = self._entries.get((key, variant), _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end((key, variant))
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        result = converter(message, variant) if pass_variant else converter(message)
+        if key is not None:
+            self._entries[(key, variant)] = result
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached conversions."""
+        self._entries.clear()
+        self._by_identity.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
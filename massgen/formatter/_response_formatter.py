@@ -28,111 +28,120 @@ class ResponseFormatter(FormatterBase):
         - {"type": "image", "base64": "..."} → {"type": "input_image", "image_url": "data:image/...;base64,..."}
 
         Note: Assistant messages with tool_calls should not be in input - they're generated by the backend.
-        """
-        cleaned_messages = []
-        for message in messages:
-            if "status" in message and "role" not in message:
-                # Create a copy without 'status'
-                cleaned_message = {k: v for k, v in message.items() if k != "status"}
-                cleaned_messages.append(cleaned_message)
-            else:
-                cleaned_messages.append(message)
 
+        Conversions are cached per message, so repeated calls over a growing
+        history only convert the new messages.
+        """
         # Collect call_ids that have outputs
         output_call_ids = {
             msg.get("call_id") or msg.get("tool_call_id")
-            for msg in cleaned_messages
+            for msg in messages
             if (msg.get("type") == "function_call_output" or msg.get("role") == "tool") and (msg.get("call_id") or msg.get("tool_call_id"))
         }
 
+        # Whether a function call has an output elsewhere in the history changes its conversion
+        has_output = [message.get("type") != "function_call" or message.get("call_id") in output_call_ids for message in messages]
+
         converted_messages = []
+        for items in self._convert_messages(messages, self._format_message, has_output):
+            converted_messages.extend(items)
+        return converted_messages
 
-        for message in cleaned_messages:
-            if message.get("type") == "reasoning":
-                # Sanitize reasoning messages: Response API expects 'content' to be an array, not a string
-                # When reasoning is encrypted/summarized, content may be empty string ""
-                # which causes "expected an array of unknown values, but got a string" error
-                sanitized = message.copy()
-                if isinstance(sanitized.get("content"), str):
-                    content = sanitized["content"]
-                    sanitized["content"] = [] if content == "" else [{"type": "text", "text": content}]
-                converted_messages.append(sanitized)
-                continue
+    def _format_message(self, message: Dict[str, Any], has_output: bool = True) -> List[Dict[str, Any]]:
+        """
+        Convert a single message to Response API input items.
 
-            if message.get("type") == "web_search_call":
-                converted_messages.append(message)
-                continue
+        Args:
+            message: Message to convert
+            has_output: For function calls, whether the history contains their output
 
-            if message.get("type") == "message":
-                # Response API output items have type="message" with content array
-                # containing output_text items. Convert to simple assistant message format.
-                role = message.get("role", "assistant")
-                content_items = message.get("content", [])
-                # Extract text from output_text items
-                text_parts = []
-                for item in content_items:
-                    if isinstance(item, dict):
-                        if item.get("type") == "output_text":
-                            text_parts.append(item.get("text", ""))
-                        elif item.get("type") == "text":
-                            text_parts.append(item.get("text", ""))
-                    elif isinstance(item, str):
-                        text_parts.append(item)
-                combined_text = "".join(text_parts)
-                if combined_text:
-                    converted_messages.append({"role": role, "content": combined_text})
-                continue
+        Returns:
+            Zero or more Response API input items
+        """
+        if "status" in message and "role" not in message:
+            # Create a copy without 'status'
+            message = {k: v for k, v in message.items() if k != "status"}
+
+        if message.get("type") == "reasoning":
+            # Sanitize reasoning messages: Response API expects 'content' to be an array, not a string
+            # When reasoning is encrypted/summarized, content may be empty string ""
+            # which causes "expected an array of unknown values, but got a string" error
+            sanitized = message.copy()
+            if isinstance(sanitized.get("content"), str):
+                content = sanitized["content"]
+                sanitized["content"] = [] if content == "" else [{"type": "text", "text": content}]
+            return [sanitized]
+
+        if message.get("type") == "web_search_call":
+            return [message]
+
+        if message.get("type") == "message":
+            # Response API output items have type="message" with content array
+            # containing output_text items. Convert to simple assistant message format.
+            role = message.get("role", "assistant")
+            content_items = message.get("content", [])
+            # Extract text from output_text items
+            text_parts = []
+            for item in content_items:
+                if isinstance(item, dict):
+                    if item.get("type") == "output_text":
+                        text_parts.append(item.get("text", ""))
+                    elif item.get("type") == "text":
+                        text_parts.append(item.get("text", ""))
+                elif isinstance(item, str):
+                    text_parts.append(item)
+            combined_text = "".join(text_parts)
+            if combined_text:
+                return [{"role": role, "content": combined_text}]
+            return []
 
-            if message.get("role") == "tool":
-                # Convert Chat Completions tool message to Response API format
-                converted_message = {
+        if message.get("role") == "tool":
+            # Convert Chat Completions tool message to Response API format
+            return [
+                {
                     "type": "function_call_output",
                     "call_id": message.get("tool_call_id"),
                     "output": message.get("content", ""),
-                }
-                converted_messages.append(converted_message)
-            elif message.get("type") == "function_call_output":
-                # Already in Response API format - but strip any invalid fields like 'content'
-                # Response API only accepts: type, call_id, output
-                cleaned_output = {
+                },
+            ]
+        elif message.get("type") == "function_call_output":
+            # Already in Response API format - but strip any invalid fields like 'content'
+            # Response API only accepts: type, call_id, output
+            return [
+                {
                     "type": "function_call_output",
                     "call_id": message.get("call_id"),
                     "output": message.get("output", ""),
-                }
-                converted_messages.append(cleaned_output)
-            elif message.get("type") == "function_call":
-                call_id = message.get("call_id")
-                # Preserve 'id' field to maintain pairing with reasoning items (required by OpenAI Responses API)
-                # See: https://github.com/langchain-ai/langchainjs/pull/9082
-                # Only keep valid function_call fields - Response API rejects unknown fields like 'content'
-                valid_fc_fields = {"type", "name", "arguments", "call_id", "id"}
-                cleaned_fc = {k: v for k, v in message.items() if k in valid_fc_fields}
-
-                # Ensure arguments is a JSON string, not an object (Response API requirement)
-                if "arguments" in cleaned_fc and not isinstance(cleaned_fc["arguments"], str):
-                    cleaned_fc["arguments"] = json.dumps(cleaned_fc["arguments"])
-
-                if call_id and call_id not in output_call_ids:
-                    converted_messages.append(cleaned_fc)
-                    converted_messages.append(
-                        {
-                            "type": "function_call_output",
-                            "call_id": call_id,
-                            "output": "[No output recorded for this tool call]",
-                        },
-                    )
-                else:
-                    converted_messages.append(cleaned_fc)
-            elif message.get("role") == "assistant" and "tool_calls" in message:
-                # Assistant message with tool_calls - remove tool_calls when sending as input
-                cleaned_message = {k: v for k, v in message.items() if k != "tool_calls"}
-                converted_messages.append(cleaned_message)
-            else:
-                # For other message types, check for multimodal content
-                converted_message = self._convert_multimodal_content(message.copy())
-                converted_messages.append(converted_message)
-
-        return converted_messages
+                },
+            ]
+        elif message.get("type") == "function_call":
+            call_id = message.get("call_id")
+            # Preserve 'id' field to maintain pairing with reasoning items (required by OpenAI Responses API)
+            # See: https://github.com/langchain-ai/langchainjs/pull/9082
+            # Only keep valid function_call fields - Response API rejects unknown fields like 'content'
+            valid_fc_fields = {"type", "name", "arguments", "call_id", "id"}
+            cleaned_fc = {k: v for k, v in message.items() if k in valid_fc_fields}
+
+            # Ensure arguments is a JSON string, not an object (Response API requirement)
+            if "arguments" in cleaned_fc and not isinstance(cleaned_fc["arguments"], str):
+                cleaned_fc["arguments"] = json.dumps(cleaned_fc["arguments"])
+
+            if call_id and not has_output:
+                return [
+                    cleaned_fc,
+                    {
+                        "type": "function_call_output",
+                        "call_id": call_id,
+                        "output": "[No output recorded for this tool call]",
+                    },
+                ]
+            return [cleaned_fc]
+        elif message.get("role") == "assistant" and "tool_calls" in message:
+            # Assistant message with tool_calls - remove tool_calls when sending as input
+            return [{k: v for k, v in message.items() if k != "tool_calls"}]
+        else:
+            # For other message types, check for multimodal content
+            return [self._convert_multimodal_content(message.copy())]
 
     def _convert_multimodal_content(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -8,7 +8,7 @@ matching the streaming UX where newest content is visible.
 """
 
 import re
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from rich.text import Text
 from textual.events import Click
@@ -99,6 +99,36 @@ class CollapsibleTextCard(Static):
         self._refresh_pending = False
         self._refresh_timer = None
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Capture the card state so it can be rebuilt after being unmounted.
+
+        Returns:
+            Plain-data snapshot accepted by from_snapshot().
+        """
+        return {
+            "content": self._content,
+            "label": self._label,
+            "expansion_level": self._expansion_level,
+            "chunks": list(self._chunks),
+        }
+
+    @classmethod
+    def from_snapshot(cls, state: Dict[str, Any], *, id: Optional[str] = None) -> "CollapsibleTextCard":
+        """Rebuild a card from a snapshot_state() snapshot.
+
+        Args:
+            state: Snapshot returned by snapshot_state().
+            id: DOM ID for the rebuilt card.
+
+        Returns:
+            A new, unmounted CollapsibleTextCard with the captured state.
+        """
+        card = cls("", label=state["label"], id=id)
+        card._content = state["content"]
+        card._expansion_level = state["expansion_level"]
+        card._chunks = list(state["chunks"])
+        return card
+
     def on_mount(self) -> None:
         """Complete appearance animation after mounting."""
         self.set_timer(0.3, self._complete_appearance)
@@ -17,7 +17,7 @@ import re
 import time
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -28,6 +28,7 @@ from textual.widgets import RichLog, Static
 from ..content_handlers import ToolDisplayData, get_mcp_tool_name
 from ..shared.tui_debug import tui_debug_enabled, tui_log
 from .collapsible_text_card import CollapsibleTextCard
+from .timeline_window import TimelineRecord, TimelineWindow
 from .tool_batch_card import ToolBatchCard, ToolBatchItem
 from .tool_card import ToolCallCard
 
@@ -411,8 +412,10 @@ class TimelineSection(ScrollableContainer):
     # CSS moved to base.tcss for theme support
     DEFAULT_CSS = ""
 
-    # Maximum number of items to keep in timeline (prevents memory/performance issues)
-    MAX_TIMELINE_ITEMS = 30  # Viewport culling threshold
+    # Virtualized window: only this many recyclable items are mounted at once
+    MAX_TIMELINE_ITEMS = 30  # Mounted window size (banners and pinned widgets don't count)
+    WINDOW_PAGE_ITEMS = 10  # Items remounted per page when scrolling past the window edge
+    WINDOW_EDGE_LINES = 2  # Distance from the window edge (in lines) that triggers paging
     SCROLL_DEBOUNCE_MS = 25  # Minimum gap between scroll operations (reduced for responsiveness)
     SCROLL_ANIMATION_THRESHOLD_MS = 300  # Threshold for animation vs instant scroll
 
@@ -428,8 +431,11 @@ class TimelineSection(ScrollableContainer):
         # Scroll mode: when True, auto-scroll is paused (user is reading history)
         self._scroll_mode = False
         self._new_content_count = 0  # Count of new items since entering scroll mode
-        # Removed widgets cache for scroll-back (widget ID -> widget)
-        self._removed_widgets: Dict[str, any] = {}
+        # Virtualized items: records for every item, widgets only for the mounted window
+        self._window = TimelineWindow(self.MAX_TIMELINE_ITEMS)
+        self._evicted_tools: Dict[str, str] = {}  # tool_id -> widget_id of unmounted card
+        self._evicted_batches: Dict[str, str] = {}  # batch_id -> widget_id of unmounted card
+        self._window_shift_pending = False
         self._truncation_shown = False  # Track if we've shown truncation message
         # Phase 12: View-based round navigation
         self._viewed_round: int = 1  # Which round is currently being displayed
@@ -622,7 +628,7 @@ class TimelineSection(ScrollableContainer):
                     self._scroll_mode = True
                     self._new_content_count = 0
                     self._update_scroll_indicator()
-        elif at_bottom and self._user_scrolled_up:
+        elif at_bottom and self._user_scrolled_up and not self._window.has_hidden_after():
             # User scrolled to bottom - exit scroll mode
             self._user_scrolled_up = False
             if self._scroll_mode:
@@ -630,6 +636,13 @@ class TimelineSection(ScrollableContainer):
                 self._new_content_count = 0
                 self._update_scroll_indicator()
 
+        # Page unmounted history in when the user scrolls into an edge of the window.
+        # The direction check ignores clamping after content above/below is evicted.
+        if new_value < old_value and new_value <= self.WINDOW_EDGE_LINES and self._window.has_hidden_before():
+            self._shift_window(older=True)
+        elif new_value > old_value and new_value >= self.max_scroll_y - self.WINDOW_EDGE_LINES and self._window.has_hidden_after():
+            self._shift_window(older=False)
+
     def refresh_scrollbar(self) -> None:
         """Force refresh of the vertical scrollbar.
 
@@ -779,6 +792,8 @@ class TimelineSection(ScrollableContainer):
         self._scroll_mode = False
         self._new_content_count = 0
         self.reset_scroll_mode()  # Reset scroll state
+        self._window.anchor_to_tail()
+        self._reconcile_window()
         self._scroll_to_end(animate=False, force=True)
         self._update_scroll_indicator()
 
@@ -788,6 +803,11 @@ class TimelineSection(ScrollableContainer):
         Args:
             widget_id: The ID of the widget to scroll to (without #)
         """
+        index = self._window.index_of(widget_id)
+        if index is not None and self._bring_into_window(index):
+            # Rebuilt widgets need a layout pass before they can be scrolled to
+            self.call_after_refresh(lambda: self.scroll_to_widget(widget_id))
+            return
         try:
             # Find the widget by ID (content is mounted directly in TimelineSection)
             target = self.query_one(f"#{widget_id}")
@@ -969,68 +989,214 @@ class TimelineSection(ScrollableContainer):
                 pass
 
     def _trim_old_items(self) -> None:
-        """ARCH-001: Cull items outside viewport using visibility toggling.
+        """ARCH-001: Keep only the virtualized window of items mounted.
 
-        Instead of removing items from DOM, we hide them with CSS display:none.
-        This preserves scroll-back capability and tool state while maintaining
-        performance by not rendering hidden items.
+        While following live output the window tracks the newest
+        MAX_TIMELINE_ITEMS items; older items are unmounted and kept as
+        lightweight records that are rebuilt when scrolled back into view.
+        In scroll mode the window stays where the user left it.
         """
-        try:
-            children = list(self.children)
+        if not self._scroll_mode:
+            self._window.anchor_to_tail()
+        self._reconcile_window()
 
-            # Skip special UI elements and keep banners out of culling
-            content_children = [c for c in children if "scroll-indicator" not in c.classes and "truncation-notice" not in c.classes]
-            prunable_children = []
-            for child in content_children:
-                if isinstance(child, (RestartBanner, AttemptBanner)):
-                    continue
-                prunable_children.append(child)
+    # === Virtualization ===
 
-            total_items = len(prunable_children)
+    def _register_item(
+        self,
+        widget: Any,
+        kind: str,
+        round_number: int,
+        *,
+        state: Optional[Dict[str, Any]] = None,
+        pinned: bool = False,
+        before: Optional[Any] = None,
+        after: Optional[Any] = None,
+    ) -> None:
+        """Record a freshly mounted item so it can be recycled later.
 
-            self._log(f"[TRIM] Starting trim: total_items={total_items}, MAX={self.MAX_TIMELINE_ITEMS}, max_scroll_y_before={self.max_scroll_y:.2f}")
+        Args:
+            widget: The mounted widget
+            kind: Rebuild strategy ("tool", "batch", "reasoning", "static") or
+                any other label for pinned widgets
+            round_number: Round the item belongs to
+            state: Constructor data for "static" items
+            pinned: Keep the item mounted permanently (banners, opaque widgets)
+            before: Widget the item was mounted before, if any
+            after: Widget the item was mounted after, if any
+        """
+        if not widget.id:
+            return  # Anonymous widgets can't be rebuilt or navigated to; leave them mounted
+        record = TimelineRecord(
+            widget_id=widget.id,
+            kind=kind,
+            round_number=round_number,
+            pinned=pinned,
+            state=state or {},
+            widget=widget,
+        )
+        self._window.insert(
+            record,
+            before_id=getattr(before, "id", None),
+            after_id=getattr(after, "id", None),
+        )
 
-            # If under limit, restore any removed items
-            if total_items <= self.MAX_TIMELINE_ITEMS:
-                # Check if we have removed widgets to restore
-                if self._removed_widgets:
-                    self._log(f"[TRIM] Under limit, restoring {len(self._removed_widgets)} removed widgets")
-                    # Note: Restoring would require preserving original order, which is complex
-                    # For now, just clear the cache when we go back under limit
-                    # In practice, items rarely go back under the limit
-                return
+    def _must_stay_mounted(self, record: TimelineRecord) -> bool:
+        """Whether a record outside the window still needs its live widget."""
+        widget = record.widget
+        if widget is self._current_reasoning_card:
+            return True  # Still streaming
+        if record.kind == "tool":
+            return getattr(widget, "status", None) in ("running", "background")
+        if record.kind == "batch":
+            return "status-running" in widget.classes
+        return False
 
-            # Calculate how many to hide
-            items_to_hide = total_items - self.MAX_TIMELINE_ITEMS
+    def _reconcile_window(self) -> None:
+        """Unmount records that left the window and rebuild records that entered it."""
+        to_evict, to_mount = self._window.plan(keep=self._must_stay_mounted)
+        if not to_evict and not to_mount:
+            return
+        self._log(f"[WINDOW] lo={self._window.lo} hi={self._window.hi} records={len(self._window)} evict={len(to_evict)} mount={len(to_mount)}")
+        child_ids = {child.id for child in self.children}
+        retry = False
+        for record in to_evict:
+            self._evict_record(record)
+        for record in to_mount:
+            if record.widget_id in child_ids:
+                # Previous instance is still being removed; try again next frame
+                retry = True
+                continue
+            self._restore_record(record)
+        if retry:
+            self.call_after_refresh(self._reconcile_window)
+
+    def _snapshot_widget(self, record: TimelineRecord, widget: Any) -> None:
+        """Store the widget's state and CSS classes on its record."""
+        if record.kind != "static":
+            record.state = widget.snapshot_state()
+        record.state["classes"] = [cls for cls in widget.classes if cls != "appearing"]
+
+    def _build_widget(self, record: TimelineRecord) -> Any:
+        """Create an unmounted widget from a record's snapshot."""
+        if record.kind == "tool":
+            widget = ToolCallCard.from_snapshot(record.state, id=record.widget_id)
+        elif record.kind == "batch":
+            widget = ToolBatchCard.from_snapshot(record.state, id=record.widget_id)
+        elif record.kind == "reasoning":
+            widget = CollapsibleTextCard.from_snapshot(record.state, id=record.widget_id)
+        else:
+            widget = Static(record.state["content"], id=record.widget_id)
+        widget.set_classes(record.state.get("classes", ()))
+        return widget
+
+    def _evict_record(self, record: TimelineRecord) -> None:
+        """Unmount a record's widget, keeping only its snapshot."""
+        widget = record.widget
+        self._snapshot_widget(record, widget)
+        if record.kind == "tool" and self._tools.get(widget.call_id) is widget:
+            del self._tools[widget.call_id]
+            self._evicted_tools[widget.call_id] = record.widget_id
+        elif record.kind == "batch":
+            for batch_id, card in list(self._batches.items()):
+                if card is widget:
+                    del self._batches[batch_id]
+                    self._evicted_batches[batch_id] = record.widget_id
+        record.widget = None
+        try:
+            widget.remove()
+        except Exception as e:
+            tui_log(f"[ContentSections] {e}")
 
-            if items_to_hide <= 0:
-                return
+    def _restore_record(self, record: TimelineRecord) -> None:
+        """Rebuild and mount a record's widget in its display position."""
+        widget = self._build_widget(record)
+        if self._answer_lock_mode:
+            widget.add_class("answer-lock-hidden")
+        successor = self._window.next_mounted(record)
+        before = successor.widget if successor is not None else None
+        if before is None:
+            for child in self.query("#winner_hint"):
+                before = child
+        try:
+            self.mount(widget, before=before)
+        except Exception as e:
+            tui_log(f"[ContentSections] {e}")
+            return
+        record.widget = widget
+        if record.kind != "static":
+            record.state = {}  # The live widget is the source of truth again
+        if record.kind == "tool" and self._evicted_tools.get(widget.call_id) == record.widget_id:
+            del self._evicted_tools[widget.call_id]
+            self._tools[widget.call_id] = widget
+        elif record.kind == "batch":
+            for batch_id, widget_id in list(self._evicted_batches.items()):
+                if widget_id == record.widget_id:
+                    del self._evicted_batches[batch_id]
+                    self._batches[batch_id] = widget
+
+    def _update_evicted(self, widget_id: str, apply: Callable[[Any], None]) -> bool:
+        """Apply an update to an unmounted item by round-tripping its snapshot.
+
+        Args:
+            widget_id: Widget ID of the evicted record
+            apply: Callable receiving a detached widget rebuilt from the snapshot
 
-            self._log(f"[TRIM] Hiding {items_to_hide} items (keeping {self.MAX_TIMELINE_ITEMS})")
+        Returns:
+            True if the record exists and was updated.
+        """
+        record = self._window.get(widget_id)
+        if record is None or record.is_mounted:
+            return False
+        widget = self._build_widget(record)
+        apply(widget)
+        self._snapshot_widget(record, widget)
+        return True
 
-            # Remove oldest items from DOM (but keep in cache for scroll-back)
-            hidden_count = 0
-            for child in prunable_children[:items_to_hide]:
-                # Don't hide tool cards that are still running
-                if hasattr(child, "tool_id") and child.tool_id in self._tools:
-                    tool_card = self._tools.get(child.tool_id)
-                    if tool_card and hasattr(tool_card, "_status") and tool_card._status == "running":
-                        self._log(f"[TRIM] Skipping running tool: {child.tool_id}")
-                        continue
+    def _bring_into_window(self, index: int) -> bool:
+        """Move the window so the record at ``index`` is mounted.
 
-                # Actually remove from DOM to free up space
-                # Cache it for potential scroll-back restoration
-                if child.id and child in self.children:
-                    self._removed_widgets[child.id] = child
-                    child.remove()
-                    hidden_count += 1
+        Returns:
+            True if widgets had to be rebuilt (caller should wait for a refresh).
+        """
+        record = self._window[index]
+        following = self._window[index + 1] if index + 1 < len(self._window) else None
+        if record.is_mounted and (following is None or following.is_mounted):
+            return False  # Already on screen (for banners: together with their content)
+        self._window.anchor_around(index)
+        if not self._window.follow_tail:
+            # Navigating into history: hold the window until the user returns
+            self._scroll_mode = True
+            self._user_scrolled_up = True
+            self._update_scroll_indicator()
+        # Layout shifts from the swap are not user scrolls; don't let them page the window
+        self._auto_scrolling = True
+        self._reconcile_window()
+        self.set_timer(0.3, self._reset_auto_scroll)
+        return True
 
-            # Note: We don't need to "show" remaining items since they're already in DOM
+    def _shift_window(self, older: bool) -> None:
+        """Page the window one step towards older or newer items, keeping the view steady."""
+        if self._window_shift_pending:
+            return
+        mounted = [record for record in self._window if record.is_mounted and not record.pinned]
+        if not mounted:
+            return
+        anchor = mounted[0].widget if older else mounted[-1].widget
+        moved = self._window.page_up(self.WINDOW_PAGE_ITEMS) if older else self._window.page_down(self.WINDOW_PAGE_ITEMS)
+        if not moved:
+            return
+        offset = anchor.virtual_region.y - self.scroll_y
+        self._window_shift_pending = True
+        self._auto_scrolling = True
+        self._reconcile_window()
 
-            self._log(f"[TRIM] Actually hid {hidden_count} items")
+        def restore_position() -> None:
+            self._window_shift_pending = False
+            self.scroll_to(y=max(0, anchor.virtual_region.y - offset), animate=False)
+            self.set_timer(0.1, self._reset_auto_scroll)
 
-        except Exception as e:
-            self._log(f"[TRIM] Exception: {e}")
+        self.call_after_refresh(restore_position)
 
     def add_tool(self, tool_data: ToolDisplayData, round_number: int = 1) -> ToolCallCard:
         """Add a tool card to the timeline.
@@ -1080,6 +1246,7 @@ class TimelineSection(ScrollableContainer):
         try:
             insert_before = self._find_insert_before_for_round(round_number)
             self.mount(card, before=insert_before)
+            self._register_item(card, "tool", round_number, before=insert_before)
 
             # Defer trim and scroll until after mount completes
             def trim_and_scroll():
@@ -1099,7 +1266,7 @@ class TimelineSection(ScrollableContainer):
             tool_id: Tool ID to update
             tool_data: Updated tool data
         """
-        if tool_id not in self._tools:
+        if tool_id not in self._tools and tool_id not in self._evicted_tools:
             return
         try:
             from massgen.frontend.displays.timeline_transcript import record_tool
@@ -1109,8 +1276,16 @@ class TimelineSection(ScrollableContainer):
         except Exception as e:
             tui_log(f"[ContentSections] {e}")
 
-        card = self._tools[tool_id]
+        if tool_id in self._evicted_tools:
+            # Card is outside the mounted window; update its snapshot instead
+            self._update_evicted(self._evicted_tools[tool_id], lambda card: self._apply_tool_update(card, tool_data))
+            return
+
+        self._apply_tool_update(self._tools[tool_id], tool_data)
+        self._auto_scroll()
 
+    def _apply_tool_update(self, card: ToolCallCard, tool_data: ToolDisplayData) -> None:
+        """Apply args/result/error from tool data to a tool card."""
         # Apply args if available and not already set on card
         if tool_data.args_full and not card._params_full:
             args_summary = tool_data.args_summary or (tool_data.args_full[:77] + "..." if len(tool_data.args_full) > 80 else tool_data.args_full)
@@ -1127,12 +1302,14 @@ class TimelineSection(ScrollableContainer):
                 tool_data.async_id,
             )
 
-        self._auto_scroll()
-
     def get_tool(self, tool_id: str) -> Optional[ToolCallCard]:
-        """Get a tool card by ID."""
+        """Get a mounted tool card by ID."""
         return self._tools.get(tool_id)
 
+    def has_tool(self, tool_id: str) -> bool:
+        """Check whether a tool card exists, mounted or recycled out of the window."""
+        return tool_id in self._tools or tool_id in self._evicted_tools
+
     def get_running_tools_count(self) -> int:
         """Count tools that are currently running or running in background."""
         return sum(1 for card in self._tools.values() if card.status in ("running", "background"))
@@ -1202,6 +1379,7 @@ class TimelineSection(ScrollableContainer):
         try:
             insert_before = self._find_insert_before_for_round(round_number)
             self.mount(card, before=insert_before)
+            self._register_item(card, "batch", round_number, before=insert_before)
 
             # Defer trim and scroll until after mount completes
             def trim_and_scroll():
@@ -1267,10 +1445,9 @@ class TimelineSection(ScrollableContainer):
             True if tool was found and updated, False otherwise
         """
         batch_id = self._tool_to_batch.get(tool_id)
-        if not batch_id or batch_id not in self._batches:
+        if not batch_id or (batch_id not in self._batches and batch_id not in self._evicted_batches):
             return False
 
-        batch_card = self._batches[batch_id]
         mcp_tool_name = get_mcp_tool_name(tool_data.tool_name) or tool_data.tool_name
 
         # Calculate elapsed time
@@ -1295,8 +1472,12 @@ class TimelineSection(ScrollableContainer):
             elapsed_seconds=elapsed_seconds,
         )
 
-        batch_card.update_tool(tool_id, item)
-        self._auto_scroll()
+        if batch_id in self._evicted_batches:
+            # Batch is outside the mounted window; update its snapshot instead
+            self._update_evicted(self._evicted_batches[batch_id], lambda card: card.update_tool(tool_id, item))
+        else:
+            self._batches[batch_id].update_tool(tool_id, item)
+            self._auto_scroll()
         try:
             from massgen.frontend.displays.timeline_transcript import record_batch_tool
 
@@ -1401,7 +1582,9 @@ class TimelineSection(ScrollableContainer):
         # Mount batch card right after the existing tool card, then remove the old card
         try:
             self.mount(batch_card, after=existing_card)
+            self._register_item(batch_card, "batch", round_number, after=existing_card)
             existing_card.remove()
+            self._window.remove(existing_card.id)
             del self._tools[pending_tool_id]
 
             # Defer trim and scroll until after mount completes
@@ -1435,6 +1618,10 @@ class TimelineSection(ScrollableContainer):
         tool_card = None
         if tool_call_id:
             tool_card = self._tools.get(tool_call_id)
+            if tool_card is None and tool_call_id in self._evicted_tools:
+                # Card is outside the mounted window; attach the hook to its snapshot
+                self._update_evicted(self._evicted_tools[tool_call_id], lambda card: self._attach_hook(card, hook_info))
+                return
 
         # If no specific tool_id, attach to the most recent tool
         if not tool_card and self._tools:
@@ -1450,29 +1637,33 @@ class TimelineSection(ScrollableContainer):
         )
 
         if tool_card:
-            hook_type = hook_info.get("hook_type", "pre")
-            hook_name = hook_info.get("hook_name", "unknown")
-            decision = hook_info.get("decision", "allow")
-            reason = hook_info.get("reason")
-            injection_preview = hook_info.get("injection_preview")
-            injection_content = hook_info.get("injection_content")
-            execution_time_ms = hook_info.get("execution_time_ms")
-
-            if hook_type == "pre":
-                tool_card.add_pre_hook(
-                    hook_name=hook_name,
-                    decision=decision,
-                    reason=reason,
-                    execution_time_ms=execution_time_ms,
-                    injection_content=injection_content,
-                )
-            else:
-                tool_card.add_post_hook(
-                    hook_name=hook_name,
-                    injection_preview=injection_preview,
-                    execution_time_ms=execution_time_ms,
-                    injection_content=injection_content,
-                )
+            self._attach_hook(tool_card, hook_info)
+
+    def _attach_hook(self, tool_card: ToolCallCard, hook_info: dict) -> None:
+        """Add a pre/post hook entry from hook_info to a tool card."""
+        hook_type = hook_info.get("hook_type", "pre")
+        hook_name = hook_info.get("hook_name", "unknown")
+        decision = hook_info.get("decision", "allow")
+        reason = hook_info.get("reason")
+        injection_preview = hook_info.get("injection_preview")
+        injection_content = hook_info.get("injection_content")
+        execution_time_ms = hook_info.get("execution_time_ms")
+
+        if hook_type == "pre":
+            tool_card.add_pre_hook(
+                hook_name=hook_name,
+                decision=decision,
+                reason=reason,
+                execution_time_ms=execution_time_ms,
+                injection_content=injection_content,
+            )
+        else:
+            tool_card.add_post_hook(
+                hook_name=hook_name,
+                injection_preview=injection_preview,
+                execution_time_ms=execution_time_ms,
+                injection_content=injection_content,
+            )
 
     def add_text(self, content: str, style: str = "", text_class: str = "", round_number: int = 1) -> None:
         """Add text content to the timeline.
@@ -1539,6 +1730,8 @@ class TimelineSection(ScrollableContainer):
 
             insert_before = self._find_insert_before_for_round(round_number)
             self.mount(widget, before=insert_before)
+            renderable = Text(content, style=style) if style else content
+            self._register_item(widget, "static", round_number, state={"content": renderable}, before=insert_before)
 
             # Defer trim and scroll until after mount completes
             def trim_and_scroll():
@@ -1594,6 +1787,7 @@ class TimelineSection(ScrollableContainer):
             is_restart = "RESTART" in label.upper() if label else False
             is_final = "FINAL" in label.upper() if label else False
 
+            separator_text = None
             if is_round or is_restart or is_final:
                 # Create prominent round/restart/final banner
                 widget = RestartBanner(label=label, subtitle=subtitle, id=widget_id)
@@ -1606,12 +1800,18 @@ class TimelineSection(ScrollableContainer):
                     sep_text.append(f" {label} ", style="dim italic")
                     sep_text.append("─" * 10, style="dim")
                 widget = Static(sep_text, id=widget_id)
+                separator_text = sep_text
 
             # Tag with round class for navigation (scroll-to behavior)
             widget.add_class(f"round-{round_number}")
             logger.debug(f"TimelineSection.add_separator: Adding widget for round {round_number}")
 
             self.mount(widget, before=before, after=after)
+            if separator_text is None:
+                # Banners stay mounted so round navigation always has a target
+                self._register_item(widget, "banner", round_number, pinned=True, before=before, after=after)
+            else:
+                self._register_item(widget, "static", round_number, state={"content": separator_text}, before=before, after=after)
 
             if label.startswith("Round "):
                 self._pending_round_separators.discard(round_number)
@@ -1676,6 +1876,7 @@ class TimelineSection(ScrollableContainer):
             )
             widget.add_class(f"round-{round_number}")
             self.mount(widget)
+            self._register_item(widget, "banner", round_number, pinned=True)
 
             def trim_and_scroll():
                 self._trim_old_items()
@@ -1752,6 +1953,7 @@ class TimelineSection(ScrollableContainer):
                 self._current_batch_label = label
                 insert_before = self._find_insert_before_for_round(round_number)
                 self.mount(self._current_reasoning_card, before=insert_before)
+                self._register_item(self._current_reasoning_card, "reasoning", round_number, before=insert_before)
 
                 # Defer trim and scroll until after mount completes
                 def trim_and_scroll():
@@ -1780,6 +1982,8 @@ class TimelineSection(ScrollableContainer):
         try:
             insert_before = self._find_insert_before_for_round(round_number)
             self.mount(widget, before=insert_before)
+            # Arbitrary widgets can't be rebuilt from a snapshot; keep them mounted
+            self._register_item(widget, "widget", round_number, pinned=True, before=insert_before)
             self._log(f"Timeline items: {len(list(self.children))}")
             self._trim_old_items()  # Keep timeline size bounded (do before scroll)
             # Defer scroll to ensure trim's layout refresh completes first
@@ -1819,7 +2023,9 @@ class TimelineSection(ScrollableContainer):
         self._batches.clear()  # Also clear batch tracking
         self._tool_to_batch.clear()  # Clear tool-to-batch mapping
         self._tool_rounds.clear()
-        self._removed_widgets.clear()  # Clear removed widgets cache
+        self._window.clear()  # Drop virtualized records
+        self._evicted_tools.clear()
+        self._evicted_batches.clear()
         # Preserve _item_count so widget IDs remain globally unique across turns.
         logger.info(f"[TimelineSection] Cleared tracking dicts; _item_count remains {self._item_count}")
         # Reset truncation tracking to avoid stale state
@@ -1865,6 +2071,8 @@ class TimelineSection(ScrollableContainer):
         self._tools.clear()
         self._batches.clear()
         self._tool_to_batch.clear()
+        self._evicted_tools.clear()
+        self._evicted_batches.clear()
 
         logger.info(f"[TimelineSection] After reset: _viewed_round={self._viewed_round}, _round_1_shown={self._round_1_shown}")
 
@@ -1878,6 +2086,8 @@ class TimelineSection(ScrollableContainer):
         self._tools.clear()
         self._batches.clear()
         self._tool_to_batch.clear()
+        self._evicted_tools.clear()
+        self._evicted_batches.clear()
 
     def set_viewed_round(self, round_number: int) -> None:
         """Update which round is currently being viewed.
@@ -1905,6 +2115,12 @@ class TimelineSection(ScrollableContainer):
 
         logger.debug(f"TimelineSection.switch_to_round: scrolling to round {round_number}")
 
+        index = self._window.first_index_for_round(round_number, prefer_kind="banner")
+        if index is not None and self._bring_into_window(index):
+            # Round content was recycled; scroll once the rebuilt widgets are laid out
+            self.call_after_refresh(lambda: self.switch_to_round(round_number))
+            return
+
         try:
             # Find the RestartBanner for this round and scroll to it
             # RestartBanners are tagged with round-X class
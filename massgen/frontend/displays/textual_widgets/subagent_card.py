@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import json
 import time
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -23,6 +22,7 @@ from textual.message import Message
 from textual.timer import Timer
 from textual.widgets import Static
 
+from massgen.events import EventReader, resolve_events_file
 from massgen.frontend.displays.content_handlers import format_tool_display_name
 from massgen.subagent.models import SubagentDisplayData, SubagentResult
 
@@ -32,12 +32,14 @@ class _ToolCache:
     path: Optional[Path]
     size: int
     tools: List[str]
+    # Kept across polls so only index records appended since the last poll are parsed
+    reader: Optional[EventReader] = None
 
 
 @dataclass
 class _PlanCache:
     path: Optional[Path]
-    mtime: float
+    mtime: Any
     summary: Optional[str]
 
 
@@ -445,6 +447,11 @@ class SubagentCard(Vertical, can_focus=True):
         return status_label
 
     def _get_plan_summary(self, sa: SubagentDisplayData) -> Optional[str]:
+        from massgen.mcp_tools.planning.plan_store import (
+            change_log_path,
+            load_plan_data,
+        )
+
         if not sa.workspace_path:
             return None
         workspace = Path(sa.workspace_path)
@@ -456,6 +463,11 @@ class SubagentCard(Vertical, can_focus=True):
             mtime = plan_path.stat().st_mtime
         except (OSError, IOError):
             return None
+        try:
+            # Pending status updates live in the plan's append-only change log
+            mtime = (mtime, change_log_path(plan_path).stat().st_mtime)
+        except (OSError, IOError):
+            pass
 
         cached = self._plan_cache.get(sa.id)
         if cached and cached.path == plan_path and cached.mtime == mtime:
@@ -463,7 +475,7 @@ class SubagentCard(Vertical, can_focus=True):
 
         summary = None
         try:
-            data = json.loads(plan_path.read_text())
+            data = load_plan_data(plan_path)
             tasks = data.get("tasks", []) if isinstance(data, dict) else []
             total = len(tasks)
             if total > 0:
@@ -489,8 +501,9 @@ class SubagentCard(Vertical, can_focus=True):
         if cached and cached.path == events_path and cached.size == size:
             return cached.tools
 
-        tools = self._extract_tools_from_events(events_path)
-        self._tool_cache[sa.id] = _ToolCache(path=events_path, size=size, tools=tools)
+        reader = cached.reader if cached and cached.path == events_path and cached.reader else EventReader(events_path)
+        tools = self._extract_tools_from_events(reader)
+        self._tool_cache[sa.id] = _ToolCache(path=events_path, size=size, tools=tools, reader=reader)
         return tools
 
     def _resolve_events_path(self, sa: SubagentDisplayData) -> Optional[Path]:
@@ -502,31 +515,20 @@ class SubagentCard(Vertical, can_focus=True):
         if log_path.is_dir():
             resolved = SubagentResult.resolve_events_path(log_path)
             return Path(resolved) if resolved else None
-        return log_path
+        return resolve_events_file(log_path) or log_path
 
-    def _extract_tools_from_events(self, path: Path, max_tools: int = 3) -> List[str]:
+    def _extract_tools_from_events(self, reader: EventReader, max_tools: int = 3) -> List[str]:
         try:
-            tail_lines: deque[str] = deque(maxlen=200)
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    if line.strip():
-                        tail_lines.append(line)
+            # The events index lets us parse only the most recent stream chunks
+            recent_chunks = reader.filter_events(event_types=["stream_chunk"], limit=200)
         except (OSError, IOError):
             return []
 
         tools: List[str] = []
         seen: set[str] = set()
 
-        for line in reversed(tail_lines):
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if event.get("event_type") != "stream_chunk":
-                continue
-
-            chunk = (event.get("data") or {}).get("chunk") or {}
+        for event in reversed(recent_chunks):
+            chunk = event.data.get("chunk") or {}
             if chunk.get("type") != "tool_calls":
                 continue
 
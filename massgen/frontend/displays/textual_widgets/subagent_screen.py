@@ -44,7 +44,7 @@ from textual.screen import ModalScreen, Screen
 from textual.timer import Timer
 from textual.widgets import Button, Static
 
-from massgen.events import EventReader, MassGenEvent
+from massgen.events import EventReader, MassGenEvent, resolve_events_file
 from massgen.subagent.models import SubagentDisplayData, SubagentResult
 
 from ..base_tui_layout import BaseTUILayoutMixin
@@ -958,7 +958,7 @@ class SubagentView(Container):
                 if resolved:
                     return Path(resolved)
             else:
-                return log_path
+                return resolve_events_file(log_path) or log_path
 
         # 2) Fall back to current session log dir
         try:
@@ -987,7 +987,7 @@ class SubagentView(Container):
 
         # Advance reader to end so polling only reads new events
         try:
-            self._event_reader._last_position = self._event_reader._file_path.stat().st_size  # type: ignore[attr-defined]
+            self._event_reader.skip_to_end()
         except Exception as e:
             tui_log(f"[SubagentScreen] {e}")
 
@@ -23,7 +23,7 @@ from textual.screen import ModalScreen
 from textual.timer import Timer
 from textual.widgets import Button, Markdown, Static
 
-from massgen.events import EventReader, MassGenEvent
+from massgen.events import EventReader, MassGenEvent, resolve_events_file
 from massgen.logger_config import get_log_session_dir
 from massgen.subagent.models import SubagentDisplayData
 
@@ -278,8 +278,9 @@ class SubagentTuiModal(ModalScreen[None]):
                 for log_subdir in sorted(log_subdirs, reverse=True):
                     candidate = log_subdir / "turn_1" / "attempt_1" / "events.jsonl"
                     debug_lines.append(f"checking candidate: {candidate}")
-                    if candidate.exists():
-                        events_file = candidate
+                    resolved = resolve_events_file(candidate)
+                    if resolved:
+                        events_file = resolved
                         debug_lines.append(f"FOUND events_file (live_logs): {events_file}")
                         break
 
@@ -291,8 +292,9 @@ class SubagentTuiModal(ModalScreen[None]):
                 if full_logs.exists():
                     candidate = full_logs / "turn_1" / "attempt_1" / "events.jsonl"
                     debug_lines.append(f"checking full_logs candidate: {candidate}")
-                    if candidate.exists():
-                        events_file = candidate
+                    resolved = resolve_events_file(candidate)
+                    if resolved:
+                        events_file = resolved
                         debug_lines.append(f"FOUND events_file (full_logs): {events_file}")
 
         except Exception as e:
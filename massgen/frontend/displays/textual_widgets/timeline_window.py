@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Virtualized window bookkeeping for the TimelineSection.
+
+Every timeline item is kept as a lightweight ``TimelineRecord`` in display
+order. Only the records inside the current window (plus pinned records such
+as round banners) are mounted as Textual widgets; records outside the window
+hold a state snapshot that is used to rebuild the widget when the user
+scrolls back to it or navigates to its round.
+
+```
+records:  [b1] t1 t2 t3 [b2] t4 t5 t6 t7 t8 t9
+window:                  lo ^^^^^^^^^^^^^^^^ hi
+mounted:  [b1]          [b2] t4 t5 t6 t7 t8 t9     (banners are pinned)
+```
+
+This module is pure bookkeeping with no Textual dependency so the window
+arithmetic can be tested in isolation.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class TimelineRecord:
+    """A single timeline item, mounted or not.
+
+    Attributes:
+        widget_id: DOM ID used whenever the item is mounted (stable across rebuilds).
+        kind: Item kind used to pick a rebuild strategy ("tool", "batch", "reasoning", "static", ...).
+        round_number: Round the item belongs to (for round navigation).
+        pinned: Pinned records are never evicted (banners, widgets that cannot be rebuilt).
+        state: Snapshot used to rebuild the widget while it is not mounted.
+        widget: The mounted widget, or None while the record is evicted.
+    """
+
+    widget_id: str
+    kind: str
+    round_number: int = 1
+    pinned: bool = False
+    state: Dict[str, Any] = field(default_factory=dict)
+    widget: Any = None
+
+    @property
+    def is_mounted(self) -> bool:
+        return self.widget is not None
+
+
+class TimelineWindow:
+    """Ordered timeline records and the window of records that should be mounted.
+
+    The window is a half-open index range ``[lo, hi)`` over the record list.
+    Its size is measured in *recyclable* records only: pinned records are
+    always mounted and do not count against the budget.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("Timeline window size must be at least 1")
+        self.size = size
+        self._records: List[TimelineRecord] = []
+        self._by_id: Dict[str, TimelineRecord] = {}
+        self.lo = 0
+        self.hi = 0
+        # When True the window tracks the end of the timeline as items arrive
+        self.follow_tail = True
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[TimelineRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> TimelineRecord:
+        return self._records[index]
+
+    def get(self, widget_id: Optional[str]) -> Optional[TimelineRecord]:
+        """Get a record by widget ID."""
+        if widget_id is None:
+            return None
+        return self._by_id.get(widget_id)
+
+    def index_of(self, widget_id: str) -> Optional[int]:
+        """Get the display index of a record, or None if unknown."""
+        record = self._by_id.get(widget_id)
+        if record is None:
+            return None
+        return self._records.index(record)
+
+    def insert(
+        self,
+        record: TimelineRecord,
+        *,
+        before_id: Optional[str] = None,
+        after_id: Optional[str] = None,
+    ) -> int:
+        """Insert a record, mirroring ``mount(before=..., after=...)`` placement.
+
+        Args:
+            record: Record to insert (replaces any record with the same widget_id)
+            before_id: Insert before the record with this widget ID
+            after_id: Insert after the record with this widget ID
+
+        Returns:
+            The index the record was inserted at.
+        """
+        if record.widget_id in self._by_id:
+            self.remove(record.widget_id)
+
+        index = len(self._records)
+        anchor_before = self.index_of(before_id) if before_id else None
+        anchor_after = self.index_of(after_id) if after_id else None
+        if anchor_before is not None:
+            index = anchor_before
+        elif anchor_after is not None:
+            index = anchor_after + 1
+
+        self._records.insert(index, record)
+        self._by_id[record.widget_id] = record
+
+        # Keep the window covering the same records; items arriving at the
+        # tail extend the window while it follows the tail.
+        if index < self.lo:
+            self.lo += 1
+            self.hi += 1
+        elif index < self.hi or (index == self.hi and self.follow_tail):
+            self.hi += 1
+        return index
+
+    def remove(self, widget_id: str) -> Optional[TimelineRecord]:
+        """Remove a record entirely (e.g. a tool card replaced by a batch)."""
+        record = self._by_id.pop(widget_id, None)
+        if record is None:
+            return None
+        index = self._records.index(record)
+        del self._records[index]
+        if index < self.lo:
+            self.lo -= 1
+        if index < self.hi:
+            self.hi -= 1
+        return record
+
+    def clear(self) -> None:
+        """Drop all records and reset the window."""
+        self._records.clear()
+        self._by_id.clear()
+        self.lo = 0
+        self.hi = 0
+        self.follow_tail = True
+
+    def _count_recyclable(self, lo: int, hi: int) -> int:
+        return sum(1 for record in self._records[lo:hi] if not record.pinned)
+
+    def _extend_back(self, hi: int, budget: int) -> int:
+        """Walk back from ``hi`` until ``budget`` recyclable records are covered."""
+        lo = hi
+        while lo > 0 and budget > 0:
+            lo -= 1
+            if not self._records[lo].pinned:
+                budget -= 1
+        # Include pinned records directly above the window (e.g. the round banner)
+        while lo > 0 and self._records[lo - 1].pinned:
+            lo -= 1
+        return lo
+
+    def _extend_forward(self, lo: int, budget: int) -> int:
+        """Walk forward from ``lo`` until ``budget`` recyclable records are covered."""
+        hi = lo
+        while hi < len(self._records) and budget > 0:
+            if not self._records[hi].pinned:
+                budget -= 1
+            hi += 1
+        return hi
+
+    def anchor_to_tail(self) -> Tuple[int, int]:
+        """Move the window to the newest ``size`` recyclable records."""
+        self.follow_tail = True
+        self.hi = len(self._records)
+        self.lo = self._extend_back(self.hi, self.size)
+        return self.lo, self.hi
+
+    def anchor_around(self, index: int, margin: int = 0) -> Tuple[int, int]:
+        """Move the window so it starts ``margin`` recyclable records before ``index``."""
+        index = max(0, min(index, len(self._records)))
+        self.lo = self._extend_back(index, margin) if margin else index
+        self.hi = self._extend_forward(self.lo, self.size)
+        self.follow_tail = self.hi >= len(self._records)
+        return self.lo, self.hi
+
+    def page_up(self, page: int) -> bool:
+        """Slide the window ``page`` recyclable records towards older items.
+
+        Returns:
+            True if the window moved.
+        """
+        if self.lo <= 0:
+            return False
+        self.lo = self._extend_back(self.lo, page)
+        self.hi = self._extend_forward(self.lo, self.size)
+        self.follow_tail = self.hi >= len(self._records)
+        return True
+
+    def page_down(self, page: int) -> bool:
+        """Slide the window ``page`` recyclable records towards newer items.
+
+        Returns:
+            True if the window moved.
+        """
+        if self.hi >= len(self._records):
+            return False
+        self.hi = self._extend_forward(self.hi, page)
+        self.lo = self._extend_back(self.hi, self.size)
+        self.follow_tail = self.hi >= len(self._records)
+        return True
+
+    def has_hidden_before(self) -> bool:
+        """Whether any recyclable record before the window is not mounted."""
+        return any(not record.pinned and not record.is_mounted for record in self._records[: self.lo])
+
+    def has_hidden_after(self) -> bool:
+        """Whether any recyclable record after the window is not mounted."""
+        return any(not record.pinned and not record.is_mounted for record in self._records[self.hi :])
+
+    def plan(self, keep: Optional[Callable[[TimelineRecord], bool]] = None) -> Tuple[List[TimelineRecord], List[TimelineRecord]]:
+        """Work out which records to evict and which to mount for the current window.
+
+        Args:
+            keep: Optional predicate for records that must stay mounted even
+                outside the window (e.g. running tools, a streaming card)
+
+        Returns:
+            ``(to_evict, to_mount)``. ``to_mount`` is ordered newest first so
+            each widget can be mounted before its already-mounted successor.
+        """
+        to_evict: List[TimelineRecord] = []
+        to_mount: List[TimelineRecord] = []
+        for index, record in enumerate(self._records):
+            wanted = record.pinned or self.lo <= index < self.hi
+            if record.is_mounted and not wanted and not (keep is not None and keep(record)):
+                to_evict.append(record)
+            elif wanted and not record.is_mounted:
+                to_mount.append(record)
+        to_mount.reverse()
+        return to_evict, to_mount
+
+    def next_mounted(self, record: TimelineRecord) -> Optional[TimelineRecord]:
+        """Get the first mounted record after ``record`` in display order."""
+        index = self._records.index(record)
+        for candidate in self._records[index + 1 :]:
+            if candidate.is_mounted:
+                return candidate
+        return None
+
+    def first_index_for_round(self, round_number: int, prefer_kind: Optional[str] = None) -> Optional[int]:
+        """Get the index of the first record of a round, preferring ``prefer_kind`` records."""
+        first = None
+        for index, record in enumerate(self._records):
+            if record.round_number != round_number:
+                continue
+            if prefer_kind is not None and record.kind == prefer_kind:
+                return index
+            if first is None:
+                first = index
+        return first
+
+    @property
+    def mounted_count(self) -> int:
+        return sum(1 for record in self._records if record.is_mounted)
@@ -18,7 +18,7 @@ Visual design:
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -108,6 +108,38 @@ class ToolBatchCard(Static, can_focus=True):
         # Appearance animation
         self.add_class("appearing")
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Capture the card state so it can be rebuilt after being unmounted.
+
+        Returns:
+            Plain-data snapshot accepted by from_snapshot().
+        """
+        return {
+            "server_name": self.server_name,
+            "tools": dict(self._tools),
+            "tool_order": list(self._tool_order),
+            "expanded": self._expanded,
+            "start_time": self._start_time,
+        }
+
+    @classmethod
+    def from_snapshot(cls, state: Dict[str, Any], *, id: Optional[str] = None) -> "ToolBatchCard":
+        """Rebuild a card from a snapshot_state() snapshot.
+
+        Args:
+            state: Snapshot returned by snapshot_state().
+            id: DOM ID for the rebuilt card.
+
+        Returns:
+            A new, unmounted ToolBatchCard with the captured state.
+        """
+        card = cls(server_name=state["server_name"], id=id)
+        card._tools = dict(state["tools"])
+        card._tool_order = list(state["tool_order"])
+        card._expanded = state["expanded"]
+        card._start_time = state["start_time"]
+        return card
+
     def on_mount(self) -> None:
         """Complete appearance animation."""
         self.set_timer(0.3, self._complete_appearance)
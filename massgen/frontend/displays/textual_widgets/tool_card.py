@@ -7,7 +7,7 @@ parameters, results, and status. Clicking opens a detail modal.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -107,6 +107,27 @@ class ToolCallCard(Static):
         "background": "○",  # Hollow circle for async/background operations
     }
 
+    # State captured by snapshot_state() so an off-screen card can be rebuilt
+    _SNAPSHOT_ATTRS = (
+        "_status",
+        "_start_time",
+        "_end_time",
+        "_params",
+        "_params_full",
+        "_result",
+        "_result_full",
+        "_error",
+        "_pre_hooks",
+        "_post_hooks",
+        "_injection_expanded",
+        "_collapsed",
+        "_expanded",
+        "_subagent_tasks",
+        "_workspace_content",
+        "_async_id",
+        "_is_background",
+    )
+
     def __init__(
         self,
         tool_name: str,
@@ -183,6 +204,32 @@ class ToolCallCard(Static):
         if not self._is_subagent and not self._is_terminal:
             self.add_class("collapsed")
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Capture the card state so it can be rebuilt after being unmounted.
+
+        Returns:
+            Plain-data snapshot accepted by from_snapshot().
+        """
+        state = {attr: getattr(self, attr) for attr in self._SNAPSHOT_ATTRS}
+        state.update(tool_name=self.tool_name, tool_type=self.tool_type, call_id=self.call_id)
+        return state
+
+    @classmethod
+    def from_snapshot(cls, state: Dict[str, Any], *, id: Optional[str] = None) -> "ToolCallCard":
+        """Rebuild a card from a snapshot_state() snapshot.
+
+        Args:
+            state: Snapshot returned by snapshot_state().
+            id: DOM ID for the rebuilt card.
+
+        Returns:
+            A new, unmounted ToolCallCard with the captured state.
+        """
+        card = cls(tool_name=state["tool_name"], tool_type=state["tool_type"], call_id=state["call_id"], id=id)
+        for attr in cls._SNAPSHOT_ATTRS:
+            setattr(card, attr, state[attr])
+        return card
+
     def _detect_terminal_tool(self, tool_name: str) -> bool:
         """Check if this is a terminal coordination tool (hero tool).
 
@@ -331,10 +331,14 @@ class TimelineEventAdapter:
         else:
             if not is_planning_tool and not is_subagent_tool:
                 # Check if this tool already exists in the timeline
+                # (has_tool also covers cards recycled out of the mounted window)
                 try:
-                    existing = timeline.get_tool(tool_data.tool_id)
+                    if hasattr(timeline, "has_tool"):
+                        tool_known = timeline.has_tool(tool_data.tool_id)
+                    else:
+                        tool_known = timeline.get_tool(tool_data.tool_id) is not None
                 except Exception:
-                    existing = None
+                    tool_known = False
 
                 # Avoid duplicating tools that already live inside a batch
                 in_batch = output.batch_action == "update_batch"
@@ -354,13 +358,13 @@ class TimelineEventAdapter:
                     # Treat None as success (some implementations don't return a value)
                     if updated is not False:
                         pass
-                    elif existing is None:
+                    elif not tool_known:
                         # Batch missing — fall back to standalone rendering
                         timeline.add_tool(tool_data, round_number=round_number)
                         timeline.update_tool(tool_data.tool_id, tool_data)
                     else:
                         timeline.update_tool(tool_data.tool_id, tool_data)
-                elif existing is None:
+                elif not tool_known:
                     # Tool arrived already completed (e.g., coordination events
                     # like workspace/vote and workspace/new_answer). Add it
                     # and immediately update so it shows the correct status
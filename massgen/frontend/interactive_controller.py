@@ -586,6 +586,7 @@ class TextualInteractiveAdapter(UIAdapter):
 
         try:
             from massgen.logger_config import get_log_session_dir
+            from massgen.mcp_tools.planning.plan_store import load_plan_data
 
             # Use get_log_session_dir() which includes turn/attempt subdirs
             log_dir = get_log_session_dir()
@@ -617,7 +618,7 @@ class TextualInteractiveAdapter(UIAdapter):
                 for plan_location in search_order:
                     if plan_location.exists():
                         try:
-                            plan_data = json.loads(plan_location.read_text())
+                            plan_data = load_plan_data(plan_location)
                             if "tasks" in plan_data:
                                 logger.info(f"[PlanApproval] Found plan at {plan_location}")
                                 return plan_location, plan_data
@@ -1024,6 +1024,7 @@ def create_app(
                 "vllm",
                 "sglang",
                 "ag2",
+                "replay",
             ]:
                 continue
 
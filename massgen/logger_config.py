@@ -17,6 +17,8 @@ Color Scheme for Debug Logging:
 Log File Structure:
 - massgen.log: Main log with [SLOW] [ERROR] markers for easy grep
 - events.jsonl: Structured events for TUI reconstruction and debugging
+- stream_chunks.jsonl/.content: Compact stream chunk records (structured
+  stream chunk log mode, see ``set_stream_chunk_log_mode``)
 - metrics_summary.json: Detailed metrics (generated by orchestrator)
 """
 
@@ -24,15 +26,20 @@ import inspect
 import os
 import subprocess
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 import yaml
 from loguru import logger
 
+from .events import get_scoped_event_emitter, scoped_event_emitter
+
 if TYPE_CHECKING:
     from .events import EventEmitter
+    from .stream_chunk_log import StreamChunkLog
 
 # Try to import massgen for version info (optional)
 try:
@@ -67,6 +74,18 @@ _STREAMING_LOG_HANDLER_ID = None
 # Global event emitter for structured event logging
 _EVENT_EMITTER: Optional["EventEmitter"] = None
 
+# How log_stream_chunk records chunks: "text" (massgen.log lines), "structured"
+# (compact stream_chunks.jsonl records) or "off". [SLOW]/[ERROR] chunks always
+# go to massgen.log.
+STREAM_CHUNK_LOG_MODES = ("text", "structured", "off")
+_STREAM_CHUNK_LOG_MODE = "text"
+_STREAM_CHUNK_SAMPLE_RATES: Dict[str, int] = {}
+_STREAM_CHUNK_LOG: Optional["StreamChunkLog"] = None
+
+# Task-scoped log directory override (set by scoped_log_session for
+# in-process subagents; takes precedence over the global session dirs)
+_SCOPED_LOG_SESSION_DIR: ContextVar[Optional[Path]] = ContextVar("massgen_scoped_log_session_dir", default=None)
+
 
 def _get_log_base_dir() -> Path:
     """Get the base directory that stores timestamped log sessions.
@@ -82,6 +101,31 @@ def _get_log_base_dir() -> Path:
     return Path(".massgen") / "massgen_logs"
 
 
+def _event_emitter_options() -> Dict[str, Any]:
+    """Get EventEmitter write options from the environment.
+
+    ``MASSGEN_EVENTS_FLUSH_INTERVAL`` sets the maximum seconds events stay
+    buffered (0 writes every event immediately) and
+    ``MASSGEN_EVENTS_COMPRESSION=zstd`` writes zstd-framed events.jsonl.zst.
+
+    Returns:
+        Keyword arguments for ``EventEmitter``
+    """
+    options: Dict[str, Any] = {}
+    flush_interval = os.getenv("MASSGEN_EVENTS_FLUSH_INTERVAL")
+    if flush_interval:
+        try:
+            options["flush_interval"] = float(flush_interval)
+        except ValueError:
+            logger.warning("Ignoring invalid MASSGEN_EVENTS_FLUSH_INTERVAL: {}", flush_interval)
+    compression = os.getenv("MASSGEN_EVENTS_COMPRESSION", "").strip().lower()
+    if compression == "zstd":
+        options["compression"] = compression
+    elif compression and compression != "none":
+        logger.warning("Ignoring unsupported MASSGEN_EVENTS_COMPRESSION: {}", compression)
+    return options
+
+
 def get_log_session_dir(turn: Optional[int] = None) -> Path:
     """Get the current log session directory, including attempt subdirectory if set.
 
@@ -93,6 +137,10 @@ def get_log_session_dir(turn: Optional[int] = None) -> Path:
     """
     global _LOG_SESSION_DIR, _LOG_BASE_SESSION_DIR, _CURRENT_TURN, _CURRENT_ATTEMPT
 
+    scoped_dir = _SCOPED_LOG_SESSION_DIR.get()
+    if scoped_dir is not None:
+        return scoped_dir
+
     # Initialize base session dir once per session
     if _LOG_BASE_SESSION_DIR is None:
         # Check if we're running from within the MassGen development directory
@@ -196,6 +244,8 @@ def set_log_attempt(attempt: int) -> None:
     if _EVENT_EMITTER is not None:
         _EVENT_EMITTER.set_log_dir(new_log_dir)
         logger.info("Reconfigured events.jsonl for attempt {}: {}", attempt, new_log_dir / "events.jsonl")
+    if _STREAM_CHUNK_LOG is not None:
+        _STREAM_CHUNK_LOG.set_log_dir(new_log_dir)
 
     # Legacy streaming_debug.log handler (kept for backwards compatibility but unused)
     if _STREAMING_LOG_HANDLER_ID is not None:
@@ -220,6 +270,43 @@ def reset_logging_session() -> None:
     _CURRENT_ATTEMPT = None
 
 
+def reset_logging_state() -> None:
+    """Reset all logging state to that of a freshly imported process.
+
+    Removes every loguru handler, closes the event emitter (dropping its
+    listeners) and the structured stream chunk log, and re-reads the stream
+    chunk settings from the environment. Used by recycled subagent workers so
+    one task's handlers and listeners never see the next task's output.
+    """
+    global _DEBUG_MODE, _CONSOLE_HANDLER_ID, _CONSOLE_SUPPRESSED, _STREAMING_DEBUG_HANDLER_ID
+    global _MAIN_LOG_HANDLER_ID, _STREAMING_LOG_HANDLER_ID, _EVENT_EMITTER, _STREAM_CHUNK_LOG
+    global _STREAM_CHUNK_LOG_MODE, _STREAM_CHUNK_SAMPLE_RATES
+
+    logger.remove()
+    _DEBUG_MODE = False
+    _CONSOLE_HANDLER_ID = None
+    _CONSOLE_SUPPRESSED = False
+    _STREAMING_DEBUG_HANDLER_ID = None
+    _MAIN_LOG_HANDLER_ID = None
+    _STREAMING_LOG_HANDLER_ID = None
+
+    if _EVENT_EMITTER is not None:
+        _EVENT_EMITTER.close()
+        _EVENT_EMITTER = None
+    from .events import set_event_emitter
+
+    set_event_emitter(None)
+
+    if _STREAM_CHUNK_LOG is not None:
+        _STREAM_CHUNK_LOG.close()
+        _STREAM_CHUNK_LOG = None
+    _STREAM_CHUNK_LOG_MODE = "text"
+    _STREAM_CHUNK_SAMPLE_RATES = {}
+    _configure_stream_chunk_log_from_env()
+
+    reset_logging_session()
+
+
 def set_log_base_session_dir(log_dir: str) -> None:
     """Set the base log session directory to an existing directory.
 
@@ -262,6 +349,10 @@ def get_log_session_dir_base() -> Path:
     """
     global _LOG_BASE_SESSION_DIR, _CURRENT_TURN
 
+    scoped_dir = _SCOPED_LOG_SESSION_DIR.get()
+    if scoped_dir is not None:
+        return scoped_dir.parent
+
     # Ensure base session dir is initialized
     if _LOG_BASE_SESSION_DIR is None:
         get_log_session_dir()
@@ -282,6 +373,10 @@ def get_log_session_root() -> Path:
     """
     global _LOG_BASE_SESSION_DIR
 
+    scoped_dir = _SCOPED_LOG_SESSION_DIR.get()
+    if scoped_dir is not None:
+        return scoped_dir.parent.parent
+
     # Ensure base session dir is initialized
     if _LOG_BASE_SESSION_DIR is None:
         get_log_session_dir()
@@ -289,6 +384,35 @@ def get_log_session_root() -> Path:
     return _LOG_BASE_SESSION_DIR
 
 
+@contextmanager
+def scoped_log_session(log_dir: Path, event_emitter: Optional["EventEmitter"] = None) -> Iterator[Path]:
+    """Scope log directory lookups (and optionally events) to the current task context.
+
+    Used by in-process subagents: the child orchestrator shares the parent's
+    process and event loop, so the global session directory would otherwise
+    receive the child's status.json, snapshots and events. Tasks created inside
+    the block inherit the scope via contextvars.
+
+    Args:
+        log_dir: Attempt-level directory (e.g. ``log_X/turn_1/attempt_1``)
+        event_emitter: Optional EventEmitter for events emitted inside the block
+
+    Yields:
+        The scoped log directory
+    """
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    token = _SCOPED_LOG_SESSION_DIR.set(log_dir)
+    try:
+        if event_emitter is not None:
+            with scoped_event_emitter(event_emitter):
+                yield log_dir
+        else:
+            yield log_dir
+    finally:
+        _SCOPED_LOG_SESSION_DIR.reset(token)
+
+
 def save_execution_metadata(
     query: str,
     config_path: Optional[str] = None,
@@ -456,10 +580,11 @@ def setup_logging(debug: bool = False, log_file: Optional[str] = None, turn: Opt
         old_listeners = _EVENT_EMITTER._listeners.copy() if _EVENT_EMITTER else []
         if _EVENT_EMITTER is not None:
             _EVENT_EMITTER.close()
-        _EVENT_EMITTER = EventEmitter(log_session_dir)
+        _EVENT_EMITTER = EventEmitter(log_session_dir, **_event_emitter_options())
         for listener in old_listeners:
             _EVENT_EMITTER.add_listener(listener)
         set_event_emitter(_EVENT_EMITTER)
+        _open_stream_chunk_log(log_session_dir)
 
         logger.info("Logging enabled - logging INFO+ to file: {}", log_file)
         logger.info("Events log: {}", log_session_dir / "events.jsonl")
@@ -870,16 +995,100 @@ def get_event_emitter() -> Optional["EventEmitter"]:
     """Get the global event emitter instance.
 
     Returns:
-        The EventEmitter instance, or None if logging not initialized
+        The task-scoped EventEmitter if one is active (in-process subagents),
+        otherwise the global EventEmitter, or None if logging not initialized
     """
-    return _EVENT_EMITTER
+    return get_scoped_event_emitter() or _EVENT_EMITTER
+
+
+def _open_stream_chunk_log(log_dir: Path) -> None:
+    """Start (or restart) the structured stream chunk log in ``log_dir`` if that mode is active."""
+    global _STREAM_CHUNK_LOG
+    if _STREAM_CHUNK_LOG is not None:
+        _STREAM_CHUNK_LOG.close()
+        _STREAM_CHUNK_LOG = None
+    if _STREAM_CHUNK_LOG_MODE == "structured":
+        from .stream_chunk_log import StreamChunkLog
+
+        _STREAM_CHUNK_LOG = StreamChunkLog(log_dir, sample_rates=_STREAM_CHUNK_SAMPLE_RATES)
+
+
+def set_stream_chunk_log_mode(mode: str, sample_rates: Optional[Dict[str, int]] = None, log_dir: Optional[Path] = None) -> None:
+    """Choose how ``log_stream_chunk`` records chunks.
+
+    Modes:
+        - "text": one formatted massgen.log line per chunk (default)
+        - "structured": compact records in stream_chunks.jsonl with payloads
+          deduplicated in stream_chunks.content (see ``massgen.stream_chunk_log``)
+        - "off": drop chunks
+
+    [SLOW] and [ERROR] chunks are written to massgen.log in every mode. The
+    mode can also be set with ``MASSGEN_STREAM_CHUNK_LOG`` and sampling with
+    ``MASSGEN_STREAM_CHUNK_SAMPLE`` (e.g. ``content=10,reasoning=10``).
+
+    Args:
+        mode: One of ``STREAM_CHUNK_LOG_MODES``
+        sample_rates: Optional ``{chunk_type: N}`` keeping 1 in N structured records
+        log_dir: Directory for the structured log. Defaults to the current log
+            session directory once logging has been set up.
+
+    Raises:
+        ValueError: If the mode is not supported
+    """
+    global _STREAM_CHUNK_LOG_MODE, _STREAM_CHUNK_SAMPLE_RATES
+    if mode not in STREAM_CHUNK_LOG_MODES:
+        raise ValueError(f"Unsupported stream chunk log mode: {mode!r} (expected one of {', '.join(STREAM_CHUNK_LOG_MODES)})")
+    _STREAM_CHUNK_LOG_MODE = mode
+    if sample_rates is not None:
+        _STREAM_CHUNK_SAMPLE_RATES = dict(sample_rates)
+    if log_dir is None:
+        if _STREAM_CHUNK_LOG is not None:
+            log_dir = _STREAM_CHUNK_LOG.log_dir
+        elif _EVENT_EMITTER is not None:
+            log_dir = get_log_session_dir()
+    if log_dir is not None:
+        _open_stream_chunk_log(Path(log_dir))
+
+
+def _configure_stream_chunk_log_from_env() -> None:
+    global _STREAM_CHUNK_LOG_MODE, _STREAM_CHUNK_SAMPLE_RATES
+    mode = os.getenv("MASSGEN_STREAM_CHUNK_LOG", "").strip().lower()
+    if mode in STREAM_CHUNK_LOG_MODES:
+        _STREAM_CHUNK_LOG_MODE = mode
+    elif mode:
+        logger.warning("Ignoring unsupported MASSGEN_STREAM_CHUNK_LOG: {}", mode)
+    sample_spec = os.getenv("MASSGEN_STREAM_CHUNK_SAMPLE")
+    if sample_spec:
+        from .stream_chunk_log import parse_sample_rates
+
+        try:
+            _STREAM_CHUNK_SAMPLE_RATES = parse_sample_rates(sample_spec)
+        except ValueError:
+            logger.warning("Ignoring invalid MASSGEN_STREAM_CHUNK_SAMPLE: {}", sample_spec)
+
+
+_configure_stream_chunk_log_from_env()
+
+
+def _is_marked_chunk(chunk_type: str, content: Any) -> bool:
+    """Whether a chunk gets a [SLOW] or [ERROR] line in massgen.log."""
+    if chunk_type == "error":
+        return True
+    if isinstance(content, dict):
+        if content.get("is_error"):
+            return True
+        if chunk_type == "tool_result" and content.get("execution_time", 0) > 5.0:
+            return True
+    return False
 
 
 def log_stream_chunk(source: str, chunk_type: str, content: Any = None, agent_id: str = None):
     """
     Log stream chunks at INFO level (always logged to file).
 
-    Includes [SLOW] and [ERROR] markers for easy grep.
+    Includes [SLOW] and [ERROR] markers for easy grep. In the "structured" and
+    "off" modes (see ``set_stream_chunk_log_mode``) only marked chunks reach
+    massgen.log.
 
     Args:
         source: Source of the stream chunk (e.g., "orchestrator", "backend.claude_code")
@@ -887,6 +1096,13 @@ def log_stream_chunk(source: str, chunk_type: str, content: Any = None, agent_id
         content: Content of the chunk
         agent_id: Optional agent ID for context
     """
+    if _STREAM_CHUNK_LOG_MODE != "text" and not _is_marked_chunk(chunk_type, content):
+        # Low-overhead path: no frame inspection, logger binding or formatting
+        chunk_log = _STREAM_CHUNK_LOG
+        if chunk_log is not None:
+            chunk_log.record(source, chunk_type, content, agent_id)
+        return
+
     # Get caller information from the actual caller (not this function)
     frame = inspect.currentframe()
     if frame and frame.f_back:
@@ -964,6 +1180,7 @@ __all__ = [
     "get_log_session_dir",
     "get_log_session_dir_base",
     "get_log_session_root",
+    "scoped_log_session",
     "set_log_turn",
     "set_log_attempt",
     "set_log_base_session_dir",
@@ -979,6 +1196,7 @@ __all__ = [
     "log_tool_call",
     "log_coordination_step",
     "log_stream_chunk",
+    "set_stream_chunk_log_mode",
     "log_streaming_debug",
     "get_event_emitter",
 ]
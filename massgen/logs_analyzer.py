@@ -165,6 +165,10 @@ class LogAnalyzer:
                 all_rounds.append(round_copy)
         return sorted(all_rounds, key=lambda x: (x.get("round_number", 0), x.get("start_time", 0)))
 
+    def get_latency(self) -> Dict[str, Any]:
+        """Get the latency profile (per-round phase breakdown and critical path)."""
+        return self.metrics_summary.get("latency", {})
+
 
 def format_duration(ms: float) -> str:
     """Format milliseconds as human-readable duration."""
@@ -390,6 +394,77 @@ def display_tools(analyzer: LogAnalyzer, console: Console, sort_by: str) -> None
     console.print(f"\n[dim]Log: {analyzer.log_dir}[/dim]")
 
 
+def display_latency(analyzer: LogAnalyzer, console: Console) -> None:
+    """Display per-round latency breakdown and the coordination critical path."""
+    latency = analyzer.get_latency()
+    rounds = latency.get("rounds", [])
+
+    if not rounds:
+        console.print("[yellow]No latency data found.[/yellow]")
+        return
+
+    phase_columns = [
+        ("prompt_build", "Prompt"),
+        ("snapshot", "Snapshot"),
+        ("rate_limit_wait", "Rate wait"),
+        ("ttft", "TTFT"),
+        ("streaming", "Stream"),
+        ("tool", "Tools"),
+        ("hook", "Hooks"),
+        ("other", "Other"),
+    ]
+
+    table = Table(title="Round Latency Breakdown", border_style="dim")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Round", justify="right")
+    table.add_column("Type")
+    table.add_column("Outcome")
+    table.add_column("Start", justify="right", style="dim")
+    table.add_column("Total", justify="right", style="bold")
+    for _, label in phase_columns:
+        table.add_column(label, justify="right")
+    table.add_column("Retries", justify="right", style="yellow")
+
+    for r in sorted(rounds, key=lambda x: x.get("start_ms", 0)):
+        phases = r.get("phases", {})
+        retry_ms = phases.get("enforcement_retry", 0)
+        table.add_row(
+            str(r.get("agent_id", "?")),
+            str(r.get("round", "")),
+            r.get("round_type") or "",
+            r.get("outcome") or "",
+            format_duration(r.get("start_ms", 0)),
+            format_duration(r.get("duration_ms", 0)),
+            *[format_duration(phases[key]) if phases.get(key) else "" for key, _ in phase_columns],
+            format_duration(retry_ms) if retry_ms else "",
+        )
+
+    console.print(table)
+
+    critical_path = latency.get("critical_path", {})
+    if critical_path:
+        total_ms = critical_path.get("total_ms", 0)
+        console.print(
+            f"\n[bold]Critical path:[/bold] {format_duration(total_ms)} " f"(rounds {format_duration(critical_path.get('rounds_ms', 0))}, gaps {format_duration(critical_path.get('gap_ms', 0))})"
+        )
+        path = " -> ".join(f"{s.get('agent_id')} r{s.get('round')} ({format_duration(s.get('duration_ms', 0))})" for s in critical_path.get("segments", []))
+        console.print(f"  {path}")
+
+        phases = critical_path.get("phases", {})
+        ranked = sorted(((ms, key) for key, ms in phases.items() if ms and key != "enforcement_retry"), reverse=True)
+        if ranked:
+            parts = [f"{key} {format_duration(ms)} ({ms / total_ms * 100:.0f}%)" if total_ms else f"{key} {format_duration(ms)}" for ms, key in ranked]
+            console.print(f"  [dim]Where the time went:[/dim] {', '.join(parts)}")
+        if phases.get("enforcement_retry"):
+            console.print(f"  [yellow]Enforcement retries on path:[/yellow] {format_duration(phases['enforcement_retry'])}")
+
+    trace_file = latency.get("trace_file")
+    if trace_file and (analyzer.log_dir / trace_file).exists():
+        console.print(f"\n[dim]Trace: {analyzer.log_dir / trace_file} (open in https://ui.perfetto.dev or chrome://tracing)[/dim]")
+    else:
+        console.print(f"\n[dim]Log: {analyzer.log_dir}[/dim]")
+
+
 def display_list(
     console: Console,
     limit: int,
@@ -885,10 +960,12 @@ def logs_command(args) -> int:
             analyzer = LogAnalyzer(log_dir)
 
             if hasattr(args, "json") and args.json:
-                console.print_json(data=analyzer.get_summary())
+                console.print_json(data=analyzer.get_latency() if logs_cmd == "latency" else analyzer.get_summary())
             elif logs_cmd == "tools":
                 sort_by = getattr(args, "sort", "time")
                 display_tools(analyzer, console, sort_by)
+            elif logs_cmd == "latency":
+                display_latency(analyzer, console)
             else:  # summary (default)
                 display_summary(analyzer, console)
     except FileNotFoundError as e:
@@ -20,18 +20,21 @@ Built-in Hooks:
 """
 
 import asyncio
+import bisect
 import fnmatch
 import importlib
 import json
+import re
 import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from ..logger_config import logger
+from ..profiling import HOOK, profile_span
 
 # MCP imports for session-based backends
 try:
@@ -271,7 +274,16 @@ class FunctionHookManager:
 
 
 class PatternHook(FunctionHook):
-    """Base class for hooks that support pattern-based tool matching."""
+    """Base class for hooks that support pattern-based tool matching.
+
+    Attributes:
+        concurrent_safe: True for PostToolUse hooks that never deny, modify
+            arguments or change shared state, and don't depend on other hooks
+            running first. Adjacent concurrent-safe hooks are awaited together
+            by GeneralHookManager.
+    """
+
+    concurrent_safe: bool = False
 
     def __init__(
         self,
@@ -291,6 +303,9 @@ class PatternHook(FunctionHook):
         self.matcher = matcher
         self.timeout = timeout
         self._patterns = self._parse_matcher(matcher)
+        # Single compiled regex for all OR'd patterns instead of one fnmatch per pattern.
+        # A matcher with no patterns (e.g. "|") matches nothing; an empty regex would match everything.
+        self._regex = re.compile("|".join(fnmatch.translate(p) for p in self._patterns) if self._patterns else "(?!)")
 
     def _parse_matcher(self, matcher: str) -> List[str]:
         """Parse matcher into list of patterns (supports | for OR)."""
@@ -300,10 +315,7 @@ class PatternHook(FunctionHook):
 
     def matches(self, tool_name: str) -> bool:
         """Check if this hook matches the given tool name."""
-        for pattern in self._patterns:
-            if fnmatch.fnmatch(tool_name, pattern):
-                return True
-        return False
+        return self._regex.match(tool_name) is not None
 
 
 class PythonCallableHook(PatternHook):
@@ -431,6 +443,40 @@ class PythonCallableHook(PatternHook):
         return HookResult.allow()
 
 
+class HookLatencyHistogram:
+    """Fixed-bucket latency histogram for a single hook.
+
+    Buckets are not cumulative: each sample lands in the first bucket whose
+    upper bound (in milliseconds) is >= the sample; the last bucket is open-ended.
+    """
+
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record one hook execution time in milliseconds."""
+        self.counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the histogram (bucket labels are upper bounds in ms)."""
+        labels = [f"<={bound:g}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
 class GeneralHookManager:
     """Extended hook manager supporting pattern-based matching and global/per-agent hooks.
 
@@ -439,6 +485,9 @@ class GeneralHookManager:
     - Per-agent hooks that can extend or override global hooks
     - Pattern-based matching on tool names
     - Aggregation of results from multiple hooks
+
+    Matching hooks are memoized per (agent, hook type, tool name) in a dispatch
+    table that is invalidated whenever hooks are registered or cleared.
     """
 
     def __init__(self):
@@ -448,12 +497,15 @@ class GeneralHookManager:
         }
         self._agent_hooks: Dict[str, Dict[HookType, List[PatternHook]]] = {}
         self._agent_overrides: Dict[str, Dict[HookType, bool]] = {}
+        self._dispatch_table: Dict[Tuple[Optional[str], HookType, str], Tuple[PatternHook, ...]] = {}
+        self._latency: Dict[str, HookLatencyHistogram] = {}
 
     def register_global_hook(self, hook_type: HookType, hook: PatternHook) -> None:
         """Register a hook that applies to all agents."""
         if hook_type not in self._global_hooks:
             self._global_hooks[hook_type] = []
         self._global_hooks[hook_type].append(hook)
+        self._dispatch_table.clear()
         logger.debug(f"[GeneralHookManager] Registered global {hook_type.value} hook: {hook.name}")
 
     def register_agent_hook(
@@ -488,6 +540,7 @@ class GeneralHookManager:
 
         if override:
             self._agent_overrides[agent_id][hook_type] = True
+        self._dispatch_table.clear()
 
         logger.debug(
             f"[GeneralHookManager] Registered {hook_type.value} hook for agent {agent_id}: {hook.name}" f"{' (override)' if override else ''}",
@@ -548,37 +601,72 @@ class GeneralHookManager:
             Aggregated HookResult from all matching hooks
         """
         agent_id = context.get("agent_id")
-        hooks = self.get_hooks_for_agent(agent_id, hook_type)
 
         # Add tool_output to context for PostToolUse hooks
         if tool_output is not None:
             context["tool_output"] = tool_output
 
-        if not hooks:
-            logger.info(f"[GeneralHookManager] No hooks registered for agent_id={agent_id}, hook_type={hook_type}")
-            return HookResult.allow()
-
-        # Filter to matching hooks
-        matching_hooks = [h for h in hooks if h.matches(function_name)]
-        logger.info(f"[GeneralHookManager] {len(matching_hooks)} matching hooks for {function_name} (out of {len(hooks)} registered)")
-
+        matching_hooks = self.get_matching_hooks(agent_id, hook_type, function_name)
         if not matching_hooks:
             return HookResult.allow()
+        logger.debug(f"[GeneralHookManager] {len(matching_hooks)} matching {hook_type.value} hooks for {function_name}")
 
+        with profile_span(f"{hook_type.value} hooks", HOOK, agent_id=agent_id, tool=function_name, hooks=len(matching_hooks)):
+            return await self._run_matching_hooks(matching_hooks, hook_type, function_name, arguments, context)
+
+    async def _run_matching_hooks(
+        self,
+        matching_hooks: Tuple[PatternHook, ...],
+        hook_type: HookType,
+        function_name: str,
+        arguments: str,
+        context: Dict[str, Any],
+    ) -> HookResult:
+        """Run matching hooks in order and aggregate their results (see ``execute_hooks``)."""
         final_result = HookResult.allow()
         modified_args = arguments
         all_injections: List[Dict[str, Any]] = []
         hook_type_str = "pre" if hook_type == HookType.PRE_TOOL_USE else "post"
 
-        for hook in matching_hooks:
-            start_time = time.time()
-            try:
-                # Update context with current args
+        index = 0
+        while index < len(matching_hooks):
+            hook = matching_hooks[index]
+            if hook_type == HookType.POST_TOOL_USE and hook.concurrent_safe:
+                # Await the run of adjacent concurrent-safe hooks together. They only
+                # read the context, so they can share one snapshot of it.
+                end = index
+                while end < len(matching_hooks) and matching_hooks[end].concurrent_safe:
+                    end += 1
+                group = matching_hooks[index:end]
                 ctx = dict(context)
-                result = await hook.execute(function_name, modified_args, ctx)
+                outcomes = await asyncio.gather(*(self._run_hook(h, function_name, modified_args, ctx) for h in group))
+                index = end
+            else:
+                group = (hook,)
+                # Update context with current args
+                outcomes = [await self._run_hook(hook, function_name, modified_args, dict(context))]
+                index += 1
+
+            # Fold results in registration order so injections keep a stable order
+            for hook, (result, error_msg, execution_time_ms) in zip(group, outcomes):
+                if error_msg is not None:
+                    # Track the error but fail open (allow tool execution to proceed)
+                    # This ensures users can see which hooks failed even in fail-open mode
+                    final_result.add_error(error_msg)
+
+                    # Track failed hook execution
+                    final_result.add_executed_hook(
+                        hook_name=hook.name,
+                        hook_type=hook_type_str,
+                        decision="error",
+                        reason=error_msg,
+                        execution_time_ms=execution_time_ms,
+                    )
 
-                # Calculate execution time
-                execution_time_ms = (time.time() - start_time) * 1000
+                    # Check if hook requires fail-closed behavior
+                    if hasattr(hook, "fail_closed") and hook.fail_closed:
+                        return HookResult.deny(reason=error_msg)
+                    continue
 
                 # Handle deny - short circuit
                 if not result.allowed or result.decision == "deny":
@@ -612,9 +700,6 @@ class GeneralHookManager:
                     injection_preview=injection_preview,
                     injection_content=injection_content,
                 )
-                logger.info(
-                    f"[GeneralHookManager] Tracked hook execution: {hook.name} ({hook_type_str}) - " f"decision={result.decision}, has_inject={result.inject is not None}",
-                )
 
                 # Handle ask decision
                 if result.decision == "ask":
@@ -636,27 +721,6 @@ class GeneralHookManager:
                     for err in result.hook_errors:
                         final_result.add_error(err)
 
-            except Exception as e:
-                execution_time_ms = (time.time() - start_time) * 1000
-                error_msg = f"Hook '{hook.name}' failed unexpectedly: {e}"
-                logger.error(f"[GeneralHookManager] {error_msg}", exc_info=True)
-                # Track the error but fail open (allow tool execution to proceed)
-                # This ensures users can see which hooks failed even in fail-open mode
-                final_result.add_error(error_msg)
-
-                # Track failed hook execution
-                final_result.add_executed_hook(
-                    hook_name=hook.name,
-                    hook_type=hook_type_str,
-                    decision="error",
-                    reason=error_msg,
-                    execution_time_ms=execution_time_ms,
-                )
-
-                # Check if hook requires fail-closed behavior
-                if hasattr(hook, "fail_closed") and hook.fail_closed:
-                    return HookResult.deny(reason=error_msg)
-
         # Build final result
         final_result.modified_args = modified_args if modified_args != arguments else None
         if all_injections:
@@ -670,6 +734,69 @@ class GeneralHookManager:
 
         return final_result
 
+    def get_matching_hooks(
+        self,
+        agent_id: Optional[str],
+        hook_type: HookType,
+        function_name: str,
+    ) -> Tuple[PatternHook, ...]:
+        """Get the hooks matching a tool call, using the compiled dispatch table.
+
+        Args:
+            agent_id: The agent identifier (None for global hooks only)
+            hook_type: Type of hook (PRE_TOOL_USE or POST_TOOL_USE)
+            function_name: Name of the tool being called
+
+        Returns:
+            Matching hooks in execution order
+        """
+        key = (agent_id, hook_type, function_name)
+        hooks = self._dispatch_table.get(key)
+        if hooks is None:
+            hooks = tuple(h for h in self.get_hooks_for_agent(agent_id, hook_type) if h.matches(function_name))
+            self._dispatch_table[key] = hooks
+        return hooks
+
+    async def _run_hook(
+        self,
+        hook: PatternHook,
+        function_name: str,
+        arguments: str,
+        context: Dict[str, Any],
+    ) -> Tuple[Optional[HookResult], Optional[str], float]:
+        """Execute one hook, recording its latency.
+
+        Args:
+            hook: The hook to execute
+            function_name: Name of the tool being called
+            arguments: JSON string of tool arguments
+            context: Context dict passed to the hook
+
+        Returns:
+            Tuple of (result, error message, execution time in ms). Exactly one
+            of result and error message is set.
+        """
+        start_time = time.perf_counter()
+        result: Optional[HookResult] = None
+        error_msg: Optional[str] = None
+        try:
+            # Timeouts are enforced by the hooks that run user code (PythonCallableHook)
+            result = await hook.execute(function_name, arguments, context)
+        except Exception as e:
+            error_msg = f"Hook '{hook.name}' failed unexpectedly: {e}"
+            logger.error(f"[GeneralHookManager] {error_msg}", exc_info=True)
+
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
+        histogram = self._latency.get(hook.name)
+        if histogram is None:
+            histogram = self._latency[hook.name] = HookLatencyHistogram()
+        histogram.record(execution_time_ms)
+        return result, error_msg, execution_time_ms
+
+    def get_hook_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-hook latency histograms keyed by hook name."""
+        return {name: histogram.to_dict() for name, histogram in self._latency.items()}
+
     def register_hooks_from_config(
         self,
         hooks_config: Dict[str, Any],
@@ -753,6 +880,7 @@ class GeneralHookManager:
         }
         self._agent_hooks.clear()
         self._agent_overrides.clear()
+        self._dispatch_table.clear()
 
 
 # =============================================================================
@@ -951,6 +1079,8 @@ class HighPriorityTaskReminderHook(PatternHook):
     task was completed, then injects a reminder to document learnings.
     """
 
+    concurrent_safe = True
+
     def __init__(self, name: str = "high_priority_task_reminder"):
         """Initialize the high-priority task reminder hook."""
         # Match update_task_status - the tool that sets status to "completed"
@@ -18,7 +18,6 @@ Tools provided:
 """
 
 import argparse
-import json
 import logging
 import uuid
 from pathlib import Path
@@ -26,6 +25,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import fastmcp
 
+from massgen.mcp_tools.planning.plan_store import PlanFileStore, load_plan_data
 from massgen.mcp_tools.planning.planning_dataclasses import Task, TaskPlan
 
 # Setup logging for debugging
@@ -90,6 +90,9 @@ _task_plans: Dict[str, TaskPlan] = {}
 # Optional workspace path for filesystem-based task storage
 _workspace_path: Optional[Path] = None
 
+# Snapshot + change log stores, keyed by plan file path
+_plan_stores: Dict[Path, PlanFileStore] = {}
+
 # Whether two-tier workspace with git versioning is enabled
 _use_two_tier_workspace: bool = False
 
@@ -128,23 +131,40 @@ def _git_commit_on_task_completion(task_id: str, completion_notes: Optional[str]
         return False
 
 
+def _get_plan_store() -> Optional[PlanFileStore]:
+    """Return the plan store for the configured workspace, if any."""
+    if _workspace_path is None:
+        return None
+
+    plan_file = _workspace_path / "tasks" / "plan.json"
+    if plan_file not in _plan_stores:
+        _plan_stores[plan_file] = PlanFileStore(plan_file)
+    return _plan_stores[plan_file]
+
+
+def _flush_plan_stores() -> None:
+    """Fold pending plan changes into plan.json (called on server shutdown)."""
+    for store in _plan_stores.values():
+        try:
+            store.flush()
+        except Exception as e:
+            logger.warning(f"[PlanningMCP] Failed to flush plan store {store.plan_file}: {e}")
+
+
 def _save_plan_to_filesystem(plan: TaskPlan) -> None:
     """
     Save task plan to filesystem if workspace path is configured.
 
-    Writes to tasks/plan.json in the workspace directory.
+    Writes tasks/plan.json in the workspace directory once, then appends
+    incremental changes to tasks/plan.changes.jsonl, which is periodically
+    compacted back into plan.json.
 
     Args:
         plan: TaskPlan to save
     """
-    if _workspace_path is None:
-        return
-
-    tasks_dir = _workspace_path / "tasks"
-    tasks_dir.mkdir(exist_ok=True)
-
-    plan_file = tasks_dir / "plan.json"
-    plan_file.write_text(json.dumps(plan.to_dict(), indent=2))
+    store = _get_plan_store()
+    if store is not None:
+        store.save(plan)
 
 
 def _load_plan_from_filesystem(agent_id: str) -> Optional[TaskPlan]:
@@ -169,7 +189,7 @@ def _load_plan_from_filesystem(agent_id: str) -> Optional[TaskPlan]:
         return None
 
     try:
-        plan_data = json.loads(plan_file.read_text())
+        plan_data = load_plan_data(plan_file)
 
         # Check if this is the full serialized format or simplified format
         if "agent_id" in plan_data and "created_at" in plan_data:
@@ -557,10 +577,9 @@ async def create_server() -> fastmcp.FastMCP:
             del _task_plans[key]
 
         # Also clear filesystem if configured
-        if _workspace_path is not None:
-            plan_file = _workspace_path / "tasks" / "plan.json"
-            if plan_file.exists():
-                plan_file.unlink()
+        store = _get_plan_store()
+        if store is not None:
+            store.clear()
 
         return {"success": True, "operation": "clear_task_plan", "had_existing_plan": had_plan}
 
@@ -671,6 +690,10 @@ async def create_server() -> fastmcp.FastMCP:
             # Git commit on task completion (if two-tier workspace enabled)
             git_committed = False
             if status == "completed":
+                # Commit the compacted snapshot rather than a pending change log
+                store = _get_plan_store()
+                if store is not None:
+                    store.flush()
                 git_committed = _git_commit_on_task_completion(task_id, completion_notes)
 
             response = {
@@ -902,4 +925,7 @@ if __name__ == "__main__":
 
     import fastmcp
 
-    asyncio.run(fastmcp.run(create_server))
+    try:
+        asyncio.run(fastmcp.run(create_server))
+    finally:
+        _flush_plan_stores()
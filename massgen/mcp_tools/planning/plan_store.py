@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only persistence for task plans.
+
+``tasks/plan.json`` stays the canonical, human-readable snapshot. Instead of
+rewriting it after every status update, ``PlanFileStore`` appends the changes
+drained from ``TaskPlan.drain_changes()`` to ``tasks/plan.changes.jsonl`` and
+folds them into the snapshot periodically (after a short idle delay, or once
+the log grows past a size threshold), on shutdown, and at the end of each
+round via ``compact_plan_log()``.
+
+Readers that want the current state should use ``load_plan_data()``, which
+returns the snapshot with any pending log entries applied.
+
+The planning MCP server appends to the log while the orchestrator process
+compacts it at round end, so appends, compaction and reads all hold an
+advisory lock on ``tasks/plan.lock``.
+"""
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+CHANGE_LOG_NAME = "plan.changes.jsonl"
+LOCK_FILE_NAME = "plan.lock"
+
+
+def change_log_path(plan_file: Union[str, Path]) -> Path:
+    """Return the change log path that accompanies a plan snapshot."""
+    return Path(plan_file).with_name(CHANGE_LOG_NAME)
+
+
+@contextlib.contextmanager
+def _plan_file_lock(plan_file: Path, shared: bool = False) -> Iterator[None]:
+    """Hold the cross-process lock guarding a plan's snapshot and change log."""
+    lock_file = plan_file.with_name(LOCK_FILE_NAME)
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def apply_changes(plan_data: Dict[str, Any], changes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply change log entries to a serialized plan in place.
+
+    Args:
+        plan_data: Plan dict as produced by ``TaskPlan.to_dict()``
+        changes: Entries as produced by ``TaskPlan.drain_changes()``
+
+    Returns:
+        The updated plan dict
+    """
+    tasks = plan_data.setdefault("tasks", [])
+    for change in changes:
+        op = change.get("op")
+        if op == "upsert":
+            task = change["task"]
+            position = next((i for i, existing in enumerate(tasks) if isinstance(existing, dict) and existing.get("id") == task.get("id")), None)
+            if position is not None:
+                tasks[position] = task
+            else:
+                tasks.insert(min(change.get("index", len(tasks)), len(tasks)), task)
+        elif op == "delete":
+            tasks[:] = [t for t in tasks if not (isinstance(t, dict) and t.get("id") == change["task_id"])]
+        elif op == "plan":
+            plan_data["subagents"] = change.get("subagents", {})
+        if change.get("updated_at"):
+            plan_data["updated_at"] = change["updated_at"]
+    return plan_data
+
+
+def _read_changes(log_file: Path) -> List[Dict[str, Any]]:
+    changes = []
+    try:
+        with open(log_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    changes.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append; everything before it is intact
+                    logger.debug(f"[PlanFileStore] Skipping malformed change log line in {log_file}")
+    except FileNotFoundError:
+        pass
+    return changes
+
+
+def load_plan_data(plan_file: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Load a plan snapshot with pending change log entries applied.
+
+    Args:
+        plan_file: Path to ``tasks/plan.json``
+
+    Returns:
+        Plan dict, or None if no snapshot exists
+
+    Raises:
+        json.JSONDecodeError: If the snapshot is not valid JSON
+    """
+    plan_file = Path(plan_file)
+    if not plan_file.exists():
+        return None
+    with _plan_file_lock(plan_file, shared=True):
+        return _load_plan_data_locked(plan_file)
+
+
+def _load_plan_data_locked(plan_file: Path) -> Optional[Dict[str, Any]]:
+    try:
+        plan_data = json.loads(plan_file.read_text())
+    except FileNotFoundError:
+        return None
+    changes = _read_changes(change_log_path(plan_file))
+    if changes and isinstance(plan_data, dict):
+        apply_changes(plan_data, changes)
+    return plan_data
+
+
+def _write_snapshot(plan_file: Path, plan_data: Dict[str, Any]) -> None:
+    tmp_file = plan_file.with_name(plan_file.name + ".tmp")
+    tmp_file.write_text(json.dumps(plan_data, indent=2))
+    os.replace(tmp_file, plan_file)
+
+
+def compact_plan_log(plan_file: Union[str, Path]) -> bool:
+    """
+    Fold a plan's pending change log into its snapshot and remove the log.
+
+    Called at round end so that snapshots and readers that open
+    ``plan.json`` directly see the current plan.
+
+    Args:
+        plan_file: Path to ``tasks/plan.json``
+
+    Returns:
+        True if pending changes were folded in
+    """
+    plan_file = Path(plan_file)
+    log_file = change_log_path(plan_file)
+    if not log_file.exists():
+        return False
+    with _plan_file_lock(plan_file):
+        # Appends from other processes wait on the lock, so none land between the read and the unlink
+        if not log_file.exists():
+            return False
+        try:
+            plan_data = _load_plan_data_locked(plan_file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[PlanFileStore] Failed to compact {plan_file}: {e}")
+            return False
+        if plan_data is not None:
+            _write_snapshot(plan_file, plan_data)
+        log_file.unlink(missing_ok=True)
+    return True
+
+
+# Stores with pending changes are flushed when the interpreter exits
+_open_stores: "weakref.WeakSet[PlanFileStore]" = weakref.WeakSet()
+
+
+def flush_all() -> None:
+    """Flush every live PlanFileStore (registered with atexit)."""
+    for store in list(_open_stores):
+        try:
+            store.flush()
+        except Exception as e:
+            logger.warning(f"[PlanFileStore] Failed to flush {store.plan_file}: {e}")
+
+
+atexit.register(flush_all)
+
+
+class PlanFileStore:
+    """
+    Persist a task plan as a snapshot plus an append-only change log.
+
+    Args:
+        plan_file: Path to the snapshot (``tasks/plan.json``)
+        compact_every: Fold the log into the snapshot once it holds this many entries
+        compact_delay: Seconds of inactivity after which pending entries are folded in
+    """
+
+    def __init__(self, plan_file: Union[str, Path], compact_every: int = 256, compact_delay: float = 1.0):
+        self.plan_file = Path(plan_file)
+        self.log_file = change_log_path(self.plan_file)
+        self.compact_every = compact_every
+        self.compact_delay = compact_delay
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        # Plan whose changes the log currently tracks; a different plan gets a fresh snapshot
+        self._plan: Any = None
+        self._pending = len(_read_changes(self.log_file))
+        _open_stores.add(self)
+
+    def save(self, plan: Any) -> None:
+        """
+        Persist changes made to a plan since the last save.
+
+        Writes a full snapshot the first time a plan is saved (or when no
+        snapshot exists) and appends to the change log afterwards.
+
+        Args:
+            plan: TaskPlan to persist
+        """
+        with self._lock:
+            self.plan_file.parent.mkdir(parents=True, exist_ok=True)
+            if plan is not self._plan or not self.plan_file.exists():
+                self._plan = plan
+                plan.drain_changes()
+                self._cancel_timer()
+                with _plan_file_lock(self.plan_file):
+                    _write_snapshot(self.plan_file, plan.to_dict())
+                    self.log_file.unlink(missing_ok=True)
+                self._pending = 0
+                return
+
+            changes = plan.drain_changes()
+            if not changes:
+                return
+            with _plan_file_lock(self.plan_file), open(self.log_file, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(change) + "\n" for change in changes))
+            self._pending += len(changes)
+
+            if self._pending >= self.compact_every:
+                self.compact()
+            else:
+                self._schedule_compaction()
+
+    def compact(self) -> None:
+        """Fold the change log into the snapshot and remove the log."""
+        with self._lock:
+            self._cancel_timer()
+            if self.log_file.exists() and not compact_plan_log(self.plan_file):
+                return
+            self._pending = 0
+
+    def flush(self) -> None:
+        """Compact immediately if there are pending log entries."""
+        if self._pending:
+            self.compact()
+
+    def clear(self) -> None:
+        """Remove the snapshot and change log."""
+        with self._lock:
+            self._cancel_timer()
+            with _plan_file_lock(self.plan_file):
+                self.plan_file.unlink(missing_ok=True)
+                self.log_file.unlink(missing_ok=True)
+            self._plan = None
+            self._pending = 0
+
+    def _schedule_compaction(self) -> None:
+        self._cancel_timer()
+        self._timer = threading.Timer(self.compact_delay, self.compact)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -9,11 +9,17 @@ status management, validation, and subagent tracking.
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     pass
 
+# Statuses that satisfy a dependency
+DONE_STATUSES = frozenset({"completed", "verified"})
+
+# Task fields the owning plan's dependency indexes are derived from
+_INDEXED_FIELDS = frozenset({"status", "dependencies"})
+
 
 @dataclass
 class Task:
@@ -42,6 +48,14 @@ class Task:
     dependencies: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _INDEXED_FIELDS:
+            # Let the owning plan re-index this task on its next query
+            dirty = self.__dict__.get("_plan_dirty")
+            if dirty is not None:
+                dirty.add(self.id)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary for serialization."""
         return {
@@ -91,8 +105,166 @@ class TaskPlan:
     subagents: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Initialize task index for fast lookups."""
-        self._task_index: Dict[str, Task] = {task.id: task for task in self.tasks}
+        """Initialize task index and dependency bookkeeping for fast lookups."""
+        self._journal: List[Dict[str, Any]] = []
+        # IDs of tasks whose status or dependencies may have been edited directly
+        self._dirty: Set[str] = set()
+        self._rebuild_indexes()
+
+    # -------------------------------------------------------------------------
+    # Dependency bookkeeping
+    #
+    # Besides the id -> task index, the plan keeps a reverse-dependency index
+    # (task -> tasks depending on it) and, per task, the number of dependencies
+    # that are not completed/verified yet. A status change only touches the
+    # changed task's dependents, and the ready/blocked sets are maintained
+    # incrementally instead of rescanning every task and dependency.
+    #
+    # Assigning a task's status or dependencies directly marks it dirty (see
+    # Task.__setattr__), as does handing it out through get_task(), which
+    # covers in-place edits of its dependency list. _sync_indexes re-indexes
+    # only the dirty tasks.
+    # -------------------------------------------------------------------------
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all derived indexes from ``self.tasks``."""
+        self._task_index: Dict[str, Task] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._unmet: Dict[str, int] = {}
+        self._ready: Set[str] = set()
+        self._blocked: Set[str] = set()
+        # (status, dependencies) of each task as last indexed
+        self._indexed: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {}
+        self._order: Optional[Dict[str, int]] = None
+        # Set when a dependency edit may have introduced a cycle among existing tasks
+        self._maybe_cyclic = False
+        self._dirty.clear()
+        for task in self.tasks:
+            self._task_index[task.id] = task
+            task._plan_dirty = self._dirty
+        for task in self.tasks:
+            self._index_task(task)
+        self._indexed_count = len(self.tasks)
+        self._maybe_cyclic = any(self._creates_cycle(task.id, task.dependencies) for task in self.tasks if self._dependents.get(task.id))
+
+    def _index_task(self, task: Task) -> None:
+        """Add one task (already in ``_task_index``) to the dependency indexes."""
+        self._indexed[task.id] = (task.status, tuple(task.dependencies))
+        unmet = 0
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+            dep_task = self._task_index.get(dep_id)
+            if dep_task is None or dep_task.status not in DONE_STATUSES:
+                unmet += 1
+        self._unmet[task.id] = unmet
+        self._refresh_queue_membership(task)
+
+    def _refresh_queue_membership(self, task: Task) -> None:
+        if task.status == "pending" and self._unmet[task.id] == 0:
+            self._ready.add(task.id)
+            self._blocked.discard(task.id)
+        elif task.status == "pending":
+            self._blocked.add(task.id)
+            self._ready.discard(task.id)
+        else:
+            self._ready.discard(task.id)
+            self._blocked.discard(task.id)
+
+    def _sync_indexes(self) -> None:
+        """Bring the indexes up to date with edits made directly on ``tasks`` or a Task.
+
+        Appending to or removing from ``tasks`` triggers a rebuild. Dirty tasks
+        with a changed status or dependency list are re-indexed incrementally
+        (and recorded as changes).
+        """
+        if len(self.tasks) != self._indexed_count or len(self._task_index) != self._indexed_count:
+            self._rebuild_indexes()
+            return
+        if not self._dirty:
+            return
+        dirty = list(self._dirty)
+        self._dirty.clear()
+        changed = []
+        for task_id in dirty:
+            task = self._task_index.get(task_id)
+            indexed = self._indexed.get(task_id)
+            if task is None or indexed is None:
+                continue
+            old_status, old_dependencies = indexed
+            status_changed = task.status != old_status
+            dependencies_changed = tuple(task.dependencies) != old_dependencies
+            if status_changed:
+                self._apply_status_change(task, old_status)
+            if dependencies_changed:
+                self._reindex_dependencies(task)
+            if status_changed or dependencies_changed:
+                changed.append(task_id)
+        for task_id in sorted(changed, key=self._position) if len(changed) > 1 else changed:
+            self._record_change("upsert", task_id)
+
+    def _position(self, task_id: str) -> int:
+        if self._order is None:
+            self._order = {task.id: i for i, task in enumerate(self.tasks)}
+        return self._order.get(task_id, len(self._order))
+
+    def _in_plan_order(self, task_ids: Set[str]) -> List[Task]:
+        return [self._task_index[task_id] for task_id in sorted(task_ids, key=self._position)]
+
+    def _apply_status_change(self, task: Task, old_status: Optional[str]) -> None:
+        """Update dependents' unmet counters and queue membership after a status change."""
+        self._indexed[task.id] = (task.status, self._indexed[task.id][1])
+        self._refresh_queue_membership(task)
+        was_done = old_status in DONE_STATUSES
+        is_done = task.status in DONE_STATUSES
+        if was_done != is_done:
+            delta = -1 if is_done else 1
+            for dependent_id in self._dependents.get(task.id, ()):
+                dependent = self._task_index.get(dependent_id)
+                if dependent is None:
+                    continue
+                self._unmet[dependent_id] += delta
+                self._refresh_queue_membership(dependent)
+
+    def _reindex_dependencies(self, task: Task) -> None:
+        """Re-index a task whose dependency list was changed."""
+        for dep_id in self._indexed[task.id][1]:
+            self._dependents.get(dep_id, set()).discard(task.id)
+        self._index_task(task)
+        if self._creates_cycle(task.id, task.dependencies):
+            self._maybe_cyclic = True
+
+    def _record_change(self, op: str, task_id: Optional[str] = None) -> None:
+        self._journal.append({"op": op, "task_id": task_id})
+
+    def drain_changes(self) -> List[Dict[str, Any]]:
+        """
+        Return and clear the changes made since the last call, for incremental persistence.
+
+        Returns:
+            Change entries in order. ``upsert`` entries carry the current task dict
+            and its position, ``delete`` entries the removed task ID, and ``plan``
+            entries the subagent map. Every entry includes ``updated_at``.
+        """
+        self._sync_indexes()
+        journal, self._journal = self._journal, []
+        # Later entries for the same task (or the subagent map) supersede earlier ones
+        latest = {(entry["op"] == "plan", entry["task_id"]): i for i, entry in enumerate(journal)}
+        updated_at = self.updated_at.isoformat()
+        changes = []
+        for i, entry in enumerate(journal):
+            op, task_id = entry["op"], entry["task_id"]
+            if latest[(op == "plan", task_id)] != i:
+                continue
+            if op == "upsert":
+                task = self._task_index.get(task_id)
+                if task is None:
+                    continue
+                changes.append({"op": "upsert", "task": task.to_dict(), "index": self._position(task_id), "updated_at": updated_at})
+            elif op == "delete":
+                changes.append({"op": "delete", "task_id": task_id, "updated_at": updated_at})
+            elif op == "plan":
+                changes.append({"op": "plan", "subagents": self.subagents.copy(), "updated_at": updated_at})
+        return changes
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """
@@ -104,7 +276,11 @@ class TaskPlan:
         Returns:
             Task if found, None otherwise
         """
-        return self._task_index.get(task_id)
+        task = self._task_index.get(task_id)
+        if task is not None:
+            # The caller may edit its dependency list in place
+            self._dirty.add(task_id)
+        return task
 
     def can_start_task(self, task_id: str) -> bool:
         """
@@ -116,16 +292,10 @@ class TaskPlan:
         Returns:
             True if all dependencies are completed/verified, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
+        self._sync_indexes()
+        if task_id not in self._task_index:
             return False
-
-        for dep_id in task.dependencies:
-            dep_task = self.get_task(dep_id)
-            if not dep_task or dep_task.status not in ("completed", "verified"):
-                return False
-
-        return True
+        return self._unmet[task_id] == 0
 
     def get_ready_tasks(self) -> List[Task]:
         """
@@ -134,7 +304,8 @@ class TaskPlan:
         Returns:
             List of tasks with status='pending' and all dependencies completed
         """
-        return [task for task in self.tasks if task.status == "pending" and self.can_start_task(task.id)]
+        self._sync_indexes()
+        return self._in_plan_order(self._ready)
 
     def get_blocked_tasks(self) -> List[Task]:
         """
@@ -144,11 +315,8 @@ class TaskPlan:
             List of tasks with status='pending' but dependencies not completed,
             including information about what each task is waiting on
         """
-        blocked = []
-        for task in self.tasks:
-            if task.status == "pending" and not self.can_start_task(task.id):
-                blocked.append(task)
-        return blocked
+        self._sync_indexes()
+        return self._in_plan_order(self._blocked)
 
     def get_tasks_awaiting_verification(self) -> Dict[str, List[Task]]:
         """
@@ -210,13 +378,14 @@ class TaskPlan:
         Returns:
             List of task IDs that are blocking this task
         """
-        task = self.get_task(task_id)
+        self._sync_indexes()
+        task = self._task_index.get(task_id)
         if not task:
             return []
 
         blocking = []
         for dep_id in task.dependencies:
-            dep_task = self.get_task(dep_id)
+            dep_task = self._task_index.get(dep_id)
             if dep_task and dep_task.status not in ("completed", "verified"):
                 blocking.append(dep_id)
 
@@ -246,6 +415,8 @@ class TaskPlan:
         Raises:
             ValueError: If dependencies are invalid or circular
         """
+        self._sync_indexes()
+
         # Generate ID if not provided
         if not task_id:
             task_id = str(uuid.uuid4())
@@ -269,26 +440,28 @@ class TaskPlan:
         )
 
         # Check for circular dependencies before adding
-        temp_tasks = self.tasks + [task]
-        if self._has_circular_dependency(task_id, temp_tasks):
+        if self._creates_cycle(task_id, task.dependencies) or (self._maybe_cyclic and self._reaches_cycle(task.dependencies)):
             raise ValueError(f"Circular dependency detected for task: {task_id}")
 
         # Add to plan
         if after_task_id:
-            # Find position and insert
-            for i, t in enumerate(self.tasks):
-                if t.id == after_task_id:
-                    self.tasks.insert(i + 1, task)
-                    break
-            else:
+            if after_task_id not in self._task_index:
                 raise ValueError(f"after_task_id not found: {after_task_id}")
+            self.tasks.insert(self._position(after_task_id) + 1, task)
+            self._order = None
         else:
             # Append to end
             self.tasks.append(task)
+            if self._order is not None:
+                self._order[task_id] = len(self.tasks) - 1
 
-        # Update index and timestamp
+        # Update indexes and timestamp
         self._task_index[task_id] = task
+        task._plan_dirty = self._dirty
+        self._index_task(task)
+        self._indexed_count += 1
         self.updated_at = datetime.now()
+        self._record_change("upsert", task_id)
 
         return task
 
@@ -316,12 +489,18 @@ class TaskPlan:
         Raises:
             ValueError: If task not found
         """
-        task = self.get_task(task_id)
+        self._sync_indexes()
+        task = self._task_index.get(task_id)
         if not task:
             raise ValueError(f"Task not found: {task_id}")
 
-        task.status = status
         self.updated_at = datetime.now()
+        old_status = task.status
+        task.status = status
+        self._dirty.discard(task_id)
+        if status != old_status:
+            self._apply_status_change(task, old_status)
+        self._record_change("upsert", task_id)
 
         if status == "completed":
             task.completed_at = datetime.now()
@@ -330,11 +509,8 @@ class TaskPlan:
             if completion_notes:
                 task.metadata["completion_notes"] = completion_notes
 
-            # Find newly ready tasks
-            newly_ready = []
-            for other_task in self.tasks:
-                if other_task.status == "pending" and task_id in other_task.dependencies and self.can_start_task(other_task.id):
-                    newly_ready.append(other_task)
+            # Find newly ready tasks (only this task's dependents can have changed)
+            newly_ready = self._in_plan_order(self._dependents.get(task_id, set()) & self._ready)
 
             # Return task completion result
             # Note: High-priority task reminders are injected via HighPriorityTaskReminderHook
@@ -368,7 +544,7 @@ class TaskPlan:
         Raises:
             ValueError: If task not found
         """
-        task = self.get_task(task_id)
+        task = self._task_index.get(task_id)
         if not task:
             raise ValueError(f"Task not found: {task_id}")
 
@@ -376,6 +552,7 @@ class TaskPlan:
             task.description = description
 
         self.updated_at = datetime.now()
+        self._record_change("upsert", task_id)
         return task
 
     def delete_task(self, task_id: str) -> None:
@@ -388,21 +565,34 @@ class TaskPlan:
         Raises:
             ValueError: If task not found or other tasks depend on it
         """
-        task = self.get_task(task_id)
+        self._sync_indexes()
+        task = self._task_index.get(task_id)
         if not task:
             raise ValueError(f"Task not found: {task_id}")
 
         # Check if any tasks depend on this one
-        for other_task in self.tasks:
-            if task_id in other_task.dependencies:
-                raise ValueError(
-                    f"Cannot delete task {task_id}: task {other_task.id} depends on it",
-                )
-
-        # Remove from list and index
-        self.tasks.remove(task)
+        dependents = [dependent_id for dependent_id in self._dependents.get(task_id, ()) if dependent_id in self._task_index]
+        if dependents:
+            raise ValueError(
+                f"Cannot delete task {task_id}: task {min(dependents, key=self._position)} depends on it",
+            )
+
+        # Remove from list and indexes
+        del self.tasks[self._position(task_id)]
         del self._task_index[task_id]
+        for dep_id in task.dependencies:
+            self._dependents.get(dep_id, set()).discard(task_id)
+        self._dependents.pop(task_id, None)
+        self._unmet.pop(task_id, None)
+        self._indexed.pop(task_id, None)
+        task._plan_dirty = None
+        self._dirty.discard(task_id)
+        self._ready.discard(task_id)
+        self._blocked.discard(task_id)
+        self._order = None
+        self._indexed_count -= 1
         self.updated_at = datetime.now()
+        self._record_change("delete", task_id)
 
     def validate_dependencies(self, task_list: List[Dict[str, Any]]) -> None:
         """
@@ -457,21 +647,41 @@ class TaskPlan:
                                     f"Task {task_id}: Self-dependency detected",
                                 )
 
-    def _has_circular_dependency(self, task_id: str, all_tasks: List[Task]) -> bool:
+    def _creates_cycle(self, task_id: str, depends_on: List[str]) -> bool:
         """
-        Check if adding a task would create a circular dependency.
+        Check if giving ``task_id`` these dependencies would create a circular dependency.
+
+        Only the dependency subgraph reachable from ``depends_on`` is walked, and a
+        task nothing depends on yet (e.g. a newly added one) can never close a cycle.
 
         Args:
             task_id: ID of task to check
-            all_tasks: All tasks including the new one
+            depends_on: Dependencies the task would have
 
         Returns:
             True if circular dependency detected, False otherwise
         """
-        # Build dependency graph
-        task_map = {t.id: t for t in all_tasks}
+        if task_id in depends_on:
+            return True
+        if not self._dependents.get(task_id):
+            return False
 
-        # DFS to detect cycles
+        visited = set()
+        stack = list(depends_on)
+        while stack:
+            current = stack.pop()
+            if current == task_id:
+                return True
+            if current in visited:
+                continue
+            visited.add(current)
+            current_task = self._task_index.get(current)
+            if current_task:
+                stack.extend(current_task.dependencies)
+        return False
+
+    def _reaches_cycle(self, start_ids: List[str]) -> bool:
+        """Check whether any existing cycle is reachable from these tasks (DFS over dependencies)."""
         visited = set()
         rec_stack = set()
 
@@ -484,7 +694,7 @@ class TaskPlan:
             visited.add(tid)
             rec_stack.add(tid)
 
-            task = task_map.get(tid)
+            task = self._task_index.get(tid)
             if task:
                 for dep_id in task.dependencies:
                     if has_cycle(dep_id):
@@ -493,7 +703,7 @@ class TaskPlan:
             rec_stack.remove(tid)
             return False
 
-        return has_cycle(task_id)
+        return any(has_cycle(tid) for tid in start_ids)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert plan to dictionary for serialization."""
@@ -544,6 +754,7 @@ class TaskPlan:
             "result_summary": None,
         }
         self.updated_at = datetime.now()
+        self._record_change("plan")
 
     def update_subagent_status(
         self,
@@ -568,6 +779,7 @@ class TaskPlan:
         if result_summary:
             self.subagents[subagent_id]["result_summary"] = result_summary
         self.updated_at = datetime.now()
+        self._record_change("plan")
 
     def get_subagent(self, subagent_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+"""
+Embedded, in-process vector store for persistent memory.
+
+The default persistent memory setup talks to Qdrant (a server from
+``docker-compose.qdrant.yml`` or the local file mode, which does not allow
+several clients on one path). ``EmbeddedVectorStore`` is a mem0 vector store
+provider that keeps everything in the MassGen process instead:
+
+- Vectors live in a memory-mapped ``.npy`` array per collection, payloads and
+  ids in a JSON sidecar written atomically after each mutation
+- Inserts are batched into a single array write and a single sidecar write
+- Search is exact (brute-force cosine similarity with numpy) for small
+  collections and switches to an HNSW index when ``hnswlib`` is installed and
+  the collection grows past ``ann_threshold`` vectors
+- Every mem0 instance in the process that points at the same path and
+  collection shares one in-memory collection, so multiple agents can use the
+  store concurrently (cross-process sharing is not supported)
+
+Select it with ``memory.persistent_memory.vector_store: embedded`` in YAML.
+"""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from mem0.vector_stores.base import VectorStoreBase
+from pydantic import BaseModel
+
+PROVIDER_NAME = "massgen_embedded"
+DEFAULT_MEMORY_DIR = ".massgen"
+STORE_DIRNAME = "vector_store"
+
+_SIDECAR_VERSION = 1
+_INITIAL_CAPACITY = 256
+
+
+class EmbeddedVectorStoreConfig(BaseModel):
+    """Configuration for ``EmbeddedVectorStore`` (mirrors mem0's per-provider configs).
+
+    Attributes:
+        collection_name: Collection (sub-directory) name
+        path: Directory holding the collections; None keeps everything in memory
+        embedding_model_dims: Vector size; inferred from the first insert when None
+        ann_threshold: Collection size at which search switches to HNSW (needs hnswlib)
+    """
+
+    collection_name: str = "mem0"
+    path: Optional[str] = None
+    embedding_model_dims: Optional[int] = None
+    ann_threshold: int = 20000
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # cosine similarity
+    payload: Optional[Dict]  # metadata
+
+
+def _field_matches(payload: Dict[str, Any], key: str, condition: Any) -> bool:
+    """Match one payload field against a mem0 filter value (scalar, list or operator dict)."""
+    if not isinstance(condition, dict):
+        if condition == "*":
+            return key in payload
+        if key not in payload:
+            return False
+        if isinstance(condition, list):
+            return payload[key] in condition
+        return payload[key] == condition
+
+    value = payload.get(key)
+    for op, expected in condition.items():
+        if op == "eq":
+            ok = value == expected
+        elif op == "ne":
+            ok = value != expected
+        elif op == "in":
+            ok = value in expected
+        elif op == "nin":
+            ok = value not in expected
+        elif op in ("gt", "gte", "lt", "lte"):
+            try:
+                ok = {"gt": value > expected, "gte": value >= expected, "lt": value < expected, "lte": value <= expected}[op]
+            except TypeError:
+                ok = False
+        elif op == "contains":
+            ok = isinstance(value, str) and str(expected) in value
+        elif op == "icontains":
+            ok = isinstance(value, str) and str(expected).lower() in value.lower()
+        else:
+            raise ValueError(f"Unsupported filter operator '{op}' for field '{key}'")
+        if not ok:
+            return False
+    return True
+
+
+def matches_filters(payload: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """Check a payload against mem0 metadata filters.
+
+    Supports simple equality, list membership, the ``eq/ne/in/nin/gt/gte/lt/lte/
+    contains/icontains`` operators, the ``"*"`` wildcard and ``AND``/``OR``/``NOT``
+    (or ``$and``/``$or``/``$not``) groups.
+
+    Args:
+        payload: Stored payload
+        filters: mem0 filters dict
+
+    Returns:
+        True if the payload satisfies every filter
+    """
+    if not filters:
+        return True
+    for key, condition in filters.items():
+        group = key.lstrip("$").upper()
+        if group == "AND":
+            ok = all(matches_filters(payload, sub) for sub in condition)
+        elif group == "OR":
+            ok = any(matches_filters(payload, sub) for sub in condition)
+        elif group == "NOT":
+            subs = condition if isinstance(condition, list) else [condition]
+            ok = not any(matches_filters(payload, sub) for sub in subs)
+        else:
+            ok = _field_matches(payload, key, condition)
+        if not ok:
+            return False
+    return True
+
+
+class _Collection:
+    """Shared state for one collection: memory-mapped vectors plus a payload sidecar."""
+
+    def __init__(self, name: str, directory: Optional[Path], dims: Optional[int], ann_threshold: int):
+        self.name = name
+        self.directory = directory
+        self.dims = dims
+        self.ann_threshold = ann_threshold
+        self.lock = threading.RLock()
+        self.vectors: Optional[np.ndarray] = None  # (capacity, dims) unit vectors
+        self.slot_ids: List[Optional[str]] = []  # slot -> id (None for free slots)
+        self.payloads: Dict[str, Dict[str, Any]] = {}
+        self.id_to_slot: Dict[str, int] = {}
+        self.free_slots: List[int] = []
+        self._ann = None
+        self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    @property
+    def vectors_path(self) -> Optional[Path]:
+        return self.directory / "vectors.npy" if self.directory else None
+
+    @property
+    def sidecar_path(self) -> Optional[Path]:
+        return self.directory / "payloads.json" if self.directory else None
+
+    def _load(self) -> None:
+        if not self.directory or not self.sidecar_path.exists() or not self.vectors_path.exists():
+            return
+        try:
+            data = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+            if data.get("version") != _SIDECAR_VERSION:
+                return
+            vectors = np.load(self.vectors_path, mmap_mode="r+")
+        except (OSError, ValueError) as e:
+            logger.warning(f"[EmbeddedVectorStore] Could not load collection {self.name} from {self.directory}: {e}")
+            return
+        if vectors.ndim != 2 or vectors.shape[0] < len(data.get("slot_ids", [])):
+            logger.warning(f"[EmbeddedVectorStore] Ignoring inconsistent collection {self.name} in {self.directory}")
+            return
+        self.vectors = vectors
+        self.dims = int(vectors.shape[1])
+        self.slot_ids = list(data.get("slot_ids", []))
+        self.payloads = data.get("payloads", {})
+        self.id_to_slot = {vector_id: slot for slot, vector_id in enumerate(self.slot_ids) if vector_id is not None}
+        self.free_slots = [slot for slot, vector_id in enumerate(self.slot_ids) if vector_id is None]
+
+    def _save_sidecar(self) -> None:
+        if not self.directory:
+            return
+        tmp_path = self.sidecar_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": _SIDECAR_VERSION, "dims": self.dims, "slot_ids": self.slot_ids, "payloads": self.payloads}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.sidecar_path)
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if not self.directory:
+            return np.zeros((capacity, self.dims), dtype=np.float32)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / "vectors.tmp.npy"
+        return np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(capacity, self.dims))
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = 0 if self.vectors is None else self.vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(_INITIAL_CAPACITY, capacity)
+        while new_capacity < needed:
+            new_capacity *= 2
+        grown = self._allocate(new_capacity)
+        used = len(self.slot_ids)
+        if used:
+            grown[:used] = self.vectors[:used]
+        if self.directory:
+            grown.flush()
+            del grown
+            os.replace(self.directory / "vectors.tmp.npy", self.vectors_path)
+            grown = np.load(self.vectors_path, mmap_mode="r+")
+        self.vectors = grown
+
+    def _flush(self) -> None:
+        if isinstance(self.vectors, np.memmap):
+            self.vectors.flush()
+        self._save_sidecar()
+
+    # -- mutation ----------------------------------------------------------
+
+    def _normalize(self, vectors: Any) -> np.ndarray:
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        if self.dims is None:
+            self.dims = int(array.shape[1])
+        if array.shape[1] != self.dims:
+            raise ValueError(f"Vector size {array.shape[1]} does not match collection size {self.dims}")
+        norms = np.linalg.norm(array, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return array / norms
+
+    def insert(self, vectors: List[list], payloads: List[Dict[str, Any]], ids: List[str]) -> None:
+        with self.lock:
+            array = self._normalize(vectors)
+            slots = []
+            new_slots = 0
+            for vector_id in ids:
+                if vector_id in self.id_to_slot:
+                    slots.append(self.id_to_slot[vector_id])
+                elif self.free_slots:
+                    slots.append(self.free_slots.pop())
+                else:
+                    slots.append(len(self.slot_ids) + new_slots)
+                    new_slots += 1
+            self._ensure_capacity(len(self.slot_ids) + new_slots)
+            self.slot_ids.extend([None] * new_slots)
+
+            # One vectorized write for the whole batch
+            self.vectors[slots] = array
+            for slot, vector_id, payload in zip(slots, ids, payloads):
+                self.slot_ids[slot] = vector_id
+                self.id_to_slot[vector_id] = slot
+                self.payloads[vector_id] = dict(payload or {})
+            if self._ann is not None:
+                self._ann_add(array, slots)
+            self._flush()
+
+    def delete(self, vector_id: str) -> bool:
+        with self.lock:
+            slot = self.id_to_slot.pop(vector_id, None)
+            if slot is None:
+                return False
+            self.slot_ids[slot] = None
+            self.payloads.pop(vector_id, None)
+            self.free_slots.append(slot)
+            if self._ann is not None:
+                self._ann.mark_deleted(slot)
+            self._flush()
+            return True
+
+    def update(self, vector_id: str, vector: Optional[list], payload: Optional[Dict[str, Any]]) -> None:
+        with self.lock:
+            if vector_id not in self.id_to_slot:
+                raise ValueError(f"Vector {vector_id} not found")
+            if vector is not None:
+                self.insert([vector], [payload if payload is not None else self.payloads[vector_id]], [vector_id])
+                return
+            if payload is not None:
+                self.payloads[vector_id] = dict(payload)
+                self._save_sidecar()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.vectors = None
+            self.slot_ids = []
+            self.payloads = {}
+            self.id_to_slot = {}
+            self.free_slots = []
+            self._ann = None
+            if self.directory:
+                for path in (self.vectors_path, self.sidecar_path):
+                    if path.exists():
+                        path.unlink()
+
+    # -- search ------------------------------------------------------------
+
+    def _ann_add(self, array: np.ndarray, slots: List[int]) -> None:
+        capacity = self._ann.get_max_elements()
+        if len(self.slot_ids) > capacity:
+            self._ann.resize_index(max(len(self.slot_ids), capacity * 2))
+        for slot in slots:
+            try:
+                self._ann.unmark_deleted(slot)
+            except RuntimeError:
+                pass
+        self._ann.add_items(array, slots)
+
+    def _get_ann(self):
+        """Build the HNSW index once the collection passes ``ann_threshold`` (None if unavailable)."""
+        if self._ann is not None or len(self.id_to_slot) < self.ann_threshold:
+            return self._ann
+        try:
+            import hnswlib
+        except ImportError:
+            return None
+        index = hnswlib.Index(space="ip", dim=self.dims)
+        index.init_index(max_elements=max(len(self.slot_ids) * 2, _INITIAL_CAPACITY), ef_construction=200, M=16)
+        slots = sorted(self.id_to_slot.values())
+        index.add_items(np.asarray(self.vectors[slots]), slots)
+        self._ann = index
+        logger.info(f"[EmbeddedVectorStore] Built HNSW index for {self.name} ({len(slots)} vectors)")
+        return index
+
+    def search(self, vectors: Any, top_k: int, filters: Optional[Dict[str, Any]]) -> List[Tuple[str, float]]:
+        with self.lock:
+            if not self.id_to_slot or top_k <= 0:
+                return []
+            query = self._normalize(vectors)[0]
+
+            ann = self._get_ann()
+            if ann is not None:
+                # Over-fetch so metadata filters still leave top_k hits; fall back to exact search otherwise
+                fetch_k = min(len(self.id_to_slot), top_k * 4 if filters else top_k)
+                ann.set_ef(max(fetch_k * 2, 64))
+                labels, distances = ann.knn_query(query, k=fetch_k)
+                hits = []
+                for slot, distance in zip(labels[0], distances[0]):
+                    vector_id = self.slot_ids[int(slot)]
+                    if vector_id is not None and matches_filters(self.payloads[vector_id], filters):
+                        hits.append((vector_id, 1.0 - float(distance)))
+                if len(hits) >= top_k or fetch_k >= len(self.id_to_slot):
+                    return hits[:top_k]
+
+            slots = np.fromiter(
+                (slot for vector_id, slot in self.id_to_slot.items() if matches_filters(self.payloads[vector_id], filters)),
+                dtype=np.int64,
+            )
+            if slots.size == 0:
+                return []
+            scores = np.asarray(self.vectors[slots]) @ query
+            if slots.size > top_k:
+                best = np.argpartition(-scores, top_k - 1)[:top_k]
+            else:
+                best = np.arange(slots.size)
+            best = best[np.argsort(-scores[best])]
+            return [(self.slot_ids[int(slots[i])], float(scores[i])) for i in best]
+
+
+_COLLECTIONS: Dict[Tuple[Optional[str], str], _Collection] = {}
+_COLLECTIONS_LOCK = threading.Lock()
+
+
+def _get_collection(path: Optional[str], name: str, dims: Optional[int], ann_threshold: int) -> _Collection:
+    key = (os.path.abspath(path) if path else None, name)
+    with _COLLECTIONS_LOCK:
+        collection = _COLLECTIONS.get(key)
+        if collection is None:
+            directory = Path(key[0]) / name if key[0] else None
+            collection = _COLLECTIONS[key] = _Collection(name, directory, dims, ann_threshold)
+        return collection
+
+
+def clear_embedded_collections() -> None:
+    """Drop all shared in-memory collections (e.g. between tests). Files on disk are kept."""
+    with _COLLECTIONS_LOCK:
+        _COLLECTIONS.clear()
+
+
+class EmbeddedVectorStore(VectorStoreBase):
+    """mem0 vector store provider backed by an in-process collection.
+
+    Args:
+        collection_name: Collection name
+        path: Directory holding the collections; None keeps everything in memory
+        embedding_model_dims: Vector size; inferred from the first insert when None
+        ann_threshold: Collection size at which search switches to HNSW (needs hnswlib)
+    """
+
+    def __init__(
+        self,
+        collection_name: str = "mem0",
+        path: Optional[str] = None,
+        embedding_model_dims: Optional[int] = None,
+        ann_threshold: int = 20000,
+    ):
+        self.path = path
+        self.embedding_model_dims = embedding_model_dims
+        self.ann_threshold = ann_threshold
+        self.create_col(collection_name, embedding_model_dims)
+
+    def create_col(self, name: str, vector_size: Optional[int] = None, distance: str = "cosine") -> "EmbeddedVectorStore":
+        """Open (or create) a collection; only cosine similarity is supported."""
+        self.collection_name = name
+        self._collection = _get_collection(self.path, name, vector_size or self.embedding_model_dims, self.ann_threshold)
+        return self
+
+    def insert(self, vectors: List[list], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None) -> None:
+        """Insert a batch of vectors with one array write and one sidecar write."""
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in vectors]
+        if payloads is None:
+            payloads = [{} for _ in vectors]
+        if not (len(vectors) == len(ids) == len(payloads)):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+        if vectors:
+            self._collection.insert(vectors, payloads, [str(vector_id) for vector_id in ids])
+
+    def search(self, query: str, vectors: list, top_k: int = 5, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
+        """Return the most similar vectors (cosine similarity, higher is better).
+
+        Accepts both ``top_k`` and the ``limit`` keyword used by older mem0 versions.
+        """
+        hits = self._collection.search(vectors, limit if limit is not None else top_k, filters)
+        payloads = self._collection.payloads
+        return [OutputData(id=vector_id, score=score, payload=dict(payloads[vector_id])) for vector_id, score in hits]
+
+    def delete(self, vector_id: str) -> None:
+        if not self._collection.delete(str(vector_id)):
+            logger.debug(f"[EmbeddedVectorStore] Vector {vector_id} not found in {self.collection_name}")
+
+    def update(self, vector_id: str, vector: Optional[list] = None, payload: Optional[Dict] = None) -> None:
+        self._collection.update(str(vector_id), vector, payload)
+
+    def get(self, vector_id: str) -> Optional[OutputData]:
+        payload = self._collection.payloads.get(str(vector_id))
+        if payload is None:
+            return None
+        return OutputData(id=str(vector_id), score=None, payload=dict(payload))
+
+    def list_cols(self) -> List[str]:
+        if not self.path or not os.path.isdir(self.path):
+            return [self.collection_name]
+        return sorted(entry.name for entry in os.scandir(self.path) if entry.is_dir())
+
+    def delete_col(self) -> None:
+        self._collection.clear()
+
+    def col_info(self) -> Dict[str, Any]:
+        return {
+            "name": self.collection_name,
+            "count": len(self._collection.id_to_slot),
+            "dimension": self._collection.dims,
+            "distance": "cosine",
+            "ann": self._collection._ann is not None,
+        }
+
+    def list(self, filters: Optional[Dict] = None, top_k: Optional[int] = 100, limit: Optional[int] = None) -> List[List[OutputData]]:
+        """List stored vectors (wrapped in an outer list, as mem0 expects)."""
+        max_items = limit if limit is not None else top_k
+        results = []
+        with self._collection.lock:
+            for vector_id, payload in self._collection.payloads.items():
+                if max_items is not None and len(results) >= max_items:
+                    break
+                if matches_filters(payload, filters):
+                    results.append(OutputData(id=vector_id, score=None, payload=dict(payload)))
+        return [results]
+
+    def reset(self) -> None:
+        logger.warning(f"[EmbeddedVectorStore] Resetting collection {self.collection_name}")
+        self.delete_col()
+
+
+def register_embedded_vector_store() -> None:
+    """Register ``EmbeddedVectorStore`` with mem0's vector store factory."""
+    from mem0.utils.factory import VectorStoreFactory
+
+    VectorStoreFactory.provider_to_class[PROVIDER_NAME] = "massgen.memory._embedded_vector_store.EmbeddedVectorStore"
+
+
+def resolve_store_path(path: Optional[str] = None, memory_dir: Optional[str] = None) -> str:
+    """Resolve the directory the embedded store persists to as an absolute path.
+
+    Relative paths are anchored when memory is configured, so the store does
+    not follow later changes of the working directory.
+
+    Args:
+        path: Explicit store directory (``persistent_memory.path``)
+        memory_dir: Memory directory the default location is derived from
+            (``persistent_memory.memory_dir``, default ``.massgen``)
+
+    Returns:
+        Absolute store directory
+    """
+    if path:
+        return str(Path(path).expanduser().resolve())
+    return str(Path(memory_dir or DEFAULT_MEMORY_DIR).expanduser().resolve() / STORE_DIRNAME)
+
+
+def embedded_vector_store_config(path: Optional[str], **kwargs: Any):
+    """Build a mem0 ``VectorStoreConfig`` selecting the embedded store.
+
+    mem0 validates providers against its built-in list, so the config is
+    constructed without validation; the provider is registered on the factory.
+
+    Args:
+        path: Directory holding the collections; None keeps everything in memory
+        **kwargs: Other ``EmbeddedVectorStoreConfig`` fields
+
+    Returns:
+        mem0 VectorStoreConfig
+    """
+    from mem0.vector_stores.configs import VectorStoreConfig
+
+    register_embedded_vector_store()
+    return VectorStoreConfig.model_construct(provider=PROVIDER_NAME, config=EmbeddedVectorStoreConfig(path=path, **kwargs))
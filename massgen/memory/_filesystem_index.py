@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Mtime-indexed store for filesystem memories.
+
+Filesystem memory mode keeps memories as markdown files with YAML frontmatter
+under ``memory/short_term/*.md`` and ``memory/long_term/*.md``. The system
+prompt is rebuilt for every agent on every round, and the prompt builder used
+to glob and re-parse every memory file each time.
+
+``MemoryFileIndex`` keeps the parsed files keyed by ``(mtime_ns, size)`` so a
+refresh only stats each file and re-reads the ones that changed. Indexes are
+shared per directory within the process (see ``get_memory_index``), and can
+optionally persist a JSON manifest next to the tiers so a new process starts
+warm. The manifest is only written for directories agents don't see (e.g.
+session archives) to keep agent workspaces free of bookkeeping files.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from loguru import logger
+
+MEMORY_TIERS = ("short_term", "long_term")
+
+_MANIFEST_VERSION = 1
+
+
+def parse_memory_text(text: str) -> Optional[Dict[str, Any]]:
+    """Parse memory markdown with YAML frontmatter.
+
+    Args:
+        text: Raw memory file content
+
+    Returns:
+        Dictionary with name, description, content, tier, agent_id, created and
+        updated, or None if the text has no frontmatter
+    """
+    # Split frontmatter from content
+    if not text.startswith("---"):
+        return None
+
+    parts = text.split("---", 2)
+    if len(parts) < 3:
+        return None
+
+    frontmatter_text = parts[1].strip()
+    memory_content = parts[2].strip()
+
+    # Parse frontmatter (simple key: value parser)
+    metadata = {}
+    for line in frontmatter_text.split("\n"):
+        line = line.strip()
+        if ":" in line:
+            key, value = line.split(":", 1)
+            metadata[key.strip()] = value.strip()
+
+    return {
+        "name": metadata.get("name", ""),
+        "description": metadata.get("description", ""),
+        "content": memory_content,
+        "tier": metadata.get("tier", ""),
+        "agent_id": metadata.get("agent_id", ""),
+        "created": metadata.get("created", ""),
+        "updated": metadata.get("updated", ""),
+    }
+
+
+@dataclass
+class MemoryFileRecord:
+    """A memory file as last seen on disk.
+
+    Attributes:
+        tier: Memory tier ("short_term" or "long_term")
+        name: File name without the .md extension
+        path: Path to the memory file
+        mtime_ns: Modification time the record was read at
+        size: File size the record was read at
+        raw: Raw file content
+        parsed: Parsed frontmatter and content, or None if the file has no frontmatter
+    """
+
+    tier: str
+    name: str
+    path: Path
+    mtime_ns: int
+    size: int
+    raw: str
+    parsed: Optional[Dict[str, Any]] = None
+    _haystack: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> float:
+        """Modification time in seconds (as ``Path.stat().st_mtime``)."""
+        return self.mtime_ns / 1e9
+
+    @property
+    def haystack(self) -> str:
+        """Lowercased text used for keyword search."""
+        if self._haystack is None:
+            parsed = self.parsed or {}
+            self._haystack = " ".join((self.name, parsed.get("name", ""), parsed.get("description", ""), self.raw)).lower()
+        return self._haystack
+
+
+class MemoryFileIndex:
+    """Mtime-indexed view of one memory directory (the parent of the tier directories).
+
+    Args:
+        memory_dir: Directory containing ``short_term/`` and ``long_term/``
+        persist: Persist a JSON manifest in ``memory_dir`` so other processes
+            can reuse parsed records
+    """
+
+    MANIFEST_NAME = ".memory_index.json"
+
+    def __init__(self, memory_dir: Union[str, Path], persist: bool = False):
+        self.memory_dir = Path(memory_dir)
+        self.persist = persist
+        self._records: Dict[str, Dict[str, MemoryFileRecord]] = {tier: {} for tier in MEMORY_TIERS}
+        self._manifest_loaded = False
+        # Statistics: files read from disk vs. reused from the index
+        self.reads = 0
+        self.reuses = 0
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.memory_dir / self.MANIFEST_NAME
+
+    def _load_manifest(self) -> None:
+        self._manifest_loaded = True
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _MANIFEST_VERSION:
+            return
+        for tier in MEMORY_TIERS:
+            tier_dir = self.memory_dir / tier
+            for filename, entry in data.get("files", {}).get(tier, {}).items():
+                try:
+                    self._records[tier][filename] = MemoryFileRecord(
+                        tier=tier,
+                        name=filename[:-3],
+                        path=tier_dir / filename,
+                        mtime_ns=int(entry["mtime_ns"]),
+                        size=int(entry["size"]),
+                        raw=entry["raw"],
+                        parsed=entry.get("parsed"),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+    def _save_manifest(self) -> None:
+        files = {tier: {filename: {"mtime_ns": r.mtime_ns, "size": r.size, "raw": r.raw, "parsed": r.parsed} for filename, r in records.items()} for tier, records in self._records.items()}
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps({"version": _MANIFEST_VERSION, "files": files}), encoding="utf-8")
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.debug(f"[MemoryFileIndex] Could not write manifest {self.manifest_path}: {e}")
+
+    def refresh(self) -> Dict[str, Dict[str, MemoryFileRecord]]:
+        """Sync the index with disk, re-reading only new or modified files.
+
+        Returns:
+            Mapping of tier -> file stem -> record, with files in name order
+        """
+        if self.persist and not self._manifest_loaded:
+            self._load_manifest()
+
+        dirty = False
+        for tier in MEMORY_TIERS:
+            known = self._records[tier]
+            current: Dict[str, MemoryFileRecord] = {}
+            try:
+                entries = sorted((entry for entry in os.scandir(self.memory_dir / tier) if entry.name.endswith(".md")), key=lambda entry: entry.name)
+            except OSError:
+                entries = []
+
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                record = known.get(entry.name)
+                if record is not None and record.mtime_ns == stat.st_mtime_ns and record.size == stat.st_size:
+                    self.reuses += 1
+                    current[entry.name] = record
+                    continue
+
+                try:
+                    raw = Path(entry.path).read_text()
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(f"[MemoryFileIndex] Failed to read memory file {entry.path}: {e}")
+                    continue
+                self.reads += 1
+                dirty = True
+                current[entry.name] = MemoryFileRecord(
+                    tier=tier,
+                    name=entry.name[:-3],
+                    path=Path(entry.path),
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    raw=raw,
+                    parsed=parse_memory_text(raw),
+                )
+
+            if current.keys() != known.keys():
+                dirty = True
+            self._records[tier] = current
+
+        if dirty and self.persist and self.memory_dir.is_dir():
+            self._save_manifest()
+
+        return {tier: {record.name: record for record in records.values()} for tier, records in self._records.items()}
+
+    def records(self, tier: Optional[str] = None) -> List[MemoryFileRecord]:
+        """Get up-to-date records, optionally for a single tier."""
+        by_tier = self.refresh()
+        tiers = [tier] if tier else list(MEMORY_TIERS)
+        return [record for t in tiers for record in by_tier.get(t, {}).values()]
+
+    def search(self, query: str, tier: Optional[str] = None, limit: Optional[int] = None) -> List[MemoryFileRecord]:
+        """Keyword lookup over memory names, descriptions and contents.
+
+        Every whitespace-separated term must appear (case-insensitive).
+        Results are ordered by total term occurrences, most relevant first.
+
+        Args:
+            query: Space-separated keywords
+            tier: Restrict the search to one tier
+            limit: Maximum number of results
+
+        Returns:
+            Matching records
+        """
+        terms = query.lower().split()
+        if not terms:
+            return []
+        scored = []
+        for record in self.records(tier):
+            haystack = record.haystack
+            if all(term in haystack for term in terms):
+                scored.append((sum(haystack.count(term) for term in terms), record))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        results = [record for _, record in scored]
+        return results[:limit] if limit is not None else results
+
+
+_INDEXES: Dict[str, MemoryFileIndex] = {}
+
+
+def get_memory_index(memory_dir: Union[str, Path], persist: bool = False) -> MemoryFileIndex:
+    """Get the process-wide index for a memory directory.
+
+    Args:
+        memory_dir: Directory containing ``short_term/`` and ``long_term/``
+        persist: Persist a JSON manifest (only honored when the index is created)
+
+    Returns:
+        The shared MemoryFileIndex for the directory
+    """
+    key = os.path.abspath(memory_dir)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = MemoryFileIndex(key, persist=persist)
+    return index
+
+
+def clear_memory_indexes() -> None:
+    """Drop all shared memory indexes (e.g. between tests)."""
+    _INDEXES.clear()
@@ -6,8 +6,12 @@ This module provides long-term memory storage with semantic retrieval capabiliti
 enabling agents to remember and recall information across multiple sessions.
 """
 
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
 from importlib import metadata
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import field_validator
 
@@ -23,6 +27,52 @@ else:
     VectorStoreConfig = Any
 
 
+class _SearchResultCache:
+    """TTL cache of mem0 search results for one vector store.
+
+    Shared by every PersistentMemory instance writing to the same store, so a
+    write by one agent invalidates the results cached by all of them. The
+    generation counter keeps searches that were in flight during a write from
+    caching their (pre-write) results afterwards.
+    """
+
+    def __init__(self) -> None:
+        self.entries: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self.generation = 0
+
+    def get(self, key: Tuple, now: float) -> Optional[List[Dict[str, Any]]]:
+        cached = self.entries.get(key)
+        if cached is None or cached[0] <= now:
+            return None
+        self.entries.move_to_end(key)
+        return cached[1]
+
+    def put(self, key: Tuple, results: List[Dict[str, Any]], generation: int, expires_at: float, max_entries: int) -> None:
+        if generation != self.generation:
+            return
+        self.entries[key] = (expires_at, results)
+        self.entries.move_to_end(key)
+        while len(self.entries) > max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.entries.clear()
+        self.generation += 1
+
+
+def _vector_store_key(vector_store: Any) -> Tuple:
+    """Identify the store behind a mem0 vector store config (shared clients by identity)."""
+    config = getattr(vector_store, "config", None)
+    if hasattr(config, "model_dump"):
+        fields = config.model_dump()
+    elif isinstance(config, dict):
+        fields = dict(config)
+    else:
+        fields = {}
+    client = fields.pop("client", None)
+    return (getattr(vector_store, "provider", None), repr(sorted(fields.items())), id(client) if client is not None else None)
+
+
 def _create_massgen_mem0_config_classes():
     """
     Create custom config classes for MassGen mem0 integration.
@@ -67,6 +117,17 @@ def _create_massgen_mem0_config_classes():
     return _MassGenLlmConfig, _MassGenEmbedderConfig
 
 
+def _supports_native_batch_embedding(embedder: Any) -> bool:
+    """Check whether a mem0 embedder overrides ``embed_batch`` with a real batched call."""
+    try:
+        from mem0.embeddings.base import EmbeddingBase
+    except ImportError:
+        return False
+
+    base_batch = getattr(EmbeddingBase, "embed_batch", None)
+    return base_batch is not None and isinstance(embedder, EmbeddingBase) and type(embedder).embed_batch is not base_batch
+
+
 class PersistentMemory(PersistentMemoryBase):
     """
     Long-term persistent memory using mem0 as the storage backend.
@@ -95,6 +156,17 @@ class PersistentMemory(PersistentMemoryBase):
         >>> relevant = await memory.retrieve("quantum computing concepts")
     """
 
+    # Maximum number of mem0 searches in flight per memory instance
+    MAX_CONCURRENT_SEARCHES = 4
+    # Search results are reused for this long (cleared whenever memories are written to the store)
+    SEARCH_CACHE_TTL_SECONDS = 30.0
+    SEARCH_CACHE_MAX_ENTRIES = 256
+    # Query embeddings kept from batched embedding calls
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 256
+
+    # Search result caches by vector store, shared across instances using the same store
+    _search_caches: "weakref.WeakValueDictionary[Tuple, _SearchResultCache]" = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         agent_name: Optional[str] = None,
@@ -165,11 +237,20 @@ class PersistentMemory(PersistentMemoryBase):
         """
         super().__init__()
 
+        # Search fan-out state (semaphore is created lazily inside the running loop)
+        self._search_semaphore: Optional[asyncio.Semaphore] = None
+        self._search_cache = _SearchResultCache()
+        self._query_embeddings: "OrderedDict[str, Any]" = OrderedDict()
+
         # Import and configure mem0
         try:
             import mem0
             from mem0.configs.llms.base import BaseLlmConfig
-            from mem0.utils.factory import EmbedderFactory, LlmFactory
+            from mem0.utils.factory import (
+                EmbedderFactory,
+                LlmFactory,
+                VectorStoreFactory,
+            )
             from packaging import version
 
             # Check mem0 version for compatibility
@@ -180,6 +261,7 @@ class PersistentMemory(PersistentMemoryBase):
 
             # Register MassGen adapters with mem0's factory system
             EmbedderFactory.provider_to_class["massgen"] = "massgen.memory._mem0_adapters.MassGenEmbeddingAdapter"
+            VectorStoreFactory.provider_to_class["massgen_embedded"] = "massgen.memory._embedded_vector_store.EmbeddedVectorStore"
 
             if is_legacy_version:
                 LlmFactory.provider_to_class["massgen"] = "massgen.memory._mem0_adapters.MassGenLLMAdapter"
@@ -322,6 +404,8 @@ class PersistentMemory(PersistentMemoryBase):
 
         # Initialize async mem0 instance
         self.mem0_memory = mem0.AsyncMemory(mem0_config)
+        store_key = _vector_store_key(mem0_config.vector_store)
+        self._search_cache = self._search_caches.setdefault(store_key, self._search_cache)
         self.default_memory_type = memory_type
 
     def _extract_metadata(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -531,20 +615,9 @@ class PersistentMemory(PersistentMemoryBase):
             ...     print(memory)
         """
         try:
-            all_memories = []
-
-            for keyword in keywords:
-                search_result = await self.mem0_memory.search(
-                    query=keyword,
-                    agent_id=self.agent_id,
-                    user_id=self.user_id,
-                    run_id=self.session_id,
-                    limit=limit,
-                )
-
-                if search_result and "results" in search_result:
-                    memories = [item["memory"] for item in search_result["results"]]
-                    all_memories.extend(memories)
+            await self._prefetch_query_embeddings(keywords)
+            result_lists = await asyncio.gather(*(self._search(keyword, agent_id=self.agent_id, limit=limit) for keyword in keywords))
+            all_memories = [item["memory"] for item in self._merge_results(result_lists)]
 
             return {
                 "success": True,
@@ -715,15 +788,19 @@ class PersistentMemory(PersistentMemoryBase):
                     logger.debug(f"      {msg.get('role', 'unknown') if isinstance(msg, dict) else 'str'}: {preview}")
 
             # Call mem0
-            results = await self.mem0_memory.add(
-                messages=messages,
-                agent_id=self.agent_id,
-                user_id=self.user_id,
-                run_id=self.session_id,
-                memory_type=memory_type or self.default_memory_type,
-                infer=infer,
-                **kwargs,
-            )
+            try:
+                results = await self.mem0_memory.add(
+                    messages=messages,
+                    agent_id=self.agent_id,
+                    user_id=self.user_id,
+                    run_id=self.session_id,
+                    memory_type=memory_type or self.default_memory_type,
+                    infer=infer,
+                    **kwargs,
+                )
+            finally:
+                # New memories must be visible to the next search, including other agents' on this store
+                self.invalidate_search_cache()
 
             # Show results in detail
             if isinstance(results, dict):
@@ -794,6 +871,115 @@ class PersistentMemory(PersistentMemoryBase):
 
             raise
 
+    def invalidate_search_cache(self) -> None:
+        """Drop cached search results for this vector store (called after memories are written)."""
+        self._search_cache.invalidate()
+
+    async def _search(self, query: str, agent_id: Optional[str], limit: int, **search_kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Run one mem0 search with bounded concurrency and a short-TTL result cache.
+
+        Args:
+            query: Query string
+            agent_id: Agent whose memories to search
+            limit: Maximum number of results
+            **search_kwargs: Extra mem0 search options (e.g. metadata_filters)
+
+        Returns:
+            List of mem0 result items (dicts with at least a 'memory' key)
+        """
+        key = (query, agent_id, self.user_id, self.session_id, limit, repr(sorted(search_kwargs.items())))
+        cached = self._search_cache.get(key, time.monotonic())
+        if cached is not None:
+            return cached
+        generation = self._search_cache.generation
+
+        if self._search_semaphore is None:
+            self._search_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+
+        async with self._search_semaphore:
+            search_result = await self.mem0_memory.search(
+                query=query,
+                agent_id=agent_id,
+                user_id=self.user_id,
+                run_id=self.session_id,
+                limit=limit,
+                **search_kwargs,
+            )
+
+        results = list(search_result["results"]) if search_result and "results" in search_result else []
+        self._search_cache.put(key, results, generation, time.monotonic() + self.SEARCH_CACHE_TTL_SECONDS, self.SEARCH_CACHE_MAX_ENTRIES)
+        return results
+
+    @staticmethod
+    def _merge_results(result_lists: List[List[Dict[str, Any]]], seen_ids: Optional[set] = None) -> List[Dict[str, Any]]:
+        """Concatenate search results in order, dropping items whose memory id was already seen."""
+        seen_ids = set() if seen_ids is None else seen_ids
+        merged = []
+        for results in result_lists:
+            for item in results:
+                memory_id = item.get("id") if isinstance(item, dict) else None
+                if memory_id is not None:
+                    if memory_id in seen_ids:
+                        continue
+                    seen_ids.add(memory_id)
+                merged.append(item)
+        return merged
+
+    async def _prefetch_query_embeddings(self, queries: List[str]) -> None:
+        """
+        Embed all uncached query strings in a single batched call.
+
+        Only applies to mem0 embedders that implement a native ``embed_batch``
+        (the base class falls back to one request per text, which gains nothing).
+        The vectors are served to mem0's own per-query ``embed(query, "search")``
+        calls through a memo installed on the embedder.
+
+        Args:
+            queries: Query strings about to be searched
+        """
+        from ..logger_config import logger
+
+        embedder = getattr(self.mem0_memory, "embedding_model", None)
+        if not _supports_native_batch_embedding(embedder):
+            return
+
+        missing = [query for query in dict.fromkeys(queries) if query not in self._query_embeddings]
+        if len(missing) < 2:
+            return
+
+        try:
+            vectors = await asyncio.to_thread(embedder.embed_batch, missing, "search")
+        except Exception as e:
+            logger.debug(f"[PersistentMemory] Batched query embedding failed, falling back to per-query embedding: {e}")
+            return
+        if not vectors or len(vectors) != len(missing):
+            return
+
+        for query, vector in zip(missing, vectors):
+            self._query_embeddings[query] = vector
+        while len(self._query_embeddings) > self.QUERY_EMBEDDING_CACHE_MAX_ENTRIES:
+            self._query_embeddings.popitem(last=False)
+        self._install_embedding_memo(embedder)
+
+    def _install_embedding_memo(self, embedder: Any) -> None:
+        """Route the embedder's search-time ``embed`` calls through the batched vectors."""
+        if getattr(embedder, "_massgen_query_memo", None) is self._query_embeddings:
+            return
+
+        original_embed = type(embedder).embed.__get__(embedder)
+        query_embeddings = self._query_embeddings
+
+        def embed(text, memory_action=None):
+            if memory_action == "search" and isinstance(text, str):
+                vector = query_embeddings.get(text)
+                if vector is not None:
+                    return vector
+            return original_embed(text, memory_action)
+
+        embedder.embed = embed
+        embedder._massgen_query_memo = query_embeddings
+
     async def retrieve(
         self,
         query: Union[str, Dict[str, Any], List[Dict[str, Any]]],
@@ -847,26 +1033,8 @@ class PersistentMemory(PersistentMemoryBase):
 
         logger.debug(f"   Queries: {len(query_strings)} query string(s)")
 
-        # Search mem0 for each query string
-        all_results = []
-
-        # 1. Search own agent's memories first
-        logger.debug(f"   🔎 Searching own memories ({self.agent_id})...")
-        for query_str in query_strings:
-            search_result = await self.mem0_memory.search(
-                query=query_str,
-                agent_id=self.agent_id,
-                user_id=self.user_id,
-                run_id=self.session_id,
-                limit=limit,
-            )
-
-            if search_result and "results" in search_result:
-                memories = [item["memory"] for item in search_result["results"]]
-                logger.debug(f"      → Found {len(memories)} memory/memories")
-                all_results.extend(memories)
-
-        # 2. Search previous winning agents' memories (turn-filtered)
+        # Build every (agent, query) search up front so they can run concurrently
+        searches = [(self.agent_id, None, query_str, {}) for query_str in query_strings]
         if previous_winners:
             logger.debug(f"   🔎 Searching {len(previous_winners)} previous winner(s)...")
             for winner in previous_winners:
@@ -878,22 +1046,24 @@ class PersistentMemory(PersistentMemoryBase):
                     continue
 
                 logger.debug(f"      → Searching {winner_agent_id} (turn {winner_turn})...")
+                metadata_filters = {"turn": winner_turn} if winner_turn else None
+                searches.extend((winner_agent_id, winner_turn, query_str, {"metadata_filters": metadata_filters}) for query_str in query_strings)
 
-                # Search each query string for this winner
-                for query_str in query_strings:
-                    search_result = await self.mem0_memory.search(
-                        query=query_str,
-                        agent_id=winner_agent_id,
-                        user_id=self.user_id,
-                        run_id=self.session_id,
-                        limit=limit,
-                        metadata_filters={"turn": winner_turn} if winner_turn else None,
-                    )
+        await self._prefetch_query_embeddings(query_strings)
+        result_lists = await asyncio.gather(
+            *(self._search(query_str, agent_id=agent_id, limit=limit, **search_kwargs) for agent_id, _, query_str, search_kwargs in searches),
+        )
 
-                    if search_result and "results" in search_result:
-                        memories = [f"[From {winner_agent_id} Turn {winner_turn}] {item['memory']}" for item in search_result["results"]]
-                        logger.debug(f"         Found {len(memories)} memory/memories")
-                        all_results.extend(memories)
+        # Own memories first, then previous winners' (turn-filtered), deduplicated by memory id
+        all_results = []
+        seen_ids = set()
+        for (agent_id, turn, _, _), results in zip(searches, result_lists):
+            memories = [item["memory"] for item in self._merge_results([results], seen_ids)]
+            logger.debug(f"      → {agent_id}: found {len(memories)} memory/memories")
+            if agent_id == self.agent_id:
+                all_results.extend(memories)
+            else:
+                all_results.extend(f"[From {agent_id} Turn {turn}] {memory}" for memory in memories)
 
         # Format results as a readable string
         logger.info(f"   ✅ Total: {len(all_results)} memories retrieved")
@@ -20,6 +20,7 @@ TODOs:
 
 import asyncio
 import concurrent.futures
+import contextvars
 import json
 import os
 import secrets
@@ -31,9 +32,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
+from ._agent_stream_mux import AgentStreamMultiplexer
 from ._broadcast_channel import BroadcastChannel
+from ._speculative_start import SpeculativeStartTracker
 from .agent_config import AgentConfig
 from .backend.base import StreamChunk
+from .backend.http_clients import SharedHTTPClients
 from .chat_agent import ChatAgent
 from .configs.rate_limits import get_rate_limit_config
 from .coordination_tracker import CoordinationTracker
@@ -66,8 +70,16 @@ from .mcp_tools.hooks import (
     SubagentCompleteHook,
 )
 from .memory import ConversationMemory, PersistentMemoryBase
+from .memory._filesystem_index import get_memory_index
 from .message_templates import MessageTemplates
 from .persona_generator import PersonaGenerator
+from .profiling import (
+    ENFORCEMENT_RETRY,
+    PROMPT_BUILD,
+    RATE_LIMIT_WAIT,
+    SpanProfiler,
+    activate_profiler,
+)
 from .stream_chunk import ChunkType
 from .structured_logging import (
     clear_current_round,
@@ -278,6 +290,12 @@ class Orchestrator(ChatAgent):
         self._selected_agent: Optional[str] = None
         self._final_presentation_content: Optional[str] = None
         self._presentation_started: bool = False  # Guard against duplicate presentations
+        # Set by CoordinationUI.set_orchestrator(); None when running headless
+        self.coordination_ui: Optional[Any] = None
+        # Per-task latency spans (rounds, prompt builds, snapshots, waits); replaced in chat()
+        self.span_profiler = SpanProfiler()
+        # Drafts and speculative starts on them (None unless speculative_start is enabled); replaced in chat()
+        self._speculative_start: Optional[SpeculativeStartTracker] = self._create_speculative_start_tracker()
 
         # Track winning agents by turn for memory sharing
         # Format: [{"agent_id": "agent_b", "turn": 1}, {"agent_id": "agent_a", "turn": 2}]
@@ -307,6 +325,7 @@ class Orchestrator(ChatAgent):
         # Coordination state tracking for cleanup
         self._active_streams: Dict = {}
         self._active_tasks: Dict = {}
+        self._stream_mux: Optional[AgentStreamMultiplexer] = None
         # Fairness gate logging state to suppress repeated spam lines.
         self._fairness_pause_log_reasons: Dict[str, str] = {}
         self._fairness_block_log_states: Dict[str, Tuple[int, int]] = {}
@@ -2074,6 +2093,9 @@ class Orchestrator(ChatAgent):
 
             # New task - start MassGen coordination with full context
             self.current_task = user_message
+            self.span_profiler = SpanProfiler()
+            activate_profiler(self.span_profiler)
+            self._speculative_start = self._create_speculative_start_tracker()
 
             # Prepare paraphrases if DSPy is enabled
             if self.dspy_paraphraser:
@@ -2160,10 +2182,16 @@ class Orchestrator(ChatAgent):
                 detail=f"{len(self.agents)} agents ready",
             )
 
-            async for chunk in self._coordinate_agents_with_timeout(
-                conversation_context,
-            ):
-                yield chunk
+            # Keep pooled provider connections open for the whole run; the last
+            # orchestrator to finish (batch runs have several) closes them
+            SharedHTTPClients.acquire()
+            try:
+                async for chunk in self._coordinate_agents_with_timeout(
+                    conversation_context,
+                ):
+                    yield chunk
+            finally:
+                await SharedHTTPClients.release()
 
         elif self.workflow_phase == "presenting":
             # Handle follow-up question with full conversation context
@@ -2369,15 +2397,16 @@ class Orchestrator(ChatAgent):
                 dest_tier_dir = winner_memory_base / tier
                 dest_tier_dir.mkdir(parents=True, exist_ok=True)
 
-                # Copy all .md files from this agent's tier
-                for memory_file in source_tier_dir.glob("*.md"):
+                # Copy all .md files from this agent's tier (contents come from the mtime index)
+                for record in get_memory_index(agent_memory_base).records(tier):
+                    memory_file = record.path
                     dest_file = dest_tier_dir / memory_file.name
 
                     # If file already exists in winner's workspace, append with agent attribution
                     if dest_file.exists():
                         try:
                             existing_content = dest_file.read_text()
-                            new_content = memory_file.read_text()
+                            new_content = record.raw
                             combined = f"{existing_content}\n\n---\n\n# From Agent {agent_id}\n\n{new_content}"
                             dest_file.write_text(combined)
                             logger.info(
@@ -2456,11 +2485,8 @@ class Orchestrator(ChatAgent):
         if log_session_dir:
             logger.info(f"[Orchestrator] Saving to {log_session_dir}")
             self.coordination_tracker.save_coordination_logs(log_session_dir)
-            # Also save final status.json with complete token/cost data
-            self.coordination_tracker.save_status_file(
-                log_session_dir,
-                orchestrator=self,
-            )
+            # Also publish and save final status.json with complete token/cost data
+            self._publish_coordination_status(log_session_dir, force=True)
             # Save detailed metrics files
             self.save_metrics(log_session_dir)
 
@@ -2700,6 +2726,16 @@ class Orchestrator(ChatAgent):
                 backend_data["time_ms"] = round(backend_data["time_ms"], 2)
                 backend_data["ttft_ms"] = round(backend_data["ttft_ms"], 2)
 
+            # Per-round latency breakdown, critical path and Chrome trace
+            try:
+                latency = self.span_profiler.save(
+                    log_dir,
+                    backends={agent_id: agent.backend for agent_id, agent in self.agents.items() if getattr(agent, "backend", None)},
+                )
+            except Exception as e:
+                logger.warning(f"[Orchestrator] Failed to save latency profile: {e}")
+                latency = {}
+
             # Save summary file
             summary_file = log_dir / "metrics_summary.json"
             summary_data = {
@@ -2723,7 +2759,11 @@ class Orchestrator(ChatAgent):
                 "api_timing": api_timing,
                 "agents": agent_metrics,
                 "subagents": subagents_summary,
+                "latency": latency,
+                "http_connections": SharedHTTPClients.stats(),
             }
+            if self._speculative_start is not None:
+                summary_data["speculative_start"] = self._speculative_start.stats()
             with open(summary_file, "w", encoding="utf-8") as f:
                 json.dump(summary_data, f, indent=2, default=str)
 
@@ -3173,12 +3213,26 @@ Your answer:"""
             )
             return {"has_irreversible": True, "blocked_tools": set()}
 
+    def _publish_coordination_status(self, log_session_dir: Path, force: bool = False) -> None:
+        """Publish a status delta if state changed, then flush status.json.
+
+        Args:
+            log_session_dir: Session log directory
+            force: Rebuild and write immediately (coordination milestones)
+                instead of relying on dirty tracking and the debounce window
+        """
+        self.coordination_tracker.publish_status(log_session_dir, self, force=force)
+        self.coordination_tracker.flush_status_file(log_session_dir, force=force)
+
     async def _continuous_status_updates(self):
-        """Background task to continuously update status.json during coordination.
+        """Background task that publishes coordination status during coordination.
 
-        This task runs every 2 seconds to provide real-time status monitoring
-        for automation tools and LLM agents.
+        Status deltas are pushed over the event pipe as soon as the coordination
+        tracker is dirty (checked every 0.5 seconds), while status.json is
+        rewritten atomically on a debounced schedule for automation tools and
+        LLM agents that poll the file.
         """
+        last_timeout_refresh = 0.0
         try:
             while True:
                 # Check for cancellation before sleeping
@@ -3188,7 +3242,7 @@ Your answer:"""
                     )
                     break
 
-                await asyncio.sleep(2)  # Update every 2 seconds
+                await asyncio.sleep(0.5)  # Dirty check interval; builds only happen on change
 
                 # Check for cancellation after sleeping
                 if hasattr(self, "cancellation_manager") and self.cancellation_manager and self.cancellation_manager.is_cancelled:
@@ -3200,19 +3254,24 @@ Your answer:"""
                 log_session_dir = get_log_session_dir()
                 if log_session_dir:
                     try:
-                        # Run synchronous save_status_file in thread pool to avoid blocking event loop
-                        # This prevents delays in WebSocket broadcasts and other async operations
+                        # Build/diff/write in thread pool to avoid blocking event loop
+                        # This prevents delays in WebSocket broadcasts and other async operations.
+                        # Copy the context so task-scoped log dirs and emitters are honored.
                         loop = asyncio.get_running_loop()
                         await loop.run_in_executor(
                             None,  # Use default thread pool executor
-                            self.coordination_tracker.save_status_file,
+                            contextvars.copy_context().run,
+                            self._publish_coordination_status,
                             log_session_dir,
-                            self,
                         )
                     except Exception as e:
-                        logger.debug(f"Failed to update status file in background: {e}")
+                        logger.debug(f"Failed to publish status in background: {e}")
 
-                # Update timeout status for each agent in the display
+                # Update timeout status for each agent in the display (every 2 seconds)
+                now = time.time()
+                if now - last_timeout_refresh < 2:
+                    continue
+                last_timeout_refresh = now
                 try:
                     display = None
                     if hasattr(self, "coordination_ui") and self.coordination_ui:
@@ -3271,6 +3330,7 @@ Your answer:"""
         # Track active coordination state for cleanup
         self._active_streams = {}
         self._active_tasks = {}
+        self._stream_mux = None
 
         timeout_seconds = self.config.timeout_config.orchestrator_timeout_seconds
 
@@ -3288,6 +3348,7 @@ Your answer:"""
 
         except asyncio.TimeoutError:
             self.is_orchestrator_timeout = True
+            self.coordination_tracker.mark_status_dirty(transition=True)
             elapsed = time.time() - self.coordination_start_time
             self.timeout_reason = f"Time limit exceeded ({elapsed:.1f}s/{timeout_seconds}s)"
             # Track timeout for all agents that were still working
@@ -3719,11 +3780,16 @@ Your answer:"""
         and gracefully terminate their current work before restarting.
         """
         active_streams = {}
-        active_tasks = {}  # Track active tasks to prevent duplicate task creation
+        active_tasks = {}  # Per-agent pump tasks (one per active stream)
+        # Pumps drain each agent stream into one shared queue; the loop consumes batches from it
+        stream_mux = AgentStreamMultiplexer(self._get_next_chunk, tasks=active_tasks)
 
         # Store references for timeout cleanup
         self._active_streams = active_streams
         self._active_tasks = active_tasks
+        self._stream_mux = stream_mux
+        if self._speculative_start is not None:
+            self._speculative_start.reset()
 
         # Helper to check if coordination should end
         def _coordination_complete() -> bool:
@@ -3763,10 +3829,19 @@ Your answer:"""
                 break
             # Start any agents that aren't running and haven't voted yet
             current_answers = {aid: state.answer for aid, state in self.agent_states.items() if state.answer}
+            # Wake up when a draft a waiting agent needs becomes stable (speculative start)
+            speculation_poll_timeout: Optional[float] = None
             for agent_id in self.agents.keys():
-                # Skip agents that are waiting for all answers before voting
+                provisional_answers: Dict[str, str] = {}
+                # Skip agents that are waiting for all answers before voting, unless
+                # every missing answer has a stable draft to start from speculatively
                 if self._is_waiting_for_all_answers(agent_id):
-                    continue
+                    provisional_answers = self._get_speculative_answers(agent_id, active_streams, require_all=True)
+                    if not provisional_answers:
+                        wait = self._get_speculation_wait(agent_id, active_streams)
+                        if wait is not None:
+                            speculation_poll_timeout = wait if speculation_poll_timeout is None else min(speculation_poll_timeout, wait)
+                        continue
 
                 # In decomposition mode, hitting max_new_answers_per_agent should auto-stop
                 # without spawning a fresh model round.
@@ -3789,9 +3864,23 @@ Your answer:"""
                     # Create a copy for this agent to avoid cross-agent coupling
                     # Each agent needs its own baseline to detect new answers independently
                     per_agent_answers = dict(current_answers)
+                    if self._speculative_start is not None:
+                        if not provisional_answers:
+                            provisional_answers = self._get_speculative_answers(agent_id, active_streams)
+                        if provisional_answers:
+                            per_agent_answers.update(provisional_answers)
+                            self._speculative_start.begin(agent_id, provisional_answers)
+                            # Starting now with every current answer; an older pending restart is moot
+                            self.agent_states[agent_id].restart_pending = False
+                            logger.info(
+                                f"[Orchestrator] Speculative start of {agent_id} on provisional answers from {sorted(provisional_answers)}",
+                            )
+                        else:
+                            self._speculative_start.end(agent_id)
+                        self._speculative_start.start_round(agent_id)
 
                     # Track which answers this agent knows about (for vote validation)
-                    self.agent_states[agent_id].known_answer_ids = set(current_answers.keys())
+                    self.agent_states[agent_id].known_answer_ids = set(per_agent_answers.keys())
                     # Mark that this agent has received the current answer revision set.
                     self._sync_decomposition_answer_visibility(agent_id)
 
@@ -3806,24 +3895,19 @@ Your answer:"""
             if not active_streams:
                 break
 
-            # Create tasks only for streams that don't already have active tasks
+            # Start pumps only for streams that don't already have one
             for agent_id, stream in active_streams.items():
-                if agent_id not in active_tasks:
-                    active_tasks[agent_id] = asyncio.create_task(
-                        self._get_next_chunk(stream),
-                    )
+                if not stream_mux.is_attached(agent_id):
+                    stream_mux.attach(agent_id, stream)
 
             if not active_tasks:
                 break
 
-            done, _ = await asyncio.wait(
-                active_tasks.values(),
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+            chunk_batch = await stream_mux.next_batch(timeout=speculation_poll_timeout)
 
             # Check for cancellation after wait
             if hasattr(self, "cancellation_manager") and self.cancellation_manager and self.cancellation_manager.is_cancelled:
-                logger.info("Cancellation detected after asyncio.wait - cleaning up")
+                logger.info("Cancellation detected while waiting for agent chunks - cleaning up")
                 # Gracefully interrupt Claude Code backends before cancelling tasks
                 for agent_id, agent in self.agents.items():
                     if hasattr(agent, "backend") and hasattr(agent.backend, "interrupt"):
@@ -3842,20 +3926,17 @@ Your answer:"""
             answered_agents = {}
             completed_agent_ids = set()  # Track all agents whose tasks completed, i.e., done, error, result.
 
-            # Process completed stream chunks
-            for task in done:
-                agent_id = next(aid for aid, t in active_tasks.items() if t is task)
-                # Remove completed task from active_tasks
-                del active_tasks[agent_id]
-
+            # Process received stream chunks (in stream order per agent)
+            for agent_id, chunk_tuple in chunk_batch:
                 try:
                     # Unpack chunk tuple - may be 2-tuple (type, data) or 3-tuple (type, data, tool_call_id)
-                    chunk_tuple = await task
                     chunk_type = chunk_tuple[0]
                     chunk_data = chunk_tuple[1]
                     chunk_tool_call_id = chunk_tuple[2] if len(chunk_tuple) > 2 else None
 
                     if chunk_type == "content":
+                        if self._speculative_start is not None:
+                            self._speculative_start.observe(agent_id, chunk_data)
                         # Stream agent content in real-time with source info
                         log_stream_chunk(
                             "orchestrator",
@@ -3870,6 +3951,9 @@ Your answer:"""
                         )
 
                     elif chunk_type == "coordination":
+                        # Strict mode routes agent content here
+                        if self._speculative_start is not None:
+                            self._speculative_start.observe(agent_id, chunk_data)
                         # Coordination traces (strict mode) - pass through as coordination type
                         log_stream_chunk(
                             "orchestrator",
@@ -4026,9 +4110,10 @@ Your answer:"""
                                 loop = asyncio.get_running_loop()
                                 await loop.run_in_executor(
                                     None,
-                                    self.coordination_tracker.save_status_file,
+                                    contextvars.copy_context().run,
+                                    self._publish_coordination_status,
                                     log_session_dir,
-                                    self,
+                                    True,  # Milestone: publish and write immediately
                                 )
                             restart_triggered_id = agent_id  # Last agent to provide new answer
                             reset_signal = True
@@ -4180,9 +4265,10 @@ Your answer:"""
                                     loop = asyncio.get_running_loop()
                                     await loop.run_in_executor(
                                         None,
-                                        self.coordination_tracker.save_status_file,
+                                        contextvars.copy_context().run,
+                                        self._publish_coordination_status,
                                         log_session_dir,
-                                        self,
+                                        True,  # Milestone: publish and write immediately
                                     )
 
                                 # Track event for logging only
@@ -4360,26 +4446,44 @@ Your answer:"""
                     )
                     await self._close_agent_stream(agent_id, active_streams)
 
+            # Agents that started speculatively keep their work only if the new answers match
+            # the provisional ones they were given
+            kept_speculations: Dict[str, List[str]] = {}
+            discarded_speculations: Set[str] = set()
+            if reset_signal and self._speculative_start is not None:
+                kept_speculations, discarded_speculations = self._speculative_start.resolve(answered_agents)
+                for agent_id, source_agent_ids in kept_speculations.items():
+                    self._keep_speculative_work(agent_id, source_agent_ids)
+
             # Apply all state changes atomically after processing all results
             if reset_signal:
                 # Reset all agents' has_voted to False (any new answer invalidates all votes/stops)
-                for state in self.agent_states.values():
+                for agent_id, state in self.agent_states.items():
+                    if agent_id in kept_speculations:
+                        continue
                     state.has_voted = False
                     state.votes = {}  # Clear stale vote data
                     state.stop_summary = None  # Clear stop metadata (wakes up stopped agents)
                     state.stop_status = None
+                kept_votes = {agent_id: vote_data for agent_id, vote_data in votes.items() if agent_id in kept_speculations}
                 votes.clear()
+                votes.update(kept_votes)
+                for agent_id, vote_data in voted_agents.items():
+                    if agent_id in kept_speculations:
+                        self.agent_states[agent_id].has_voted = True
+                        votes[agent_id] = vote_data
 
                 # Skip restart signaling when injection is disabled (multi-agent refinement OFF)
                 # Agents work independently and don't need to see each other's answers
                 if not self.config.disable_injection:
-                    for agent_id in self.agent_states.keys():
+                    restarted_agent_ids = [agent_id for agent_id in self.agent_states.keys() if agent_id not in kept_speculations]
+                    for agent_id in restarted_agent_ids:
                         self.agent_states[agent_id].restart_pending = True
 
                     # Track restart signals
                     self.coordination_tracker.track_restart_signal(
                         restart_triggered_id,
-                        list(self.agent_states.keys()),
+                        restarted_agent_ids,
                     )
                     # Note that the agent that sent the restart signal had its stream end so we should mark as completed. NOTE the below breaks it.
                     self.coordination_tracker.complete_agent_restart(restart_triggered_id)
@@ -4413,6 +4517,26 @@ Your answer:"""
                         self.coordination_tracker.change_status(agent_id, AgentStatus.VOTED)
                 # Errors and timeouts are already tracked via track_agent_action
 
+            if self._speculative_start is not None:
+                for agent_id in completed_agent_ids:
+                    if agent_id in answered_agents:
+                        continue
+                    if agent_id not in voted_agents:
+                        # Round ended without a result; a restart starts a new speculation
+                        self._speculative_start.end(agent_id)
+                    # Provisional answers from a round that ended without an answer are void
+                    discarded_speculations |= self._speculative_start.invalidate_source(agent_id)
+
+            for agent_id in sorted(discarded_speculations):
+                self._discard_speculative_work(agent_id, votes, active_streams)
+                message = "🔄 Speculative work discarded - final answer differs from the provisional one it started from"
+                log_stream_chunk("orchestrator", "content", message, agent_id)
+                yield StreamChunk(
+                    type="agent_status" if self.trace_classification == "strict" else "content",
+                    content=message,
+                    source=agent_id,
+                )
+
         # Cancel any remaining tasks and close streams, as all agents have voted (no more new answers)
         for agent_id, task in active_tasks.items():
             if not task.done():
@@ -4790,6 +4914,10 @@ Your answer:"""
         active_streams: Dict[str, AsyncGenerator],
     ) -> None:
         """Close and remove an agent stream safely."""
+        # Stop the agent's pump first; the stream can't be closed while it is being iterated
+        stream_mux = getattr(self, "_stream_mux", None)
+        if stream_mux is not None:
+            await stream_mux.detach(agent_id)
         if agent_id in active_streams:
             try:
                 await active_streams[agent_id].aclose()
@@ -6552,7 +6680,8 @@ Your answer:"""
         # unless global answer cap has already been reached.
         if self.config.defer_voting_until_all_answered and not hit_global_limit:
             all_answered = all(state.answer is not None for state in self.agent_states.values())
-            if not all_answered:
+            # A speculative start with provisional versions of every missing answer counts as all answered
+            if not all_answered and not self._speculation_covers_missing_answers(agent_id):
                 # Agent hit their limit but others haven't answered yet
                 # Return False - agent is in "waiting" state, handled by _is_waiting_for_all_answers
                 return False
@@ -6621,6 +6750,106 @@ Your answer:"""
         )
         return True
 
+    def _create_speculative_start_tracker(self) -> Optional[SpeculativeStartTracker]:
+        """Create the speculative start tracker if enabled in the config."""
+        speculative_config = getattr(self.config, "speculative_start", None)
+        if speculative_config is None or not speculative_config.enabled:
+            return None
+        return SpeculativeStartTracker(speculative_config)
+
+    def _get_speculation_source_ids(self, agent_id: str) -> List[str]:
+        """Peers a speculative start of `agent_id` needs provisional answers from.
+
+        Only peers that have not submitted any answer yet are covered; revisions of
+        existing answers go through the normal injection path.
+        """
+        if self._speculative_start is None or self._is_decomposition_mode() or self.config.skip_voting:
+            return []
+        return [aid for aid, state in self.agent_states.items() if aid != agent_id and state.answer is None]
+
+    def _get_speculative_answers(
+        self,
+        agent_id: str,
+        active_streams: Dict[str, AsyncGenerator],
+        require_all: bool = False,
+    ) -> Dict[str, str]:
+        """Get provisional answers `agent_id` can start from.
+
+        Args:
+            agent_id: Agent about to start
+            active_streams: Currently running agent streams (only running peers have drafts)
+            require_all: Return nothing unless every missing answer has a provisional version
+
+        Returns:
+            Dict of source agent_id -> provisional answer
+        """
+        source_ids = self._get_speculation_source_ids(agent_id)
+        provisional_answers = {}
+        for source_id in source_ids:
+            provisional = self._speculative_start.provisional_answer(source_id) if source_id in active_streams else None
+            if provisional:
+                provisional_answers[source_id] = provisional
+        if require_all and len(provisional_answers) < len(source_ids):
+            return {}
+        return provisional_answers
+
+    def _get_speculation_wait(self, agent_id: str, active_streams: Dict[str, AsyncGenerator]) -> Optional[float]:
+        """Seconds until a waiting agent's missing answers all have stable drafts.
+
+        Returns:
+            Seconds to wait, or None when no draft is close (only new content can change that)
+        """
+        if self.agent_states[agent_id].has_voted:
+            return None
+        source_ids = self._get_speculation_source_ids(agent_id)
+        waits = []
+        for source_id in source_ids:
+            wait = self._speculative_start.seconds_until_ready(source_id) if source_id in active_streams else None
+            if wait is None:
+                return None
+            waits.append(wait)
+        longest = max(waits, default=0.0)
+        return longest if longest > 0 else None
+
+    def _speculation_covers_missing_answers(self, agent_id: str) -> bool:
+        """Whether `agent_id` runs speculatively with provisional versions of all missing answers."""
+        if self._speculative_start is None:
+            return False
+        missing = [aid for aid, state in self.agent_states.items() if state.answer is None]
+        return self._speculative_start.covers(agent_id, missing)
+
+    def _keep_speculative_work(self, agent_id: str, source_agent_ids: List[str]) -> None:
+        """Treat final answers that matched an agent's provisional ones as already seen."""
+        self._mark_seen_answer_revisions(agent_id, source_agent_ids)
+        self.coordination_tracker.update_agent_context_with_new_answers(agent_id, source_agent_ids)
+        # Votes cast before the answer existed were recorded without a label
+        for vote in self.coordination_tracker.votes:
+            if vote.voter_id == agent_id and vote.voted_for in source_agent_ids and vote.voted_for_label == "unknown":
+                vote.voted_for_label = self.coordination_tracker.get_latest_answer_label(vote.voted_for) or "unknown"
+        logger.info(
+            f"[Orchestrator] Speculative work of {agent_id} kept: final answers from {source_agent_ids} match the provisional ones",
+        )
+
+    def _discard_speculative_work(
+        self,
+        agent_id: str,
+        votes: Dict[str, Dict],
+        active_streams: Dict[str, AsyncGenerator],
+    ) -> None:
+        """Drop an agent's speculative vote and have its speculative round restart.
+
+        A running round is not closed here: like any agent with unseen answers,
+        it picks up restart_pending at its next safe point and restarts (or
+        receives the final answers mid-stream).
+        """
+        state = self.agent_states[agent_id]
+        state.has_voted = False
+        state.votes = {}
+        votes.pop(agent_id, None)
+        if agent_id in active_streams:
+            state.restart_pending = True
+        logger.info(f"[Orchestrator] Speculative work of {agent_id} discarded")
+
     def _get_buffer_content(self, agent: "ChatAgent") -> tuple[Optional[str], int]:
         """Get streaming buffer content from agent backend for enforcement tracking.
 
@@ -6962,7 +7191,8 @@ Your answer:"""
                     f"[Orchestrator] Rate limit: {len(startup_times)}/{max_starts} {model_key} agents " f"started in {time_window}s window. Waiting {wait_time:.2f}s before starting {agent_id}...",
                 )
 
-                await asyncio.sleep(wait_time)
+                with self.span_profiler.span("rate_limit_wait", RATE_LIMIT_WAIT, agent_id, model=model_key):
+                    await asyncio.sleep(wait_time)
 
                 # After waiting, clean up old timestamps again
                 current_time = time.time()
@@ -7186,6 +7416,11 @@ Your answer:"""
         _agent_voted_for_label = None  # Only set for votes (e.g., "agent2.1")
         _agent_error_message = None  # Only set for errors
 
+        # Latency profile for this round (see massgen/profiling)
+        _profile_round = self.span_profiler.begin_round(agent_id, self.coordination_tracker.get_agent_round(agent_id), round_type)
+        _profile_prompt = self.span_profiler.start("prompt_build", PROMPT_BUILD, agent_id)
+        _profile_retry = None
+
         try:
             # Normalize workspace paths in agent answers for better comparison from this agent's perspective
             normalized_answers = self._normalize_workspace_paths_in_answers(answers, agent_id) if answers else answers
@@ -7499,6 +7734,7 @@ Your answer:"""
             )
 
             enforcement_msg = self.message_templates.enforcement_message()
+            self.span_profiler.finish(_profile_prompt)
 
             # Update agent status to STREAMING
             self.coordination_tracker.change_status(agent_id, AgentStatus.STREAMING)
@@ -7520,6 +7756,8 @@ Your answer:"""
                 logger.info(
                     f"[Orchestrator] Agent {agent_id} workflow enforcement attempt {attempt + 1}/{max_attempts}",
                 )
+                if not is_first_real_attempt and _profile_retry is None:
+                    _profile_retry = self.span_profiler.start("enforcement_retry", ENFORCEMENT_RETRY, agent_id)
 
                 if self._check_restart_pending(agent_id):
                     logger.info(
@@ -7763,26 +8001,30 @@ Your answer:"""
                                 )
 
                         # Stream reasoning content as tuple format for Rich display
-                        reasoning_chunk = StreamChunk(
-                            type=chunk.type,
-                            content=chunk.content,
-                            source=agent_id,
-                            reasoning_delta=getattr(chunk, "reasoning_delta", None),
-                            reasoning_text=getattr(chunk, "reasoning_text", None),
-                            reasoning_summary_delta=getattr(
-                                chunk,
-                                "reasoning_summary_delta",
-                                None,
-                            ),
-                            reasoning_summary_text=getattr(
-                                chunk,
-                                "reasoning_summary_text",
-                                None,
-                            ),
-                            item_id=getattr(chunk, "item_id", None),
-                            content_index=getattr(chunk, "content_index", None),
-                            summary_index=getattr(chunk, "summary_index", None),
-                        )
+                        if isinstance(chunk, StreamChunk):
+                            # Forward the backend's chunk itself instead of re-wrapping it
+                            reasoning_chunk = chunk.attributed_to(agent_id)
+                        else:
+                            reasoning_chunk = StreamChunk(
+                                type=chunk.type,
+                                content=chunk.content,
+                                source=agent_id,
+                                reasoning_delta=getattr(chunk, "reasoning_delta", None),
+                                reasoning_text=getattr(chunk, "reasoning_text", None),
+                                reasoning_summary_delta=getattr(
+                                    chunk,
+                                    "reasoning_summary_delta",
+                                    None,
+                                ),
+                                reasoning_summary_text=getattr(
+                                    chunk,
+                                    "reasoning_summary_text",
+                                    None,
+                                ),
+                                item_id=getattr(chunk, "item_id", None),
+                                content_index=getattr(chunk, "content_index", None),
+                                summary_index=getattr(chunk, "summary_index", None),
+                            )
                         yield ("reasoning", reasoning_chunk)
                     elif chunk_type == "backend_status":
                         pass
@@ -8218,6 +8460,10 @@ Your answer:"""
                         if tool_name == "vote":
                             # Fetch fresh answers from agent_states (injection may have added new ones)
                             answers = {aid: state.answer for aid, state in self.agent_states.items() if state.answer}
+                            # Provisional answers this agent started from speculatively are valid targets too
+                            if self._speculative_start is not None:
+                                for source_id, provisional in self._speculative_start.provisional_answers_for(agent_id).items():
+                                    answers.setdefault(source_id, provisional)
 
                             # Log which agents we are choosing from
                             logger.info(
@@ -8823,6 +9069,10 @@ Your answer:"""
             # Hook manager cleanup is automatic - no explicit cleanup needed
             # The GeneralHookManager is recreated for each agent run
 
+            self.span_profiler.finish(_profile_prompt)
+            self.span_profiler.finish(_profile_retry)
+            self.span_profiler.finish(_profile_round, outcome=_agent_outcome or "interrupted")
+
             # Add outcome attributes to agent execution span
             if _agent_outcome:
                 _agent_span.set_attribute("massgen.outcome", _agent_outcome)
@@ -8893,6 +9143,22 @@ Your answer:"""
             # Clear the round context
             clear_current_round()
 
+    @staticmethod
+    def _forward_chunk(chunk: Any, chunk_type: str, source: str) -> StreamChunk:
+        """Pass a chunk through attributed to ``source``.
+
+        StreamChunks are forwarded without copying; other chunk classes
+        (e.g. TextStreamChunk) are converted field by field.
+        """
+        if isinstance(chunk, StreamChunk):
+            return chunk.attributed_to(source, chunk_type)
+        return StreamChunk(
+            type=chunk_type,
+            content=getattr(chunk, "content", ""),
+            source=source,
+            **{k: v for k, v in chunk.__dict__.items() if k not in ("type", "content", "source", "timestamp", "sequence_number")},
+        )
+
     async def _get_next_chunk(self, stream: AsyncGenerator[tuple, None]) -> tuple:
         """Get the next chunk from an agent stream."""
         try:
@@ -9463,6 +9729,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
             attributes=span_attributes,
         )
         _presentation_span = _presentation_span_cm.__enter__()  # Capture yielded span for set_attribute()
+        _profile_round = self.span_profiler.begin_round(selected_agent_id, final_round, "presentation")
 
         # Set the round context for nested tool calls to use
         set_current_round(final_round, "presentation")
@@ -9809,9 +10076,10 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
             loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
-                self.coordination_tracker.save_status_file,
+                contextvars.copy_context().run,
+                self._publish_coordination_status,
                 log_session_dir,
-                self,
+                True,  # Milestone: publish and write immediately
             )
 
         # Create conversation with system and user messages
@@ -10139,23 +10407,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                             getattr(chunk, "content", ""),
                             selected_agent_id,
                         )
-                        yield StreamChunk(
-                            type=chunk_type,
-                            content=getattr(chunk, "content", ""),
-                            source=selected_agent_id,
-                            **{
-                                k: v
-                                for k, v in chunk.__dict__.items()
-                                if k
-                                not in [
-                                    "type",
-                                    "content",
-                                    "source",
-                                    "timestamp",
-                                    "sequence_number",
-                                ]
-                            },
-                        )
+                        yield self._forward_chunk(chunk, chunk_type, selected_agent_id)
                     else:
                         log_stream_chunk(
                             "orchestrator",
@@ -10163,23 +10415,7 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                             getattr(chunk, "content", ""),
                             selected_agent_id,
                         )
-                        yield StreamChunk(
-                            type=chunk_type,
-                            content=getattr(chunk, "content", ""),
-                            source=selected_agent_id,
-                            **{
-                                k: v
-                                for k, v in chunk.__dict__.items()
-                                if k
-                                not in [
-                                    "type",
-                                    "content",
-                                    "source",
-                                    "timestamp",
-                                    "sequence_number",
-                                ]
-                            },
-                        )
+                        yield self._forward_chunk(chunk, chunk_type, selected_agent_id)
 
         finally:
             # Ensure final snapshot is always saved (even if "done" chunk wasn't yielded)
@@ -10293,6 +10529,8 @@ INSTRUCTIONS FOR NEXT ATTEMPT:
                     round(token_usage.estimated_cost or 0, 6),
                 )
 
+            self.span_profiler.finish(_profile_round, outcome="presentation")
+
             # Close the presentation span for hierarchical tracing
             # Wrap in try/except to handle OpenTelemetry context issues in async generators
             try:
@@ -11021,23 +11259,7 @@ Then call either submit(confirmed=True) if the answer is satisfactory, or restar
                             getattr(chunk, "content", ""),
                             selected_agent_id,
                         )
-                        yield StreamChunk(
-                            type=chunk_type,
-                            content=getattr(chunk, "content", ""),
-                            source=selected_agent_id,
-                            **{
-                                k: v
-                                for k, v in chunk.__dict__.items()
-                                if k
-                                not in [
-                                    "type",
-                                    "content",
-                                    "source",
-                                    "timestamp",
-                                    "sequence_number",
-                                ]
-                            },
-                        )
+                        yield self._forward_chunk(chunk, chunk_type, selected_agent_id)
         except asyncio.TimeoutError:
             log_stream_chunk(
                 "orchestrator",
@@ -11838,6 +12060,7 @@ Then call either submit(confirmed=True) if the answer is satisfactory, or restar
         # Clear coordination state
         self._active_streams = {}
         self._active_tasks = {}
+        self._stream_mux = None
         self._fairness_pause_log_reasons = {}
         self._fairness_block_log_states = {}
         self._round_isolation_managers = {}
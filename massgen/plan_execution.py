@@ -6,6 +6,7 @@ This module provides reusable functions for preparing plan execution,
 ensuring both CLI (--execute-plan) and TUI execute mode use the same logic.
 """
 
+import asyncio
 import copy
 import json
 import logging
@@ -13,7 +14,19 @@ import re
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .mcp_tools.planning.plan_store import change_log_path, load_plan_data
 
 if TYPE_CHECKING:
     from .plan_storage import PlanMetadata, PlanSession
@@ -87,7 +100,7 @@ def _archive_existing_operational_plan(
         return
 
     try:
-        existing_payload = json.loads(plan_file.read_text())
+        existing_payload = load_plan_data(plan_file)
     except json.JSONDecodeError:
         logger.warning(
             "[PlanExecution] Skipping plan archive: existing %s is not valid JSON",
@@ -222,6 +235,155 @@ def validate_chunked_plan(
     return chunk_order, tasks_by_chunk
 
 
+def compute_chunk_dependencies(plan_data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Derive the chunk dependency DAG from task dependencies.
+
+    A chunk depends on another when any of its tasks depends on a task in that
+    chunk. Chunks with no cross-chunk dependencies between them can run
+    concurrently.
+
+    Returns:
+        Mapping of chunk -> upstream chunks (in chunk order)
+    """
+    chunk_order, tasks_by_chunk = validate_chunked_plan(plan_data)
+    task_chunk_by_id = {str(task.get("id")).strip(): chunk for chunk, tasks in tasks_by_chunk.items() for task in tasks}
+
+    dependencies: Dict[str, List[str]] = {}
+    for chunk in chunk_order:
+        upstream = set()
+        for task in tasks_by_chunk[chunk]:
+            for dep_id in _normalize_dependency_ids(task):
+                dep_chunk = task_chunk_by_id.get(dep_id)
+                if dep_chunk and dep_chunk != chunk:
+                    upstream.add(dep_chunk)
+        dependencies[chunk] = [c for c in chunk_order if c in upstream]
+    return dependencies
+
+
+async def run_chunk_dag(
+    chunk_order: List[str],
+    chunk_dependencies: Dict[str, List[str]],
+    run_chunk: Callable[[str, int], Awaitable[bool]],
+    *,
+    completed: Iterable[str] = (),
+    max_parallel: int = 1,
+) -> None:
+    """
+    Run chunks as soon as their upstream chunks finish, up to max_parallel at once.
+
+    Args:
+        chunk_order: Chunks in planner order (a topological order of the DAG)
+        chunk_dependencies: Mapping of chunk -> upstream chunks
+        run_chunk: Coroutine called with (chunk, lane). Returns True when the
+            chunk is done and False to queue it again. Lanes are integers in
+            [0, max_parallel) and are never shared by two running chunks.
+        completed: Chunks already done (e.g. when resuming)
+        max_parallel: Maximum number of chunks to run concurrently
+
+    Raises:
+        PlanValidationError: If remaining chunks depend on chunks that can never finish
+        Exception: Whatever run_chunk raises; other running chunks are cancelled first
+    """
+    done = set(completed)
+    pending = [chunk for chunk in chunk_order if chunk not in done]
+    free_lanes = list(range(max(1, max_parallel)))
+    running: Dict["asyncio.Future[bool]", Tuple[str, int]] = {}
+
+    while pending or running:
+        for chunk in list(pending):
+            if not free_lanes:
+                break
+            if all(dep in done for dep in chunk_dependencies.get(chunk, [])):
+                pending.remove(chunk)
+                lane = free_lanes.pop(0)
+                running[asyncio.ensure_future(run_chunk(chunk, lane))] = (chunk, lane)
+
+        if not running:
+            raise PlanValidationError(f"Chunks have unsatisfiable dependencies: {', '.join(pending)}")
+
+        finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in finished:
+            chunk, lane = running.pop(future)
+            free_lanes.append(lane)
+            free_lanes.sort()
+            try:
+                chunk_done = future.result()
+            except BaseException:
+                for other in running:
+                    other.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                raise
+            if chunk_done:
+                done.add(chunk)
+            else:
+                # Retry in its original position so downstream order stays deterministic
+                requeued = set(pending) | {chunk}
+                pending = [c for c in chunk_order if c in requeued]
+
+
+def combine_chunk_answers(
+    chunk_order: List[str],
+    chunk_dependencies: Dict[str, List[str]],
+    answers: Dict[str, str],
+) -> str:
+    """
+    Build the final answer of a concurrent chunk run from per-chunk answers.
+
+    Only the answers of chunks no other chunk builds on are used, since
+    upstream answers are superseded by their downstream chunks. Several such
+    answers are returned as sections in chunk order.
+
+    Args:
+        chunk_order: Chunks in planner order
+        chunk_dependencies: Mapping of chunk -> upstream chunks
+        answers: Latest answer of each chunk that produced one
+
+    Returns:
+        Combined answer, or an empty string if no chunk produced one
+    """
+    upstream = {dep for deps in chunk_dependencies.values() for dep in deps}
+    final_chunks = [chunk for chunk in chunk_order if chunk not in upstream and answers.get(chunk)]
+    if len(final_chunks) == 1:
+        return answers[final_chunks[0]]
+    return "\n\n".join(f"## Chunk {chunk}\n\n{answers[chunk]}" for chunk in final_chunks)
+
+
+def merge_chunk_workspace(source: Path, target: Path) -> List[str]:
+    """
+    Merge a chunk's workspace output into another workspace via ChangeApplier.
+
+    Per-chunk operational files (``tasks/`` and ``planning_docs/``) are left
+    alone so each lane keeps its own plan scope.
+
+    Returns:
+        Applied file paths (relative to target)
+    """
+    from .filesystem_manager import ChangeApplier
+
+    source = Path(source)
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    blocked = [str(path.relative_to(source)) for scope in ("tasks", "planning_docs") if (source / scope).is_dir() for path in (source / scope).rglob("*") if path.is_file()]
+    return ChangeApplier().apply_changes(str(source), str(target), blocked_files=blocked)
+
+
+def build_lane_config(config: Dict[str, Any], lane: int) -> Dict[str, Any]:
+    """
+    Return a copy of an execution config for an additional chunk lane.
+
+    Agent IDs get a ``_laneN`` suffix so concurrently running lanes keep
+    separate snapshots, temporary workspaces and logs.
+    """
+    lane_config = copy.deepcopy(config)
+    agent_entries = lane_config.get("agents")
+    if agent_entries is None and "agent" in lane_config:
+        agent_entries = [lane_config["agent"]]
+    for i, agent_cfg in enumerate(agent_entries or [], start=1):
+        agent_cfg["id"] = f"{agent_cfg.get('id', f'agent{i}')}_lane{lane}"
+    return lane_config
+
+
 def get_next_pending_chunk(metadata: "PlanMetadata") -> Optional[str]:
     """Return the next pending chunk from metadata."""
     chunk_order = metadata.chunk_order or []
@@ -240,6 +402,7 @@ def initialize_chunk_execution_state(plan_session: "PlanSession") -> "PlanMetada
 
     metadata.execution_mode = "chunked_by_planner_v1"
     metadata.chunk_order = chunk_order
+    metadata.chunk_dependencies = compute_chunk_dependencies(plan_data)
     metadata.completed_chunks = [chunk for chunk in (metadata.completed_chunks or []) if chunk in set(chunk_order)]
     metadata.chunk_history = metadata.chunk_history or []
     metadata.planning_feedback_history = metadata.planning_feedback_history or []
@@ -322,6 +485,49 @@ def evaluate_chunk_progress(
     }
 
 
+def _latest_chunk_timing(history: List[Dict[str, Any]], chunk: str) -> Optional[Dict[str, Any]]:
+    for entry in reversed(history):
+        if entry.get("chunk") == chunk and isinstance(entry.get("timing"), dict):
+            return entry["timing"]
+    return None
+
+
+def _chunk_critical_path_timing(
+    metadata: "PlanMetadata",
+    chunk: str,
+    timing: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Complete a checkpoint's timing with critical-path totals.
+
+    The critical path to a chunk is the time spent on the chunk itself (all
+    attempts) plus the longest critical path among its upstream chunks.
+    """
+    duration = float(timing.get("duration_seconds") or 0.0)
+    history = metadata.chunk_history or []
+    chunk_seconds = duration + sum(float(entry.get("timing", {}).get("duration_seconds") or 0.0) for entry in history if entry.get("chunk") == chunk)
+
+    upstream_seconds = 0.0
+    upstream_path: List[str] = []
+    for dep in (metadata.chunk_dependencies or {}).get(chunk, []):
+        dep_timing = _latest_chunk_timing(history, dep)
+        if dep_timing and float(dep_timing.get("critical_path_seconds") or 0.0) > upstream_seconds:
+            upstream_seconds = float(dep_timing["critical_path_seconds"])
+            upstream_path = list(dep_timing.get("critical_path") or [dep])
+
+    completed = dict(timing)
+    completed.update(
+        {
+            "finished_at": _utc_now_iso(),
+            "duration_seconds": round(duration, 3),
+            "chunk_seconds": round(chunk_seconds, 3),
+            "critical_path_seconds": round(upstream_seconds + chunk_seconds, 3),
+            "critical_path": upstream_path + [chunk],
+        },
+    )
+    return completed
+
+
 def record_chunk_checkpoint(
     plan_session: "PlanSession",
     *,
@@ -330,8 +536,16 @@ def record_chunk_checkpoint(
     attempt: int,
     progress: Optional[Dict[str, Any]] = None,
     error_message: Optional[str] = None,
+    timing: Optional[Dict[str, Any]] = None,
 ) -> "PlanMetadata":
-    """Persist chunk checkpoint metadata and append chunk history entry."""
+    """
+    Persist chunk checkpoint metadata and append chunk history entry.
+
+    Args:
+        timing: Optional attempt timing (``started_at``, ``duration_seconds``
+            and e.g. ``lane``). Critical-path totals over the chunk DAG are
+            added before it is stored on the history entry.
+    """
     metadata = plan_session.load_metadata()
     metadata.chunk_history = metadata.chunk_history or []
     metadata.completed_chunks = metadata.completed_chunks or []
@@ -346,6 +560,8 @@ def record_chunk_checkpoint(
         entry["progress"] = progress
     if error_message:
         entry["error"] = error_message
+    if timing:
+        entry["timing"] = _chunk_critical_path_timing(metadata, chunk, timing)
     metadata.chunk_history.append(entry)
 
     if status == "completed" and chunk not in metadata.completed_chunks:
@@ -371,19 +587,47 @@ def record_chunk_checkpoint(
             "attempt": attempt,
             "progress": progress or {},
             "error": error_message,
+            "timing": entry.get("timing"),
         },
     )
     return metadata
 
 
+def summarize_chunk_timing(metadata: "PlanMetadata") -> Optional[Dict[str, Any]]:
+    """
+    Summarize recorded chunk timing.
+
+    Returns:
+        Dict with ``total_chunk_seconds`` (sum over all attempts),
+        ``critical_path_seconds`` and ``critical_path``, or None when no
+        checkpoint carried timing
+    """
+    timings = [entry["timing"] for entry in metadata.chunk_history or [] if isinstance(entry.get("timing"), dict)]
+    if not timings:
+        return None
+    longest = max(timings, key=lambda timing: float(timing.get("critical_path_seconds") or 0.0))
+    return {
+        "total_chunk_seconds": round(sum(float(timing.get("duration_seconds") or 0.0) for timing in timings), 3),
+        "critical_path_seconds": float(longest.get("critical_path_seconds") or 0.0),
+        "critical_path": list(longest.get("critical_path") or []),
+    }
+
+
 def mark_session_resumable(
     plan_session: "PlanSession",
     *,
     current_chunk: Optional[str],
     reason: str,
     retry_counts: Optional[Dict[str, int]] = None,
+    running_chunks: Optional[List[str]] = None,
 ) -> "PlanMetadata":
-    """Mark the plan session as resumable with the latest checkpoint pointer."""
+    """
+    Mark the plan session as resumable with the latest checkpoint pointer.
+
+    Args:
+        running_chunks: Chunks that were in flight when execution stopped
+            (concurrent chunk execution); recorded in ``resumable_state``.
+    """
     metadata = plan_session.load_metadata()
     metadata.status = "resumable"
     metadata.current_chunk = current_chunk or metadata.current_chunk
@@ -393,6 +637,8 @@ def mark_session_resumable(
         "reason": reason,
         "retry_counts": retry_counts or {},
     }
+    if running_chunks is not None:
+        metadata.resumable_state["running_chunks"] = list(running_chunks)
     plan_session.save_metadata(metadata)
     plan_session.log_event(
         "execution_resumable",
@@ -628,6 +874,8 @@ def setup_agent_workspaces_for_execution(
         _archive_existing_operational_plan(tasks_dir, selected_chunk)
         plan_file = tasks_dir / "plan.json"
         plan_file.write_text(json.dumps(operational_plan, indent=2))
+        # Pending entries belong to the archived plan, not the one just written
+        change_log_path(plan_file).unlink(missing_ok=True)
         logger.info(
             "[PlanExecution] Wrote operational plan to %s (%d tasks, chunk=%s)",
             plan_file,
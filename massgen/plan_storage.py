@@ -35,6 +35,7 @@ class PlanMetadata:
     # Chunk execution metadata
     execution_mode: Optional[str] = None  # "chunked_by_planner_v1"
     chunk_order: Optional[List[str]] = None
+    chunk_dependencies: Optional[Dict[str, List[str]]] = None  # chunk -> upstream chunks
     current_chunk: Optional[str] = None
     completed_chunks: Optional[List[str]] = None
     chunk_history: Optional[List[Dict[str, Any]]] = None
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Internal latency and sampling profilers for coordination runs (no Logfire required)."""
+
+from massgen.profiling.sampler import (
+    COLLAPSED_FILENAME,
+    LOOP_BLOCKS_FILENAME,
+    SPEEDSCOPE_FILENAME,
+    LoopBlockDetector,
+    SamplingProfiler,
+    StackSampler,
+)
+from massgen.profiling.spans import (
+    ENFORCEMENT_RETRY,
+    HOOK,
+    PHASES,
+    PROMPT_BUILD,
+    RATE_LIMIT_WAIT,
+    ROUND,
+    SNAPSHOT,
+    STREAMING,
+    TOOL,
+    TRACE_FILENAME,
+    TTFT,
+    Span,
+    SpanProfiler,
+    activate_profiler,
+    backend_metric_spans,
+    build_report,
+    get_active_profiler,
+    profile_span,
+    profiled,
+    to_chrome_trace,
+)
+
+__all__ = [
+    "COLLAPSED_FILENAME",
+    "ENFORCEMENT_RETRY",
+    "HOOK",
+    "LOOP_BLOCKS_FILENAME",
+    "LoopBlockDetector",
+    "PHASES",
+    "PROMPT_BUILD",
+    "RATE_LIMIT_WAIT",
+    "ROUND",
+    "SNAPSHOT",
+    "SPEEDSCOPE_FILENAME",
+    "STREAMING",
+    "SamplingProfiler",
+    "Span",
+    "SpanProfiler",
+    "StackSampler",
+    "TOOL",
+    "TRACE_FILENAME",
+    "TTFT",
+    "activate_profiler",
+    "backend_metric_spans",
+    "build_report",
+    "get_active_profiler",
+    "profile_span",
+    "profiled",
+    "to_chrome_trace",
+]
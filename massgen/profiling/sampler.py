@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in sampling profiler and event-loop block detector for long runs.
+
+``SamplingProfiler`` runs two daemon threads next to the event loop:
+
+- A stack sampler that snapshots ``sys._current_frames()`` at a fixed interval
+  and aggregates the stacks of the event-loop thread and worker threads (tool
+  calls run via ``asyncio.to_thread``, executors, MCP clients). It samples from
+  a thread rather than with ``SIGPROF`` so it works on every platform and sees
+  threads other than the main one.
+- A watchdog that pings the loop with ``call_soon_threadsafe`` and, when the
+  ping is not serviced within the threshold, logs the loop thread's stack at
+  that moment, which is the callback that is blocking it.
+
+On ``stop()`` it writes into the session log directory:
+
+- ``profile.collapsed``: folded stacks (``thread;frame;frame count``) for
+  flamegraph.pl, speedscope or inferno
+- ``profile.speedscope.json``: one sampled profile per thread, open it in
+  https://www.speedscope.app
+- ``loop_blocks.json``: every detected block with its duration and stack
+
+Enable it with ``massgen --sample-profile`` or in the config:
+
+.. code-block:: yaml
+
+    profiling:
+      sampling: true
+      interval_ms: 10            # Stack sampling interval
+      loop_block_threshold_ms: 250
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..logger_config import logger
+
+COLLAPSED_FILENAME = "profile.collapsed"
+SPEEDSCOPE_FILENAME = "profile.speedscope.json"
+LOOP_BLOCKS_FILENAME = "loop_blocks.json"
+
+DEFAULT_INTERVAL_MS = 10.0
+DEFAULT_LOOP_BLOCK_THRESHOLD_MS = 250.0
+
+# Deepest frames kept per sample; deeper stacks are truncated at the root side
+_MAX_STACK_DEPTH = 128
+
+# Frame key: (function name, file, first line of the function)
+_FrameKey = Tuple[str, str, int]
+
+
+def _frame_keys(frame: Optional[FrameType]) -> Tuple[_FrameKey, ...]:
+    """Stack of a frame from root to leaf."""
+    keys: List[_FrameKey] = []
+    while frame is not None and len(keys) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        keys.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    keys.reverse()
+    return tuple(keys)
+
+
+def _short_filename(filename: str) -> str:
+    parts = Path(filename).parts
+    for marker in ("site-packages", "massgen"):
+        if marker in parts:
+            index = len(parts) - 1 - parts[::-1].index(marker)
+            return "/".join(parts[index + (marker == "site-packages") :])
+    return "/".join(parts[-2:])
+
+
+def _frame_label(key: _FrameKey) -> str:
+    name, filename, line = key
+    return f"{name} ({_short_filename(filename)}:{line})"
+
+
+class StackSampler:
+    """Periodically samples the stacks of all Python threads but its own."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL_MS / 1000, loop_thread_id: Optional[int] = None):
+        """
+        Args:
+            interval: Seconds between samples
+            loop_thread_id: Ident of the event-loop thread, labelled ``event_loop`` in the output
+        """
+        self.interval = interval
+        self.loop_thread_id = loop_thread_id
+        self.samples: Dict[str, Counter] = {}
+        self.sample_count = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="massgen-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.stopped_at = time.time()
+
+    def _thread_label(self, ident: int, names: Dict[int, str]) -> str:
+        if ident == self.loop_thread_id:
+            return "event_loop"
+        return names.get(ident, f"thread-{ident}")
+
+    def sample_once(self) -> None:
+        """Record one stack per thread."""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = _frame_keys(frame)
+            if stack:
+                self.samples.setdefault(self._thread_label(ident, names), Counter())[stack] += 1
+        self.sample_count += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception as e:  # Never let profiling take down a run
+                logger.debug(f"[StackSampler] Sample failed: {e}")
+
+    def to_collapsed(self) -> str:
+        """Folded stacks, one ``thread;frame;...;frame count`` line per unique stack."""
+        lines = []
+        for thread, stacks in sorted(self.samples.items()):
+            for stack, count in stacks.most_common():
+                lines.append(";".join([thread] + [_frame_label(key) for key in stack]) + f" {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "MassGen") -> Dict[str, Any]:
+        """Speedscope file with one sampled profile per thread (weights in milliseconds)."""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[_FrameKey, int] = {}
+        profiles = []
+        weight = round(self.interval * 1000, 3)
+        duration = ((self.stopped_at or time.time()) - (self.started_at or time.time())) * 1000
+        for thread, stacks in sorted(self.samples.items(), key=lambda item: (item[0] != "event_loop", item[0])):
+            samples, weights = [], []
+            for stack, count in stacks.items():
+                indices = []
+                for key in stack:
+                    if key not in frame_index:
+                        frame_index[key] = len(frames)
+                        frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                    indices.append(frame_index[key])
+                samples.append(indices)
+                weights.append(weight * count)
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(max(duration, sum(weights)), 3),
+                    "samples": samples,
+                    "weights": weights,
+                },
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "massgen",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+class LoopBlockDetector:
+    """Watchdog that logs the event loop's stack while a callback is blocking it."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread_id: int,
+        threshold: float = DEFAULT_LOOP_BLOCK_THRESHOLD_MS / 1000,
+        check_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            loop: Event loop to watch
+            loop_thread_id: Ident of the thread running the loop
+            threshold: Seconds a ping may wait before the loop counts as blocked
+            check_interval: Seconds between pings (defaults to half the threshold)
+        """
+        self.loop = loop
+        self.loop_thread_id = loop_thread_id
+        self.threshold = threshold
+        self.check_interval = check_interval if check_interval is not None else threshold / 2
+        self.blocks: List[Dict[str, Any]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the watchdog in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="massgen-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watchdog and wait for its thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            serviced = threading.Event()
+            sent = time.monotonic()
+            try:
+                self.loop.call_soon_threadsafe(serviced.set)
+            except RuntimeError:  # Loop closed
+                return
+            if serviced.wait(self.threshold):
+                continue
+
+            frame = sys._current_frames().get(self.loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            logger.warning(f"[LoopBlockDetector] Event loop blocked for over {self.threshold * 1000:.0f}ms, loop thread stack:\n{stack}")
+            while not serviced.wait(self.check_interval):
+                if self._stop.is_set() or self.loop.is_closed():
+                    break
+            duration = time.monotonic() - sent
+            self.blocks.append({"detected_at": time.time(), "duration_ms": round(duration * 1000, 1), "stack": stack})
+            logger.warning(f"[LoopBlockDetector] Event loop unblocked after {duration * 1000:.0f}ms")
+
+
+class SamplingProfiler:
+    """Stack sampler plus loop block detector, writing results to a log directory."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+        loop_block_threshold_ms: Optional[float] = DEFAULT_LOOP_BLOCK_THRESHOLD_MS,
+    ):
+        """
+        Args:
+            output_dir: Directory for the profile files (usually the session log root)
+            interval_ms: Stack sampling interval in milliseconds
+            loop_block_threshold_ms: Loop block threshold in milliseconds (None disables the detector)
+        """
+        self.output_dir = Path(output_dir)
+        self.interval_ms = interval_ms
+        self.loop_block_threshold_ms = loop_block_threshold_ms
+        self.sampler: Optional[StackSampler] = None
+        self.detector: Optional[LoopBlockDetector] = None
+
+    @classmethod
+    def from_config(cls, output_dir: Path, profiling_config: Optional[Dict[str, Any]] = None) -> "SamplingProfiler":
+        """Build from the ``profiling`` config section.
+
+        Args:
+            output_dir: Directory for the profile files
+            profiling_config: ``profiling`` section (``interval_ms``, ``loop_block_threshold_ms``)
+
+        Returns:
+            Profiler that has not been started yet
+        """
+        profiling_config = profiling_config or {}
+        return cls(
+            output_dir,
+            interval_ms=float(profiling_config.get("interval_ms", DEFAULT_INTERVAL_MS)),
+            loop_block_threshold_ms=profiling_config.get("loop_block_threshold_ms", DEFAULT_LOOP_BLOCK_THRESHOLD_MS),
+        )
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Start sampling; must be called from the thread running ``loop``.
+
+        Args:
+            loop: Loop to watch for blocks (defaults to the running loop, if any)
+        """
+        loop_thread_id = threading.get_ident()
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+        self.sampler = StackSampler(interval=self.interval_ms / 1000, loop_thread_id=loop_thread_id)
+        self.sampler.start()
+        if loop is not None and self.loop_block_threshold_ms:
+            self.detector = LoopBlockDetector(loop, loop_thread_id, threshold=float(self.loop_block_threshold_ms) / 1000)
+            self.detector.start()
+        logger.info(f"[SamplingProfiler] Sampling every {self.interval_ms:g}ms, loop block threshold {self.loop_block_threshold_ms}ms")
+
+    def stop(self) -> Dict[str, Path]:
+        """Stop sampling and write the profile files.
+
+        Returns:
+            Mapping of output kind ("collapsed", "speedscope", "loop_blocks") to written path
+        """
+        written: Dict[str, Path] = {}
+        if self.sampler is None:
+            return written
+        self.sampler.stop()
+        if self.detector is not None:
+            self.detector.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        collapsed_path = self.output_dir / COLLAPSED_FILENAME
+        collapsed_path.write_text(self.sampler.to_collapsed(), encoding="utf-8")
+        written["collapsed"] = collapsed_path
+
+        speedscope_path = self.output_dir / SPEEDSCOPE_FILENAME
+        with open(speedscope_path, "w", encoding="utf-8") as f:
+            json.dump(self.sampler.to_speedscope(name=self.output_dir.name), f)
+        written["speedscope"] = speedscope_path
+
+        if self.detector is not None:
+            blocks_path = self.output_dir / LOOP_BLOCKS_FILENAME
+            with open(blocks_path, "w", encoding="utf-8") as f:
+                json.dump({"threshold_ms": self.loop_block_threshold_ms, "blocks": self.detector.blocks}, f, indent=2)
+            written["loop_blocks"] = blocks_path
+
+        blocks = len(self.detector.blocks) if self.detector is not None else 0
+        logger.info(f"[SamplingProfiler] {self.sampler.sample_count} samples, {blocks} loop blocks; profile written to {self.output_dir}")
+        self.sampler = None
+        self.detector = None
+        return written
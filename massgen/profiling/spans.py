@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+Span-based latency profiler for coordination rounds.
+
+The orchestrator owns one ``SpanProfiler`` per task and activates it for the
+current context, so backends, hooks, rate limiters and filesystem managers can
+record spans without holding a reference to the orchestrator. Spans carry wall
+clock timestamps (``time.time()``) like ``APICallMetric`` and
+``ToolExecutionMetric``, whose existing records are converted into TTFT,
+streaming and tool spans when the profile is saved instead of being recorded
+twice.
+
+``SpanProfiler.save()`` writes a Chrome trace (``latency_trace.json``, open it
+in https://ui.perfetto.dev or chrome://tracing) and returns a report with a
+per-agent, per-round phase breakdown and the coordination critical path, which
+the orchestrator stores under ``latency`` in ``metrics_summary.json``.
+
+Usage:
+    profiler = SpanProfiler()
+    activate_profiler(profiler)
+
+    round_span = profiler.begin_round("agent_a", 1, "initial_answer")
+    with profile_span("prompt_build", PROMPT_BUILD):
+        build_prompt()
+    profiler.finish(round_span, outcome="answer")
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from ..logger_config import logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACE_FILENAME = "latency_trace.json"
+
+# Span categories
+ROUND = "round"
+PROMPT_BUILD = "prompt_build"
+SNAPSHOT = "snapshot"
+RATE_LIMIT_WAIT = "rate_limit_wait"
+TTFT = "ttft"
+STREAMING = "streaming"
+TOOL = "tool"
+HOOK = "hook"
+ENFORCEMENT_RETRY = "enforcement_retry"
+
+# Leaf phases of a round; time not covered by any of them is reported as "other".
+# Enforcement retries wrap leaf phases, so they are reported separately.
+PHASES = (PROMPT_BUILD, SNAPSHOT, RATE_LIMIT_WAIT, TTFT, STREAMING, TOOL, HOOK)
+
+# Slack when matching a round's start to the round that unblocked it
+_CRITICAL_PATH_SLACK_SECONDS = 0.05
+
+_active_profiler: ContextVar[Optional["SpanProfiler"]] = ContextVar("massgen_span_profiler", default=None)
+_current_agent: ContextVar[Optional[str]] = ContextVar("massgen_profiled_agent", default=None)
+
+
+@dataclass
+class Span:
+    """One timed interval, attributed to an agent and round when known."""
+
+    name: str
+    category: str
+    start: float
+    end: Optional[float] = None
+    agent_id: Optional[str] = None
+    round_number: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is open)."""
+        return (self.end - self.start) if self.end is not None else 0.0
+
+
+class SpanProfiler:
+    """Collects spans for one coordination task and exports trace and breakdown."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._agent_rounds: Dict[str, int] = {}
+
+    def start(
+        self,
+        name: str,
+        category: str,
+        agent_id: Optional[str] = None,
+        round_number: Optional[int] = None,
+        **attributes: Any,
+    ) -> Span:
+        """Open a span.
+
+        Args:
+            name: Span name shown in the trace
+            category: One of the category constants in this module
+            agent_id: Owning agent (defaults to the agent whose round is running in this context)
+            round_number: Round number (defaults to the agent's current round)
+            **attributes: Extra attributes stored in the trace
+
+        Returns:
+            The open span; close it with ``finish()``
+        """
+        agent_id = agent_id or _current_agent.get()
+        if round_number is None and agent_id is not None:
+            round_number = self._agent_rounds.get(agent_id)
+        span = Span(name=name, category=category, start=time.time(), agent_id=agent_id, round_number=round_number, attributes=attributes)
+        self.spans.append(span)
+        return span
+
+    def finish(self, span: Optional[Span], **attributes: Any) -> None:
+        """Close a span (no-op for None or already closed spans)."""
+        if span is None or span.end is not None:
+            return
+        span.end = time.time()
+        span.attributes.update(attributes)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        agent_id: Optional[str] = None,
+        round_number: Optional[int] = None,
+        **attributes: Any,
+    ) -> Iterator[Span]:
+        """Context manager form of ``start()``/``finish()``."""
+        span = self.start(name, category, agent_id=agent_id, round_number=round_number, **attributes)
+        try:
+            yield span
+        finally:
+            self.finish(span)
+
+    def begin_round(self, agent_id: str, round_number: int, round_type: str) -> Span:
+        """Open an agent round and attribute later spans in this context to it.
+
+        Args:
+            agent_id: Agent starting the round
+            round_number: Coordination round number
+            round_type: "initial_answer", "voting" or "presentation"
+
+        Returns:
+            The open round span
+        """
+        self._agent_rounds[agent_id] = round_number
+        _current_agent.set(agent_id)
+        return self.start(f"{agent_id} round {round_number}", ROUND, agent_id=agent_id, round_number=round_number, round_type=round_type)
+
+    def save(self, log_dir: Path, backends: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write the Chrome trace and return the latency report.
+
+        Args:
+            log_dir: Directory to write ``latency_trace.json`` into
+            backends: Agent ID -> backend, whose API call and tool metrics become spans
+
+        Returns:
+            Report with ``rounds`` (per-round phase breakdown), ``critical_path`` and ``trace_file``
+        """
+        spans = [span for span in self.spans if span.end is not None]
+        for agent_id, backend in (backends or {}).items():
+            spans.extend(backend_metric_spans(agent_id, backend))
+        spans.sort(key=lambda span: (span.start, -span.end))
+
+        report = build_report(spans)
+        trace_path = Path(log_dir) / TRACE_FILENAME
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(to_chrome_trace(spans), f, default=str)
+        report["trace_file"] = TRACE_FILENAME
+        logger.info(f"[SpanProfiler] Saved {len(spans)} spans to {trace_path}")
+        return report
+
+
+def activate_profiler(profiler: Optional[SpanProfiler]) -> None:
+    """Make ``profiler`` receive spans recorded in this context (and tasks it creates)."""
+    _active_profiler.set(profiler)
+
+
+def get_active_profiler() -> Optional[SpanProfiler]:
+    """Get the profiler active in this context, if any."""
+    return _active_profiler.get()
+
+
+@contextmanager
+def profile_span(name: str, category: str, agent_id: Optional[str] = None, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record a span on the active profiler; a no-op when none is active."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield None
+        return
+    span = profiler.start(name, category, agent_id=agent_id, **attributes)
+    try:
+        yield span
+    finally:
+        profiler.finish(span)
+
+
+def profiled(name: str, category: str) -> Callable[[F], F]:
+    """Decorator recording an async method as a span on the active profiler.
+
+    The span is attributed to ``self.agent_id`` when the instance has one,
+    otherwise to the agent whose round is running in the current context.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            agent_id = getattr(args[0], "agent_id", None) if args else None
+            with profile_span(name, category, agent_id=agent_id if isinstance(agent_id, str) else None):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def backend_metric_spans(agent_id: str, backend: Any) -> List[Span]:
+    """Convert a backend's API call and tool metrics into TTFT, streaming and tool spans.
+
+    Args:
+        agent_id: Agent owning the backend (used when a metric has no agent)
+        backend: Backend with ``get_api_call_history()`` and/or ``get_tool_metrics()``
+
+    Returns:
+        Closed spans
+    """
+    spans: List[Span] = []
+    if hasattr(backend, "get_api_call_history"):
+        for call in backend.get_api_call_history():
+            if not call.end_time:
+                continue
+            owner = call.agent_id if call.agent_id and call.agent_id != "unknown" else agent_id
+            attributes = {"backend": call.backend_name, "model": call.model, "call_index": call.call_index, "success": call.success}
+            first_token = call.start_time + call.time_to_first_token_ms / 1000 if call.time_to_first_token_ms else None
+            if first_token is None or first_token >= call.end_time:
+                # No content token recorded (e.g. tool-call-only response): the whole call is waiting
+                spans.append(Span(f"ttft {call.model}", TTFT, call.start_time, call.end_time, owner, call.round_number, attributes))
+                continue
+            spans.append(Span(f"ttft {call.model}", TTFT, call.start_time, first_token, owner, call.round_number, dict(attributes)))
+            spans.append(Span(f"stream {call.model}", STREAMING, first_token, call.end_time, owner, call.round_number, attributes))
+    if hasattr(backend, "get_tool_metrics"):
+        for event in backend.get_tool_metrics():
+            if not event.get("end_time"):
+                continue
+            spans.append(
+                Span(
+                    f"tool {event.get('tool_name', 'unknown')}",
+                    TOOL,
+                    event["start_time"],
+                    event["end_time"],
+                    event.get("agent_id") or agent_id,
+                    event.get("round_number"),
+                    {"tool_type": event.get("tool_type"), "success": event.get("success", True)},
+                ),
+            )
+    return spans
+
+
+def _union_seconds(intervals: List[Tuple[float, float]]) -> float:
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def _phase_breakdown(spans: List[Span], start: float, end: float, agent_id: Optional[str] = None) -> Dict[str, float]:
+    """Milliseconds covered by each phase inside [start, end] (overlaps within a phase counted once)."""
+    by_category: Dict[str, List[Tuple[float, float]]] = {}
+    for span in spans:
+        if span.category == ROUND or (agent_id is not None and span.agent_id != agent_id):
+            continue
+        clipped = (max(span.start, start), min(span.end, end))
+        if clipped[1] > clipped[0]:
+            by_category.setdefault(span.category, []).append(clipped)
+    phases = {category: round(_union_seconds(by_category.get(category, [])) * 1000, 2) for category in PHASES}
+    busy = _union_seconds([interval for category in PHASES for interval in by_category.get(category, [])])
+    phases["other"] = round(max(end - start - busy, 0.0) * 1000, 2)
+    phases[ENFORCEMENT_RETRY] = round(_union_seconds(by_category.get(ENFORCEMENT_RETRY, [])) * 1000, 2)
+    return phases
+
+
+def build_report(spans: List[Span]) -> Dict[str, Any]:
+    """Per-round phase breakdown and coordination critical path for closed spans.
+
+    The critical path walks back from the round that finished last: at each
+    step it moves to the round that finished most recently before the current
+    one started (the round whose answer or vote unblocked it). Time between
+    consecutive rounds on the path (scheduling, snapshot copies, rate limits
+    outside rounds) is reported as ``gap``.
+
+    Args:
+        spans: Closed spans sorted by start time
+
+    Returns:
+        Dict with ``rounds`` and ``critical_path``
+    """
+    if not spans:
+        return {"rounds": [], "critical_path": {}}
+    origin = min(span.start for span in spans)
+    rounds = [span for span in spans if span.category == ROUND]
+
+    def row(span: Span) -> Dict[str, Any]:
+        return {
+            "agent_id": span.agent_id,
+            "round": span.round_number,
+            "round_type": span.attributes.get("round_type"),
+            "outcome": span.attributes.get("outcome"),
+            "start_ms": round((span.start - origin) * 1000, 2),
+            "duration_ms": round(span.duration * 1000, 2),
+        }
+
+    round_rows = [dict(row(span), phases=_phase_breakdown(spans, span.start, span.end, span.agent_id)) for span in rounds]
+
+    critical_path: Dict[str, Any] = {}
+    if rounds:
+        path = [max(rounds, key=lambda span: span.end)]
+        while True:
+            current = path[-1]
+            candidates = [span for span in rounds if span is not current and span.end <= current.start + _CRITICAL_PATH_SLACK_SECONDS and span.end < current.end]
+            if not candidates:
+                break
+            path.append(max(candidates, key=lambda span: (span.end, span.attributes.get("outcome") == "answer")))
+        path.reverse()
+
+        total = path[-1].end - origin
+        on_path = 0.0
+        phases = {category: 0.0 for category in PHASES}
+        phases.update({"other": 0.0, ENFORCEMENT_RETRY: 0.0})
+        previous_end = origin
+        for span in path:
+            # Rounds on the path can overlap slightly; count shared time once
+            segment_start = max(span.start, previous_end)
+            on_path += max(span.end - segment_start, 0.0)
+            for category, ms in _phase_breakdown(spans, segment_start, span.end, span.agent_id).items():
+                phases[category] += ms
+            previous_end = span.end
+        critical_path = {
+            "total_ms": round(total * 1000, 2),
+            "rounds_ms": round(on_path * 1000, 2),
+            "gap_ms": round(max(total - on_path, 0.0) * 1000, 2),
+            "phases": {category: round(ms, 2) for category, ms in phases.items()},
+            "segments": [row(span) for span in path],
+        }
+    return {"rounds": round_rows, "critical_path": critical_path}
+
+
+def _assign_lanes(spans: List[Span]) -> List[int]:
+    """Lane index per span so spans within a lane nest properly (required by trace viewers)."""
+    lanes: List[List[float]] = []
+    assigned = []
+    for span in spans:
+        for index, stack in enumerate(lanes):
+            while stack and stack[-1] <= span.start:
+                stack.pop()
+            if not stack or span.end <= stack[-1]:
+                stack.append(span.end)
+                assigned.append(index)
+                break
+        else:
+            lanes.append([span.end])
+            assigned.append(len(lanes) - 1)
+    return assigned
+
+
+def to_chrome_trace(spans: List[Span]) -> Dict[str, Any]:
+    """Render spans in the Chrome trace event format (one track per agent).
+
+    Args:
+        spans: Closed spans sorted by (start, -end)
+
+    Returns:
+        Trace dict with ``traceEvents``
+    """
+    origin = min((span.start for span in spans), default=0.0)
+    tracks: Dict[str, List[Span]] = {}
+    for span in spans:
+        tracks.setdefault(span.agent_id or "orchestrator", []).append(span)
+
+    events: List[Dict[str, Any]] = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "MassGen coordination"}}]
+    tid = 0
+    for track_index, (track, track_spans) in enumerate(sorted(tracks.items())):
+        lane_tids: Dict[int, int] = {}
+        for span, lane in zip(track_spans, _assign_lanes(track_spans)):
+            if lane not in lane_tids:
+                tid += 1
+                lane_tids[lane] = tid
+                label = track if lane == 0 else f"{track} ({lane + 1})"
+                events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": label}})
+                events.append({"name": "thread_sort_index", "ph": "M", "pid": 1, "tid": tid, "args": {"sort_index": track_index * 100 + lane}})
+            args = dict(span.attributes)
+            if span.round_number is not None:
+                args["round"] = span.round_number
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - origin) * 1e6, 1),
+                    "dur": round(span.duration * 1e6, 1),
+                    "pid": 1,
+                    "tid": lane_tids[lane],
+                    "args": args,
+                },
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"origin_unix_time": origin}}
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Compact structured log of stream chunks.
+
+``log_stream_chunk`` is called for every streamed token. In the default text
+mode each call inspects the caller's frame, binds a loguru logger and formats
+the chunk into massgen.log. ``StreamChunkLog`` is the low-overhead
+alternative used by the ``structured`` stream chunk log mode:
+
+- ``stream_chunks.jsonl`` holds one compact JSON array per chunk:
+  ``[elapsed_ms, key, offset, length, skipped]``. ``key`` refers to a
+  ``{"key": n, "source": ..., "agent_id": ..., "chunk_type": ...}`` line
+  written the first time that combination appears
+- ``stream_chunks.content`` holds chunk payloads; ``offset``/``length`` are
+  byte positions in it. Repeated payloads (tool call lists, status messages)
+  are stored once and referenced by every record that carries them
+- ``sample_rates`` keeps 1 in N records for high-frequency chunk types;
+  ``skipped`` counts the records dropped since the previous kept one
+
+Both files are written through large buffers and flushed periodically, on
+``close()`` and at interpreter exit.
+"""
+
+import atexit
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+RECORD_FIELDS = ["elapsed_ms", "key", "offset", "length", "skipped"]
+RECORDS_FILE_NAME = "stream_chunks.jsonl"
+CONTENT_FILE_NAME = "stream_chunks.content"
+
+# Payloads shorter than this are cheaper to store again than to hash
+_DEDUP_MIN_BYTES = 64
+_DEDUP_CACHE_SIZE = 4096
+_BUFFER_SIZE = 256 * 1024
+
+_live_logs: "weakref.WeakSet[StreamChunkLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_logs() -> None:
+    for chunk_log in list(_live_logs):
+        chunk_log.flush()
+
+
+def parse_sample_rates(spec: str) -> Dict[str, int]:
+    """Parse a ``type=N,type=N`` sampling spec.
+
+    Args:
+        spec: Comma separated ``chunk_type=N`` pairs (keep 1 in N)
+
+    Returns:
+        Mapping of chunk type to sampling rate
+
+    Raises:
+        ValueError: If an entry is malformed or a rate is below 1
+    """
+    rates: Dict[str, int] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        chunk_type, _, rate = item.partition("=")
+        chunk_type = chunk_type.strip()
+        rates[chunk_type] = int(rate)
+        if rates[chunk_type] < 1:
+            raise ValueError(f"Sampling rate for {chunk_type!r} must be at least 1")
+    return rates
+
+
+class StreamChunkLog:
+    """Writes stream chunks as compact records with deduplicated content.
+
+    Args:
+        log_dir: Directory for stream_chunks.jsonl and stream_chunks.content
+        sample_rates: Optional ``{chunk_type: N}`` keeping 1 in N records
+        flush_interval: Seconds between buffer flushes while chunks arrive
+    """
+
+    def __init__(self, log_dir: Union[str, Path], sample_rates: Optional[Dict[str, int]] = None, flush_interval: float = 1.0):
+        self.sample_rates = dict(sample_rates or {})
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._records = None
+        self._content = None
+        self._open(Path(log_dir))
+        _live_logs.add(self)
+
+    def _open(self, log_dir: Path) -> None:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = log_dir
+        self._records = open(log_dir / RECORDS_FILE_NAME, "a", encoding="utf-8", buffering=_BUFFER_SIZE)
+        self._content = open(log_dir / CONTENT_FILE_NAME, "ab", buffering=_BUFFER_SIZE)
+        self._content_offset = self._content.tell()
+        self._start = time.perf_counter()
+        self._last_flush = self._start
+        self._seen: "OrderedDict[bytes, Tuple[int, int]]" = OrderedDict()
+        self._keys: Dict[Tuple[str, Optional[str], str], int] = {}
+        self._sample_counts: Dict[int, int] = {}
+        header = {"fields": RECORD_FIELDS, "started_at": datetime.now().isoformat(), "content_file": CONTENT_FILE_NAME}
+        self._records.write(json.dumps(header) + "\n")
+
+    def record(self, source: str, chunk_type: str, content: Any = None, agent_id: Optional[str] = None) -> None:
+        """Record one stream chunk.
+
+        Args:
+            source: Source of the stream chunk (e.g., "orchestrator", "backend.claude_code")
+            chunk_type: Type of the chunk (e.g., "content", "tool_call")
+            content: Chunk payload; strings are stored as-is, other values as JSON
+            agent_id: Optional agent ID
+        """
+        with self._lock:
+            if self._records is None:
+                return
+            key = self._keys.get((source, agent_id, chunk_type))
+            if key is None:
+                key = self._keys[(source, agent_id, chunk_type)] = len(self._keys)
+                self._records.write(json.dumps({"key": key, "source": source, "agent_id": agent_id, "chunk_type": chunk_type}) + "\n")
+
+            skipped = 0
+            rate = self.sample_rates.get(chunk_type)
+            if rate and rate > 1:
+                skipped = self._sample_counts.get(key, 0)
+                if skipped + 1 < rate:
+                    self._sample_counts[key] = skipped + 1
+                    return
+                self._sample_counts[key] = 0
+
+            offset, length = self._store_content(content)
+            now = time.perf_counter()
+            self._records.write(f"[{int((now - self._start) * 1000)},{key},{offset},{length},{skipped}]\n")
+            if now - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def _store_content(self, content: Any) -> Tuple[int, int]:
+        if content is None or content == "":
+            return -1, 0
+        if isinstance(content, str):
+            data = content.encode("utf-8")
+        else:
+            data = json.dumps(content, ensure_ascii=False, default=str).encode("utf-8")
+
+        digest = None
+        if len(data) >= _DEDUP_MIN_BYTES:
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            stored = self._seen.get(digest)
+            if stored is not None:
+                self._seen.move_to_end(digest)
+                return stored
+
+        offset = self._content_offset
+        self._content.write(data)
+        self._content_offset += len(data)
+        if digest is not None:
+            self._seen[digest] = (offset, len(data))
+            if len(self._seen) > _DEDUP_CACHE_SIZE:
+                self._seen.popitem(last=False)
+        return offset, len(data)
+
+    def flush(self) -> None:
+        """Write buffered records and content to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._records is None:
+            return
+        # Content first, so flushed records never point past the end of the content file
+        self._content.flush()
+        self._records.flush()
+        self._last_flush = time.perf_counter()
+
+    def set_log_dir(self, log_dir: Union[str, Path]) -> None:
+        """Continue logging in a new directory (e.g., when the attempt changes).
+
+        Args:
+            log_dir: New directory for the stream chunk files
+        """
+        with self._lock:
+            self._close_locked()
+            self._open(Path(log_dir))
+
+    def close(self) -> None:
+        """Flush and close the stream chunk files."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._records is None:
+            return
+        self._flush_locked()
+        self._records.close()
+        self._content.close()
+        self._records = None
+        self._content = None
+
+
+def read_stream_chunks(log_dir: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read stream chunk records back with their keys and content resolved.
+
+    Args:
+        log_dir: Directory containing stream_chunks.jsonl
+
+    Returns:
+        List of dicts with elapsed_ms, source, agent_id, chunk_type, skipped
+        and ``content`` (str, or None for chunks without a payload)
+    """
+    log_dir = Path(log_dir)
+    records_file = log_dir / RECORDS_FILE_NAME
+    if not records_file.exists():
+        return []
+
+    content_file = log_dir / CONTENT_FILE_NAME
+    content = content_file.read_bytes() if content_file.exists() else b""
+    keys: Dict[int, Dict[str, Any]] = {}
+    chunks = []
+    with open(records_file, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn final line
+            if isinstance(record, dict):
+                if "key" in record:
+                    keys[record["key"]] = {name: record.get(name) for name in ("source", "agent_id", "chunk_type")}
+                continue
+            elapsed_ms, key, offset, length, skipped = record
+            chunk = {"elapsed_ms": elapsed_ms, **keys.get(key, {}), "skipped": skipped}
+            chunk["content"] = content[offset : offset + length].decode("utf-8", errors="replace") if offset >= 0 else None
+            chunks.append(chunk)
+    return chunks
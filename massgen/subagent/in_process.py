@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+In-process subagent execution for MassGen.
+
+Runs a subagent's Orchestrator directly on the caller's event loop instead of
+spawning a separate ``massgen`` process. The child reuses the already-imported
+backends and orchestrator code, receives an isolated workspace and log directory
+(same ``.massgen/massgen_logs/log_*/turn_1/attempt_1`` layout the subprocess
+produces, so status/answer recovery keeps working), and delivers MassGenEvents
+to the caller through a direct callback instead of stdout JSON lines.
+
+Subprocess mode remains the default for isolation-critical cases: it gives the
+child its own cwd, global logging handlers and crash containment.
+"""
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from massgen.agent_config import AgentConfig
+    from massgen.events import MassGenEvent
+    from massgen.orchestrator import Orchestrator
+
+
+@dataclass
+class InProcessRunResult:
+    """Outcome of an in-process subagent run.
+
+    Attributes:
+        answer: Final coordinated answer text
+        token_usage: Aggregated token usage across the child's agents
+        log_dir: Attempt-level log directory the child wrote to
+    """
+
+    answer: str
+    token_usage: Dict[str, Any] = field(default_factory=dict)
+    log_dir: Optional[str] = None
+
+
+def build_subagent_orchestrator_config(subagent_config: Dict[str, Any]) -> "AgentConfig":
+    """Translate a generated subagent config dict into an orchestrator AgentConfig.
+
+    Covers the keys ``SubagentManager._generate_subagent_yaml_config`` emits, which
+    mirror what ``run_single_question`` applies for the subprocess path.
+
+    Args:
+        subagent_config: Config dict with ``orchestrator`` and optional ``timeout_settings``
+
+    Returns:
+        AgentConfig for the child orchestrator
+    """
+    from massgen.agent_config import AgentConfig, SpeculativeStartConfig, TimeoutConfig
+    from massgen.cli import _parse_coordination_config
+
+    orchestrator_cfg = subagent_config.get("orchestrator", {})
+    orchestrator_config = AgentConfig()
+
+    timeout_settings = subagent_config.get("timeout_settings")
+    if timeout_settings:
+        orchestrator_config.timeout_config = TimeoutConfig(**timeout_settings)
+
+    if "coordination" in orchestrator_cfg:
+        orchestrator_config.coordination_config = _parse_coordination_config(orchestrator_cfg["coordination"])
+
+    if "max_new_answers_per_agent" in orchestrator_cfg:
+        orchestrator_config.max_new_answers_per_agent = orchestrator_cfg["max_new_answers_per_agent"]
+    if orchestrator_cfg.get("skip_final_presentation", False):
+        orchestrator_config.skip_final_presentation = True
+    if orchestrator_cfg.get("skip_voting", False):
+        orchestrator_config.skip_voting = True
+    if orchestrator_cfg.get("disable_injection", False):
+        orchestrator_config.disable_injection = True
+    if "defer_voting_until_all_answered" in orchestrator_cfg:
+        orchestrator_config.defer_voting_until_all_answered = orchestrator_cfg["defer_voting_until_all_answered"]
+    if "speculative_start" in orchestrator_cfg:
+        orchestrator_config.speculative_start = SpeculativeStartConfig(**orchestrator_cfg["speculative_start"])
+
+    return orchestrator_config
+
+
+def build_subagent_orchestrator(subagent_id: str, subagent_config: Dict[str, Any]) -> "Orchestrator":
+    """Create the child Orchestrator for an in-process subagent.
+
+    Args:
+        subagent_id: Subagent identifier (used as the orchestrator ID)
+        subagent_config: Generated subagent config dict (``agents`` + ``orchestrator``)
+
+    Returns:
+        Orchestrator ready for coordination
+    """
+    from massgen.cli import create_agents_from_config
+    from massgen.orchestrator import create_orchestrator
+
+    orchestrator_cfg = subagent_config.get("orchestrator", {})
+    agents = create_agents_from_config(subagent_config, orchestrator_cfg)
+    return create_orchestrator(
+        list(agents.items()),
+        orchestrator_id=f"subagent_{subagent_id}",
+        config=build_subagent_orchestrator_config(subagent_config),
+        snapshot_storage=orchestrator_cfg.get("snapshot_storage"),
+        agent_temporary_workspace=orchestrator_cfg.get("agent_temporary_workspace"),
+    )
+
+
+def create_subagent_log_dir(workspace: Path) -> Path:
+    """Create the child's attempt-level log directory inside its workspace.
+
+    Uses the same layout a subprocess run creates under its cwd so that
+    ``_parse_subprocess_status`` and the live-log symlink work unchanged.
+
+    Args:
+        workspace: Subagent workspace path
+
+    Returns:
+        Path to ``.massgen/massgen_logs/log_<ts>/turn_1/attempt_1``
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    log_dir = workspace / ".massgen" / "massgen_logs" / f"log_{timestamp}" / "turn_1" / "attempt_1"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def _collect_token_usage(orchestrator: "Orchestrator") -> Dict[str, Any]:
+    """Aggregate token usage across the child orchestrator's agent backends."""
+    input_tokens = 0
+    output_tokens = 0
+    estimated_cost = 0.0
+    for agent in orchestrator.agents.values():
+        backend = getattr(agent, "backend", None)
+        usage = getattr(backend, "token_usage", None) if backend else None
+        if usage:
+            input_tokens += usage.input_tokens
+            output_tokens += usage.output_tokens
+            estimated_cost += usage.estimated_cost
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "estimated_cost": round(estimated_cost, 6),
+    }
+
+
+async def _cleanup_orchestrator_agents(orchestrator: "Orchestrator") -> None:
+    """Release MCP connections and filesystem resources held by the child's agents."""
+    for agent_id, agent in orchestrator.agents.items():
+        backend = getattr(agent, "backend", None)
+        if backend is None:
+            continue
+        if getattr(backend, "filesystem_manager", None):
+            try:
+                backend.filesystem_manager.cleanup()
+            except Exception as e:
+                logger.debug(f"[InProcessSubagent] Filesystem cleanup failed for {agent_id}: {e}")
+        if hasattr(backend, "__aexit__"):
+            try:
+                await backend.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"[InProcessSubagent] Backend cleanup failed for {agent_id}: {e}")
+
+
+async def run_subagent_in_process(
+    subagent_id: str,
+    subagent_config: Dict[str, Any],
+    task: str,
+    workspace: Path,
+    answer_file: Optional[Path] = None,
+    on_event: Optional[Callable[["MassGenEvent"], Awaitable[None]]] = None,
+    orchestrator_factory: Optional[Callable[[str, Dict[str, Any]], "Orchestrator"]] = None,
+) -> InProcessRunResult:
+    """Run a subagent orchestrator on the current event loop.
+
+    Log-directory lookups and events emitted inside the child (including tasks it
+    spawns) are scoped to the child's own directory via contextvars, so the parent's
+    status.json and events.jsonl are untouched.
+
+    Args:
+        subagent_id: Subagent identifier
+        subagent_config: Generated subagent config dict
+        task: Full task prompt for the child orchestrator
+        workspace: Subagent workspace (receives ``.massgen/massgen_logs``)
+        answer_file: Optional path to write the final answer to (subprocess parity)
+        on_event: Optional async callback receiving each MassGenEvent as it is emitted
+        orchestrator_factory: Optional override for building the child orchestrator
+
+    Returns:
+        InProcessRunResult with the answer, token usage and log directory
+    """
+    from massgen.events import EventEmitter
+    from massgen.frontend.coordination_ui import CoordinationUI
+    from massgen.logger_config import scoped_log_session
+
+    log_dir = create_subagent_log_dir(workspace)
+    emitter = EventEmitter(log_dir)
+
+    loop = asyncio.get_running_loop()
+    event_queue: "asyncio.Queue[Optional[MassGenEvent]]" = asyncio.Queue()
+    pump_task: Optional[asyncio.Task] = None
+
+    if on_event is not None:
+
+        def enqueue_event(event: "MassGenEvent") -> None:
+            # Emitters may fire from executor threads (e.g. status writers)
+            loop.call_soon_threadsafe(event_queue.put_nowait, event)
+
+        async def pump_events() -> None:
+            while True:
+                event = await event_queue.get()
+                if event is None:
+                    return
+                try:
+                    await on_event(event)
+                except Exception as e:
+                    logger.debug(f"[InProcessSubagent] Error processing event: {e}")
+
+        emitter.add_listener(enqueue_event)
+        pump_task = asyncio.create_task(pump_events())
+
+    factory = orchestrator_factory or build_subagent_orchestrator
+    orchestrator = None
+    try:
+        with scoped_log_session(log_dir, emitter):
+            orchestrator = factory(subagent_id, subagent_config)
+            if inspect.isawaitable(orchestrator):
+                orchestrator = await orchestrator
+
+            ui = CoordinationUI(display_type="none", logging_enabled=False, enable_final_presentation=True)
+            answer = await ui.coordinate(orchestrator, task)
+            while getattr(orchestrator, "restart_pending", False):
+                for agent in orchestrator.agents.values():
+                    reset_state = getattr(getattr(agent, "backend", None), "reset_state", None)
+                    if reset_state:
+                        result = reset_state()
+                        if inspect.iscoroutine(result):
+                            await result
+                ui = CoordinationUI(display_type="none", logging_enabled=False, enable_final_presentation=True)
+                answer = await ui.coordinate(orchestrator, task)
+
+        answer = (answer or "").strip()
+        if answer_file is not None:
+            answer_file.write_text(answer)
+
+        return InProcessRunResult(
+            answer=answer,
+            token_usage=_collect_token_usage(orchestrator),
+            log_dir=str(log_dir),
+        )
+    finally:
+        if orchestrator is not None:
+            await _cleanup_orchestrator_agents(orchestrator)
+        emitter.close()
+        if pump_task is not None:
+            # Drain events already queued before stopping the pump
+            loop.call_soon(event_queue.put_nowait, None)
+            try:
+                await asyncio.wait_for(pump_task, timeout=5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pump_task.cancel()
@@ -6,7 +6,9 @@ Manages the lifecycle of subagents: creation, workspace setup, execution, and re
 """
 
 import asyncio
+import dataclasses
 import json
+import os
 import shutil
 import time
 from datetime import datetime
@@ -15,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from massgen.events import MassGenEvent
+    from massgen.subagent.zygote import ZygotePool
 
 import yaml
 from loguru import logger
@@ -125,6 +128,10 @@ class SubagentManager:
         self._background_tasks: Dict[str, asyncio.Task] = {}
         # Track active subprocess handles for graceful cancellation
         self._active_processes: Dict[str, asyncio.subprocess.Process] = {}
+        # Pre-forked worker pool for subprocess mode (created lazily when use_zygote is set)
+        self._zygote_pool: Optional["ZygotePool"] = None
+        # Latest coordination status per subagent, assembled from pushed status_delta events
+        self._live_status: Dict[str, Dict[str, Any]] = {}
         # Track session IDs for each subagent (for continuation support)
         self._subagent_sessions: Dict[str, str] = {}  # subagent_id -> session_id
         self._semaphore = asyncio.Semaphore(max_concurrent)
@@ -563,6 +570,13 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         try:
             # Always use orchestrator mode for subagent execution
+            if self._uses_in_process_execution():
+                return await self._execute_in_process(
+                    config,
+                    workspace,
+                    start_time,
+                    context_warning,
+                )
             return await self._execute_with_orchestrator(
                 config,
                 workspace,
@@ -593,6 +607,162 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                 warning=context_warning,
             )
 
+    def _uses_in_process_execution(self) -> bool:
+        """Whether subagents run as in-process child orchestrators instead of subprocesses."""
+        orch_config = self._subagent_orchestrator_config
+        return bool(orch_config and orch_config.execution_mode == "in_process")
+
+    def _get_zygote_pool(self) -> Optional["ZygotePool"]:
+        """Return the zygote worker pool, creating it on first use (None if disabled)."""
+        orch_config = self._subagent_orchestrator_config
+        if not (orch_config and orch_config.use_zygote):
+            return None
+        if self._zygote_pool is None:
+            from massgen.subagent.zygote import ZygotePool, zygote_supported
+
+            if not zygote_supported():
+                logger.warning("[SubagentManager] Zygote pool not supported on this platform, using subprocesses")
+                return None
+            self._zygote_pool = ZygotePool(
+                pool_size=orch_config.zygote_pool_size or self.max_concurrent,
+                max_tasks_per_worker=orch_config.zygote_max_tasks_per_worker,
+            )
+        return self._zygote_pool
+
+    async def _spawn_massgen_process(self, args: List[str], cwd: Path, env_overrides: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Start a MassGen run for a subagent.
+
+        Uses a pre-forked zygote worker when ``use_zygote`` is enabled (falling back
+        to a fresh process if the pool is unavailable), otherwise ``uv run massgen``.
+        Both return a process handle with the same stdout/stderr protocol.
+
+        Args:
+            args: Arguments for the ``massgen`` CLI
+            cwd: Working directory for the run
+            env_overrides: Environment variables to set for this run on top of ours
+
+        Returns:
+            asyncio.subprocess.Process or a compatible ZygoteProcess
+        """
+        # Zygote workers are forked when the pool starts, so send the current environment explicitly
+        env = {**os.environ, **(env_overrides or {})}
+        pool = self._get_zygote_pool()
+        if pool is not None:
+            try:
+                return await pool.spawn(args, cwd=str(cwd), env=env)
+            except Exception as e:
+                logger.warning(f"[SubagentManager] Zygote pool unavailable, falling back to subprocess: {e}")
+
+        return await asyncio.create_subprocess_exec(
+            "uv",
+            "run",
+            "massgen",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(cwd),
+            env=env,
+        )
+
+    async def _execute_in_process(
+        self,
+        config: SubagentConfig,
+        workspace: Path,
+        start_time: float,
+        context_warning: Optional[str] = None,
+        on_event: Optional["Callable[[MassGenEvent], Awaitable[None]]"] = None,
+    ) -> SubagentResult:
+        """
+        Execute subagent as a child Orchestrator on the current event loop.
+
+        Skips interpreter startup, re-imports and YAML round-tripping of the
+        subprocess path. The child gets the same workspace and log layout as a
+        subprocess run, so status parsing, log copying and timeout recovery are shared.
+
+        Args:
+            config: Subagent configuration
+            workspace: Path to subagent workspace
+            start_time: Execution start time
+            context_warning: Warning message if CONTEXT.md was truncated
+            on_event: Optional async callback receiving each MassGenEvent
+
+        Returns:
+            SubagentResult with execution outcome
+        """
+        from massgen.subagent.in_process import run_subagent_in_process
+
+        workspace_abs = workspace.resolve()
+        context_paths: List[Dict[str, str]] = []
+        for ctx_file in config.context_files or []:
+            src_path = Path(ctx_file)
+            if src_path.exists():
+                context_paths.append({"path": str(src_path.resolve()), "permission": "read"})
+            else:
+                logger.warning(f"[SubagentManager] Context file not found: {ctx_file}")
+
+        subagent_config = self._generate_subagent_yaml_config(config, workspace_abs, context_paths)
+        # Keep the generated config next to the workspace for debugging parity with subprocess mode
+        yaml_path = workspace_abs / f"subagent_config_{config.id}.yaml"
+        yaml_path.write_text(yaml.dump(subagent_config, default_flow_style=False))
+
+        system_prompt, _ = self._build_subagent_system_prompt(config, workspace)
+        answer_file = workspace_abs / "answer.txt"
+        timeout = self._clamp_timeout(config.timeout_seconds)
+
+        logger.info(f"[SubagentManager] Executing subagent {config.id} in-process")
+        self._create_live_logs_symlink(config.id, workspace_abs)
+
+        try:
+            run_result = await asyncio.wait_for(
+                run_subagent_in_process(
+                    subagent_id=config.id,
+                    subagent_config=subagent_config,
+                    task=system_prompt,
+                    workspace=workspace_abs,
+                    answer_file=answer_file,
+                    on_event=on_event,
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"[SubagentManager] Subagent {config.id} timed out")
+            _, subprocess_log_dir, _ = self._parse_subprocess_status(workspace_abs)
+            self._write_subprocess_log_reference(config.id, subprocess_log_dir, error="Subagent timed out")
+            log_dir = self._get_subagent_log_dir(config.id)
+            return self._create_timeout_result_with_recovery(
+                subagent_id=config.id,
+                workspace=workspace,
+                timeout_seconds=timeout,
+                log_path=str(log_dir) if log_dir else None,
+                warning=context_warning,
+            )
+        except Exception as e:
+            logger.error(f"[SubagentManager] Subagent {config.id} error: {e}")
+            _, subprocess_log_dir, _ = self._parse_subprocess_status(workspace_abs)
+            self._write_subprocess_log_reference(config.id, subprocess_log_dir, error=str(e))
+            log_dir = self._get_subagent_log_dir(config.id)
+            return SubagentResult.create_error(
+                subagent_id=config.id,
+                error=str(e),
+                workspace_path=str(workspace),
+                execution_time_seconds=time.time() - start_time,
+                log_path=str(log_dir) if log_dir else None,
+                warning=context_warning,
+            )
+
+        self._write_subprocess_log_reference(config.id, run_result.log_dir)
+        log_dir = self._get_subagent_log_dir(config.id)
+        return SubagentResult.create_success(
+            subagent_id=config.id,
+            answer=run_result.answer,
+            workspace_path=str(workspace),
+            execution_time_seconds=time.time() - start_time,
+            token_usage=run_result.token_usage,
+            log_path=str(log_dir) if log_dir else None,
+            warning=context_warning,
+        )
+
     async def _execute_with_orchestrator(
         self,
         config: SubagentConfig,
@@ -659,10 +829,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         # DON'T use --session-id for initial spawn (that's for restoring existing sessions)
         # We'll extract the auto-generated session ID from the subprocess status afterward
         answer_file = workspace_abs / "answer.txt"
-        cmd = [
-            "uv",
-            "run",
-            "massgen",
+        massgen_args = [
             "--config",
             str(yaml_path),
             "--automation",  # Silent mode with minimal output
@@ -673,13 +840,8 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         process: Optional[asyncio.subprocess.Process] = None
         try:
-            # Use async subprocess for graceful cancellation support
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(workspace_abs),
-            )
+            # Use async subprocess (or zygote worker) for graceful cancellation support
+            process = await self._spawn_massgen_process(massgen_args, workspace_abs)
 
             # Track the process for potential cancellation
             self._active_processes[config.id] = process
@@ -751,7 +913,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                 # Log detailed error information for debugging
                 logger.error(
                     f"[SubagentManager] Subagent {config.id} failed with exit code {process.returncode}\n"
-                    f"Command: {' '.join(cmd)}\n"
+                    f"Command: massgen {' '.join(massgen_args)}\n"
                     f"Working directory: {workspace}\n"
                     f"STDERR: {stderr_text[:1000]}\n"  # First 1000 chars of stderr
                     f"STDOUT: {stdout_text[:500]}",  # First 500 chars of stdout
@@ -831,7 +993,9 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         This method spawns a subagent subprocess with --stream-events flag,
         allowing real-time event streaming to a callback (typically the TUI
-        subagent modal). Events are parsed from stdout as JSON lines.
+        subagent modal). Events are parsed from stdout as JSON lines. In
+        ``in_process`` execution mode the child orchestrator runs on the current
+        event loop and events are delivered to the callback directly.
 
         Args:
             config: Subagent configuration
@@ -845,6 +1009,8 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         from massgen.events import MassGenEvent
 
         start_time = time.time()
+        # Work on a copy so the refine flag doesn't leak into the caller's config
+        config = dataclasses.replace(config, metadata={**(config.metadata or {}), "refine": refine})
 
         # Create workspace
         workspace = self._create_workspace(config.id)
@@ -876,6 +1042,24 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
             started_at=datetime.now(),
         )
         self._subagents[config.id] = state
+        on_event = self._track_status_events(config.id, on_event)
+
+        if self._uses_in_process_execution():
+            result = await self._execute_in_process(
+                config,
+                workspace,
+                start_time,
+                context_warning,
+                on_event=on_event,
+            )
+            if result.success:
+                state.status = "completed"
+            elif result.status in ("timeout", "completed_but_timeout", "partial"):
+                state.status = "timeout"
+            else:
+                state.status = "failed"
+            state.result = result
+            return result
 
         # Build context paths from config.context_files
         context_paths: List[Dict[str, str]] = []
@@ -893,8 +1077,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         workspace_abs = workspace.resolve()
 
         # Generate YAML config
-        config.metadata = config.metadata or {}
-        config.metadata["refine"] = refine
         subagent_yaml = self._generate_subagent_yaml_config(config, workspace, context_paths)
         yaml_path = workspace_abs / f"subagent_config_{config.id}.yaml"
         yaml_path.write_text(yaml.dump(subagent_yaml, default_flow_style=False))
@@ -905,10 +1087,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         # Build command with --stream-events for real-time event streaming
         answer_file = workspace_abs / "answer.txt"
-        cmd = [
-            "uv",
-            "run",
-            "massgen",
+        massgen_args = [
             "--config",
             str(yaml_path),
             "--stream-events",  # Enable event streaming (implies --automation)
@@ -923,13 +1102,8 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         process: Optional[asyncio.subprocess.Process] = None
         try:
-            # Use async subprocess for real-time streaming
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(workspace_abs),
-            )
+            # Use async subprocess (or zygote worker) for real-time streaming
+            process = await self._spawn_massgen_process(massgen_args, workspace_abs)
 
             # Track the process for potential cancellation
             self._active_processes[config.id] = process
@@ -1935,10 +2109,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         # Build command to continue the session
         # Use --session-id to restore the conversation, then append new message
         answer_file = workspace / "answer_continued.txt"
-        cmd = [
-            "uv",
-            "run",
-            "massgen",
+        massgen_args = [
             "--session-id",
             session_id,  # Restore existing session
             "--automation",
@@ -1949,13 +2120,8 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         process: Optional[asyncio.subprocess.Process] = None
         try:
-            # Use async subprocess for graceful cancellation support
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(workspace),
-            )
+            # Use async subprocess (or zygote worker) for graceful cancellation support
+            process = await self._spawn_massgen_process(massgen_args, workspace)
 
             # Track the process for potential cancellation
             # Use a continuation-specific ID to avoid conflicts
@@ -2031,7 +2197,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                 # Log detailed error information for debugging
                 logger.error(
                     f"[SubagentManager] Continuation of {subagent_id} failed with exit code {process.returncode}\n"
-                    f"Command: {' '.join(cmd)}\n"
+                    f"Command: massgen {' '.join(massgen_args)}\n"
                     f"Working directory: {workspace}\n"
                     f"STDERR: {stderr_text[:1000]}\n"  # First 1000 chars of stderr
                     f"STDOUT: {stdout_text[:500]}",  # First 500 chars of stdout
@@ -2060,12 +2226,40 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                 execution_time_seconds=execution_time,
             )
 
+    def _track_status_events(
+        self,
+        subagent_id: str,
+        on_event: "Callable[[MassGenEvent], Awaitable[None]]",
+    ) -> "Callable[[MassGenEvent], Awaitable[None]]":
+        """Wrap an event callback to fold pushed status deltas into live status.
+
+        Args:
+            subagent_id: Subagent whose events are being streamed
+            on_event: Downstream event callback
+
+        Returns:
+            Callback that updates ``_live_status`` and then forwards the event
+        """
+        from massgen.coordination_tracker import apply_status_delta
+        from massgen.events import EventType
+
+        async def handle_event(event: "MassGenEvent") -> None:
+            if event.event_type == EventType.STATUS_DELTA:
+                delta = event.data.get("delta") or {}
+                if event.data.get("full") or subagent_id not in self._live_status:
+                    self._live_status[subagent_id] = {}
+                apply_status_delta(self._live_status[subagent_id], delta)
+            await on_event(event)
+
+        return handle_event
+
     def get_subagent_status(self, subagent_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the current status of a subagent.
 
-        Reads from full_logs/status.json (written by Orchestrator) and transforms
-        the rich status into a simplified view for MCP consumers.
+        Uses the status pushed by the subagent over its event stream when
+        available, otherwise reads full_logs/status.json (written by Orchestrator),
+        and transforms the rich status into a simplified view for MCP consumers.
 
         Args:
             subagent_id: Subagent identifier
@@ -2078,7 +2272,11 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         if not state:
             return None
 
-        # Try to read from full_logs/status.json (the single source of truth)
+        live_status = self._live_status.get(subagent_id)
+        if live_status:
+            return self._transform_orchestrator_status(subagent_id, live_status, state)
+
+        # Try to read from full_logs/status.json (written on a debounced schedule)
         if self._subagent_logs_base:
             status_file = self._subagent_logs_base / subagent_id / "full_logs" / "status.json"
             if status_file.exists():
@@ -2535,6 +2733,10 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         self._active_processes.clear()
 
+        if self._zygote_pool is not None:
+            await self._zygote_pool.shutdown()
+            self._zygote_pool = None
+
         # Also cancel any background tasks
         for task_id, task in list(self._background_tasks.items()):
             if not task.done():
@@ -12,12 +12,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
+from massgen.events import resolve_events_file
+
 # Subagent timeout defaults (in seconds)
 # These are defaults; actual min/max are configurable via YAML
 SUBAGENT_MIN_TIMEOUT = 60  # 1 minute (default minimum)
 SUBAGENT_MAX_TIMEOUT = 600  # 10 minutes (default maximum)
 SUBAGENT_DEFAULT_TIMEOUT = 300  # 5 minutes
 
+# How subagent orchestrators are executed:
+# - subprocess: separate `massgen` process per subagent (full isolation: cwd,
+#   global logging handlers, crash containment)
+# - in_process: child Orchestrator on the caller's event loop (no interpreter
+#   startup or re-import cost; events delivered via direct callback)
+SUBAGENT_EXECUTION_MODES = ("subprocess", "in_process")
+
 
 @dataclass
 class SubagentConfig:
@@ -141,6 +150,14 @@ class SubagentOrchestratorConfig:
                         Default 3 for subagents to prevent runaway iterations.
         enable_web_search: Whether to enable web search for subagents (None = inherit from parent).
                           This is set in YAML config, not by agents at runtime.
+        execution_mode: "subprocess" (default) spawns a separate MassGen process per
+                        subagent; "in_process" builds the child Orchestrator on the
+                        parent's event loop with an isolated workspace and log directory.
+        use_zygote: In subprocess mode, run subagents in workers forked from a
+                    pre-imported zygote process instead of fresh ``uv run massgen``
+                    processes (POSIX only; falls back to subprocesses elsewhere).
+        zygote_pool_size: Number of pre-forked workers (None = max_concurrent).
+        zygote_max_tasks_per_worker: Tasks a worker runs before it is recycled.
     """
 
     enabled: bool = False
@@ -148,6 +165,10 @@ class SubagentOrchestratorConfig:
     coordination: Dict[str, Any] = field(default_factory=dict)
     max_new_answers: int = 3  # Conservative default for subagents
     enable_web_search: Optional[bool] = None  # None = inherit from parent
+    execution_mode: str = "subprocess"
+    use_zygote: bool = False
+    zygote_pool_size: Optional[int] = None
+    zygote_max_tasks_per_worker: int = 4
 
     @property
     def num_agents(self) -> int:
@@ -158,6 +179,14 @@ class SubagentOrchestratorConfig:
         """Validate configuration after initialization."""
         if self.agents and len(self.agents) > 10:
             raise ValueError("Cannot have more than 10 agents for subagents")
+        if self.execution_mode not in SUBAGENT_EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid subagent execution_mode '{self.execution_mode}'. " f"Must be one of: {', '.join(SUBAGENT_EXECUTION_MODES)}",
+            )
+        if self.zygote_pool_size is not None and self.zygote_pool_size < 1:
+            raise ValueError("zygote_pool_size must be at least 1")
+        if self.zygote_max_tasks_per_worker < 1:
+            raise ValueError("zygote_max_tasks_per_worker must be at least 1")
 
     def get_agent_config(self, agent_index: int, subagent_id: str) -> Dict[str, Any]:
         """
@@ -188,6 +217,10 @@ class SubagentOrchestratorConfig:
             coordination=data.get("coordination", {}),
             max_new_answers=data.get("max_new_answers", 3),
             enable_web_search=data.get("enable_web_search"),
+            execution_mode=data.get("execution_mode", "subprocess"),
+            use_zygote=data.get("use_zygote", False),
+            zygote_pool_size=data.get("zygote_pool_size"),
+            zygote_max_tasks_per_worker=data.get("zygote_max_tasks_per_worker", 4),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -200,6 +233,13 @@ class SubagentOrchestratorConfig:
         }
         if self.enable_web_search is not None:
             result["enable_web_search"] = self.enable_web_search
+        if self.execution_mode != "subprocess":
+            result["execution_mode"] = self.execution_mode
+        if self.use_zygote:
+            result["use_zygote"] = True
+            result["zygote_max_tasks_per_worker"] = self.zygote_max_tasks_per_worker
+            if self.zygote_pool_size is not None:
+                result["zygote_pool_size"] = self.zygote_pool_size
         return result
 
 
@@ -255,16 +295,17 @@ class SubagentResult:
             base_log_dir: Base log directory for the subagent (e.g., /logs/sub_abc123/)
 
         Returns:
-            Full path to events.jsonl if found, None otherwise
+            Full path to events.jsonl (or events.jsonl.zst when events are
+            compressed) if found, None otherwise
         """
         # Check full_logs (completed subagents)
-        full_logs_events = base_log_dir / "full_logs" / "events.jsonl"
-        if full_logs_events.exists():
+        full_logs_events = resolve_events_file(base_log_dir / "full_logs" / "events.jsonl")
+        if full_logs_events:
             return str(full_logs_events.resolve())
 
         # Legacy layout: full_logs/turn_1/attempt_1/events.jsonl
-        legacy_full_logs = base_log_dir / "full_logs" / "turn_1" / "attempt_1" / "events.jsonl"
-        if legacy_full_logs.exists():
+        legacy_full_logs = resolve_events_file(base_log_dir / "full_logs" / "turn_1" / "attempt_1" / "events.jsonl")
+        if legacy_full_logs:
             return str(legacy_full_logs.resolve())
 
         # Check live_logs (running subagents)
@@ -272,12 +313,12 @@ class SubagentResult:
         if live_logs.exists():
             try:
                 for subdir in sorted(live_logs.glob("log_*"), reverse=True):
-                    candidate = subdir / "turn_1" / "attempt_1" / "events.jsonl"
-                    if candidate.exists():
+                    candidate = resolve_events_file(subdir / "turn_1" / "attempt_1" / "events.jsonl")
+                    if candidate:
                         return str(candidate.resolve())
                     # Fallback if events.jsonl lives at root of log_* (older layout)
-                    candidate = subdir / "events.jsonl"
-                    if candidate.exists():
+                    candidate = resolve_events_file(subdir / "events.jsonl")
+                    if candidate:
                         return str(candidate.resolve())
             except Exception:
                 pass
@@ -289,8 +330,8 @@ class SubagentResult:
                 ref_data = json.loads(subprocess_ref.read_text())
                 subprocess_log_dir = ref_data.get("subprocess_log_dir")
                 if subprocess_log_dir:
-                    live_events = Path(subprocess_log_dir) / "events.jsonl"
-                    if live_events.exists():
+                    live_events = resolve_events_file(Path(subprocess_log_dir) / "events.jsonl")
+                    if live_events:
                         return str(live_events.resolve())
             except (json.JSONDecodeError, OSError):
                 pass
@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-forked worker pool (zygote) for subagent subprocesses.
+
+Every subprocess subagent normally pays interpreter startup plus the full
+``massgen`` import graph (backends, orchestrator, formatters, MCP tooling)
+before it reads its YAML. The zygote pays that once: it is a long-lived
+process that pre-imports MassGen and forks workers that inherit the warm
+module state.
+
+Protocol (parent <-> worker, over a per-task Unix socket connection):
+
+1. Worker connects to the parent's socket and sends ``{"type": "ready", "pid": N}``
+2. Parent sends one request line ``{"args": [...], "cwd": "...", "env": {...}}``
+3. Worker runs ``massgen <args>`` in-process with stdout bound to the socket, so
+   the parent sees exactly the stdout a ``uv run massgen`` subprocess would
+   produce (``--stream-events`` JSONL included)
+4. Worker ends the task with an exit trailer line carrying the return code and
+   captured stderr, then reconnects for the next task
+
+Workers are recycled after ``max_tasks_per_worker`` tasks (or when killed); the
+zygote forks a replacement so the pool stays at ``pool_size``. The zygote exits
+when its stdin (held by the parent) closes.
+
+Requires ``os.fork`` and Unix sockets; callers should check ``zygote_supported()``
+and fall back to plain subprocesses otherwise.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import select
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+# Modules imported once in the zygote so forked workers start warm
+PRELOAD_MODULES = (
+    "massgen.cli",
+    "massgen.orchestrator",
+    "massgen.backend",
+    "massgen.formatter",
+    "massgen.mcp_tools",
+    "massgen.frontend.coordination_ui",
+)
+
+# Function each worker runs per task (argv is set to ``massgen <args>``)
+DEFAULT_ENTRY_POINT = "massgen.cli:cli_main"
+
+# Exit trailer written by a worker after its task output; the NUL prefix cannot
+# appear at the start of a JSONL event or a printed status line
+EXIT_MARKER = b"\x00massgen-zygote-exit "
+
+# Stream limit for worker output (events can carry large tool results)
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# Tail of worker stderr returned in the exit trailer
+MAX_STDERR_BYTES = 64 * 1024
+
+
+def zygote_supported() -> bool:
+    """Return True when the platform supports forking workers over Unix sockets."""
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+
+# =============================================================================
+# Zygote / worker side
+# =============================================================================
+
+
+def _preload_modules(module_names: Tuple[str, ...]) -> None:
+    """Import modules so forked workers inherit them."""
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            print(f"[Zygote] Failed to preload {module_name}: {e}", file=sys.stderr)
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    """Read a single newline-terminated line from a blocking socket."""
+    chunks = []
+    while True:
+        chunk = conn.recv(1)
+        if not chunk:
+            return b""
+        if chunk == b"\n":
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _resolve_entry_point(entry_point: str) -> Callable[[], Any]:
+    """Resolve a ``module:function`` reference."""
+    module_name, _, attr = entry_point.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _run_task(conn: socket.socket, request: Dict[str, Any], entry_point: str) -> None:
+    """Run one ``massgen`` invocation with stdout bound to the task connection.
+
+    The task's environment and logging state are undone afterwards so a
+    recycled worker starts its next task like a fresh process.
+    """
+    from massgen.logger_config import reset_logging_state
+
+    os.chdir(request["cwd"])
+    saved_environ = dict(os.environ)
+    if request.get("env") is not None:
+        # The worker was forked before the parent's environment reached its current state
+        os.environ.clear()
+        os.environ.update(request["env"])
+
+    stderr_file = tempfile.TemporaryFile()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    os.dup2(conn.fileno(), 1)
+    os.dup2(stderr_file.fileno(), 2)
+
+    returncode = 0
+    try:
+        # Stream chunk settings are read from the task's environment
+        reset_logging_state()
+        sys.argv = ["massgen", *request["args"]]
+        _resolve_entry_point(entry_point)()
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except KeyboardInterrupt:
+        returncode = 130
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        # Flush and close this task's log handlers and event log before the exit trailer
+        try:
+            reset_logging_state()
+        except Exception:
+            traceback.print_exc()
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+    stderr_file.seek(0, os.SEEK_END)
+    stderr_file.seek(max(0, stderr_file.tell() - MAX_STDERR_BYTES))
+    stderr_text = stderr_file.read().decode(errors="replace")
+    stderr_file.close()
+
+    trailer = {"returncode": returncode, "stderr": stderr_text}
+    conn.sendall(EXIT_MARKER + json.dumps(trailer).encode() + b"\n")
+
+
+def _worker_main(socket_path: str, max_tasks: int, entry_point: str) -> None:
+    """Entry point for a forked worker; serves up to ``max_tasks`` tasks then exits."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # The zygote's stdin is the parent's control pipe - tasks must not read it
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+
+    exit_code = 0
+    try:
+        for _ in range(max_tasks):
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                conn.connect(socket_path)
+                conn.sendall(json.dumps({"type": "ready", "pid": os.getpid()}).encode() + b"\n")
+                request_line = _read_line(conn)
+                if not request_line:
+                    break  # Parent went away
+                _run_task(conn, json.loads(request_line), entry_point)
+            finally:
+                conn.close()
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        os._exit(exit_code)
+
+
+def serve(
+    socket_path: str,
+    pool_size: int,
+    max_tasks_per_worker: int,
+    entry_point: str = DEFAULT_ENTRY_POINT,
+    preload_modules: Tuple[str, ...] = PRELOAD_MODULES,
+) -> None:
+    """Run the zygote: preload modules, keep ``pool_size`` workers forked.
+
+    Args:
+        socket_path: Parent's Unix socket that workers connect to
+        pool_size: Number of workers to keep alive
+        max_tasks_per_worker: Tasks a worker serves before it is recycled
+        entry_point: ``module:function`` each worker runs per task
+        preload_modules: Modules imported before forking
+    """
+    _preload_modules(preload_modules)
+    _resolve_entry_point(entry_point)
+
+    workers: set = set()
+
+    def fork_worker() -> None:
+        pid = os.fork()
+        if pid == 0:
+            _worker_main(socket_path, max_tasks_per_worker, entry_point)
+        workers.add(pid)
+
+    for _ in range(pool_size):
+        fork_worker()
+
+    try:
+        while True:
+            readable, _, _ = select.select([sys.stdin], [], [], 0.5)
+            if readable and not sys.stdin.readline():
+                break  # Parent closed the control pipe
+
+            # Reap finished/recycled workers and replace them
+            while workers:
+                try:
+                    pid, _ = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    workers.clear()
+                    break
+                if pid == 0:
+                    break
+                workers.discard(pid)
+                fork_worker()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+# =============================================================================
+# Parent side
+# =============================================================================
+
+
+class ZygoteProcess:
+    """Handle for a task running in a zygote worker.
+
+    Mirrors the subset of ``asyncio.subprocess.Process`` that SubagentManager
+    uses (``stdout``, ``stderr``, ``returncode``, ``wait``, ``communicate``,
+    ``terminate``, ``kill``), so callers can treat it like a spawned process.
+    """
+
+    def __init__(self, pid: int, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.pid = pid
+        self.returncode: Optional[int] = None
+        self.stdout = asyncio.StreamReader(limit=STREAM_LIMIT)
+        self.stderr = asyncio.StreamReader(limit=STREAM_LIMIT)
+        self._signal: Optional[int] = None
+        self._exited = asyncio.get_running_loop().create_future()
+        self._pump_task = asyncio.create_task(self._pump_output(reader, writer))
+
+    def _worker_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    async def _pump_output(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Forward worker output to ``stdout`` until the exit trailer arrives."""
+        returncode: Optional[int] = None
+        stderr_text = ""
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    # Grandchildren may hold the socket open after a killed worker
+                    if self._signal is not None and not self._worker_alive():
+                        break
+                    continue
+                if not line:
+                    break
+                if line.startswith(EXIT_MARKER):
+                    trailer = json.loads(line[len(EXIT_MARKER) :])
+                    returncode = trailer.get("returncode", 1)
+                    stderr_text = trailer.get("stderr", "")
+                    break
+                self.stdout.feed_data(line)
+        except Exception as e:
+            logger.debug(f"[ZygoteProcess] Output pump for worker {self.pid} failed: {e}")
+        finally:
+            writer.close()
+            if returncode is None:
+                returncode = -self._signal if self._signal is not None else 1
+            self.stdout.feed_eof()
+            if stderr_text:
+                self.stderr.feed_data(stderr_text.encode())
+            self.stderr.feed_eof()
+            self.returncode = returncode
+            if not self._exited.done():
+                self._exited.set_result(returncode)
+
+    def _send_signal(self, sig: int) -> None:
+        if self.returncode is not None:
+            return
+        self._signal = sig
+        try:
+            os.kill(self.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def terminate(self) -> None:
+        """Terminate the worker (the zygote forks a replacement)."""
+        self._send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        """Kill the worker (the zygote forks a replacement)."""
+        self._send_signal(signal.SIGKILL)
+
+    async def wait(self) -> int:
+        """Wait for the task to finish and return its return code."""
+        return await asyncio.shield(self._exited)
+
+    async def communicate(self, input: Optional[bytes] = None) -> Tuple[bytes, bytes]:
+        """Read all output and wait for the task to finish."""
+        stdout = await self.stdout.read()
+        await self.wait()
+        stderr = await self.stderr.read()
+        return stdout, stderr
+
+
+class ZygotePool:
+    """Bounded pool of pre-forked MassGen workers.
+
+    Example:
+        pool = ZygotePool(pool_size=4)
+        process = await pool.spawn(["--config", "cfg.yaml", "--stream-events", task], cwd=workspace)
+        async for line in process.stdout:
+            ...
+        await pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        max_tasks_per_worker: int = 4,
+        entry_point: str = DEFAULT_ENTRY_POINT,
+        preload_modules: Tuple[str, ...] = PRELOAD_MODULES,
+    ):
+        """
+        Initialize the pool (the zygote starts lazily on first spawn).
+
+        Args:
+            pool_size: Number of pre-forked workers (upper bound on concurrent tasks)
+            max_tasks_per_worker: Tasks a worker serves before it is recycled
+            entry_point: ``module:function`` each worker runs per task
+            preload_modules: Modules the zygote imports before forking
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if max_tasks_per_worker < 1:
+            raise ValueError("max_tasks_per_worker must be at least 1")
+        self.pool_size = pool_size
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.entry_point = entry_point
+        self.preload_modules = tuple(preload_modules)
+        self._idle: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._zygote: Optional[asyncio.subprocess.Process] = None
+        self._socket_dir: Optional[Path] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the zygote process is alive."""
+        return self._zygote is not None and self._zygote.returncode is None
+
+    async def start(self) -> None:
+        """Start the socket server and the zygote process."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.running:
+                return
+            if not zygote_supported():
+                raise RuntimeError("Zygote worker pool requires os.fork and Unix sockets")
+
+            self._idle = asyncio.Queue()
+            # Keep the socket path short (AF_UNIX paths are limited to ~100 bytes)
+            self._socket_dir = Path(tempfile.mkdtemp(prefix="mg_zygote_"))
+            socket_path = str(self._socket_dir / "workers.sock")
+            self._server = await asyncio.start_unix_server(self._on_worker_connect, path=socket_path, limit=STREAM_LIMIT)
+            self._zygote = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "massgen.subagent.zygote",
+                "--socket",
+                socket_path,
+                "--pool-size",
+                str(self.pool_size),
+                "--max-tasks-per-worker",
+                str(self.max_tasks_per_worker),
+                "--entry-point",
+                self.entry_point,
+                "--preload",
+                ",".join(self.preload_modules),
+                stdin=asyncio.subprocess.PIPE,
+            )
+            logger.info(
+                f"[ZygotePool] Started zygote pid={self._zygote.pid} " f"(pool_size={self.pool_size}, max_tasks_per_worker={self.max_tasks_per_worker})",
+            )
+
+    async def _on_worker_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            hello = json.loads(await asyncio.wait_for(reader.readline(), timeout=10.0))
+            await self._idle.put((hello["pid"], reader, writer))
+        except Exception as e:
+            logger.debug(f"[ZygotePool] Dropping worker connection: {e}")
+            writer.close()
+
+    async def _acquire_worker(self) -> Tuple[int, asyncio.StreamReader, asyncio.StreamWriter]:
+        """Wait for an idle worker, failing fast if the zygote dies."""
+        while True:
+            if not self.running:
+                raise RuntimeError("Zygote process is not running")
+            try:
+                pid, reader, writer = await asyncio.wait_for(self._idle.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            if writer.is_closing() or reader.at_eof():
+                continue
+            return pid, reader, writer
+
+    async def spawn(self, args: List[str], cwd: str, env: Optional[Dict[str, str]] = None) -> ZygoteProcess:
+        """
+        Run ``massgen <args>`` in a pre-forked worker.
+
+        Waits for a free worker when all ``pool_size`` workers are busy.
+
+        Args:
+            args: Arguments as passed to the ``massgen`` CLI
+            cwd: Working directory for the task
+            env: Environment for the task, as for ``subprocess``; None keeps
+                the worker's environment (inherited when it was forked)
+
+        Returns:
+            ZygoteProcess handle with the same stdout protocol as a subprocess
+        """
+        if not self.running:
+            await self.start()
+
+        pid, reader, writer = await self._acquire_worker()
+        request = {"args": list(args), "cwd": str(cwd), "env": env}
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        logger.debug(f"[ZygotePool] Dispatched task to worker {pid}")
+        return ZygoteProcess(pid, reader, writer)
+
+    async def shutdown(self) -> None:
+        """Stop the zygote (which terminates its workers) and remove the socket."""
+        if self._zygote is not None and self._zygote.returncode is None:
+            if self._zygote.stdin:
+                self._zygote.stdin.close()
+            try:
+                await asyncio.wait_for(self._zygote.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                self._zygote.kill()
+                await self._zygote.wait()
+        self._zygote = None
+
+        if self._idle is not None:
+            while not self._idle.empty():
+                _, _, writer = self._idle.get_nowait()
+                writer.close()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MassGen zygote worker pool")
+    parser.add_argument("--socket", required=True, help="Parent Unix socket path")
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--max-tasks-per-worker", type=int, default=4)
+    parser.add_argument("--entry-point", default=DEFAULT_ENTRY_POINT)
+    parser.add_argument("--preload", default=",".join(PRELOAD_MODULES), help="Comma-separated modules to import before forking")
+    args = parser.parse_args()
+    preload = tuple(name for name in args.preload.split(",") if name)
+    serve(args.socket, args.pool_size, args.max_tasks_per_worker, args.entry_point, preload)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from massgen.memory._filesystem_index import get_memory_index, parse_memory_text
 from massgen.system_prompt_sections import (
     AgentIdentitySection,
     BroadcastCommunicationSection,
@@ -831,27 +832,11 @@ This makes the work reusable for similar future tasks."""
             if not memory_dir.exists():
                 continue
 
-            # Read short-term memories
-            short_term_dir = memory_dir / "short_term"
-            if short_term_dir.exists():
-                for mem_file in short_term_dir.glob("*.md"):
-                    try:
-                        memory_data = self._parse_memory_file(mem_file)
-                        if memory_data:
-                            short_term_memories.append(memory_data)
-                    except Exception as e:
-                        logger.warning(f"[SystemMessageBuilder] Failed to parse memory file {mem_file}: {e}")
-
-            # Read long-term memories
-            long_term_dir = memory_dir / "long_term"
-            if long_term_dir.exists():
-                for mem_file in long_term_dir.glob("*.md"):
-                    try:
-                        memory_data = self._parse_memory_file(mem_file)
-                        if memory_data:
-                            long_term_memories.append(memory_data)
-                    except Exception as e:
-                        logger.warning(f"[SystemMessageBuilder] Failed to parse memory file {mem_file}: {e}")
+            # Parsed files are reused from the mtime index; only changed files are re-read
+            for record in get_memory_index(memory_dir).records():
+                if record.parsed:
+                    memories = short_term_memories if record.tier == "short_term" else long_term_memories
+                    memories.append(dict(record.parsed))
 
         return short_term_memories, long_term_memories
 
@@ -877,7 +862,8 @@ This makes the work reusable for similar future tasks."""
         # Format: {tier: {filename: [{"content": str, "source": str, "timestamp": float, "path": Path}, ...]}}
         all_memories: Dict[str, Dict[str, list]] = {"short_term": {}, "long_term": {}}
 
-        # Scan all archived answer directories
+        # Scan all archived answer directories. Archives are immutable once written,
+        # so their indexes persist a manifest and later processes start warm.
         for archive_dir in sorted(archive_base.iterdir()):
             if not archive_dir.is_dir():
                 continue
@@ -887,32 +873,15 @@ This makes the work reusable for similar future tasks."""
             source_label = dir_name.replace("_", " ").title()  # "Agent A Answer 0"
 
             # Process both tiers
-            for tier in ["short_term", "long_term"]:
-                tier_dir = archive_dir / tier
-                if not tier_dir.exists():
-                    continue
-
-                for mem_file in tier_dir.glob("*.md"):
-                    try:
-                        filename = mem_file.stem
-                        content = mem_file.read_text()
-                        timestamp = mem_file.stat().st_mtime
-
-                        # Initialize list for this filename if needed
-                        if filename not in all_memories[tier]:
-                            all_memories[tier][filename] = []
-
-                        # Add this version
-                        all_memories[tier][filename].append(
-                            {
-                                "content": content,
-                                "source": source_label,
-                                "timestamp": timestamp,
-                                "path": mem_file,
-                            },
-                        )
-                    except Exception as e:
-                        logger.warning(f"[SystemMessageBuilder] Failed to read archived memory {mem_file}: {e}")
+            for record in get_memory_index(archive_dir, persist=True).records():
+                all_memories[record.tier].setdefault(record.name, []).append(
+                    {
+                        "content": record.raw,
+                        "source": source_label,
+                        "timestamp": record.timestamp,
+                        "path": record.path,
+                    },
+                )
 
         # Deduplicate: for each filename, keep only the most recent version
         deduplicated = {"short_term": {}, "long_term": {}}
@@ -958,40 +927,9 @@ This makes the work reusable for similar future tasks."""
                 continue
 
             memories = {"short_term": {}, "long_term": {}}
-
-            # Load short_term memories
-            short_term_dir = memory_dir / "short_term"
-            if short_term_dir.exists():
-                for mem_file in short_term_dir.glob("*.md"):
-                    try:
-                        memory_data = self._parse_memory_file(mem_file)
-                        if memory_data:
-                            memories["short_term"][mem_file.stem] = memory_data
-                        else:
-                            # Fallback to raw content if parsing fails
-                            memories["short_term"][mem_file.stem] = {
-                                "name": mem_file.stem,
-                                "content": mem_file.read_text(),
-                            }
-                    except Exception as e:
-                        logger.warning(f"[SystemMessageBuilder] Failed to read temp workspace memory {mem_file}: {e}")
-
-            # Load long_term memories
-            long_term_dir = memory_dir / "long_term"
-            if long_term_dir.exists():
-                for mem_file in long_term_dir.glob("*.md"):
-                    try:
-                        memory_data = self._parse_memory_file(mem_file)
-                        if memory_data:
-                            memories["long_term"][mem_file.stem] = memory_data
-                        else:
-                            # Fallback to raw content if parsing fails
-                            memories["long_term"][mem_file.stem] = {
-                                "name": mem_file.stem,
-                                "content": mem_file.read_text(),
-                            }
-                    except Exception as e:
-                        logger.warning(f"[SystemMessageBuilder] Failed to read temp workspace memory {mem_file}: {e}")
+            for record in get_memory_index(memory_dir).records():
+                # Fallback to raw content if parsing fails
+                memories[record.tier][record.name] = dict(record.parsed) if record.parsed else {"name": record.name, "content": record.raw}
 
             # Only add if there are actual memories
             if memories["short_term"] or memories["long_term"]:
@@ -1015,36 +953,6 @@ This makes the work reusable for similar future tasks."""
             Dictionary with memory data or None if parsing fails
         """
         try:
-            content = file_path.read_text()
-
-            # Split frontmatter from content
-            if not content.startswith("---"):
-                return None
-
-            parts = content.split("---", 2)
-            if len(parts) < 3:
-                return None
-
-            frontmatter_text = parts[1].strip()
-            memory_content = parts[2].strip()
-
-            # Parse frontmatter (simple key: value parser)
-            metadata = {}
-            for line in frontmatter_text.split("\n"):
-                line = line.strip()
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    metadata[key.strip()] = value.strip()
-
-            # Return combined memory data
-            return {
-                "name": metadata.get("name", ""),
-                "description": metadata.get("description", ""),
-                "content": memory_content,
-                "tier": metadata.get("tier", ""),
-                "agent_id": metadata.get("agent_id", ""),
-                "created": metadata.get("created", ""),
-                "updated": metadata.get("updated", ""),
-            }
+            return parse_memory_text(file_path.read_text())
         except Exception:
             return None
@@ -10,12 +10,24 @@ maintainability.
 Design Document: docs/dev_notes/system_prompt_architecture_redesign.md
 """
 
+import os
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from enum import IntEnum
+from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 from loguru import logger
 
@@ -613,6 +625,82 @@ tweaks. Use your improvements analysis to guide what to build differently, and
 implement the changes you identified — not just acknowledge them."""
 
 
+# ---------------------------------------------------------------------------
+# Section render cache
+#
+# Sections are rebuilt for every agent on every round, but most of them only
+# depend on their constructor inputs (and a few files). Cacheable sections are
+# keyed by their frozen attributes plus the mtime/size of the files they read,
+# so unchanged sections are reused across rounds and agents.
+# ---------------------------------------------------------------------------
+
+
+class SectionRenderCache:
+    """Bounded LRU cache of section content keyed by ``SystemPromptSection.cache_key()``."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], str]) -> str:
+        """Return the cached content for ``key``, building and storing it on a miss."""
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+        self.misses += 1
+        content = build()
+        self._entries[key] = content
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return content
+
+    def clear(self) -> None:
+        """Drop all cached content and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_SECTION_RENDER_CACHE = SectionRenderCache()
+
+
+def clear_section_render_cache() -> None:
+    """Clear the shared section render cache (e.g. between tests)."""
+    _SECTION_RENDER_CACHE.clear()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert section inputs into a hashable cache key component.
+
+    Raises:
+        TypeError: If the value contains objects that can't be compared by value
+    """
+    if value is None or isinstance(value, (str, int, float, bool, bytes, Enum)):
+        return value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return tuple((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    raise TypeError(f"Unfreezable section input: {type(value).__name__}")
+
+
+def _file_fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) for a file, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class Priority(IntEnum):
     """
     Explicit priority levels for system prompt sections.
@@ -671,6 +759,10 @@ class SystemPromptSection(ABC):
     enabled: bool = True
     subsections: List["SystemPromptSection"] = field(default_factory=list)
 
+    # Set on sections whose build_content() is a pure function of their
+    # attributes plus the files listed by cache_files()
+    cacheable: ClassVar[bool] = False
+
     @abstractmethod
     def build_content(self) -> str:
         """
@@ -682,6 +774,31 @@ class SystemPromptSection(ABC):
             String content for this section (without XML wrapping)
         """
 
+    def cache_files(self) -> Iterable[Path]:
+        """
+        Files read by build_content(); their mtime and size are part of the cache key.
+
+        Returns:
+            Paths of files this section depends on
+        """
+        return ()
+
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Build the render cache key for this section.
+
+        Returns:
+            Hashable key, or None if the section must be rebuilt every time
+        """
+        if not self.cacheable:
+            return None
+        try:
+            attrs = _freeze({name: value for name, value in vars(self).items() if name != "subsections"})
+        except TypeError:
+            return None
+        files = tuple((str(path), _file_fingerprint(path)) for path in self.cache_files())
+        return (type(self).__qualname__, attrs, files)
+
     def render(self) -> str:
         """
         Render the complete section with XML structure if specified.
@@ -697,8 +814,9 @@ class SystemPromptSection(ABC):
         if not self.enabled:
             return ""
 
-        # Build main content
-        content = self.build_content()
+        # Build main content (reused from the render cache when inputs are unchanged)
+        key = self.cache_key()
+        content = self.build_content() if key is None else _SECTION_RENDER_CACHE.get_or_build(key, self.build_content)
 
         # Render and append subsections if present
         if self.subsections:
@@ -738,6 +856,8 @@ class AgentIdentitySection(SystemPromptSection):
                       agent.get_configurable_system_message()
     """
 
+    cacheable = True
+
     def __init__(self, agent_message: str):
         super().__init__(
             title="Agent Identity",
@@ -769,6 +889,8 @@ class CoreBehaviorsSection(SystemPromptSection):
     Priority 4 puts this after agent_identity(1), massgen_coordination(2), and skills(3).
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="Core Behaviors",
@@ -810,6 +932,8 @@ class GPT5GuidanceSection(SystemPromptSection):
         - https://cookbook.openai.com/examples/gpt-5/gpt-5_prompting_guide#tool-preambles
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="GPT-5 Guidance",
@@ -855,6 +979,8 @@ class GrokGuidanceSection(SystemPromptSection):
     Priority 4 places this alongside CoreBehaviorsSection.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="Grok Guidance",
@@ -891,6 +1017,7 @@ class SkillsSection(SystemPromptSection):
     """
 
     REGISTRY_FILENAME = "SKILL_REGISTRY.md"
+    cacheable = True
 
     def __init__(
         self,
@@ -905,6 +1032,11 @@ class SkillsSection(SystemPromptSection):
         self.skills = skills
         self.skills_dir = skills_dir
 
+    def cache_files(self) -> Iterable[Path]:
+        if self.skills_dir is None:
+            return ()
+        return (Path(self.skills_dir) / self.REGISTRY_FILENAME,)
+
     def _try_load_registry(self) -> Optional[str]:
         """Attempt to load registry content if it exists."""
         if self.skills_dir is None:
@@ -1031,6 +1163,8 @@ class FileSearchSection(SystemPromptSection):
     MEDIUM priority - useful but not critical for all tasks.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="File Search Tools",
@@ -1334,6 +1468,8 @@ class MemorySection(SystemPromptSection):
                       including short-term and long-term memory content
     """
 
+    cacheable = True
+
     def __init__(self, memory_config: Dict[str, Any]):
         super().__init__(
             title="Memory System",
@@ -1591,6 +1727,8 @@ class WorkspaceStructureSection(SystemPromptSection):
         use_two_tier_workspace: If True, include documentation for scratch/deliverable structure
     """
 
+    cacheable = True
+
     def __init__(
         self,
         workspace_path: str,
@@ -1727,6 +1865,13 @@ class ProjectInstructionsSection(SystemPromptSection):
         workspace_root: Agent workspace root (kept for backwards compatibility, not used for search boundary)
     """
 
+    INSTRUCTION_FILENAMES = ("CLAUDE.md", "AGENTS.md")
+    MAX_SEARCH_DEPTH = 10
+    cacheable = True
+
+    # Start directory -> (searched directory mtimes, discovered file)
+    _discovery_cache: ClassVar[Dict[str, Tuple[Tuple[int, ...], Optional[Path]]]] = {}
+
     def __init__(self, context_paths: List[Dict[str, str]], workspace_root: str):
         super().__init__(
             title="Project Instructions",
@@ -1746,41 +1891,49 @@ class ProjectInstructionsSection(SystemPromptSection):
         1. An instruction file is found (success)
         2. We reach the filesystem root (no more parents)
         3. We've searched up to a reasonable depth (safety limit)
+
+        Results are memoized per start directory and reused while the mtimes
+        of the searched directories are unchanged (creating, deleting or
+        renaming an instruction file updates its directory's mtime).
         """
         current = context_path if context_path.is_dir() else context_path.parent
 
         # Safety limit: search up to 10 levels max (prevents infinite loops)
-        max_depth = 10
-        depth = 0
-
-        # Walk up directory hierarchy
-        while current and depth < max_depth:
-            # Priority 1: CLAUDE.md (Claude-specific)
-            claude_md = current / "CLAUDE.md"
-            if claude_md.exists() and claude_md.is_file():
-                return claude_md
-
-            # Priority 2: AGENTS.md (universal standard)
-            agents_md = current / "AGENTS.md"
-            if agents_md.exists() and agents_md.is_file():
-                return agents_md
-
+        search_dirs = []
+        while current and len(search_dirs) < self.MAX_SEARCH_DEPTH:
+            search_dirs.append(current)
             # Stop at filesystem root
             parent = current.parent
             if parent == current:
                 break
-
             current = parent
-            depth += 1
 
-        return None
+        try:
+            fingerprint = tuple(os.stat(directory).st_mtime_ns for directory in search_dirs)
+        except OSError:
+            fingerprint = None  # Nonexistent directories: don't memoize
+        cache_key = str(search_dirs[0]) if search_dirs else ""
+        cached = self._discovery_cache.get(cache_key)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        found = None
+        for directory in search_dirs:
+            # Priority 1: CLAUDE.md (Claude-specific), Priority 2: AGENTS.md (universal standard)
+            for name in self.INSTRUCTION_FILENAMES:
+                candidate = directory / name
+                if candidate.exists() and candidate.is_file():
+                    found = candidate
+                    break
+            if found is not None:
+                break
 
-    def build_content(self) -> str:
-        """
-        Discover and inject CLAUDE.md/AGENTS.md contents from context paths.
-        Uses "closest wins" semantics - only one instruction file per context path.
-        """
-        # Collect discovered instruction files (deduplicate by path)
+        if fingerprint is not None:
+            self._discovery_cache[cache_key] = (fingerprint, found)
+        return found
+
+    def _discover_files(self) -> Dict[str, Path]:
+        """Discover instruction files for all context paths (deduplicated by path)."""
         discovered_files = {}  # path -> file_path mapping
 
         for ctx_path in self.context_paths:
@@ -1792,7 +1945,7 @@ class ProjectInstructionsSection(SystemPromptSection):
                 path = Path(path_str).resolve()
 
                 # Check if path IS an instruction file directly
-                if path.name in ["CLAUDE.md", "AGENTS.md"]:
+                if path.name in self.INSTRUCTION_FILENAMES:
                     if path.exists() and path.is_file():
                         discovered_files[str(path)] = path
                         continue
@@ -1805,6 +1958,19 @@ class ProjectInstructionsSection(SystemPromptSection):
             except Exception as e:
                 logger.warning(f"Error checking context path {path_str} for instruction files: {e}")
 
+        return discovered_files
+
+    def cache_files(self) -> Iterable[Path]:
+        return self._discover_files().values()
+
+    def build_content(self) -> str:
+        """
+        Discover and inject CLAUDE.md/AGENTS.md contents from context paths.
+        Uses "closest wins" semantics - only one instruction file per context path.
+        """
+        # Collect discovered instruction files (deduplicate by path)
+        discovered_files = self._discover_files()
+
         if not discovered_files:
             return ""  # No instruction files found
 
@@ -1858,6 +2024,8 @@ class CommandExecutionSection(SystemPromptSection):
         concurrent_tool_execution: Whether tools execute in parallel
     """
 
+    cacheable = True
+
     def __init__(self, docker_mode: bool = False, enable_sudo: bool = False, concurrent_tool_execution: bool = False):
         super().__init__(
             title="Command Execution",
@@ -1928,6 +2096,8 @@ class FilesystemOperationsSection(SystemPromptSection):
         enable_command_execution: Whether command line execution is enabled
     """
 
+    cacheable = True
+
     def __init__(
         self,
         main_workspace: Optional[str] = None,
@@ -2112,6 +2282,8 @@ class FilesystemBestPracticesSection(SystemPromptSection):
         enable_code_based_tools: Whether code-based tools mode is enabled
     """
 
+    cacheable = True
+
     def __init__(self, enable_code_based_tools: bool = False, decomposition_mode: bool = False):
         super().__init__(
             title="Filesystem Best Practices",
@@ -2203,6 +2375,8 @@ class FilesystemSection(SystemPromptSection):
         use_two_tier_workspace: Whether two-tier workspace (scratch/deliverable) is enabled
     """
 
+    cacheable = True
+
     def __init__(
         self,
         workspace_path: str,
@@ -2262,6 +2436,8 @@ class TaskPlanningSection(SystemPromptSection):
         filesystem_mode: If True, includes guidance about filesystem-based task storage
     """
 
+    cacheable = True
+
     def __init__(self, filesystem_mode: bool = False, decomposition_mode: bool = False):
         super().__init__(
             title="Task Planning",
@@ -2793,6 +2969,8 @@ class PostEvaluationSection(SystemPromptSection):
     MEDIUM priority as this is phase-specific operational guidance.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="Post-Presentation Evaluation",
@@ -2852,6 +3030,8 @@ class PlanningModeSection(SystemPromptSection):
         planning_mode_instruction: The planning mode instruction text
     """
 
+    cacheable = True
+
     def __init__(self, planning_mode_instruction: str):
         super().__init__(
             title="Planning Mode",
@@ -3058,6 +3238,8 @@ class ChangedocSection(SystemPromptSection):
         has_prior_answers: Whether other agents' answers are visible.
     """
 
+    cacheable = True
+
     def __init__(self, has_prior_answers: bool = False):
         super().__init__(
             title="Change Document",
@@ -3084,6 +3266,8 @@ class SubagentSection(SystemPromptSection):
         max_concurrent: Maximum concurrent subagents allowed
     """
 
+    cacheable = True
+
     def __init__(self, workspace_path: str, max_concurrent: int = 3):
         super().__init__(
             title="Subagent Delegation",
@@ -3322,6 +3506,8 @@ class BroadcastCommunicationSection(SystemPromptSection):
         >>> print(section.render())
     """
 
+    cacheable = True
+
     def __init__(
         self,
         broadcast_mode: str,
@@ -3518,6 +3704,8 @@ class EvolvingSkillsSection(SystemPromptSection):
     reference the plan and capture task-specific learnings.
     """
 
+    cacheable = True
+
     def __init__(self, plan_context: dict | None = None):
         super().__init__(
             title="Evolving Skills",
@@ -3678,6 +3866,8 @@ class OutputFirstVerificationSection(SystemPromptSection):
     Always included regardless of tools available.
     """
 
+    cacheable = True
+
     def __init__(self, decomposition_mode: bool = False):
         super().__init__(
             title="Output-First Iteration",
@@ -3756,6 +3946,8 @@ class MultimodalToolsSection(SystemPromptSection):
     Only included when multimodal tools are enabled.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="Visual Verification Tools",
@@ -3811,6 +4003,8 @@ class TaskContextSection(SystemPromptSection):
     MEDIUM priority - included when multimodal tools or subagents are enabled.
     """
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             title="Task Context",
@@ -3916,8 +4110,17 @@ class SystemPromptBuilder:
         # Sort by priority (CRITICAL=1 comes before LOW=15)
         sorted_sections = sorted(enabled_sections, key=lambda s: s.priority)
 
-        # Render each section
-        rendered_sections = [s.render() for s in sorted_sections]
+        # Render each section, timing each one for the debug breakdown
+        rendered_sections = []
+        timings = []
+        build_start = time.perf_counter()
+        for section in sorted_sections:
+            hits_before = _SECTION_RENDER_CACHE.hits
+            section_start = time.perf_counter()
+            rendered_sections.append(section.render())
+            elapsed_ms = (time.perf_counter() - section_start) * 1000
+            timings.append(f"{section.title}={elapsed_ms:.1f}ms{' (cached)' if _SECTION_RENDER_CACHE.hits > hits_before else ''}")
+        logger.debug(f"[SystemPromptBuilder] Rendered {len(sorted_sections)} sections in {(time.perf_counter() - build_start) * 1000:.1f}ms: {', '.join(timings)}")
 
         # Join with blank lines
         content = "\n\n".join(rendered_sections)
@@ -42,6 +42,31 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=_env_flag("RUN_EXPENSIVE"),
         help="Run tests marked as expensive (or set RUN_EXPENSIVE=1).",
     )
+    group.addoption(
+        "--run-performance",
+        action="store_true",
+        default=_env_flag("RUN_PERFORMANCE"),
+        help="Run tests marked as performance (or set RUN_PERFORMANCE=1).",
+    )
+    group.addoption(
+        "--perf-baseline",
+        action="store",
+        default=os.getenv("MASSGEN_PERF_BASELINE"),
+        help="Path to the local performance baseline JSON (default: massgen_perf/baselines.json in the pytest cache dir).",
+    )
+    group.addoption(
+        "--perf-threshold",
+        action="store",
+        type=float,
+        default=float(os.getenv("MASSGEN_PERF_THRESHOLD", "0.25")),
+        help="Allowed slowdown over the stored baseline before a performance test fails (default: 0.25 = 25%%).",
+    )
+    group.addoption(
+        "--perf-save",
+        action="store_true",
+        default=_env_flag("MASSGEN_PERF_SAVE"),
+        help="Overwrite stored performance baselines with this run's timings (or set MASSGEN_PERF_SAVE=1).",
+    )
     group.addoption(
         "--xfail-expired-fail",
         action="store_true",
@@ -136,6 +161,9 @@ class MockLLMBackend:
     def set_planning_mode(self, enabled: bool) -> None:
         self._planning_mode = enabled
 
+    def is_planning_mode_enabled(self) -> bool:
+        return self._planning_mode
+
     def get_provider_name(self) -> str:
         return self._provider_name
 
@@ -325,13 +353,15 @@ def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item
     run_live_api = bool(config.getoption("--run-live-api"))
     run_docker = bool(config.getoption("--run-docker"))
     run_expensive = bool(config.getoption("--run-expensive"))
+    run_performance = bool(config.getoption("--run-performance"))
     xfail_registry_path = str(config.getoption("--xfail-registry"))
 
-    # 1) Default policy: skip integration/live_api/docker/expensive unless explicitly enabled.
+    # 1) Default policy: skip integration/live_api/docker/expensive/performance unless explicitly enabled.
     skip_integration = pytest.mark.skip(reason="integration test (enable with --run-integration or RUN_INTEGRATION=1)")
     skip_live_api = pytest.mark.skip(reason="live API test (enable with --run-live-api or RUN_LIVE_API=1)")
     skip_docker = pytest.mark.skip(reason="docker test (enable with --run-docker or RUN_DOCKER=1)")
     skip_expensive = pytest.mark.skip(reason="expensive test (enable with --run-expensive or RUN_EXPENSIVE=1)")
+    skip_performance = pytest.mark.skip(reason="performance test (enable with --run-performance or RUN_PERFORMANCE=1)")
 
     for item in items:
         if (not run_integration) and _should_skip_marker(item, "integration"):
@@ -342,6 +372,8 @@ def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item
             item.add_marker(skip_docker)
         if (not run_expensive) and _should_skip_marker(item, "expensive"):
             item.add_marker(skip_expensive)
+        if (not run_performance) and _should_skip_marker(item, "performance"):
+            item.add_marker(skip_performance)
 
     # 2) Expiring xfail registry: apply known-failure tracking.
     registry = _load_xfail_registry(xfail_registry_path)
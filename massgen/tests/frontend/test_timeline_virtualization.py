@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Tests for the virtualized TimelineSection window."""
+
+from datetime import datetime, timezone
+
+import pytest
+from textual.app import App, ComposeResult
+
+from massgen.frontend.displays.content_handlers import ToolDisplayData
+from massgen.frontend.displays.textual_widgets.content_sections import (
+    RestartBanner,
+    TimelineSection,
+)
+from massgen.frontend.displays.textual_widgets.timeline_window import (
+    TimelineRecord,
+    TimelineWindow,
+)
+from massgen.frontend.displays.textual_widgets.tool_card import ToolCallCard
+
+
+class _TimelineApp(App):
+    def compose(self) -> ComposeResult:
+        yield TimelineSection(id="timeline")
+
+
+def _tool(tool_id: str, status: str = "running") -> ToolDisplayData:
+    return ToolDisplayData(
+        tool_id=tool_id,
+        tool_name="read_file",
+        display_name="read_file",
+        tool_type="tool",
+        category="filesystem",
+        icon="F",
+        color="blue",
+        status=status,
+        start_time=datetime.now(timezone.utc),
+        result_summary="ok" if status == "success" else None,
+    )
+
+
+def _window_of(kinds: str) -> TimelineWindow:
+    """Build a window from a string like 'btttbtt' (b = pinned banner, t = item)."""
+    window = TimelineWindow(size=3)
+    for i, kind in enumerate(kinds):
+        window.insert(TimelineRecord(widget_id=f"w{i}", kind=kind, pinned=kind == "b", widget=object()))
+    return window
+
+
+async def _add_completed_tools(pilot, timeline: TimelineSection, count: int, round_number: int = 1, prefix: str = "t") -> None:
+    for i in range(count):
+        tool_id = f"{prefix}{i}"
+        timeline.add_tool(_tool(tool_id), round_number=round_number)
+        timeline.update_tool(tool_id, _tool(tool_id, status="success"))
+        await pilot.pause()
+
+
+# =============================================================================
+# TimelineWindow Tests
+# =============================================================================
+
+
+class TestTimelineWindow:
+    """Tests for the pure window bookkeeping."""
+
+    def test_anchor_to_tail_counts_only_recyclable_records(self):
+        window = _window_of("btttbttt")
+        assert window.anchor_to_tail() == (4, 8)  # Includes the round banner above the window
+
+        to_evict, to_mount = window.plan()
+        assert [r.widget_id for r in to_evict] == ["w1", "w2", "w3"]
+        assert to_mount == []
+
+    def test_tail_window_includes_leading_banner(self):
+        window = _window_of("btttbtt")
+        assert window.anchor_to_tail() == (3, 7)  # w4 banner pinned, so window reaches back to w3
+
+    def test_page_up_and_down(self):
+        window = _window_of("tttttttt")
+        window.anchor_to_tail()
+        for record in window.plan()[0]:
+            record.widget = None
+
+        assert window.has_hidden_before()
+        assert window.page_up(2)
+        assert (window.lo, window.hi) == (3, 6)
+        assert not window.follow_tail
+        _, to_mount = window.plan()
+        assert [r.widget_id for r in to_mount] == ["w4", "w3"]  # Newest first
+
+        assert window.page_down(5)
+        assert (window.lo, window.hi) == (5, 8)
+        assert window.follow_tail
+
+    def test_insert_positions_shift_window(self):
+        window = _window_of("ttt")
+        window.anchor_to_tail()
+        window.insert(TimelineRecord(widget_id="late", kind="t"), before_id="w1")
+        assert window.index_of("late") == 1
+        assert (window.lo, window.hi) == (0, 4)
+        window.insert(TimelineRecord(widget_id="tail", kind="t"))
+        assert window.hi == 5  # Following the tail
+        window.remove("late")
+        assert window.index_of("w1") == 1 and window.hi == 4
+
+    def test_keep_predicate_prevents_eviction(self):
+        window = _window_of("tttt")
+        window.anchor_to_tail()
+        to_evict, _ = window.plan(keep=lambda record: record.widget_id == "w0")
+        assert to_evict == []
+
+    def test_rejects_invalid_size(self):
+        with pytest.raises(ValueError):
+            TimelineWindow(size=0)
+
+
+# =============================================================================
+# TimelineSection Virtualization Tests
+# =============================================================================
+
+
+class TestTimelineVirtualization:
+    """Widget-level tests for mounting only the visible window."""
+
+    @pytest.mark.asyncio
+    async def test_old_items_are_unmounted_but_recorded(self):
+        app = _TimelineApp()
+        async with app.run_test(headless=True) as pilot:
+            timeline = app.query_one(TimelineSection)
+            timeline.MAX_TIMELINE_ITEMS = timeline._window.size = 5
+
+            await _add_completed_tools(pilot, timeline, 12)
+            await pilot.pause()
+
+            mounted_cards = list(timeline.query(ToolCallCard))
+            assert len(mounted_cards) == 5
+            assert [card.call_id for card in mounted_cards] == [f"t{i}" for i in range(7, 12)]
+            assert len([r for r in timeline._window if r.kind == "tool"]) == 12
+            assert timeline.get_tool("t0") is None
+            assert timeline.has_tool("t0")
+
+    @pytest.mark.asyncio
+    async def test_running_tools_stay_mounted(self):
+        app = _TimelineApp()
+        async with app.run_test(headless=True) as pilot:
+            timeline = app.query_one(TimelineSection)
+            timeline.MAX_TIMELINE_ITEMS = timeline._window.size = 3
+
+            timeline.add_tool(_tool("long_running"), round_number=1)
+            await _add_completed_tools(pilot, timeline, 6)
+            await pilot.pause()
+
+            assert timeline.get_tool("long_running") is not None
+            assert timeline.get_running_tools_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_update_to_evicted_tool_survives_rebuild(self):
+        app = _TimelineApp()
+        async with app.run_test(headless=True) as pilot:
+            timeline = app.query_one(TimelineSection)
+            timeline.MAX_TIMELINE_ITEMS = timeline._window.size = 3
+
+            await _add_completed_tools(pilot, timeline, 6)
+            timeline.add_hook_to_tool("t0", {"hook_name": "audit", "hook_type": "post", "injection_preview": "note"})
+            errored = _tool("t1", status="error")
+            errored.error = "boom"
+            timeline.update_tool("t1", errored)
+
+            timeline.scroll_to_widget(timeline._window[1].widget_id)  # t0's card
+            await pilot.pause()
+            await pilot.pause()
+
+            card = timeline.get_tool("t0")
+            assert card is not None and card.is_mounted
+            assert [hook["hook_name"] for hook in card.post_hooks] == ["audit"]
+            assert timeline.get_tool("t1").status == "error"
+            assert "status-error" in timeline.get_tool("t1").classes
+            assert timeline.in_scroll_mode
+
+    @pytest.mark.asyncio
+    async def test_round_navigation_restores_recycled_round(self):
+        app = _TimelineApp()
+        async with app.run_test(headless=True) as pilot:
+            timeline = app.query_one(TimelineSection)
+            timeline.MAX_TIMELINE_ITEMS = timeline._window.size = 4
+
+            await _add_completed_tools(pilot, timeline, 5, round_number=1, prefix="r1_")
+            await _add_completed_tools(pilot, timeline, 5, round_number=2, prefix="r2_")
+            await pilot.pause()
+            assert timeline.get_tool("r1_0") is None
+            assert len(list(timeline.query(RestartBanner))) == 2  # Banners are pinned
+
+            timeline.switch_to_round(1)
+            await pilot.pause()
+            await pilot.pause()
+
+            assert timeline.get_tool("r1_0") is not None
+            assert timeline.get_tool("r2_4") is None
+            children = [child for child in timeline.children if child.id != "scroll_mode_indicator"]
+            ids = [child.id for child in children]
+            assert ids.index(timeline.get_tool("r1_0").id) < ids.index(timeline.get_tool("r1_3").id)
+
+            timeline.exit_scroll_mode()
+            await pilot.pause()
+            assert timeline.get_tool("r2_4") is not None
+            assert timeline.get_tool("r1_0") is None
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Timing harness and synthetic fixtures for hot-path performance tests.
+
+Performance tests are skipped unless ``--run-performance`` (or
+``RUN_PERFORMANCE=1``) is given. Each measurement is the median of several
+rounds after warmup. Medians are compared against a local baseline file
+(``--perf-baseline``, default ``massgen_perf/baselines.json`` in the pytest
+cache directory); a test fails
+when its median is more than ``--perf-threshold`` (default 25%) slower than
+the stored baseline. Measurements without a baseline are recorded and pass;
+``--perf-save`` overwrites existing baselines with the current run.
+
+Baselines are machine-specific, so they live in the pytest cache rather than
+in the repository. With the cache provider disabled and no explicit path they
+are kept for the session only. Everything here runs offline.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+# Regressions smaller than this are treated as timer noise regardless of ratio
+ABSOLUTE_TOLERANCE_SECONDS = 0.001
+
+
+@dataclass
+class PerfResult:
+    """Timing summary for one measured operation."""
+
+    name: str
+    median: float
+    minimum: float
+    rounds: int
+    baseline: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"median": self.median, "min": self.minimum, "rounds": self.rounds}
+
+
+_perf_results: List[PerfResult] = []
+
+
+class PerfBaselines:
+    """Local store of baseline medians, keyed by measurement name."""
+
+    def __init__(self, path: Optional[Path], threshold: float, save: bool):
+        self.path = path
+        self.threshold = threshold
+        self.save = save
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8")).get("benchmarks", {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def check(self, result: PerfResult) -> None:
+        """Compare a result against its baseline, recording it when missing or saving."""
+        stored = self.entries.get(result.name)
+        if stored is None or self.save:
+            self.entries[result.name] = result.to_dict()
+            self._dirty = True
+            return
+
+        result.baseline = stored["median"]
+        budget = result.baseline * (1 + self.threshold)
+        if result.median > budget and result.median - result.baseline > ABSOLUTE_TOLERANCE_SECONDS:
+            pytest.fail(
+                f"{result.name}: median {result.median * 1000:.2f} ms is {result.median / result.baseline - 1:.0%} slower than "
+                f"baseline {result.baseline * 1000:.2f} ms (threshold {self.threshold:.0%}). "
+                f"Re-run with --perf-save if the slowdown is expected.",
+            )
+
+    def flush(self) -> None:
+        if not self._dirty or self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "machine": {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()},
+            "benchmarks": dict(sorted(self.entries.items())),
+        }
+        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+class PerfHarness:
+    """Runs an operation repeatedly and checks its median against the baseline."""
+
+    def __init__(self, baselines: PerfBaselines):
+        self._baselines = baselines
+
+    async def measure(
+        self,
+        name: str,
+        operation: Callable[..., Any],
+        setup: Optional[Callable[[], Any]] = None,
+        rounds: int = 7,
+        warmup: int = 2,
+        inner: int = 1,
+    ) -> PerfResult:
+        """Time ``operation`` and enforce the regression budget.
+
+        Args:
+            name: Baseline key (include the fixture size so shapes don't collide)
+            operation: Sync or async callable; receives ``setup()``'s return value when ``setup`` is given
+            setup: Untimed per-round preparation
+            rounds: Measured rounds (the median is reported)
+            warmup: Unmeasured rounds before them
+            inner: Calls per round, for operations too fast to time individually
+
+        Returns:
+            PerfResult with per-call timings
+        """
+        timings = []
+        for index in range(warmup + rounds):
+            args = () if setup is None else (setup(),)
+            start = time.perf_counter()
+            for _ in range(inner):
+                value = operation(*args)
+                if inspect.isawaitable(value):
+                    await value
+            elapsed = (time.perf_counter() - start) / inner
+            if index >= warmup:
+                timings.append(elapsed)
+
+        result = PerfResult(name=name, median=statistics.median(timings), minimum=min(timings), rounds=rounds)
+        _perf_results.append(result)
+        self._baselines.check(result)
+        return result
+
+
+def _baseline_path(config) -> Optional[Path]:
+    option = config.getoption("--perf-baseline")
+    if option:
+        return Path(option).expanduser()
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return None
+    return cache.mkdir("massgen_perf") / "baselines.json"
+
+
+@pytest.fixture(scope="session")
+def perf_baselines(pytestconfig):
+    baselines = PerfBaselines(
+        path=_baseline_path(pytestconfig),
+        threshold=pytestconfig.getoption("--perf-threshold"),
+        save=pytestconfig.getoption("--perf-save"),
+    )
+    yield baselines
+    baselines.flush()
+
+
+@pytest.fixture
+def perf(perf_baselines) -> PerfHarness:
+    """Timing harness bound to the session's baseline store."""
+    return PerfHarness(perf_baselines)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print a timing table for the performance tests that ran."""
+    if not _perf_results:
+        return
+    terminalreporter.section("performance")
+    for result in _perf_results:
+        baseline = "new baseline" if result.baseline is None else f"baseline {result.baseline * 1000:9.3f} ms ({result.median / result.baseline - 1:+.0%})"
+        terminalreporter.write_line(f"{result.name:<55} {result.median * 1000:9.3f} ms  {baseline}")
+
+
+# ---------------------------------------------------------------------------
+# Synthetic fixtures
+# ---------------------------------------------------------------------------
+
+WORKSPACE_DIRS = 20
+WORKSPACE_FILES_PER_DIR = 50
+CONTEXT_PATHS = 200
+HISTORY_TURNS = 40
+HOOK_COUNT = 40
+
+
+@pytest.fixture(scope="session")
+def large_workspace(tmp_path_factory) -> Path:
+    """Workspace of WORKSPACE_DIRS x WORKSPACE_FILES_PER_DIR small source files."""
+    root = tmp_path_factory.mktemp("perf_workspace")
+    body = "def handler(event):\n    return {'status': 'ok', 'event': event}\n" * 20
+    for d in range(WORKSPACE_DIRS):
+        package = root / f"pkg_{d:02d}" / "src"
+        package.mkdir(parents=True)
+        for f in range(WORKSPACE_FILES_PER_DIR):
+            (package / f"module_{f:03d}.py").write_text(body, encoding="utf-8")
+    return root
+
+
+@pytest.fixture(scope="session")
+def context_path_tree(tmp_path_factory) -> Dict[str, Any]:
+    """CONTEXT_PATHS context directories, each with protected paths, plus query paths."""
+    root = tmp_path_factory.mktemp("perf_context")
+    context_paths = []
+    queries = []
+    for i in range(CONTEXT_PATHS):
+        project = root / f"project_{i:03d}"
+        (project / "src" / "core").mkdir(parents=True)
+        (project / "tests").mkdir()
+        context_paths.append(
+            {
+                "path": str(project),
+                "permission": "write" if i % 2 else "read",
+                "protected_paths": ["tests/", "config.yaml"],
+            },
+        )
+        queries.append(project / "src" / "core" / "engine.py")
+        queries.append(project / "tests" / "test_engine.py")
+    queries.append(root / "outside" / "unmanaged.txt")
+    return {"root": root, "context_paths": context_paths, "queries": queries}
+
+
+@pytest.fixture(scope="session")
+def long_history() -> Dict[str, Any]:
+    """Answers, previous turns and human Q&A shaped like a long multi-turn session."""
+    paragraph = "The proposal trades latency for consistency; see the benchmark table for the measured impact. "
+    agent_ids = [f"agent_{chr(ord('a') + i)}" for i in range(5)]
+    return {
+        "agent_ids": agent_ids,
+        "answers": {agent_id: paragraph * 200 for agent_id in agent_ids},
+        "previous_turns": [{"turn": turn, "path": f"/tmp/massgen/turn_{turn}/workspace", "task": f"Follow-up request {turn}", "winner": agent_ids[turn % 5]} for turn in range(1, HISTORY_TURNS + 1)],
+        "human_qa_history": [{"question": f"Should step {i} keep the cache?", "answer": "Yes, keep it warm."} for i in range(HISTORY_TURNS)],
+    }
+
+
+@pytest.fixture
+def many_hooks():
+    """GeneralHookManager with HOOK_COUNT global and per-agent hooks over mixed matchers."""
+    from massgen.mcp_tools.hooks import (
+        GeneralHookManager,
+        HookResult,
+        HookType,
+        PythonCallableHook,
+    )
+
+    async def allow(event):
+        return HookResult.allow()
+
+    def inject(event):
+        return HookResult(inject={"content": f"checked {event.tool_name}", "strategy": "tool_result"})
+
+    manager = GeneralHookManager()
+    matchers = ["*", "Write|Edit", "mcp__*", "read_*", "execute_command"]
+    for i in range(HOOK_COUNT):
+        matcher = matchers[i % len(matchers)]
+        manager.register_global_hook(HookType.PRE_TOOL_USE, PythonCallableHook(f"pre_{i}", allow, matcher=matcher))
+        manager.register_global_hook(HookType.POST_TOOL_USE, PythonCallableHook(f"post_{i}", inject if i % 4 == 0 else allow, matcher=matcher))
+        manager.register_agent_hook("agent_a", HookType.PRE_TOOL_USE, PythonCallableHook(f"agent_pre_{i}", allow, matcher=matcher))
+    return manager
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Performance budgets for coordination hot paths.
+
+Tests cover:
+- Orchestrator._stream_coordination_with_agents over replayed synthetic agents
+- SystemMessageBuilder.build_coordination_message with long histories
+- CoordinationTracker.save_status_file with many recorded answers and votes
+"""
+
+import pytest
+
+from massgen.agent_config import AgentConfig
+from massgen.bench import BenchScenario, build_orchestrator
+from massgen.coordination_tracker import CoordinationTracker
+from massgen.message_templates import MessageTemplates
+from massgen.system_message_builder import SystemMessageBuilder
+
+pytestmark = pytest.mark.performance
+
+_SCENARIO = BenchScenario(name="perf", agents=3, rounds=2, tool_calls=3, content_chunks=50)
+
+
+class _StaticBackend:
+    def __init__(self):
+        self.config = {"model": "gpt-4o-mini"}
+        self.filesystem_manager = None
+
+
+class _StaticAgent:
+    def __init__(self, system_message: str):
+        self.backend = _StaticBackend()
+        self._system_message = system_message
+
+    def get_configurable_system_message(self):
+        return self._system_message
+
+
+class TestCoordinationPerformance:
+    """Budgets for the coordination loop and the work it repeats per round."""
+
+    @pytest.mark.asyncio
+    async def test_stream_coordination_with_agents(self, perf):
+        def setup():
+            orchestrator = build_orchestrator(_SCENARIO)
+            orchestrator.current_task = "Summarize the trade-offs and recommend one approach."
+            orchestrator.config.disable_injection = True
+            return orchestrator
+
+        async def coordinate(orchestrator):
+            votes = {}
+            async for _ in orchestrator._stream_coordination_with_agents(votes, {}):
+                pass
+            assert len(votes) == _SCENARIO.agents
+
+        await perf.measure(
+            f"stream_coordination[{_SCENARIO.agents}x{_SCENARIO.rounds}x{_SCENARIO.tool_calls}]",
+            coordinate,
+            setup=setup,
+            rounds=5,
+            warmup=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_build_coordination_message(self, perf, long_history):
+        builder = SystemMessageBuilder(config=AgentConfig.create_openai_config(), message_templates=MessageTemplates(), agents={})
+        agent = _StaticAgent("You are Agent A.")
+        mapping = {agent_id: f"agent{i + 1}" for i, agent_id in enumerate(long_history["agent_ids"])}
+
+        def build():
+            return builder.build_coordination_message(
+                agent=agent,
+                agent_id="agent_a",
+                answers=long_history["answers"],
+                planning_mode_enabled=False,
+                use_skills=False,
+                enable_memory=False,
+                enable_task_planning=True,
+                previous_turns=long_history["previous_turns"],
+                human_qa_history=long_history["human_qa_history"],
+                agent_mapping=mapping,
+            )
+
+        await perf.measure("build_coordination_message[long_history]", build, inner=5)
+
+        assert "<system_prompt>" in build()
+
+    @pytest.mark.asyncio
+    async def test_save_status_file(self, perf, long_history, tmp_path):
+        agent_ids = long_history["agent_ids"]
+        tracker = CoordinationTracker()
+        tracker.initialize_session(agent_ids, user_prompt="Summarize the trade-offs.")
+        for round_index in range(10):
+            for agent_id in agent_ids:
+                tracker.add_agent_answer(agent_id, f"Round {round_index} answer from {agent_id}. " * 20)
+            for agent_id in agent_ids:
+                tracker.add_agent_vote(agent_id, {"agent_id": agent_ids[0], "reason": "Most complete answer."})
+            tracker.start_new_iteration()
+
+        await perf.measure("save_status_file[long_history]", lambda: tracker.save_status_file(tmp_path), inner=5)
+
+        assert (tmp_path / "status.json").exists()
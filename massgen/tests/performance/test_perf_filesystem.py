@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Performance budgets for filesystem hot paths.
+
+Tests cover:
+- FilesystemManager.save_snapshot over a large workspace
+- PathPermissionManager.get_permission with many context paths (cold and cached)
+"""
+
+import shutil
+
+import pytest
+
+from massgen.filesystem_manager import FilesystemManager
+from massgen.filesystem_manager._path_permission_manager import PathPermissionManager
+
+pytestmark = pytest.mark.performance
+
+
+class TestSnapshotPerformance:
+    """Budgets for workspace snapshotting."""
+
+    @pytest.mark.asyncio
+    async def test_save_snapshot_large_workspace(self, perf, large_workspace, tmp_path):
+        workspace = tmp_path / "workspace"
+        manager = FilesystemManager(cwd=str(workspace), agent_temporary_workspace_parent=str(tmp_path / "temp"))
+        manager.setup_orchestration_paths(agent_id="agent_a", snapshot_storage=str(tmp_path / "snapshots"))
+        shutil.copytree(large_workspace, workspace, dirs_exist_ok=True)
+
+        files = len(list(workspace.rglob("*.py")))
+        await perf.measure("save_snapshot[large_workspace]", lambda: manager.save_snapshot(timestamp="perf"), rounds=5, warmup=1)
+
+        assert len(list((tmp_path / "snapshots").rglob("*.py"))) == files
+
+
+class TestPermissionPerformance:
+    """Budgets for permission lookups, which run on every file tool call."""
+
+    @staticmethod
+    def _manager(context_path_tree) -> PathPermissionManager:
+        manager = PathPermissionManager(context_write_access_enabled=True)
+        manager.add_context_paths(context_path_tree["context_paths"])
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_get_permission_cold(self, perf, context_path_tree):
+        manager = self._manager(context_path_tree)
+        # Uncached lookups scan every managed path, so sample the queries
+        queries = context_path_tree["queries"][::10] + context_path_tree["queries"][-1:]
+
+        def lookup_all():
+            manager._permission_cache.clear()
+            for path in queries:
+                manager.get_permission(path)
+
+        await perf.measure("get_permission[many_context_paths_cold]", lookup_all, rounds=5, warmup=1)
+
+        assert manager.get_permission(queries[-1]) is None
+
+    @pytest.mark.asyncio
+    async def test_get_permission_cached(self, perf, context_path_tree):
+        manager = self._manager(context_path_tree)
+        queries = context_path_tree["queries"]
+
+        def lookup_all():
+            for path in queries:
+                manager.get_permission(path)
+
+        await perf.measure("get_permission[many_context_paths_cached]", lookup_all, inner=5)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Performance budgets for the hook framework.
+
+Tests cover:
+- GeneralHookManager.execute_hooks for PreToolUse with many global and agent hooks
+- GeneralHookManager.execute_hooks for PostToolUse with injections
+"""
+
+import json
+
+import pytest
+
+from massgen.mcp_tools.hooks import HookType
+
+pytestmark = pytest.mark.performance
+
+_TOOLS = ["Write", "mcp__filesystem__read_file", "read_multiple_files", "execute_command", "web_search"]
+_ARGUMENTS = json.dumps({"path": "src/core/engine.py", "content": "x" * 2000})
+
+
+class TestHookPerformance:
+    """Budgets for hook dispatch, which runs around every tool call."""
+
+    @pytest.mark.asyncio
+    async def test_execute_pre_tool_hooks(self, perf, many_hooks):
+        context = {"agent_id": "agent_a", "session_id": "perf"}
+
+        async def dispatch():
+            for tool in _TOOLS:
+                result = await many_hooks.execute_hooks(HookType.PRE_TOOL_USE, tool, _ARGUMENTS, context)
+                assert result.allowed
+
+        await perf.measure("execute_hooks[many_hooks_pre]", dispatch)
+
+    @pytest.mark.asyncio
+    async def test_execute_post_tool_hooks(self, perf, many_hooks):
+        context = {"agent_id": "agent_b", "session_id": "perf"}
+
+        async def dispatch():
+            for tool in _TOOLS:
+                await many_hooks.execute_hooks(HookType.POST_TOOL_USE, tool, _ARGUMENTS, context, tool_output="ok" * 500)
+
+        await perf.measure("execute_hooks[many_hooks_post]", dispatch)
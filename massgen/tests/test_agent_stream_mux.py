@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the agent stream multiplexer used by the coordination loop.
+
+Tests cover:
+- Per-agent chunk order across interleaved agents
+- Backpressure: a pump never runs more than its budget ahead of the consumer
+- Terminal chunks stop the pump with the stream still suspended
+- Detaching cancels the pump and drops queued chunks
+"""
+
+import asyncio
+
+import pytest
+
+from massgen._agent_stream_mux import AgentStreamMultiplexer
+
+
+async def _next_chunk(stream):
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return ("done", None)
+    except Exception as e:
+        return ("error", str(e))
+
+
+async def _content_stream(count, pulled=None, terminal=None):
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        yield ("content", i)
+        await asyncio.sleep(0)
+    if terminal is not None:
+        yield terminal
+        yield ("content", "after terminal")
+
+
+async def _drain(mux, agents):
+    received = {agent_id: [] for agent_id in agents}
+    open_agents = set(agents)
+    while open_agents:
+        for agent_id, chunk in await mux.next_batch():
+            received[agent_id].append(chunk)
+            if chunk[0] in ("done", "error", "result"):
+                open_agents.discard(agent_id)
+                await mux.detach(agent_id)
+    return received
+
+
+class TestAgentStreamMultiplexer:
+    """Tests for AgentStreamMultiplexer."""
+
+    @pytest.mark.asyncio
+    async def test_interleaved_agents_keep_stream_order(self):
+        tasks = {}
+        mux = AgentStreamMultiplexer(_next_chunk, tasks=tasks, max_pending_per_agent=4, max_queue_size=8)
+        for agent_id in ("a", "b", "c"):
+            mux.attach(agent_id, _content_stream(50))
+        assert set(tasks) == {"a", "b", "c"}
+
+        received = await _drain(mux, ["a", "b", "c"])
+        for chunks in received.values():
+            assert chunks == [("content", i) for i in range(50)] + [("done", None)]
+        assert tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_backpressure_limits_lookahead(self):
+        pulled = []
+        mux = AgentStreamMultiplexer(_next_chunk, max_pending_per_agent=3)
+        mux.attach("a", _content_stream(100, pulled))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(pulled) == 3
+
+        batch = await mux.next_batch()
+        assert [chunk for _, chunk in batch] == [("content", i) for i in range(3)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(pulled) == 6
+        await mux.detach("a")
+
+    @pytest.mark.asyncio
+    async def test_terminal_chunk_stops_pump(self):
+        stream = _content_stream(2, terminal=("result", ("answer", "42")))
+        mux = AgentStreamMultiplexer(_next_chunk)
+        mux.attach("a", stream)
+
+        received = await _drain(mux, ["a"])
+        assert received["a"][-1] == ("result", ("answer", "42"))
+        # The stream is still suspended at the terminal yield and can be closed normally
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_detach_drops_queued_chunks_and_errors_surface(self):
+        async def failing():
+            yield ("content", "partial")
+            raise RuntimeError("backend failed")
+
+        mux = AgentStreamMultiplexer(_next_chunk)
+        mux.attach("a", _content_stream(10))
+        mux.attach("b", failing())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await mux.detach("a")
+        assert not mux.is_attached("a")
+
+        received = []
+        while not received or received[-1][1][0] != "error":
+            received.extend(await mux.next_batch())
+        assert {agent_id for agent_id, _ in received} == {"b"}
+        assert received[-1] == ("b", ("error", "backend failed"))
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the batch question runner.
+
+Tests cover:
+- Loading questions files (strings, objects, ids, metadata) and rejecting bad lines
+- Checkpoint records: latest record per id, truncated lines ignored
+- Summary throughput and latency percentiles
+- Running questions concurrently end to end over replay backends
+- Resuming from a checkpoint and retrying failed questions
+- Per-question timeouts and the `massgen batch` CLI
+- No per-question sessions saved under the working directory
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from massgen.batch import (
+    BatchCheckpoint,
+    BatchQuestion,
+    BatchResult,
+    BatchRunner,
+    load_questions,
+    summarize,
+)
+from massgen.bench import BenchScenario, build_cassette
+from massgen.token_manager.token_manager import TokenCostCalculator
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    # Anything a run writes relative to the working directory stays in tmp_path
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def replay_config(tmp_path):
+    scenario = BenchScenario(agents=2, rounds=1, tool_calls=0, content_chunks=3)
+    agents = []
+    for agent_id in ("agent_a", "agent_b"):
+        path = tmp_path / f"{agent_id}.jsonl"
+        build_cassette(scenario, agent_id).save(path)
+        agents.append({"id": agent_id, "backend": {"type": "replay", "cassette": str(path), "time_scale": 0, "on_exhausted": "repeat_last"}})
+    return {"agents": agents, "orchestrator": {}}
+
+
+def _questions(count: int):
+    return [BatchQuestion(id=f"q{index}", query=f"Question {index}?") for index in range(count)]
+
+
+class TestQuestionsAndCheckpoint:
+    """Questions file parsing and the results checkpoint."""
+
+    def test_load_questions(self, tmp_path):
+        path = tmp_path / "questions.jsonl"
+        lines = ['"What is 2+2?"', json.dumps({"id": "capital", "question": "Capital of France?", "expected": "Paris"}), "", json.dumps({"prompt": "Summarize"})]
+        path.write_text("\n".join(lines))
+
+        questions = load_questions(path)
+
+        assert [question.id for question in questions] == ["q00001", "capital", "q00003"]
+        assert questions[1].query == "Capital of France?"
+        assert questions[1].metadata == {"expected": "Paris"}
+        assert questions[2].query == "Summarize"
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            ("{not json", "invalid JSON"),
+            (json.dumps({"answer": "x"}), "no question"),
+            ('{"id": "a", "query": "x"}\n{"id": "a", "query": "y"}', "duplicate"),
+        ],
+    )
+    def test_load_questions_rejects_bad_lines(self, tmp_path, content, message):
+        path = tmp_path / "questions.jsonl"
+        path.write_text(content)
+        with pytest.raises(ValueError, match=message):
+            load_questions(path)
+
+    def test_checkpoint_keeps_latest_record(self, tmp_path):
+        checkpoint = BatchCheckpoint(tmp_path / "results.jsonl")
+        checkpoint.append({"id": "q1", "status": "error"})
+        checkpoint.append({"id": "q1", "status": "success"})
+        with open(checkpoint.path, "a") as f:
+            f.write('{"id": "q2", "sta')
+
+        assert checkpoint.load() == {"q1": {"id": "q1", "status": "success"}}
+
+    def test_summarize(self):
+        results = [BatchResult(id=f"q{index}", query="", status="success", latency_seconds=float(index), usage={"input_tokens": 10}) for index in range(1, 11)]
+        results[-1].status = "error"
+
+        summary = summarize(results, wall_seconds=30.0, resumed=2)
+
+        assert (summary["total"], summary["succeeded"], summary["failed"], summary["ran"]) == (10, 9, 1, 8)
+        assert summary["throughput_per_minute"] == 16.0
+        assert summary["latency_seconds"]["p50"] == 7.0
+        assert summary["latency_seconds"]["max"] == 10.0
+        assert summary["usage"]["input_tokens"] == 100
+
+
+class TestBatchRunner:
+    """End-to-end batch runs over replay backends."""
+
+    @pytest.mark.asyncio
+    async def test_runs_questions_concurrently(self, tmp_path, replay_config):
+        checkpoint = tmp_path / "results.jsonl"
+        finished = []
+        runner = BatchRunner(replay_config, concurrency=3, checkpoint_path=checkpoint, log_dir=tmp_path / "logs", on_result=finished.append)
+
+        report = await runner.run(_questions(4))
+
+        assert [result.id for result in report.results] == ["q0", "q1", "q2", "q3"]
+        assert all(result.status == "success" for result in report.results), [result.error for result in report.results]
+        assert all(result.answer and result.selected_agent for result in report.results)
+        assert all(result.usage["input_tokens"] > 0 for result in report.results)
+        assert len(finished) == 4
+        assert report.summary["succeeded"] == 4
+        assert set(BatchCheckpoint(checkpoint).load()) == {"q0", "q1", "q2", "q3"}
+        assert json.loads((tmp_path / "results.summary.json").read_text())["total"] == 4
+        assert (tmp_path / "logs" / "q2" / "turn_1" / "attempt_1").is_dir()
+
+    @pytest.mark.asyncio
+    async def test_does_not_persist_sessions_in_cwd(self, tmp_path, replay_config):
+        runner = BatchRunner(replay_config, concurrency=2, log_dir=tmp_path / "logs")
+
+        report = await runner.run(_questions(2))
+
+        assert report.summary["succeeded"] == 2
+        assert not (tmp_path / ".massgen" / "sessions").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_answered_and_retries_failed(self, tmp_path, replay_config):
+        checkpoint = BatchCheckpoint(tmp_path / "results.jsonl")
+        checkpoint.append(BatchResult(id="q0", query="Question 0?", status="success", answer="cached").to_dict())
+        checkpoint.append(BatchResult(id="q1", query="Question 1?", status="error", error="boom").to_dict())
+        executed = []
+        runner = BatchRunner(replay_config, concurrency=2, checkpoint_path=checkpoint.path, log_dir=tmp_path / "logs", on_result=lambda result: executed.append(result.id))
+
+        report = await runner.run(_questions(3))
+
+        assert sorted(executed) == ["q1", "q2"]
+        assert report.results[0].answer == "cached"
+        assert report.summary["resumed"] == 1
+        assert report.summary["succeeded"] == 3
+        assert checkpoint.load()["q1"]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_are_recorded(self, tmp_path, replay_config, monkeypatch):
+        async def slow_execute(question):
+            if question.id == "q1":
+                raise RuntimeError("backend exploded")
+            await asyncio.sleep(5)
+
+        runner = BatchRunner(replay_config, concurrency=2, log_dir=tmp_path / "logs", timeout=0.1)
+        monkeypatch.setattr(runner, "_execute", slow_execute)
+
+        report = await runner.run(_questions(2))
+
+        assert [result.status for result in report.results] == ["timeout", "error"]
+        assert "RuntimeError: backend exploded" == report.results[1].error
+        assert report.summary["failed"] == 2
+
+    def test_config_not_mutated_and_paths_isolated(self, replay_config):
+        replay_config["orchestrator"] = {"snapshot_storage": "snapshots", "agent_temporary_workspace": "temp"}
+        runner = BatchRunner(replay_config)
+
+        config = runner._question_config(BatchQuestion(id="q7", query="?"))
+
+        assert config["orchestrator"]["snapshot_storage"].endswith("batch_q7")
+        assert config["orchestrator"]["agent_temporary_workspace"].endswith("batch_q7")
+        assert replay_config["orchestrator"]["snapshot_storage"] == "snapshots"
+
+    def test_pricing_database_fetch_is_shared(self, monkeypatch):
+        calls = []
+
+        def failing_get(*args, **kwargs):
+            calls.append(args)
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr("requests.get", failing_get)
+        monkeypatch.setattr(TokenCostCalculator, "_litellm_cache", None)
+        monkeypatch.setattr(TokenCostCalculator, "_litellm_failed_at", None)
+        monkeypatch.setattr(TokenCostCalculator, "_tiktoken_attempted", False)
+        monkeypatch.setattr(TokenCostCalculator, "_shared_tiktoken_encoder", None)
+
+        calculators = [TokenCostCalculator() for _ in range(3)]
+        assert [calculator._fetch_litellm_pricing() for calculator in calculators] == [None, None, None]
+        # One pricing download (and at most one tiktoken encoding download) for the whole process
+        assert sum("litellm" in args[0] for args in calls) == 1
+        assert len(calls) <= 2
+
+
+class TestBatchCLI:
+    """The `massgen batch` subcommand."""
+
+    def test_cli_runs_batch(self, tmp_path, replay_config, monkeypatch, capsys):
+        import yaml
+
+        import massgen.cli as cli
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.safe_dump(replay_config))
+        questions_path = tmp_path / "questions.jsonl"
+        questions_path.write_text('"First?"\n"Second?"\n')
+        checkpoint = tmp_path / "out.jsonl"
+        monkeypatch.setenv("MASSGEN_LOG_BASE_DIR", str(tmp_path / "logs"))
+        monkeypatch.setattr(
+            "sys.argv",
+            ["massgen", "batch", str(questions_path), "--config", str(config_path), "--concurrency", "2", "--checkpoint", str(checkpoint), "--json"],
+        )
+
+        with pytest.raises(SystemExit) as exit_info:
+            cli.cli_main()
+
+        assert exit_info.value.code == 0
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["succeeded"] == 2
+        assert set(BatchCheckpoint(checkpoint).load()) == {"q00001", "q00002"}
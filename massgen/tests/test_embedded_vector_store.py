@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the embedded in-process vector store.
+
+Tests cover:
+- Batched inserts and cosine similarity search ordering
+- mem0 metadata filter semantics
+- Delete/update with slot reuse and growth past the initial capacity
+- Persistence through the memory-mapped array and payload sidecar
+- Registration with mem0's vector store factory
+- Resolving the store directory from the memory config
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mem0")
+
+from massgen.memory._embedded_vector_store import (  # noqa: E402
+    PROVIDER_NAME,
+    EmbeddedVectorStore,
+    clear_embedded_collections,
+    embedded_vector_store_config,
+    matches_filters,
+    resolve_store_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_collections():
+    clear_embedded_collections()
+    yield
+    clear_embedded_collections()
+
+
+def _unit(index: int, dims: int = 8) -> list:
+    vector = [0.0] * dims
+    vector[index] = 1.0
+    return vector
+
+
+class TestEmbeddedVectorStore:
+    """Tests for EmbeddedVectorStore operations."""
+
+    def test_insert_and_search(self, tmp_path):
+        store = EmbeddedVectorStore(path=str(tmp_path))
+        store.insert(
+            [_unit(0), _unit(1), [1.0, 1.0, 0, 0, 0, 0, 0, 0]],
+            payloads=[{"data": "a", "agent_id": "x"}, {"data": "b", "agent_id": "y"}, {"data": "ab", "agent_id": "x"}],
+            ids=["a", "b", "ab"],
+        )
+
+        results = store.search("q", _unit(0), top_k=2)
+        assert [r.id for r in results] == ["a", "ab"]
+        assert results[0].score == pytest.approx(1.0)
+        assert results[1].score == pytest.approx(np.sqrt(0.5))
+
+        assert [r.id for r in store.search("q", _unit(1), top_k=5, filters={"agent_id": "x"})] == ["ab", "a"]
+        assert [r.id for r in store.search("q", [_unit(1)], limit=1)] == ["b"]
+
+    def test_filters(self):
+        payload = {"agent_id": "a", "turn": 2, "data": "Likes Python"}
+        assert matches_filters(payload, {"agent_id": ["a", "b"], "turn": {"gte": 2}})
+        assert matches_filters(payload, {"$or": [{"agent_id": "z"}, {"data": {"icontains": "python"}}]})
+        assert matches_filters(payload, {"NOT": [{"turn": {"lt": 2}}], "agent_id": "*"})
+        assert not matches_filters(payload, {"run_id": "*"})
+        assert not matches_filters(payload, {"turn": {"nin": [1, 2]}})
+        with pytest.raises(ValueError):
+            matches_filters(payload, {"turn": {"near": 2}})
+
+    def test_delete_update_and_growth(self):
+        store = EmbeddedVectorStore(path=None)
+        count = 300  # Past the initial capacity
+        store.insert([_unit(i % 8) for i in range(count)], ids=[f"m{i}" for i in range(count)])
+        assert store.col_info()["count"] == count
+
+        store.delete("m0")
+        assert store.get("m0") is None
+        store.insert([_unit(3)], payloads=[{"data": "new"}], ids=["fresh"])
+        assert store._collection.id_to_slot["fresh"] == 0  # Freed slot is reused
+
+        store.update("fresh", vector=_unit(5), payload={"data": "moved"})
+        assert store.get("fresh").payload == {"data": "moved"}
+        top = store.search("q", _unit(5), top_k=40)
+        assert "fresh" in [r.id for r in top]
+
+        store.update("fresh", payload={"data": "renamed"})
+        assert store.list(filters={"data": "renamed"})[0][0].id == "fresh"
+
+    def test_persists_across_processes(self, tmp_path):
+        store = EmbeddedVectorStore(collection_name="memories", path=str(tmp_path))
+        store.insert([_unit(0), _unit(1)], payloads=[{"data": "a"}, {"data": "b"}], ids=["a", "b"])
+        store.delete("a")
+        assert (tmp_path / "memories" / "vectors.npy").exists()
+
+        clear_embedded_collections()  # Simulate a new process
+        reopened = EmbeddedVectorStore(collection_name="memories", path=str(tmp_path))
+        assert reopened.col_info()["count"] == 1
+        assert reopened.search("q", _unit(1), top_k=1)[0].payload == {"data": "b"}
+        assert reopened.list_cols() == ["memories"]
+
+    def test_instances_share_collection(self, tmp_path):
+        first = EmbeddedVectorStore(path=str(tmp_path))
+        second = EmbeddedVectorStore(path=str(tmp_path))
+        first.insert([_unit(2)], ids=["shared"])
+        assert second.get("shared") is not None
+
+    def test_dimension_mismatch_rejected(self):
+        store = EmbeddedVectorStore(path=None, embedding_model_dims=8)
+        with pytest.raises(ValueError):
+            store.insert([[1.0, 0.0]], ids=["short"])
+
+    def test_mem0_factory_creates_store(self, tmp_path):
+        from mem0.utils.factory import VectorStoreFactory
+
+        config = embedded_vector_store_config(path=str(tmp_path), collection_name="agent_memories")
+        assert config.provider == PROVIDER_NAME
+
+        store = VectorStoreFactory.create(config.provider, config.config)
+        assert isinstance(store, EmbeddedVectorStore)
+        assert store.collection_name == "agent_memories"
+
+    def test_store_path_is_anchored_to_memory_dir(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        default = resolve_store_path(memory_dir="memory")
+        assert default == str(tmp_path / "memory" / "vector_store")
+        assert resolve_store_path() == str(tmp_path / ".massgen" / "vector_store")
+        assert resolve_store_path("custom", memory_dir="ignored") == str(tmp_path / "custom")
+
+        # A later change of directory does not move a store opened from the resolved path
+        store = EmbeddedVectorStore(path=default)
+        store.insert([_unit(0)], ids=["kept"])
+        monkeypatch.chdir(tmp_path.parent)
+        clear_embedded_collections()
+        assert EmbeddedVectorStore(path=default).get("kept") is not None
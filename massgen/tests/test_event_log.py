@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the buffered, indexed events.jsonl writer and reader.
+
+Tests cover:
+- Write buffering with a flush interval and explicit flush/close
+- Index-driven filters, limits and tool summaries
+- Files written without an index sidecar
+- Tail limits and coalesced reads through one file handle
+- zstd-framed segments and resolving compressed subagent event logs
+- Partial trailing lines and skip_to_end
+- Flush wakeups for stream() and astream()
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from massgen.events import (
+    EventEmitter,
+    EventReader,
+    EventType,
+    index_path_for,
+    resolve_events_file,
+)
+from massgen.subagent.models import SubagentResult
+
+
+def _emit_sample(emitter: EventEmitter) -> None:
+    emitter.emit_round_start(1, agent_id="a")
+    emitter.emit_tool_start("t1", "read_file", {"path": "x"}, agent_id="a")
+    emitter.emit_text("hello", agent_id="b")
+    emitter.emit_tool_complete("t1", "read_file", "contents", 0.5, agent_id="a")
+    emitter.emit_raw("stream_chunk", agent_id="b", chunk={"type": "content"})
+
+
+class TestEventEmitterBuffering:
+    """Tests for buffered writes."""
+
+    def test_burst_is_buffered_until_flush(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=60)
+        emitter.emit_text("first")
+        emitter.emit_text("second")
+        lines = (tmp_path / "events.jsonl").read_text().splitlines()
+        assert [json.loads(line)["data"]["content"] for line in lines] == ["first"]
+
+        emitter.flush()
+        assert len((tmp_path / "events.jsonl").read_text().splitlines()) == 2
+        emitter.close()
+
+    def test_timer_flushes_buffer(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0.05)
+        emitter.emit_text("first")
+        emitter.emit_text("second")
+        reader = EventReader(tmp_path / "events.jsonl")
+        events = []
+        for event in reader.stream(poll_interval=1):
+            events.append(event)
+            if len(events) == 2:
+                break
+        assert [e.data["content"] for e in events] == ["first", "second"]
+        emitter.close()
+
+    def test_close_and_set_log_dir_flush(self, tmp_path):
+        emitter = EventEmitter(tmp_path / "attempt_1", flush_interval=60)
+        emitter.emit_text("one")
+        emitter.emit_text("two")
+        emitter.set_log_dir(tmp_path / "attempt_2")
+        emitter.emit_text("three")
+        emitter.close()
+        assert len(EventReader(tmp_path / "attempt_1" / "events.jsonl").read_all()) == 2
+        assert len(EventReader(tmp_path / "attempt_2" / "events.jsonl").read_all()) == 1
+
+    def test_invalid_compression_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            EventEmitter(tmp_path, compression="gzip")
+
+
+class TestEventReaderIndex:
+    """Tests for index-driven reads."""
+
+    def test_filters_use_index(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        _emit_sample(emitter)
+        emitter.close()
+        assert index_path_for(tmp_path / "events.jsonl").exists()
+
+        reader = EventReader(tmp_path / "events.jsonl")
+        assert [e.event_type for e in reader.filter_by_agent("b")] == [EventType.TEXT, "stream_chunk"]
+        assert [e.event_type for e in reader.filter_by_type([EventType.TOOL_COMPLETE, EventType.TOOL_START])] == [EventType.TOOL_START, EventType.TOOL_COMPLETE]
+        assert [e.data["content"] for e in reader.filter_events(event_types=[EventType.TEXT], agent_id="b", limit=1)] == ["hello"]
+
+        summary = reader.get_tools_summary()
+        assert summary[0]["tool_name"] == "read_file"
+        assert summary[0]["args"] == {"path": "x"}
+
+    def test_index_is_incremental(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        reader = EventReader(tmp_path / "events.jsonl")
+        emitter.emit_text("one")
+        assert len(reader.filter_by_type([EventType.TEXT])) == 1
+        emitter.emit_text("two")
+        assert [e.data["content"] for e in reader.filter_by_type([EventType.TEXT])] == ["one", "two"]
+        emitter.close()
+
+    def test_limit_reads_tail_through_one_handle(self, tmp_path, monkeypatch):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        for i in range(20):
+            emitter.emit_text(f"text {i}", agent_id="a")
+            emitter.emit_tool_start(f"t{i}", "read_file", {}, agent_id="a")
+        emitter.close()
+        events_file = tmp_path / "events.jsonl"
+        reader = EventReader(events_file)
+        reader.refresh_index()
+
+        opened = []
+        real_open = open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        events = reader.filter_events(event_types=[EventType.TOOL_START, EventType.TEXT], limit=3)
+        assert [e.event_type for e in events] == [EventType.TOOL_START, EventType.TEXT, EventType.TOOL_START]
+        assert [e.data.get("tool_id") for e in events] == ["t18", None, "t19"]
+        assert [e.data["content"] for e in reader.filter_by_type([EventType.TEXT])][-1] == "text 19"
+        assert opened.count(events_file) == 2
+
+    def test_file_without_index(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_text(
+            json.dumps({"timestamp": "t", "event_type": "text", "agent_id": "a", "round_number": 0, "data": {}})
+            + "\n"
+            + "not json\n"
+            + json.dumps({"timestamp": "t", "event_type": "error", "agent_id": "b", "round_number": 2, "data": {}})
+            + "\n",
+        )
+        reader = EventReader(events_file)
+        assert [e.agent_id for e in reader.filter_events(round_number=2)] == ["b"]
+        assert len(reader.read_all()) == 2
+
+    def test_partial_trailing_line_is_not_consumed(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        emitter.emit_text("one")
+        emitter.close()
+        events_file = tmp_path / "events.jsonl"
+        complete = events_file.read_bytes()
+        with open(events_file, "ab") as f:
+            f.write(complete[:20])
+
+        reader = EventReader(events_file)
+        assert len(reader.get_new_events()) == 1
+        with open(events_file, "ab") as f:
+            f.write(complete[20:])
+        assert [e.data["content"] for e in reader.get_new_events()] == ["one"]
+
+    def test_skip_to_end(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        emitter.emit_text("old")
+        reader = EventReader(tmp_path / "events.jsonl")
+        reader.skip_to_end()
+        emitter.emit_text("new")
+        assert [e.data["content"] for e in reader.get_new_events()] == ["new"]
+        emitter.close()
+
+
+class TestCompressedEventLog:
+    """Tests for zstd-framed event segments."""
+
+    def test_round_trip(self, tmp_path):
+        pytest.importorskip("zstandard")
+        emitter = EventEmitter(tmp_path, flush_interval=0, compression="zstd")
+        _emit_sample(emitter)
+        emitter.close()
+        assert emitter.file_path.name == "events.jsonl.zst"
+
+        reader = EventReader(tmp_path / "events.jsonl")
+        assert reader.exists()
+        assert len(reader.read_all()) == 5
+        assert [e.data["tool_id"] for e in reader.filter_by_type([EventType.TOOL_COMPLETE])] == ["t1"]
+
+        # Appending after reopening continues the logical offsets
+        reopened = EventEmitter(tmp_path, flush_interval=0, compression="zstd")
+        reopened.emit_text("later", agent_id="c")
+        reopened.close()
+        assert [e.data["content"] for e in reader.get_new_events()] == ["later"]
+        assert len(EventReader(tmp_path / "events.jsonl.zst").filter_by_agent("c")) == 1
+
+    def test_subagent_log_resolves_compressed_events(self, tmp_path):
+        pytest.importorskip("zstandard")
+        assert resolve_events_file(tmp_path / "events.jsonl") is None
+        for events_dir in (tmp_path / "done" / "full_logs", tmp_path / "live" / "live_logs" / "log_1" / "turn_1" / "attempt_1"):
+            emitter = EventEmitter(events_dir, flush_interval=0, compression="zstd")
+            _emit_sample(emitter)
+            emitter.close()
+            assert not (events_dir / "events.jsonl").exists()
+            assert resolve_events_file(events_dir / "events.jsonl") == events_dir / "events.jsonl.zst"
+
+        for base_dir in (tmp_path / "done", tmp_path / "live"):
+            resolved = SubagentResult.resolve_events_path(base_dir)
+            assert resolved and resolved.endswith("events.jsonl.zst")
+            assert len(EventReader(resolved).filter_by_type(["stream_chunk"])) == 1
+
+
+class TestEventTail:
+    """Tests for flush-driven wakeups."""
+
+    def test_stream_wakes_on_flush(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        reader = EventReader(tmp_path / "events.jsonl")
+        timer = threading.Timer(0.05, emitter.emit_text, args=("late",))
+        timer.start()
+        event = next(reader.stream(poll_interval=30))
+        assert event.data["content"] == "late"
+        emitter.close()
+
+    @pytest.mark.asyncio
+    async def test_astream_wakes_on_flush(self, tmp_path):
+        emitter = EventEmitter(tmp_path, flush_interval=0)
+        reader = EventReader(tmp_path / "events.jsonl")
+        asyncio.get_running_loop().call_later(0.05, emitter.emit_text, "late")
+
+        stream = reader.astream(poll_interval=30)
+        event = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        await stream.aclose()
+        assert event.data["content"] == "late"
+        emitter.close()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for per-message conversion caching in the formatters.
+
+Tests cover:
+- Cache hits for repeated and copied messages, misses after in-place edits
+  (including nested ones)
+- Claude and Response formatter output parity with caching
+- Response API function calls whose output appears later in the history
+- Linear-time tool call sanitization in the Chat Completions handler
+"""
+
+import copy
+from types import SimpleNamespace
+
+from massgen.api_params_handler._chat_completions_api_params_handler import (
+    ChatCompletionsAPIParamsHandler,
+)
+from massgen.formatter._chat_completions_formatter import ChatCompletionsFormatter
+from massgen.formatter._claude_formatter import ClaudeFormatter
+from massgen.formatter._message_cache import MessageConversionCache, message_key
+from massgen.formatter._response_formatter import ResponseFormatter
+
+
+def _tool_loop_history(turns: int = 3) -> list:
+    messages = [
+        {"role": "system", "content": "You are helpful."},
+        {"role": "user", "content": [{"type": "text", "text": "Look at this"}, {"type": "image", "base64": "aGVsbG8=", "mime_type": "image/png"}]},
+    ]
+    for i in range(turns):
+        messages.append({"role": "assistant", "content": "", "tool_calls": [{"id": f"call_{i}", "type": "function", "function": {"name": "read_file", "arguments": {"path": f"f{i}.py"}}}]})
+        messages.append({"role": "tool", "tool_call_id": f"call_{i}", "content": f"contents {i}"})
+    return messages
+
+
+def _uncached(formatter):
+    formatter._convert_messages = lambda messages, converter, variants=None: [converter(m) if variants is None else converter(m, v) for m, v in zip(messages, variants or messages)]
+    return formatter
+
+
+class TestMessageConversionCache:
+    """Tests for MessageConversionCache."""
+
+    def test_hits_for_equal_copies(self):
+        cache = MessageConversionCache()
+        calls = []
+
+        def convert(message):
+            calls.append(message)
+            return {"converted": message["content"]}
+
+        message = {"role": "user", "content": "hi"}
+        assert cache.convert(message, convert) == {"converted": "hi"}
+        assert cache.convert(copy.deepcopy(message), convert) == {"converted": "hi"}
+        assert len(calls) == 1 and cache.hits == 1
+
+        message["content"] = "edited"
+        assert cache.convert(message, convert) == {"converted": "edited"}
+        assert len(calls) == 2
+
+    def test_nested_in_place_edits_miss(self):
+        cache = MessageConversionCache()
+        message = {"role": "user", "content": [{"type": "text", "text": "a"}]}
+
+        def convert(m):
+            return [block["text"] for block in m["content"]]
+
+        assert cache.convert(message, convert) == ["a"]
+        assert cache.convert(message, convert) == ["a"]
+
+        message["content"].append({"type": "text", "text": "b"})
+        assert cache.convert(message, convert) == ["a", "b"]
+        message["content"][0]["text"] = "c"
+        assert cache.convert(message, convert) == ["c", "b"]
+        assert cache.hits == 1
+
+    def test_returned_messages_are_copies(self):
+        cache = MessageConversionCache()
+        message = {"role": "assistant", "content": "text  "}
+        first = cache.convert(message, dict)
+        first["content"] = first["content"].rstrip()
+        assert cache.convert(message, dict)["content"] == "text  "
+
+    def test_variants_and_eviction(self):
+        cache = MessageConversionCache(max_entries=2)
+        message = {"type": "function_call", "call_id": "c"}
+        assert cache.convert(message, lambda m: "with", variant=True) == "with"
+        assert cache.convert(message, lambda m: "without", variant=False) == "without"
+        cache.convert({"role": "user", "content": "x"}, dict)
+        assert len(cache) == 2
+
+    def test_key_distinguishes_bool_and_int(self):
+        assert message_key({"arguments": {"flag": True}}) != message_key({"arguments": {"flag": 1}})
+        assert message_key({"content": object.__new__(type("Unhashable", (), {"__hash__": None}))}) is None
+
+
+class TestFormatterParity:
+    """Cached formatting matches uncached formatting across a growing history."""
+
+    def test_claude(self):
+        formatter = ClaudeFormatter()
+        history = _tool_loop_history()
+        for end in range(1, len(history) + 1):
+            assert formatter.format_messages_and_system(history[:end]) == _uncached(ClaudeFormatter()).format_messages_and_system(history[:end])
+        assert formatter.message_cache.hits > 0
+
+    def test_claude_tool_result_appended_in_place(self):
+        """A tool_result appended to an existing user message (as the Claude backend does) is formatted."""
+        formatter = ClaudeFormatter()
+        history = [
+            {"role": "user", "content": "go"},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t1", "name": "a", "input": {}}, {"type": "tool_use", "id": "t2", "name": "b", "input": {}}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "one"}]},
+        ]
+        formatter.format_messages_and_system(history)
+
+        history[-1]["content"].append({"type": "tool_result", "tool_use_id": "t2", "content": "two"})
+        messages, _ = formatter.format_messages_and_system(history)
+        assert messages == _uncached(ClaudeFormatter()).format_messages_and_system(history)[0]
+        assert [block["tool_use_id"] for block in messages[-1]["content"]] == ["t1", "t2"]
+
+    def test_response_function_call_output_variant(self):
+        formatter = ResponseFormatter()
+        call = {"type": "function_call", "call_id": "c1", "name": "read_file", "arguments": {"path": "a"}, "status": "completed"}
+        pending = formatter.format_messages([{"role": "user", "content": "go"}, call])
+        assert pending[-1]["output"] == "[No output recorded for this tool call]"
+
+        answered = formatter.format_messages([{"role": "user", "content": "go"}, call, {"type": "function_call_output", "call_id": "c1", "output": "ok"}])
+        assert [item.get("type") for item in answered[1:]] == ["function_call", "function_call_output"]
+        assert answered[-1]["output"] == "ok"
+        assert answered[1]["arguments"] == '{"path": "a"}'
+
+
+class TestChatCompletionsSanitize:
+    """Tests for tool call sanitization."""
+
+    def test_unanswered_tool_calls_are_dropped(self):
+        handler = ChatCompletionsAPIParamsHandler(SimpleNamespace(formatter=ChatCompletionsFormatter(), custom_tool_manager=None))
+        messages = _tool_loop_history(2)
+        messages.append({"role": "tool", "tool_call_id": "call_0", "content": "late duplicate"})
+        messages.append({"role": "assistant", "content": "", "tool_calls": [{"id": "call_x", "function": {"name": "f", "arguments": "{}"}}]})
+
+        sanitized = handler._sanitize_messages_for_api(messages)
+        assert len(sanitized) == len(messages) - 1
+        assert [tc["id"] for m in sanitized if "tool_calls" in m for tc in m["tool_calls"]] == ["call_0", "call_1"]
@@ -10,6 +10,7 @@ Tests:
 - Built-in hooks (MidStreamInjection, HighPriorityTaskReminder)
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 
@@ -24,6 +25,8 @@ from massgen.mcp_tools.hooks import (
     MidStreamInjectionHook,
     PatternHook,
     PythonCallableHook,
+    RoundTimeoutPostHook,
+    SubagentCompleteHook,
 )
 
 # =============================================================================
@@ -202,6 +205,18 @@ class TestPatternHook:
         assert hook.matches("execute_command")
         assert not hook.matches("delete_file")
 
+    def test_matcher_without_patterns_matches_nothing(self):
+        """Test that a matcher of only separators or whitespace matches no tools."""
+
+        class TestHook(PatternHook):
+            async def execute(self, *args, **kwargs):
+                return HookResult.allow()
+
+        for matcher in ("|", " ", " | "):
+            hook = TestHook("test", matcher=matcher)
+            assert not hook.matches("read_file")
+            assert not hook.matches("")
+
 
 # =============================================================================
 # PythonCallableHook Tests
@@ -853,6 +868,109 @@ class TestGeneralHookManagerErrorTracking:
         assert "Error from child hook" in result.hook_errors
 
 
+class _SlowInjectHook(PatternHook):
+    """Concurrent-safe post hook that sleeps before injecting."""
+
+    concurrent_safe = True
+
+    def __init__(self, name: str, delay: float, log: list, timeout: int = 5):
+        super().__init__(name, matcher="*", timeout=timeout)
+        self.delay = delay
+        self.log = log
+
+    async def execute(self, function_name, arguments, context=None, **kwargs):
+        self.log.append(f"start:{self.name}")
+        await asyncio.sleep(self.delay)
+        self.log.append(f"end:{self.name}")
+        return HookResult(inject={"content": self.name, "strategy": "tool_result"})
+
+
+class TestGeneralHookManagerDispatch:
+    """Tests for the compiled dispatch table, concurrent post hooks and latency stats."""
+
+    def test_matching_hooks_are_memoized_and_invalidated(self):
+        manager = GeneralHookManager()
+        write_hook = PythonCallableHook("write", lambda event: None, matcher="Write|Edit")
+        manager.register_global_hook(HookType.PRE_TOOL_USE, write_hook)
+
+        first = manager.get_matching_hooks("agent-1", HookType.PRE_TOOL_USE, "Edit")
+        assert first == (write_hook,)
+        assert manager.get_matching_hooks("agent-1", HookType.PRE_TOOL_USE, "Edit") is first
+        assert manager.get_matching_hooks("agent-1", HookType.PRE_TOOL_USE, "Read") == ()
+
+        any_hook = PythonCallableHook("any", lambda event: None)
+        manager.register_agent_hook("agent-1", HookType.PRE_TOOL_USE, any_hook)
+        assert manager.get_matching_hooks("agent-1", HookType.PRE_TOOL_USE, "Read") == (any_hook,)
+
+        manager.clear_hooks()
+        assert manager.get_matching_hooks("agent-1", HookType.PRE_TOOL_USE, "Edit") == ()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_safe_post_hooks_run_together_in_order(self):
+        manager = GeneralHookManager()
+        log = []
+        manager.register_global_hook(HookType.POST_TOOL_USE, _SlowInjectHook("slow", 0.05, log))
+        manager.register_global_hook(HookType.POST_TOOL_USE, _SlowInjectHook("fast", 0.0, log))
+
+        result = await manager.execute_hooks(HookType.POST_TOOL_USE, "tool", "{}", {}, tool_output="out")
+
+        assert log[:2] == ["start:slow", "start:fast"]  # Both started before either finished
+        assert result.inject["content"] == "slow\nfast"  # Registration order is kept
+        assert [hook["hook_name"] for hook in result.executed_hooks] == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_pre_hooks_stay_sequential(self):
+        manager = GeneralHookManager()
+        log = []
+        manager.register_global_hook(HookType.PRE_TOOL_USE, _SlowInjectHook("a", 0.01, log))
+        manager.register_global_hook(HookType.PRE_TOOL_USE, _SlowInjectHook("b", 0.0, log))
+
+        await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+
+        assert log == ["start:a", "end:a", "start:b", "end:b"]
+
+    @pytest.mark.asyncio
+    async def test_slow_injection_hook_still_delivers(self):
+        """Built-in hooks are not cut off by their timeout; a slow injection still lands."""
+        manager = GeneralHookManager()
+        state = {"injection_count": 0}
+
+        async def slow_injection():
+            await asyncio.sleep(0.05)  # e.g. copying peer snapshots into the workspace
+            state["injection_count"] += 1
+            return "peer answer update"
+
+        hook = MidStreamInjectionHook(injection_callback=slow_injection)
+        hook.timeout = 0.01
+        manager.register_global_hook(HookType.POST_TOOL_USE, hook)
+        manager.register_global_hook(HookType.POST_TOOL_USE, _SlowInjectHook("other", 0.0, []))
+
+        result = await manager.execute_hooks(HookType.POST_TOOL_USE, "tool", "{}", {}, tool_output="out")
+
+        assert result.hook_errors == []
+        assert result.inject["content"] == "peer answer update\nother"
+        assert state["injection_count"] == 1
+
+    def test_state_changing_builtin_hooks_run_sequentially(self):
+        assert not MidStreamInjectionHook.concurrent_safe
+        assert not SubagentCompleteHook.concurrent_safe
+        assert not RoundTimeoutPostHook.concurrent_safe
+        assert HighPriorityTaskReminderHook.concurrent_safe
+
+    @pytest.mark.asyncio
+    async def test_latency_histograms_recorded(self):
+        manager = GeneralHookManager()
+        manager.register_global_hook(HookType.PRE_TOOL_USE, PythonCallableHook("h", lambda event: None))
+
+        for _ in range(3):
+            await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+
+        stats = manager.get_hook_latency_stats()["h"]
+        assert stats["count"] == 3
+        assert sum(stats["buckets"].values()) == 3
+        assert stats["max_ms"] >= stats["mean_ms"]
+
+
 # =============================================================================
 # Native Hook Adapter Tests
 # =============================================================================
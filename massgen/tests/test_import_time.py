@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time budget tests for the massgen package and CLI entry point.
+
+Tests cover:
+- ``import massgen`` / ``import massgen.cli`` not loading backends, orchestrator or LiteLLM
+- Cumulative ``-X importtime`` budget for the CLI module
+- Lazy (PEP 562) attribute resolution on ``massgen`` and ``massgen.backend``
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for ``import massgen.cli`` (microseconds).
+# Eagerly importing every backend used to cost several seconds; the lazy CLI
+# imports in well under one. The budget is loose to absorb slow CI machines.
+CLI_IMPORT_BUDGET_US = 2_500_000
+
+# Modules that must only be imported when actually used
+HEAVY_MODULES = (
+    "litellm",
+    "dspy",
+    "massgen.orchestrator",
+    "massgen.chat_agent",
+    "massgen.backend.base",
+    "massgen.backend.claude",
+    "massgen.backend.response",
+    "massgen.frontend.coordination_ui",
+    "massgen.config_builder",
+)
+
+
+def _importtime(statement: str) -> dict:
+    """Run ``statement`` under ``-X importtime`` and return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue  # Header row
+        timings[fields[2].strip()] = cumulative
+    return timings
+
+
+class TestImportBudget:
+    """Tests that heavy dependencies stay off the import path."""
+
+    @pytest.mark.parametrize("module", ["massgen", "massgen.cli"])
+    def test_heavy_modules_not_imported(self, module):
+        timings = _importtime(f"import {module}")
+        loaded = [name for name in HEAVY_MODULES if name in timings]
+        assert loaded == []
+
+    def test_cli_import_within_budget(self):
+        timings = _importtime("import massgen.cli")
+        assert timings["massgen.cli"] < CLI_IMPORT_BUDGET_US
+
+
+class TestLazyAttributes:
+    """Tests for PEP 562 lazy attribute resolution."""
+
+    def test_package_attributes_resolve(self):
+        import massgen
+        from massgen.orchestrator import Orchestrator
+
+        assert massgen.Orchestrator is Orchestrator
+        assert "ResponseBackend" in dir(massgen)
+        assert isinstance(massgen.LITELLM_AVAILABLE, bool)
+        with pytest.raises(AttributeError):
+            massgen.does_not_exist
+
+    def test_backend_attributes_resolve(self):
+        import massgen.backend as backend
+        from massgen.backend.base import StreamChunk
+
+        assert backend.StreamChunk is StreamChunk
+        assert isinstance(backend.AZURE_OPENAI_AVAILABLE, bool)
+        with pytest.raises(AttributeError):
+            backend.DoesNotExistBackend
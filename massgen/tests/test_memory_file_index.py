@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the mtime-indexed filesystem memory store.
+
+Tests cover:
+- Parsing memory files and reusing unchanged files across refreshes
+- Picking up modified, added and deleted files
+- Persistent JSON manifest warm starts
+- Keyword search
+- SystemMessageBuilder memory loading through the index
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.memory._filesystem_index import (
+    MemoryFileIndex,
+    clear_memory_indexes,
+    get_memory_index,
+)
+from massgen.system_message_builder import SystemMessageBuilder
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    clear_memory_indexes()
+    yield
+    clear_memory_indexes()
+
+
+def _write_memory(memory_dir, tier, name, content, description="note"):
+    tier_dir = memory_dir / tier
+    tier_dir.mkdir(parents=True, exist_ok=True)
+    path = tier_dir / f"{name}.md"
+    path.write_text(f"---\nname: {name}\ndescription: {description}\ntier: {tier}\n---\n{content}\n")
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestMemoryFileIndex:
+    """Tests for MemoryFileIndex refresh semantics."""
+
+    def test_unchanged_files_are_not_reread(self, tmp_path):
+        _write_memory(tmp_path, "short_term", "prefs", "User prefers tabs")
+        _write_memory(tmp_path, "long_term", "lessons", "Validate inputs")
+        index = MemoryFileIndex(tmp_path)
+
+        records = index.refresh()
+        assert records["short_term"]["prefs"].parsed["content"] == "User prefers tabs"
+        assert index.reads == 2
+
+        index.refresh()
+        assert (index.reads, index.reuses) == (2, 2)
+
+    def test_modified_added_and_deleted_files(self, tmp_path):
+        prefs = _write_memory(tmp_path, "short_term", "prefs", "User prefers tabs")
+        stale = _write_memory(tmp_path, "short_term", "stale", "Old note")
+        index = MemoryFileIndex(tmp_path)
+        index.refresh()
+
+        prefs.write_text("---\nname: prefs\n---\nUser prefers spaces\n")
+        _bump_mtime(prefs)
+        stale.unlink()
+        _write_memory(tmp_path, "long_term", "new", "Fresh note")
+
+        records = index.refresh()
+        assert records["short_term"]["prefs"].parsed["content"] == "User prefers spaces"
+        assert "stale" not in records["short_term"]
+        assert "new" in records["long_term"]
+        assert index.reads == 4
+
+    def test_files_without_frontmatter_keep_raw_content(self, tmp_path):
+        (tmp_path / "long_term").mkdir()
+        (tmp_path / "long_term" / "plain.md").write_text("no frontmatter")
+        record = MemoryFileIndex(tmp_path).records("long_term")[0]
+        assert record.parsed is None
+        assert record.raw == "no frontmatter"
+
+    def test_persistent_manifest_warm_start(self, tmp_path):
+        _write_memory(tmp_path, "short_term", "prefs", "User prefers tabs")
+        MemoryFileIndex(tmp_path, persist=True).refresh()
+        assert (tmp_path / MemoryFileIndex.MANIFEST_NAME).exists()
+
+        warm = MemoryFileIndex(tmp_path, persist=True)
+        assert warm.refresh()["short_term"]["prefs"].parsed["content"] == "User prefers tabs"
+        assert (warm.reads, warm.reuses) == (0, 1)
+
+    def test_keyword_search(self, tmp_path):
+        _write_memory(tmp_path, "short_term", "prefs", "User prefers tabs over spaces")
+        _write_memory(tmp_path, "long_term", "lessons", "Always run the tests; tests catch regressions", description="testing lessons")
+        index = MemoryFileIndex(tmp_path)
+
+        assert [r.name for r in index.search("TESTS")] == ["lessons"]
+        assert [r.name for r in index.search("user tabs")] == ["prefs"]
+        assert index.search("tabs", tier="long_term") == []
+        assert index.search("   ") == []
+
+    def test_shared_index_per_directory(self, tmp_path):
+        assert get_memory_index(tmp_path) is get_memory_index(str(tmp_path))
+
+
+class TestSystemMessageBuilderMemoryLoading:
+    """Tests for prompt-building memory loaders backed by the index."""
+
+    def test_get_all_memories_uses_index(self, tmp_path):
+        memory_dir = tmp_path / "memory"
+        _write_memory(memory_dir, "short_term", "prefs", "User prefers tabs")
+        _write_memory(memory_dir, "long_term", "lessons", "Validate inputs")
+        agent = SimpleNamespace(backend=SimpleNamespace(filesystem_manager=SimpleNamespace(cwd=str(tmp_path))))
+        builder = SystemMessageBuilder(config=None, message_templates=None, agents={"agent_a": agent})
+
+        short_term, long_term = builder._get_all_memories()
+        assert [m["name"] for m in short_term] == ["prefs"]
+        assert [m["content"] for m in long_term] == ["Validate inputs"]
+
+        short_term[0]["content"] = "mutated by caller"
+        builder._get_all_memories()
+        assert get_memory_index(memory_dir).reads == 2
+        assert builder._get_all_memories()[0][0]["content"] == "User prefers tabs"
+
+    def test_archived_memories_dedup_keeps_newest(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        archive_base = tmp_path / ".massgen" / "sessions" / "s1" / "archived_memories"
+        old = archive_base / "agent_a_answer_0" / "short_term" / "insight.md"
+        old.parent.mkdir(parents=True)
+        old.write_text("old insight")
+        new = archive_base / "agent_b_answer_1" / "short_term" / "insight.md"
+        new.parent.mkdir(parents=True)
+        new.write_text("new insight")
+        _bump_mtime(new)
+
+        builder = SystemMessageBuilder(config=None, message_templates=None, agents={}, session_id="s1")
+        archived = builder._load_archived_memories()
+        assert archived["short_term"]["insight"]["content"] == "new insight"
+        assert archived["short_term"]["insight"]["source"] == "Agent B Answer 1"
@@ -9,6 +9,7 @@ including recording, retrieving, and managing memories across sessions.
 Note: Some tests require mem0ai to be installed and may be skipped if unavailable.
 """
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
@@ -132,6 +133,8 @@ class TestPersistentMemoryMocked:
 
             # Replace with our mock
             memory.mem0_memory = mock_mem0_instance
+            # Mocked instances share the default vector store's search cache
+            memory.invalidate_search_cache()
 
             yield memory, mock_mem0_instance
 
@@ -334,6 +337,177 @@ class TestPersistentMemoryMocked:
 
         print("✅ Retrieving with empty query handled gracefully")
 
+    @pytest.mark.asyncio
+    async def test_searches_run_concurrently_with_bounded_parallelism(self, mock_memory):
+        """Test that keyword searches fan out but never exceed MAX_CONCURRENT_SEARCHES."""
+        memory, mock_mem0 = mock_memory
+        memory.MAX_CONCURRENT_SEARCHES = 2
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"results": [{"id": kwargs["query"], "memory": kwargs["query"]}]}
+
+        mock_mem0.search = AsyncMock(side_effect=slow_search)
+
+        result = await memory.recall_from_memory(keywords=["a", "b", "c", "d", "e"])
+
+        assert result["memories"] == ["a", "b", "c", "d", "e"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_retrieve_uses_result_cache(self, mock_memory):
+        """Test that repeated retrieves hit the TTL cache until memories are written."""
+        memory, mock_mem0 = mock_memory
+        mock_mem0.search = AsyncMock(return_value={"results": [{"id": "m1", "memory": "Fact"}]})
+        mock_mem0.add = AsyncMock(return_value={"results": []})
+
+        assert await memory.retrieve("question") == "Fact"
+        assert await memory.retrieve("question") == "Fact"
+        assert mock_mem0.search.call_count == 1
+
+        await memory.record([{"role": "user", "content": "New fact"}])
+        await memory.retrieve("question")
+        assert mock_mem0.search.call_count == 2
+
+        memory.SEARCH_CACHE_TTL_SECONDS = 0
+        memory.invalidate_search_cache()
+        await memory.retrieve("question")
+        await memory.retrieve("question")
+        assert mock_mem0.search.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_search_during_write_is_not_served_stale(self, mock_memory):
+        """Test that results found while a write is in flight are not cached past it."""
+        memory, mock_mem0 = mock_memory
+        store = {"fact": "Old fact"}
+        add_started = asyncio.Event()
+        release_add = asyncio.Event()
+
+        async def slow_add(**kwargs):
+            add_started.set()
+            await release_add.wait()
+            store["fact"] = "New fact"
+            return {"results": []}
+
+        async def search(**kwargs):
+            return {"results": [{"id": "m1", "memory": store["fact"]}]}
+
+        mock_mem0.add = AsyncMock(side_effect=slow_add)
+        mock_mem0.search = AsyncMock(side_effect=search)
+
+        write = asyncio.create_task(memory.record([{"role": "user", "content": "New fact"}]))
+        await add_started.wait()
+        assert await memory.retrieve("question") == "Old fact"
+
+        # A search still in flight when the write lands must not cache its results either
+        search_started = asyncio.Event()
+        release_search = asyncio.Event()
+
+        async def blocked_search(**kwargs):
+            results = {"results": [{"id": "m1", "memory": store["fact"]}]}
+            search_started.set()
+            await release_search.wait()
+            return results
+
+        mock_mem0.search = AsyncMock(side_effect=blocked_search)
+        in_flight = asyncio.create_task(memory.retrieve("other question"))
+        await search_started.wait()
+        release_add.set()
+        await write
+        release_search.set()
+        assert await in_flight == "Old fact"
+
+        mock_mem0.search = AsyncMock(side_effect=search)
+        assert await memory.retrieve("question") == "New fact"
+        assert await memory.retrieve("other question") == "New fact"
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache_of_instances_sharing_the_store(self, mock_memory):
+        """Test that one agent's write clears the cached searches of other agents on the same store."""
+        memory, mock_mem0 = mock_memory
+        with patch("mem0.AsyncMemory"):
+            other = PersistentMemory(
+                agent_name="other_agent",
+                llm_backend=create_mock_backend(),
+                embedding_backend=create_mock_backend(),
+            )
+        other_mem0 = AsyncMock()
+        other.mem0_memory = other_mem0
+        other_mem0.search = AsyncMock(return_value={"results": [{"id": "m1", "memory": "Fact"}]})
+        mock_mem0.add = AsyncMock(return_value={"results": []})
+
+        await other.retrieve("question")
+        await other.retrieve("question")
+        assert other_mem0.search.call_count == 1
+
+        await memory.record([{"role": "user", "content": "New fact"}])
+        await other.retrieve("question")
+        assert other_mem0.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retrieve_dedups_by_memory_id(self, mock_memory):
+        """Test that the same memory found by several queries/agents appears once."""
+        memory, mock_mem0 = mock_memory
+
+        async def search(**kwargs):
+            if kwargs["agent_id"] == "agent_b":
+                return {"results": [{"id": "shared", "memory": "Shared"}, {"id": "b1", "memory": "From B"}]}
+            return {"results": [{"id": "shared", "memory": "Shared"}, {"id": kwargs["query"], "memory": kwargs["query"]}]}
+
+        mock_mem0.search = AsyncMock(side_effect=search)
+
+        result = await memory.retrieve(
+            [{"role": "user", "content": "q1"}, {"role": "user", "content": "q2"}],
+            previous_winners=[{"agent_id": "agent_b", "turn": 1}],
+        )
+
+        assert result.split("\n") == ["Shared", "q1", "q2", "[From agent_b Turn 1] From B"]
+        winner_call = mock_mem0.search.call_args_list[-1].kwargs
+        assert winner_call["metadata_filters"] == {"turn": 1}
+
+    @pytest.mark.asyncio
+    async def test_query_embeddings_are_batched(self, mock_memory):
+        """Test that embedders with native batching embed all queries in one call."""
+        from mem0.embeddings.base import EmbeddingBase
+
+        class BatchingEmbedder(EmbeddingBase):
+            def __init__(self):
+                super().__init__()
+                self.embed_calls = []
+                self.batch_calls = []
+
+            def embed(self, text, memory_action=None):
+                self.embed_calls.append(text)
+                return [0.0]
+
+            def embed_batch(self, texts, memory_action="add"):
+                self.batch_calls.append(list(texts))
+                return [[float(len(text))] for text in texts]
+
+        memory, mock_mem0 = mock_memory
+        embedder = BatchingEmbedder()
+        mock_mem0.embedding_model = embedder
+        vectors = []
+
+        async def search(**kwargs):
+            vectors.append(embedder.embed(kwargs["query"], "search"))
+            return {"results": []}
+
+        mock_mem0.search = AsyncMock(side_effect=search)
+
+        await memory.recall_from_memory(keywords=["ab", "abcd", "ab"])
+
+        assert embedder.batch_calls == [["ab", "abcd"]]
+        assert embedder.embed_calls == []
+        assert vectors == [[2.0], [4.0]]  # The repeated keyword is served from the result cache
+        assert embedder.embed("other", "add") == [0.0]
+
 
 @pytest.mark.skipif(
     not MEMORY_AVAILABLE or not MEM0_AVAILABLE,
@@ -417,7 +591,6 @@ class TestPersistentMemoryBase:
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def run_all_tests():
         """Run all tests manually."""
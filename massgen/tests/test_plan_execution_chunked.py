@@ -6,10 +6,16 @@ from pathlib import Path
 
 import pytest
 
+from massgen.logger_config import get_log_session_dir, scoped_log_session
 from massgen.plan_execution import (
     PlanValidationError,
+    combine_chunk_answers,
+    compute_chunk_dependencies,
     initialize_chunk_execution_state,
+    record_chunk_checkpoint,
+    run_chunk_dag,
     setup_agent_workspaces_for_execution,
+    summarize_chunk_timing,
     validate_chunked_plan,
 )
 from massgen.plan_storage import PlanStorage
@@ -45,8 +51,8 @@ class _DummyBackend:
 
 
 class _DummyAgent:
-    def __init__(self, cwd: Path) -> None:
-        self.agent_id = "agent_a"
+    def __init__(self, cwd: Path, agent_id: str = "agent_a") -> None:
+        self.agent_id = agent_id
         self.backend = _DummyBackend(cwd)
 
 
@@ -453,3 +459,288 @@ async def test_execute_plan_phase_timeout_skips_chunk_and_advances_to_next_chunk
     assert history[0].get("status") == "timed_out"
     assert history[1].get("chunk") == "C02_polish"
     assert history[1].get("status") == "completed"
+
+
+_DIAMOND_CHUNK_PLAN = {
+    "tasks": [
+        {"id": "T001", "description": "API", "chunk": "C01_api"},
+        {"id": "T002", "description": "UI", "chunk": "C02_ui"},
+        {"id": "T003", "description": "Wire up", "chunk": "C03_join", "depends_on": ["T001", "T002"]},
+    ],
+}
+
+
+def test_compute_chunk_dependencies_finds_independent_chunks():
+    assert compute_chunk_dependencies(_DIAMOND_CHUNK_PLAN) == {
+        "C01_api": [],
+        "C02_ui": [],
+        "C03_join": ["C01_api", "C02_ui"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_chunk_dag_runs_independent_chunks_concurrently():
+    import asyncio
+
+    running = set()
+    max_running = {"value": 0}
+    lanes_in_use = set()
+    calls = []
+    retried = set()
+
+    async def _run_chunk(chunk, lane):
+        assert lane not in lanes_in_use
+        lanes_in_use.add(lane)
+        running.add(chunk)
+        max_running["value"] = max(max_running["value"], len(running))
+        calls.append((chunk, set(running)))
+        await asyncio.sleep(0.01)
+        running.discard(chunk)
+        lanes_in_use.discard(lane)
+        if chunk == "C02_ui" and chunk not in retried:
+            retried.add(chunk)
+            return False
+        return True
+
+    await run_chunk_dag(
+        ["C01_api", "C02_ui", "C03_join"],
+        compute_chunk_dependencies(_DIAMOND_CHUNK_PLAN),
+        _run_chunk,
+        max_parallel=2,
+    )
+
+    assert max_running["value"] == 2
+    assert [chunk for chunk, _ in calls] == ["C01_api", "C02_ui", "C02_ui", "C03_join"]
+    # The join chunk only starts once both upstream chunks are done
+    assert calls[-1][1] == {"C03_join"}
+
+
+@pytest.mark.asyncio
+async def test_run_chunk_dag_cancels_running_chunks_on_failure():
+    import asyncio
+
+    cancelled = []
+
+    async def _run_chunk(chunk, lane):
+        if chunk == "C01_api":
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(chunk)
+            raise
+        return True
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await run_chunk_dag(
+            ["C01_api", "C02_ui", "C03_join"],
+            compute_chunk_dependencies(_DIAMOND_CHUNK_PLAN),
+            _run_chunk,
+            max_parallel=2,
+        )
+    assert cancelled == ["C02_ui"]
+
+
+def test_record_chunk_checkpoint_tracks_critical_path(temp_plans_dir):
+    storage = PlanStorage()
+    session = storage.create_plan("planning_session", "/tmp/logs")
+    _write_frozen_plan(session, _DIAMOND_CHUNK_PLAN)
+    initialize_chunk_execution_state(session)
+
+    record_chunk_checkpoint(session, chunk="C01_api", status="completed", attempt=1, timing={"duration_seconds": 5.0})
+    record_chunk_checkpoint(session, chunk="C02_ui", status="incomplete", attempt=1, timing={"duration_seconds": 4.0})
+    record_chunk_checkpoint(session, chunk="C02_ui", status="completed", attempt=2, timing={"duration_seconds": 3.0})
+    metadata = record_chunk_checkpoint(session, chunk="C03_join", status="completed", attempt=1, timing={"duration_seconds": 2.0})
+
+    join_timing = metadata.chunk_history[-1]["timing"]
+    assert join_timing["critical_path"] == ["C02_ui", "C03_join"]
+    assert join_timing["critical_path_seconds"] == pytest.approx(9.0)
+    assert metadata.status == "completed"
+
+    summary = summarize_chunk_timing(metadata)
+    assert summary["total_chunk_seconds"] == pytest.approx(14.0)
+    assert summary["critical_path_seconds"] == pytest.approx(9.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_phase_parallel_chunks_merge_outputs(
+    temp_plans_dir,
+    tmp_path,
+    monkeypatch,
+):
+    """Independent chunks run on separate lanes and downstream chunks see both outputs."""
+    import asyncio
+
+    import massgen.cli as cli_module
+
+    storage = PlanStorage()
+    session = storage.create_plan("planning_session", "/tmp/logs")
+    _write_frozen_plan(session, _DIAMOND_CHUNK_PLAN)
+
+    lanes_created = []
+
+    def _fake_create_agents(config, *args, **kwargs):
+        agent_id = config["agents"][0].get("id", "agent_a")
+        workspace = tmp_path / f"workspace_{len(lanes_created)}"
+        workspace.mkdir()
+        lanes_created.append(agent_id)
+        return {agent_id: _DummyAgent(workspace, agent_id)}
+
+    monkeypatch.setattr(cli_module, "create_agents_from_config", _fake_create_agents)
+
+    outputs = {"C01_api": "api.txt", "C02_ui": "ui.txt", "C03_join": "app.txt"}
+    running = set()
+    concurrent = {"max": 0}
+    seen_at_join = []
+
+    async def _fake_run_single_question(prompt, agents, *args, **kwargs):
+        agent_id, agent = next(iter(agents.items()))
+        workspace = Path(agent.backend.filesystem_manager.cwd)
+        plan_file = workspace / "tasks" / "plan.json"
+        current_plan = json.loads(plan_file.read_text())
+        active_chunk = current_plan["execution_scope"]["active_chunk"]
+
+        running.add(active_chunk)
+        concurrent["max"] = max(concurrent["max"], len(running))
+        await asyncio.sleep(0.05)
+        running.discard(active_chunk)
+
+        if active_chunk == "C03_join":
+            seen_at_join.extend(sorted(p.name for p in workspace.glob("*.txt")))
+        (workspace / outputs[active_chunk]).write_text(active_chunk)
+        for task in current_plan["tasks"]:
+            task["status"] = "completed"
+        plan_file.write_text(json.dumps(current_plan))
+        return {"answer": f"done {active_chunk}", "coordination_result": {"selected_agent": agent_id}}
+
+    monkeypatch.setattr(cli_module, "run_single_question", _fake_run_single_question)
+
+    config = {
+        "agents": [{"id": "agent_a", "type": "mock", "model": "mock-model"}],
+        "orchestrator": {},
+    }
+    with scoped_log_session(tmp_path / "logs"):
+        await cli_module._execute_plan_phase(
+            config=config,
+            plan_session=session,
+            question="Build",
+            automation=True,
+            max_parallel_chunks=2,
+        )
+
+    assert lanes_created == ["agent_a", "agent_a_lane1"]
+    assert concurrent["max"] == 2
+    assert seen_at_join == ["api.txt", "ui.txt"]
+    assert sorted(p.name for p in (tmp_path / "workspace_0").glob("*.txt")) == ["api.txt", "app.txt", "ui.txt"]
+
+    metadata = session.load_metadata()
+    assert metadata.status == "completed"
+    assert sorted(metadata.completed_chunks) == ["C01_api", "C02_ui", "C03_join"]
+    assert {entry["timing"]["lane"] for entry in metadata.chunk_history} == {0, 1}
+
+
+def test_combine_chunk_answers_uses_final_chunks():
+    dependencies = compute_chunk_dependencies(_DIAMOND_CHUNK_PLAN)
+    answers = {"C01_api": "api", "C02_ui": "ui", "C03_join": "app"}
+    assert combine_chunk_answers(["C01_api", "C02_ui", "C03_join"], dependencies, answers) == "app"
+
+    independent = {"C01_api": [], "C02_ui": []}
+    assert combine_chunk_answers(["C01_api", "C02_ui"], independent, {"C01_api": "api", "C02_ui": "ui"}) == ("## Chunk C01_api\n\napi\n\n## Chunk C02_ui\n\nui")
+    assert combine_chunk_answers(["C01_api", "C02_ui"], independent, {}) == ""
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_phase_parallel_lanes_are_isolated(
+    temp_plans_dir,
+    tmp_path,
+    monkeypatch,
+):
+    """Concurrent lanes run silently with their own log dirs, and running chunks and results are tracked per chunk."""
+    import asyncio
+
+    import massgen.cli as cli_module
+
+    storage = PlanStorage()
+    session = storage.create_plan("planning_session", "/tmp/logs")
+    _write_frozen_plan(
+        session,
+        {
+            "tasks": [
+                {"id": "T001", "description": "API", "chunk": "C01_api"},
+                {"id": "T002", "description": "UI", "chunk": "C02_ui"},
+            ],
+        },
+    )
+    log_root = tmp_path / "logs"
+
+    workspaces = iter(range(2))
+
+    def _fake_create_agents(config, *args, **kwargs):
+        agent_id = config["agents"][0].get("id", "agent_a")
+        workspace = tmp_path / f"workspace_{next(workspaces)}"
+        workspace.mkdir()
+        return {agent_id: _DummyAgent(workspace, agent_id)}
+
+    monkeypatch.setattr(cli_module, "create_agents_from_config", _fake_create_agents)
+
+    both_running = asyncio.Event()
+    api_finished = asyncio.Event()
+    started = []
+    seen = {}
+
+    async def _fake_run_single_question(prompt, agents, ui_config, *args, **kwargs):
+        agent_id, agent = next(iter(agents.items()))
+        plan_file = Path(agent.backend.filesystem_manager.cwd) / "tasks" / "plan.json"
+        current_plan = json.loads(plan_file.read_text())
+        active_chunk = current_plan["execution_scope"]["active_chunk"]
+        seen[active_chunk] = {"display_type": ui_config["display_type"], "log_dir": get_log_session_dir()}
+
+        started.append(active_chunk)
+        if len(started) == 2:
+            both_running.set()
+        await both_running.wait()
+        seen[active_chunk]["running_chunks"] = session.load_metadata().resumable_state["running_chunks"]
+
+        if active_chunk == "C01_api":
+            return {"answer": "", "coordination_result": {"selected_agent": agent_id, "is_orchestrator_timeout": True}}
+
+        await api_finished.wait()
+        metadata = session.load_metadata()
+        seen[active_chunk]["after_timeout"] = (metadata.current_chunk, metadata.resumable_state["running_chunks"])
+        for task in current_plan["tasks"]:
+            task["status"] = "completed"
+        plan_file.write_text(json.dumps(current_plan))
+        return {"answer": "ui done", "coordination_result": {"selected_agent": agent_id, "session_id": "ui_session"}}
+
+    monkeypatch.setattr(cli_module, "run_single_question", _fake_run_single_question)
+
+    async def _signal_when_api_checkpointed():
+        while "C01_api" not in (session.load_metadata().completed_chunks or []):
+            await asyncio.sleep(0.01)
+        api_finished.set()
+
+    watcher = asyncio.ensure_future(_signal_when_api_checkpointed())
+    config = {
+        "agents": [{"id": "agent_a", "type": "mock", "model": "mock-model"}],
+        "orchestrator": {},
+    }
+    with scoped_log_session(log_root):
+        final_answer, _ = await cli_module._execute_plan_phase(
+            config=config,
+            plan_session=session,
+            question="Build",
+            automation=False,
+            max_parallel_chunks=2,
+        )
+    await watcher
+
+    assert {chunk: info["display_type"] for chunk, info in seen.items()} == {"C01_api": "silent", "C02_ui": "silent"}
+    assert {info["log_dir"] for info in seen.values()} == {log_root / "lane_0", log_root / "lane_1"}
+    assert seen["C01_api"]["running_chunks"] == ["C01_api", "C02_ui"]
+    # The timed-out chunk hands the pointer to the chunk still running, not to the next pending one
+    assert seen["C02_ui"]["after_timeout"] == ("C02_ui", ["C02_ui"])
+
+    assert final_answer == "ui done"
+    metadata = session.load_metadata()
+    assert metadata.status == "completed"
+    assert metadata.execution_session_id == "ui_session"
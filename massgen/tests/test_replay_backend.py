@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the record/replay backend and the offline bench runner.
+
+Tests cover:
+- Recording a backend's streams (chunks, timings, usage) to a cassette
+- Replaying a cassette with time scaling and exhaustion policies
+- create_backend() wiring for replay and record modes, config validation
+- ResourceMonitor event-loop lag measurement
+- Running a synthetic bench scenario end to end through the orchestrator
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from massgen.backend.base import LLMBackend, StreamChunk
+from massgen.backend.replay import (
+    Cassette,
+    CassetteCall,
+    CassetteRecorder,
+    ReplayBackend,
+)
+from massgen.bench import BenchScenario, ResourceMonitor, build_cassette, run_scenario
+from massgen.cli import create_backend
+from massgen.config_validator import ConfigValidator
+
+
+class _ScriptedBackend(LLMBackend):
+    """Stands in for a provider backend: fixed stream plus token usage."""
+
+    async def stream_with_tools(self, messages, tools, **kwargs):
+        yield StreamChunk(type="content", content="Hello")
+        await asyncio.sleep(0.02)
+        yield StreamChunk(type="tool_calls", tool_calls=[{"id": "c1", "type": "function", "function": {"name": "vote", "arguments": {"agent_id": "agent_a"}}}])
+        yield StreamChunk(type="done")
+        self.token_usage.input_tokens += 120
+        self.token_usage.output_tokens += 7
+
+    def get_provider_name(self) -> str:
+        return "Scripted"
+
+
+async def _collect(backend):
+    return [chunk async for chunk in backend.stream_with_tools([{"role": "user", "content": "hi"}], [])]
+
+
+def _cassette(*offsets: float, duration: float = 0.0) -> Cassette:
+    call = CassetteCall(chunks=[(offset, {"type": "content", "content": f"t{i}"}) for i, offset in enumerate(offsets)], duration=duration)
+    return Cassette(calls=[call])
+
+
+class TestRecordReplay:
+    """Tests for CassetteRecorder and ReplayBackend."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        path = tmp_path / "cassettes" / "agent_a.jsonl"
+        recorded = CassetteRecorder(path).attach(_ScriptedBackend(model="scripted-1"))
+        original = await _collect(recorded)
+        await _collect(recorded)
+
+        cassette = Cassette.load(path)
+        assert cassette.metadata == {"provider": "Scripted", "model": "scripted-1"}
+        assert len(cassette.calls) == 2
+        first = cassette.calls[0]
+        assert first.usage == {"input_tokens": 120, "output_tokens": 7}
+        assert first.chunks[1][0] >= 0.015 and first.duration >= first.chunks[1][0]
+
+        replay = ReplayBackend(cassette=str(path), time_scale=0)
+        replayed = await _collect(replay)
+        assert [(c.type, c.content, c.tool_calls) for c in replayed] == [(c.type, c.content, c.tool_calls) for c in original]
+        assert (replay.token_usage.input_tokens, replay.token_usage.output_tokens) == (120, 7)
+        assert replay.config["model"] == "scripted-1"
+        assert len(replay.get_api_call_history()) == 1
+
+    @pytest.mark.asyncio
+    async def test_time_scale(self):
+        start = time.perf_counter()
+        await _collect(ReplayBackend(cassette=_cassette(0.0, 0.1, duration=0.1), time_scale=0))
+        assert time.perf_counter() - start < 0.05
+
+        start = time.perf_counter()
+        await _collect(ReplayBackend(cassette=_cassette(0.0, 0.1, duration=0.1), time_scale=0.5))
+        assert time.perf_counter() - start >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_exhaustion_policies(self):
+        cassette = Cassette(calls=[CassetteCall(chunks=[(0.0, {"type": "content", "content": str(i)})]) for i in range(2)])
+
+        async def contents(policy):
+            backend = ReplayBackend(cassette=cassette, time_scale=0, on_exhausted=policy)
+            return [(await _collect(backend))[0].content or "error" for _ in range(3)]
+
+        assert await contents("loop") == ["0", "1", "0"]
+        assert await contents("repeat_last") == ["0", "1", "1"]
+        assert await contents("error") == ["0", "1", "error"]
+        with pytest.raises(ValueError):
+            ReplayBackend(cassette=cassette, on_exhausted="bogus")
+
+
+class TestReplayConfig:
+    """Tests for selecting the replay backend from configuration."""
+
+    @pytest.mark.asyncio
+    async def test_create_backend_replay_and_record(self, tmp_path):
+        source = tmp_path / "source.jsonl"
+        _cassette(0.0, 0.001).save(source)
+
+        recorded_path = tmp_path / "recorded.jsonl"
+        recorder = create_backend(
+            "replay",
+            mode="record",
+            cassette=str(recorded_path),
+            record_backend={"type": "replay", "cassette": str(source), "time_scale": 0},
+        )
+        await _collect(recorder)
+        assert len(Cassette.load(recorded_path).calls) == 1
+
+        backend = create_backend("replay", cassette=str(recorded_path), time_scale=0)
+        assert isinstance(backend, ReplayBackend)
+        assert [c.content for c in await _collect(backend)] == ["t0", "t1"]
+
+    def test_config_validation(self):
+        config = {"agents": [{"id": "agent_a", "backend": {"type": "replay", "cassette": "a.jsonl"}}]}
+        result = ConfigValidator().validate_config(config)
+        assert not [error for error in result.errors if "backend" in error.location]
+
+
+class TestBench:
+    """Tests for the bench metrics and scenario runner."""
+
+    @pytest.mark.asyncio
+    async def test_resource_monitor_measures_loop_lag(self):
+        async with ResourceMonitor(interval=0.005) as monitor:
+            await asyncio.sleep(0.02)
+            time.sleep(0.05)  # blocks the event loop
+            await asyncio.sleep(0.02)
+        metrics = monitor.metrics
+        assert metrics.wall_seconds >= 0.09
+        assert metrics.loop_lag_max_ms >= 40
+        assert metrics.cpu_seconds >= 0
+
+    def test_build_cassette_shape(self):
+        scenario = BenchScenario(agents=2, rounds=2, tool_calls=3, content_chunks=4)
+        cassette = build_cassette(scenario, "agent_b")
+        assert len(cassette.calls) == 3
+        statuses = [record.get("status") for _, record in cassette.calls[0].chunks if record["type"] == "custom_tool_status"]
+        assert statuses.count("custom_tool_called") == 3 and statuses.count("custom_tool_response") == 3
+        workflow = [record["tool_calls"][0]["function"]["name"] for call in cassette.calls for _, record in call.chunks if record["type"] == "tool_calls"]
+        assert workflow == ["new_answer", "new_answer", "vote"]
+
+    @pytest.mark.asyncio
+    async def test_run_scenario(self):
+        scenario = BenchScenario(name="test", agents=2, rounds=1, tool_calls=2, content_chunks=5)
+        metrics = await run_scenario(scenario, time_scale=0)
+        assert metrics.extra["winner"] == "agent_a"
+        assert metrics.extra["backend_calls"] >= scenario.agents * (scenario.rounds + 1)
+        assert metrics.extra["chunks"] > 0
+        assert metrics.wall_seconds > 0
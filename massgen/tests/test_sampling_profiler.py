@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the opt-in sampling profiler.
+
+Tests cover:
+- Stack sampling of the event-loop thread and worker threads
+- Collapsed-stack and speedscope output
+- Event-loop block detection with the blocking stack captured
+- SamplingProfiler config handling and files written on stop
+- The --sample-profile CLI flag
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from massgen.profiling import (
+    COLLAPSED_FILENAME,
+    LOOP_BLOCKS_FILENAME,
+    SPEEDSCOPE_FILENAME,
+    LoopBlockDetector,
+    SamplingProfiler,
+    StackSampler,
+)
+
+
+def _busy_tool_work(seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(1000))
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestStackSampler:
+    """Sampling and output formats."""
+
+    def test_samples_worker_threads(self):
+        sampler = StackSampler(interval=0.005, loop_thread_id=threading.get_ident())
+        worker = threading.Thread(target=_busy_tool_work, args=(0.2,), name="tool-worker")
+        sampler.start()
+        worker.start()
+        worker.join()
+        sampler.stop()
+
+        assert sampler.sample_count > 5
+        assert "tool-worker" in sampler.samples
+        assert "event_loop" in sampler.samples
+        worker_frames = {frame[0] for stack in sampler.samples["tool-worker"] for frame in stack}
+        assert "_busy_tool_work" in worker_frames
+
+    def test_collapsed_and_speedscope(self):
+        sampler = StackSampler(interval=0.01)
+        leaf = ("leaf", "/src/massgen/tool/_code.py", 10)
+        root = ("run", "/usr/lib/python3.11/threading.py", 1)
+        sampler.samples = {"worker": Counter({(root, leaf): 3, (root,): 1})}
+        sampler.started_at, sampler.stopped_at = 100.0, 100.05
+
+        collapsed = sampler.to_collapsed().splitlines()
+        assert collapsed[0] == "worker;run (python3.11/threading.py:1);leaf (massgen/tool/_code.py:10) 3"
+        assert collapsed[1].endswith(" 1")
+
+        speedscope = sampler.to_speedscope(name="session")
+        (profile,) = speedscope["profiles"]
+        assert profile["name"] == "worker"
+        assert sorted(profile["weights"]) == [10.0, 30.0]
+        assert [speedscope["shared"]["frames"][i]["name"] for i in profile["samples"][0]] == ["run", "leaf"]
+        assert profile["endValue"] == 50.0
+
+
+class TestLoopBlockDetector:
+    """Watchdog for callbacks that block the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_callback(self):
+        detector = LoopBlockDetector(asyncio.get_running_loop(), threading.get_ident(), threshold=0.05, check_interval=0.01)
+        detector.start()
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+        detector.stop()
+
+        assert len(detector.blocks) == 1
+        block = detector.blocks[0]
+        assert block["duration_ms"] >= 200
+        assert "_block_the_loop" in block["stack"]
+
+    @pytest.mark.asyncio
+    async def test_no_blocks_when_loop_is_responsive(self):
+        detector = LoopBlockDetector(asyncio.get_running_loop(), threading.get_ident(), threshold=0.2, check_interval=0.01)
+        detector.start()
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        detector.stop()
+
+        assert detector.blocks == []
+
+
+class TestSamplingProfiler:
+    """Lifecycle, config and files written to the log directory."""
+
+    def test_from_config(self, tmp_path):
+        profiler = SamplingProfiler.from_config(tmp_path, {"sampling": True, "interval_ms": 2, "loop_block_threshold_ms": None})
+        assert profiler.interval_ms == 2.0
+        assert profiler.loop_block_threshold_ms is None
+
+    @pytest.mark.asyncio
+    async def test_writes_profiles_on_stop(self, tmp_path):
+        profiler = SamplingProfiler(tmp_path / "log_session", interval_ms=5, loop_block_threshold_ms=50)
+        profiler.start()
+        await asyncio.to_thread(_busy_tool_work, 0.1)
+        _block_the_loop(0.15)
+        await asyncio.sleep(0.05)
+        written = profiler.stop()
+
+        assert set(written) == {"collapsed", "speedscope", "loop_blocks"}
+        collapsed = (tmp_path / "log_session" / COLLAPSED_FILENAME).read_text()
+        assert "event_loop;" in collapsed
+        assert "_busy_tool_work" in collapsed
+        speedscope = json.loads((tmp_path / "log_session" / SPEEDSCOPE_FILENAME).read_text())
+        assert speedscope["profiles"][0]["name"] == "event_loop"
+        blocks = json.loads((tmp_path / "log_session" / LOOP_BLOCKS_FILENAME).read_text())
+        assert blocks["threshold_ms"] == 50
+        assert any("_block_the_loop" in block["stack"] for block in blocks["blocks"])
+
+    def test_stop_without_start(self, tmp_path):
+        assert SamplingProfiler(tmp_path).stop() == {}
+        assert not (tmp_path / COLLAPSED_FILENAME).exists()
+
+    def test_cli_flag(self, monkeypatch):
+        import massgen.cli as cli
+
+        captured = {}
+
+        async def fake_main(args):
+            captured["sample_profile"] = args.sample_profile
+
+        monkeypatch.setattr(cli, "main", fake_main)
+        monkeypatch.setattr("sys.argv", ["massgen", "--sample-profile", "--model", "gpt-4o-mini", "hi"])
+        cli.cli_main()
+
+        assert captured == {"sample_profile": True}
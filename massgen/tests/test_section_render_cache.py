@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the system prompt section render cache.
+
+Tests cover:
+- Reusing rendered content for sections with identical inputs
+- Invalidation when inputs or dependent files (mtime/size) change
+- Memoized CLAUDE.md/AGENTS.md discovery picking up new files
+- Sections that opt out of caching
+"""
+
+import os
+
+import pytest
+
+from massgen.system_prompt_sections import (
+    _SECTION_RENDER_CACHE,
+    AgentIdentitySection,
+    CoreBehaviorsSection,
+    EvaluationSection,
+    ProjectInstructionsSection,
+    SkillsSection,
+    SystemPromptBuilder,
+    clear_section_render_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_section_render_cache()
+    yield
+    clear_section_render_cache()
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSectionRenderCache:
+    """Tests for cache hits and invalidation."""
+
+    def test_identical_sections_reuse_render(self):
+        first = AgentIdentitySection("You are a helpful assistant.").render()
+        second = AgentIdentitySection("You are a helpful assistant.").render()
+        assert first == second
+        assert (_SECTION_RENDER_CACHE.misses, _SECTION_RENDER_CACHE.hits) == (1, 1)
+
+        AgentIdentitySection("You are a different assistant.").render()
+        assert _SECTION_RENDER_CACHE.misses == 2
+
+    def test_builder_output_unchanged_when_cached(self):
+        def build():
+            builder = SystemPromptBuilder()
+            builder.add_section(AgentIdentitySection("Identity"))
+            builder.add_section(CoreBehaviorsSection())
+            return builder.build()
+
+        uncached = build()
+        assert build() == uncached
+        assert _SECTION_RENDER_CACHE.hits == 2
+
+    def test_uncacheable_sections_have_no_key(self):
+        assert EvaluationSection(voting_sensitivity="balanced").cache_key() is None
+
+    def test_skills_registry_change_invalidates(self, tmp_path):
+        registry = tmp_path / SkillsSection.REGISTRY_FILENAME
+        registry.write_text("---\nname: registry\n---\n- **pdf**: read PDFs\n")
+        skills = [{"name": "pdf", "description": "PDF tools", "location": "builtin"}]
+
+        assert "read PDFs" in SkillsSection(skills, skills_dir=tmp_path).render()
+
+        registry.write_text("---\nname: registry\n---\n- **pdf**: read and write PDFs\n")
+        _bump_mtime(registry)
+        assert "read and write PDFs" in SkillsSection(skills, skills_dir=tmp_path).render()
+        assert _SECTION_RENDER_CACHE.hits == 0
+
+
+class TestProjectInstructionsCaching:
+    """Tests for memoized instruction file discovery."""
+
+    def test_new_instruction_file_is_discovered(self, tmp_path):
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        section = ProjectInstructionsSection([{"path": str(nested)}], workspace_root=str(tmp_path))
+        assert section.discover_instruction_file(nested) is None
+
+        (tmp_path / "AGENTS.md").write_text("Agents rules")
+        assert section.discover_instruction_file(nested) == tmp_path / "AGENTS.md"
+
+        # CLAUDE.md created at the same level wins once the directory changes
+        (tmp_path / "CLAUDE.md").write_text("Claude rules")
+        assert section.discover_instruction_file(nested) == tmp_path / "CLAUDE.md"
+
+    def test_edited_instruction_file_rerenders(self, tmp_path):
+        claude_md = tmp_path / "CLAUDE.md"
+        claude_md.write_text("Use TDD.")
+        paths = [{"path": str(tmp_path)}]
+
+        assert "Use TDD." in ProjectInstructionsSection(paths, workspace_root=str(tmp_path)).render()
+        assert "Use TDD." in ProjectInstructionsSection(paths, workspace_root=str(tmp_path)).render()
+        assert _SECTION_RENDER_CACHE.hits == 1
+
+        claude_md.write_text("Use TDD and type hints.")
+        _bump_mtime(claude_md)
+        assert "type hints" in ProjectInstructionsSection(paths, workspace_root=str(tmp_path)).render()
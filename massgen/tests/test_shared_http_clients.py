@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the process-wide pooled HTTP client registry.
+
+Tests cover:
+- Client keying by provider, base_url, API key and event loop
+- SDK close() leaving shared clients open; release()/close_all() closing them
+- Connection reuse counters across SDK clients built by backends
+- Metrics summary including the counters
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from massgen.backend.http_clients import ConnectionStats, SharedHTTPClients
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    SharedHTTPClients.clear()
+    yield
+    SharedHTTPClients.clear()
+
+
+class _ModelsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"object": "list", "data": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ModelsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedHTTPClients:
+    """Registry keying and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_clients_keyed_by_endpoint_and_key(self):
+        client = SharedHTTPClients.get("openai", "https://api.openai.com/v1", "sk-a")
+
+        assert SharedHTTPClients.get("openai", "https://api.openai.com/v1", "sk-a") is client
+        assert SharedHTTPClients.get("openai", "https://api.openai.com/v1", "sk-b") is not client
+        assert SharedHTTPClients.get("openai", "https://example.com/v1", "sk-a") is not client
+        assert SharedHTTPClients.get("claude", "https://api.openai.com/v1", "sk-a") is not client
+
+    def test_no_client_outside_event_loop_and_one_per_loop(self):
+        assert SharedHTTPClients.get("openai", None, "sk") is None
+
+        async def get():
+            return SharedHTTPClients.get("openai", None, "sk")
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    @pytest.mark.asyncio
+    async def test_sdk_close_is_ignored_and_release_closes(self):
+        import openai
+
+        http_client = SharedHTTPClients.get("openai", None, "sk")
+        await openai.AsyncOpenAI(api_key="sk", http_client=http_client).close()
+        assert not http_client.is_closed
+
+        SharedHTTPClients.acquire()
+        SharedHTTPClients.acquire()
+        await SharedHTTPClients.release()
+        assert not http_client.is_closed
+        await SharedHTTPClients.release()
+        assert http_client.is_closed
+
+        replacement = SharedHTTPClients.get("openai", None, "sk")
+        assert replacement is not http_client and not replacement.is_closed
+        await SharedHTTPClients.close_all()
+        assert replacement.is_closed
+
+
+class TestConnectionReuse:
+    """Counters observed through real requests to a local server."""
+
+    @pytest.mark.asyncio
+    async def test_backends_reuse_connections(self, local_api):
+        from massgen.backend.chat_completions import ChatCompletionsBackend
+
+        backend = ChatCompletionsBackend(api_key="sk-test", base_url=local_api, model="test-model")
+        for _ in range(3):
+            # A fresh SDK client per call, as stream_with_tools does
+            client = backend._create_client()
+            await client.models.list()
+            await client.close()
+
+        stats = SharedHTTPClients.stats()
+        (name,) = stats
+        assert name.startswith(backend.get_provider_name())
+        assert stats[name]["requests"] == 3
+        assert stats[name]["connections_opened"] == 1
+        assert stats[name]["reused_requests"] == 2
+        assert stats[name]["reuse_ratio"] == pytest.approx(0.667, abs=0.001)
+        await SharedHTTPClients.close_all()
+
+    def test_metrics_summary_includes_connection_stats(self, tmp_path):
+        from massgen.orchestrator import Orchestrator
+
+        SharedHTTPClients._stats["OpenAI api.openai.com"] = ConnectionStats(requests=4, connections_opened=1)
+
+        orchestrator = Orchestrator(agents={})
+        orchestrator.save_metrics(tmp_path)
+
+        summary = json.loads((tmp_path / "metrics_summary.json").read_text())
+        assert summary["http_connections"]["OpenAI api.openai.com"]["reused_requests"] == 3
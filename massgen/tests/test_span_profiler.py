@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the span-based latency profiler.
+
+Tests cover:
+- Span attribution to the agent and round running in the current context
+- profile_span/profiled recording on the active profiler and no-op without one
+- Converting backend API call and tool metrics into TTFT, streaming and tool spans
+- Per-round phase breakdown and the coordination critical path
+- Chrome trace export with properly nested lanes per agent
+- Orchestrator runs writing latency to metrics_summary.json plus latency_trace.json
+- The `massgen logs latency` display
+"""
+
+import asyncio
+import json
+
+import pytest
+from rich.console import Console
+
+from massgen.bench import BenchScenario, build_orchestrator
+from massgen.logs_analyzer import LogAnalyzer, display_latency
+from massgen.mcp_tools.hooks import GeneralHookManager, HookType, PythonCallableHook
+from massgen.profiling import (
+    HOOK,
+    PROMPT_BUILD,
+    ROUND,
+    STREAMING,
+    TOOL,
+    TRACE_FILENAME,
+    TTFT,
+    Span,
+    SpanProfiler,
+    activate_profiler,
+    backend_metric_spans,
+    build_report,
+    profile_span,
+    profiled,
+    to_chrome_trace,
+)
+from massgen.token_manager.token_manager import APICallMetric
+
+
+@pytest.fixture
+def profiler():
+    profiler = SpanProfiler()
+    activate_profiler(profiler)
+    yield profiler
+    activate_profiler(None)
+
+
+class _Backend:
+    def __init__(self, calls, tools):
+        self._calls = calls
+        self._tools = tools
+
+    def get_api_call_history(self):
+        return self._calls
+
+    def get_tool_metrics(self):
+        return self._tools
+
+
+def _round(agent_id, round_number, start, end, outcome="answer"):
+    return Span(f"{agent_id} round {round_number}", ROUND, start, end, agent_id, round_number, {"round_type": "initial_answer", "outcome": outcome})
+
+
+class TestSpanRecording:
+    """Spans recorded through the profiler and module helpers."""
+
+    def test_spans_attributed_to_current_round(self, profiler):
+        round_span = profiler.begin_round("agent_a", 2, "voting")
+        with profile_span("prompt_build", PROMPT_BUILD):
+            pass
+        profiler.finish(round_span, outcome="vote")
+
+        prompt = profiler.spans[1]
+        assert (prompt.agent_id, prompt.round_number) == ("agent_a", 2)
+        assert prompt.end is not None and prompt.end >= prompt.start
+        assert round_span.attributes == {"round_type": "voting", "outcome": "vote"}
+
+    def test_finish_is_idempotent(self, profiler):
+        span = profiler.start("x", TOOL)
+        profiler.finish(span)
+        end = span.end
+        profiler.finish(span, late=True)
+        profiler.finish(None)
+        assert span.end == end
+        assert "late" not in span.attributes
+
+    def test_profile_span_without_profiler_is_noop(self):
+        activate_profiler(None)
+        with profile_span("prompt_build", PROMPT_BUILD) as span:
+            assert span is None
+
+    @pytest.mark.asyncio
+    async def test_profiled_uses_instance_agent_id(self, profiler):
+        class _Manager:
+            agent_id = "agent_b"
+
+            @profiled("save_snapshot", "snapshot")
+            async def save(self):
+                return "saved"
+
+        assert await _Manager().save() == "saved"
+        assert [(s.name, s.agent_id) for s in profiler.spans] == [("save_snapshot", "agent_b")]
+
+    @pytest.mark.asyncio
+    async def test_rounds_stay_separate_across_agent_tasks(self, profiler):
+        async def agent_round(agent_id):
+            round_span = profiler.begin_round(agent_id, 1, "initial_answer")
+            await asyncio.sleep(0.01)
+            with profile_span("prompt_build", PROMPT_BUILD):
+                await asyncio.sleep(0)
+            profiler.finish(round_span)
+
+        await asyncio.gather(agent_round("agent_a"), agent_round("agent_b"))
+
+        prompts = {s.agent_id for s in profiler.spans if s.category == PROMPT_BUILD}
+        assert prompts == {"agent_a", "agent_b"}
+
+    @pytest.mark.asyncio
+    async def test_hook_dispatch_recorded(self, profiler):
+        manager = GeneralHookManager()
+        manager.register_global_hook(HookType.PRE_TOOL_USE, PythonCallableHook(name="allow", handler=lambda event: None, matcher="*"))
+
+        await manager.execute_hooks(HookType.PRE_TOOL_USE, "Write", "{}", {"agent_id": "agent_a"})
+        await manager.execute_hooks(HookType.POST_TOOL_USE, "Write", "{}", {"agent_id": "agent_a"}, tool_output="ok")
+
+        hooks = [s for s in profiler.spans if s.category == HOOK]
+        assert len(hooks) == 1  # No span when nothing matches
+        assert hooks[0].agent_id == "agent_a"
+        assert hooks[0].attributes["tool"] == "Write"
+
+
+class TestBackendMetricSpans:
+    """Existing backend metrics become TTFT, streaming and tool spans."""
+
+    def test_api_calls_and_tools(self):
+        calls = [
+            APICallMetric("agent_a", 1, 0, "OpenAI", "gpt-4o", start_time=100.0, end_time=102.0, time_to_first_token_ms=500.0),
+            APICallMetric("agent_a", 1, 1, "OpenAI", "gpt-4o", start_time=103.0, end_time=103.4),
+            APICallMetric("agent_a", 1, 2, "OpenAI", "gpt-4o", start_time=104.0),  # Still open
+        ]
+        tools = [{"tool_name": "read_file", "tool_type": "mcp", "start_time": 102.0, "end_time": 102.8, "round_number": 1}]
+
+        spans = backend_metric_spans("agent_a", _Backend(calls, tools))
+
+        assert [(s.category, s.start, s.end) for s in spans] == [
+            (TTFT, 100.0, 100.5),
+            (STREAMING, 100.5, 102.0),
+            (TTFT, 103.0, 103.4),  # No content token: the whole call is waiting
+            (TOOL, 102.0, 102.8),
+        ]
+        assert all(s.agent_id == "agent_a" and s.round_number == 1 for s in spans)
+
+
+class TestReport:
+    """Per-round breakdown and critical path."""
+
+    def test_phase_breakdown(self):
+        spans = [
+            _round("agent_a", 1, 0.0, 1.0),
+            Span("prompt_build", PROMPT_BUILD, 0.0, 0.1, "agent_a", 1),
+            Span("ttft", TTFT, 0.1, 0.4, "agent_a", 1),
+            Span("stream", STREAMING, 0.4, 0.9, "agent_a", 1),
+            Span("tool", TOOL, 0.5, 0.7, "agent_a", 1),
+            Span("other agent", TOOL, 0.0, 1.0, "agent_b", 1),
+        ]
+
+        (row,) = build_report(spans)["rounds"]
+
+        assert row["duration_ms"] == 1000.0
+        assert row["phases"]["prompt_build"] == 100.0
+        assert row["phases"]["ttft"] == 300.0
+        assert row["phases"]["tool"] == 200.0
+        assert row["phases"]["other"] == 100.0  # Overlapping tool/stream time counted once
+
+    def test_critical_path_follows_unblocking_rounds(self):
+        spans = [
+            _round("agent_a", 1, 0.0, 1.0),
+            _round("agent_b", 1, 0.0, 3.0),  # Slow answer gates the vote round
+            _round("agent_a", 2, 3.01, 4.0, outcome="vote"),
+            _round("agent_b", 2, 3.02, 3.5, outcome="vote"),
+        ]
+
+        path = build_report(spans)["critical_path"]
+
+        assert [(s["agent_id"], s["round"]) for s in path["segments"]] == [("agent_b", 1), ("agent_a", 2)]
+        assert path["total_ms"] == 4000.0
+        assert path["gap_ms"] == pytest.approx(10.0)
+
+    def test_empty(self):
+        assert build_report([]) == {"rounds": [], "critical_path": {}}
+
+
+class TestChromeTrace:
+    """Chrome/Perfetto trace export."""
+
+    def test_overlapping_spans_get_separate_lanes(self):
+        spans = [
+            _round("agent_a", 1, 0.0, 1.0),
+            Span("tool a", TOOL, 0.1, 0.5, "agent_a", 1),
+            Span("tool b", TOOL, 0.2, 0.8, "agent_a", 1),  # Overlaps tool a without nesting
+            Span("wait", "rate_limit_wait", 0.0, 0.2),
+        ]
+
+        trace = to_chrome_trace(spans)
+
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert events["tool a"]["tid"] == events[spans[0].name]["tid"]
+        assert events["tool b"]["tid"] != events["tool a"]["tid"]
+        assert events["tool a"]["ts"] == pytest.approx(100000.0)
+        assert events["tool a"]["dur"] == pytest.approx(400000.0)
+        names = {e["args"]["name"] for e in trace["traceEvents"] if e["name"] == "thread_name"}
+        assert names == {"agent_a", "agent_a (2)", "orchestrator"}
+
+
+class TestOrchestratorLatency:
+    """Coordination runs export the latency profile with their metrics."""
+
+    @pytest.mark.asyncio
+    async def test_save_metrics_writes_latency(self, tmp_path):
+        orchestrator = build_orchestrator(BenchScenario(name="latency", agents=2, rounds=1, tool_calls=0, content_chunks=5))
+        async for _ in orchestrator.chat([{"role": "user", "content": "Summarize the trade-offs."}]):
+            pass
+        activate_profiler(None)
+
+        orchestrator.save_metrics(tmp_path)
+
+        latency = json.loads((tmp_path / "metrics_summary.json").read_text())["latency"]
+        round_types = {r["round_type"] for r in latency["rounds"]}
+        assert {"initial_answer", "voting", "presentation"} <= round_types
+        assert any(r["phases"]["prompt_build"] > 0 for r in latency["rounds"])
+        assert latency["critical_path"]["segments"][-1]["round_type"] == "presentation"
+
+        trace = json.loads((tmp_path / TRACE_FILENAME).read_text())
+        categories = {e.get("cat") for e in trace["traceEvents"]}
+        assert {ROUND, PROMPT_BUILD, TTFT} <= categories
+
+        console = Console(record=True, width=200)
+        display_latency(LogAnalyzer(tmp_path), console)
+        output = console.export_text()
+        assert "Critical path" in output
+        assert TRACE_FILENAME in output
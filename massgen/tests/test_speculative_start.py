@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for speculative early start of agents on peers' in-progress answers.
+
+Tests cover:
+- Draft readiness (minimum length, stability window) and answer similarity
+- Resolving speculations: matched, diverged, superseded, source without answer
+- Stream multiplexer batch timeout used to poll for stable drafts
+- speculative_start config parsing, serialization and validation
+- Coordination over replay backends: a waiting agent starts early and keeps
+  its vote when the final answer matches, and is restarted when it diverges
+  (a round still running is left to restart at its next safe point)
+"""
+
+import asyncio
+
+import pytest
+
+from massgen._agent_stream_mux import AgentStreamMultiplexer
+from massgen._speculative_start import SpeculativeStartTracker, answer_similarity
+from massgen.agent_config import AgentConfig, SpeculativeStartConfig
+from massgen.backend.replay import Cassette, CassetteCall, ReplayBackend
+from massgen.config_validator import ConfigValidator
+
+DRAFT = "The capital of France is Paris. It has been the capital since the tenth century and is the largest city in the country."
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _tracker(**overrides):
+    settings = {"enabled": True, "min_chars": 20, "stable_seconds": 2.0, "similarity_threshold": 0.8}
+    settings.update(overrides)
+    clock = _Clock()
+    return SpeculativeStartTracker(SpeculativeStartConfig(**settings), clock=clock), clock
+
+
+class TestSpeculativeStartTracker:
+    """Drafts, readiness and resolution."""
+
+    def test_draft_ready_after_min_chars_and_stability(self):
+        tracker, clock = _tracker()
+        tracker.start_round("b")
+        tracker.observe("b", "Short ")
+        assert tracker.seconds_until_ready("b") is None
+
+        tracker.observe("b", "but now long enough draft")
+        assert tracker.seconds_until_ready("b") == 2.0
+        assert tracker.provisional_answer("b") is None
+
+        clock.now += 1.5
+        assert tracker.seconds_until_ready("b") == pytest.approx(0.5)
+        clock.now += 0.5
+        assert tracker.provisional_answer("b") == "Short but now long enough draft"
+
+        tracker.start_round("b")
+        assert tracker.provisional_answer("b") is None
+
+    def test_answer_similarity(self):
+        assert answer_similarity(DRAFT, "  " + DRAFT.replace(" ", "\n", 3)) == 1.0
+        assert answer_similarity(DRAFT, DRAFT + " Population is about two million.") > 0.8
+        assert answer_similarity(DRAFT, "Berlin is the capital of Germany.") < 0.5
+        assert answer_similarity("", DRAFT) == 0.0
+
+    def test_resolve_keeps_matching_and_discards_diverging(self):
+        tracker, _ = _tracker()
+        tracker.begin("a", {"b": DRAFT})
+        tracker.begin("c", {"b": "Something else entirely that was streamed"})
+        tracker.begin("d", {"b": DRAFT, "e": DRAFT})
+
+        kept, discarded = tracker.resolve({"b": DRAFT + " Final."})
+
+        assert kept == {"a": ["b"], "d": ["b"]}
+        assert discarded == {"c"}
+        # d still waits for e's final answer
+        assert tracker.covers("d", ["e"]) and not tracker.covers("d", ["b"])
+        stats = tracker.stats()
+        assert (stats["started"], stats["kept"], stats["discarded"], stats["pending"]) == (3, 1, 1, 1)
+        assert {outcome["reason"] for outcome in stats["outcomes"]} == {"matched", "diverged"}
+
+    def test_unspeculated_answer_supersedes_and_own_answer_ends(self):
+        tracker, _ = _tracker()
+        tracker.begin("a", {"b": DRAFT})
+        tracker.begin("c", {"b": DRAFT})
+
+        kept, discarded = tracker.resolve({"c": "c's own answer", "e": DRAFT})
+
+        assert kept == {}
+        assert discarded == {"a"}
+        assert not tracker.is_speculating("c")
+        assert tracker.stats()["outcomes"][0]["reason"] == "superseded"
+
+    def test_source_without_answer_invalidates(self):
+        tracker, _ = _tracker()
+        tracker.begin("a", {"b": DRAFT})
+
+        assert tracker.invalidate_source("c") == set()
+        assert tracker.invalidate_source("b") == {"a"}
+        assert tracker.stats()["outcomes"] == [{"agent_id": "a", "kept": False, "reason": "no_answer", "similarities": {"b": None}}]
+
+
+class TestMultiplexerTimeout:
+    """next_batch timeout used while waiting for drafts to stabilize."""
+
+    @pytest.mark.asyncio
+    async def test_next_batch_times_out_without_losing_chunks(self):
+        release = asyncio.Event()
+
+        async def stream():
+            await release.wait()
+            yield ("content", "late")
+
+        async def next_chunk(agent_stream):
+            try:
+                return await agent_stream.__anext__()
+            except StopAsyncIteration:
+                return ("done", None)
+
+        mux = AgentStreamMultiplexer(next_chunk)
+        mux.attach("a", stream())
+        assert await mux.next_batch(timeout=0.01) == []
+
+        release.set()
+        batch = await mux.next_batch(timeout=1.0)
+        assert batch[0] == ("a", ("content", "late"))
+        await mux.detach("a")
+
+
+class TestSpeculativeStartConfig:
+    """Config dataclass, serialization and validation."""
+
+    def test_defaults_and_round_trip(self):
+        config = AgentConfig()
+        assert config.speculative_start.enabled is False
+
+        config.speculative_start = SpeculativeStartConfig(enabled=True, min_chars=100)
+        restored = AgentConfig.from_dict(config.to_dict())
+        assert restored.speculative_start == config.speculative_start
+
+    def test_invalid_values_rejected(self):
+        with pytest.raises(ValueError, match="similarity_threshold"):
+            SpeculativeStartConfig(similarity_threshold=1.5)
+
+        config = {
+            "agents": [{"id": "a", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+            "orchestrator": {"speculative_start": {"enabled": "yes", "min_chars": 0, "similarity": 0.9}},
+        }
+        result = ConfigValidator().validate_config(config)
+        locations = {error.location for error in result.errors}
+        assert {"orchestrator.speculative_start.enabled", "orchestrator.speculative_start.min_chars", "orchestrator.speculative_start.similarity"} <= locations
+
+
+def _workflow_call(call_id, name, arguments):
+    return (0.0, {"type": "tool_calls", "tool_calls": [{"id": call_id, "type": "function", "function": {"name": name, "arguments": arguments}}]})
+
+
+def _call(chunks, duration=0.0):
+    call = CassetteCall(usage={"input_tokens": 100, "output_tokens": 20}, duration=duration)
+    call.chunks = chunks + [(duration, {"type": "done"})]
+    return call
+
+
+def _fast_cassette(vote_duration=0.0):
+    """Answers immediately, then votes for agent_b (after ``vote_duration`` seconds)."""
+    answer = _call([(0.0, {"type": "content", "content": "Quick answer."}), _workflow_call("a1", "new_answer", {"content": "Paris."})])
+    vote_chunks = [(0.0, {"type": "content", "content": "Comparing answers. "}), (vote_duration, _workflow_call("a2", "vote", {"agent_id": "agent_b", "reason": "More complete"})[1])]
+    vote = _call(vote_chunks, duration=vote_duration)
+    return Cassette(calls=[answer, vote])
+
+
+def _slow_cassette(final_answer):
+    """Streams a draft, then thinks for a while before submitting the final answer."""
+    words = DRAFT.split(" ")
+    chunks = [(0.01 * i, {"type": "content", "content": word + " "}) for i, word in enumerate(words)]
+    submit = (0.8, {"type": "tool_calls", "tool_calls": [{"id": "b1", "type": "function", "function": {"name": "new_answer", "arguments": {"content": final_answer}}}]})
+    answer = _call(chunks + [submit], duration=0.8)
+    vote = _call([_workflow_call("b2", "vote", {"agent_id": "agent_b", "reason": "Mine is complete"})])
+    return Cassette(calls=[answer, vote])
+
+
+def _orchestrator(final_answer, enabled=True, vote_duration=0.0):
+    from massgen.chat_agent import SingleAgent
+    from massgen.orchestrator import Orchestrator
+
+    backends = {
+        "agent_a": ReplayBackend(cassette=_fast_cassette(vote_duration), time_scale=1.0, on_exhausted="repeat_last"),
+        "agent_b": ReplayBackend(cassette=_slow_cassette(final_answer), time_scale=1.0, on_exhausted="repeat_last"),
+    }
+    agents = {agent_id: SingleAgent(backend=backend, agent_id=agent_id, system_message=f"You are {agent_id}.") for agent_id, backend in backends.items()}
+    config = AgentConfig()
+    config.max_new_answers_per_agent = 1
+    config.defer_voting_until_all_answered = True
+    config.speculative_start = SpeculativeStartConfig(enabled=enabled, min_chars=40, stable_seconds=0.1, similarity_threshold=0.8)
+    return Orchestrator(agents=agents, config=config), backends
+
+
+async def _run(orchestrator):
+    async for _ in orchestrator.chat_simple("What is the capital of France?"):
+        pass
+
+
+class TestSpeculativeCoordination:
+    """Waiting agents starting on provisional answers during real coordination."""
+
+    @pytest.mark.asyncio
+    async def test_matching_final_answer_keeps_speculative_vote(self):
+        orchestrator, backends = _orchestrator(final_answer=DRAFT)
+
+        await asyncio.wait_for(_run(orchestrator), timeout=30)
+
+        stats = orchestrator._speculative_start.stats()
+        assert (stats["started"], stats["kept"], stats["discarded"]) == (1, 1, 0)
+        assert stats["outcomes"][0]["similarities"] == {"agent_b": 1.0}
+        # agent_a answered once and voted once; its speculative vote survived agent_b's answer
+        assert backends["agent_a"].calls_replayed == 2
+        assert orchestrator.agent_states["agent_a"].has_voted
+        vote = next(vote for vote in orchestrator.coordination_tracker.votes if vote.voter_id == "agent_a")
+        assert vote.voted_for == "agent_b"
+        assert vote.voted_for_label != "unknown"
+
+    @pytest.mark.asyncio
+    async def test_diverging_final_answer_discards_speculative_vote(self):
+        orchestrator, backends = _orchestrator(final_answer="Lyon, after reconsidering the question carefully.")
+
+        await asyncio.wait_for(_run(orchestrator), timeout=30)
+
+        stats = orchestrator._speculative_start.stats()
+        assert (stats["started"], stats["kept"], stats["discarded"]) == (1, 0, 1)
+        assert stats["outcomes"][0]["reason"] == "diverged"
+        # agent_a had to vote again after seeing the real answer
+        assert backends["agent_a"].calls_replayed == 3
+        assert orchestrator.agent_states["agent_a"].has_voted
+
+    @pytest.mark.asyncio
+    async def test_discarded_running_round_restarts_at_safe_point(self):
+        from massgen.coordination_tracker import EventType
+
+        # agent_a is still deliberating on its speculative vote when agent_b's answer diverges
+        orchestrator, backends = _orchestrator(final_answer="Lyon, after reconsidering the question carefully.", vote_duration=1.5)
+        discard = orchestrator._discard_speculative_work
+        discarded = []
+
+        def record_discard(agent_id, votes, active_streams):
+            discard(agent_id, votes, active_streams)
+            discarded.append((agent_id, agent_id in active_streams, orchestrator.agent_states[agent_id].restart_pending, len(orchestrator.coordination_tracker.events)))
+
+        orchestrator._discard_speculative_work = record_discard
+        await asyncio.wait_for(_run(orchestrator), timeout=30)
+
+        # The running stream was left open and flagged instead of being cancelled mid-call
+        assert [entry[:3] for entry in discarded] == [("agent_a", True, True)]
+        # It restarted on the real answer and voted again, without being cancelled
+        events = orchestrator.coordination_tracker.events
+        assert not any(event.event_type in (EventType.AGENT_CANCELLED, EventType.AGENT_ERROR) for event in events)
+        after_discard = events[discarded[0][3] :]
+        assert any(event.agent_id == "agent_a" and event.event_type == EventType.CONTEXT_RECEIVED for event in after_discard)
+        assert backends["agent_a"].calls_replayed == 3
+        assert orchestrator.agent_states["agent_a"].has_voted
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        orchestrator, backends = _orchestrator(final_answer=DRAFT, enabled=False)
+
+        await asyncio.wait_for(_run(orchestrator), timeout=30)
+
+        assert orchestrator._speculative_start is None
+        assert backends["agent_a"].calls_replayed == 2
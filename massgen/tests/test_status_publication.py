@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for push-based coordination status publication.
+
+Tests cover:
+- Status snapshot diffing and delta application
+- Dirty tracking in CoordinationTracker.publish_status
+- status_delta events on the event pipe
+- Debounced atomic status.json writes
+- Phase/round transitions written without waiting for the debounce
+- SubagentManager assembling live status from pushed deltas
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from massgen.coordination_tracker import (
+    CoordinationTracker,
+    apply_status_delta,
+    diff_status,
+)
+from massgen.events import EventEmitter, EventType, MassGenEvent
+
+
+def _init_tracker() -> CoordinationTracker:
+    tracker = CoordinationTracker()
+    tracker.initialize_session(["agent_a", "agent_b"], user_prompt="test")
+    return tracker
+
+
+def _orchestrator() -> MagicMock:
+    orchestrator = MagicMock()
+    orchestrator.agent_states = {}
+    orchestrator.agents = {}
+    orchestrator.is_orchestrator_timeout = False
+    return orchestrator
+
+
+# =============================================================================
+# Delta Tests
+# =============================================================================
+
+
+class TestStatusDelta:
+    """Tests for diff_status and apply_status_delta."""
+
+    def test_round_trip(self):
+        previous = {"a": 1, "nested": {"x": 1, "y": [1, 2]}, "gone": True}
+        current = {"a": 1, "nested": {"x": 2, "y": [1, 2]}, "new": "v"}
+
+        delta = diff_status(previous, current)
+
+        assert delta == {"nested": {"x": 2}, "new": "v", "gone": None}
+        rebuilt = apply_status_delta(json.loads(json.dumps(previous)), delta)
+        assert rebuilt["nested"] == current["nested"]
+        assert rebuilt["new"] == "v"
+
+    def test_volatile_fields_ignored(self):
+        previous = {"meta": {"last_updated": 1.0, "elapsed_seconds": 1.0, "question": "q"}}
+        current = {"meta": {"last_updated": 2.0, "elapsed_seconds": 2.0, "question": "q"}}
+        assert diff_status(previous, current) == {}
+
+
+# =============================================================================
+# Publication Tests
+# =============================================================================
+
+
+class TestPublishStatus:
+    """Tests for CoordinationTracker status publication."""
+
+    def test_publishes_only_when_dirty(self, tmp_path):
+        tracker = _init_tracker()
+        orchestrator = _orchestrator()
+
+        first = tracker.publish_status(tmp_path, orchestrator)
+        assert first is not None and "agents" in first
+
+        with patch.object(tracker, "build_status_snapshot", wraps=tracker.build_status_snapshot) as build:
+            assert tracker.publish_status(tmp_path, orchestrator) is None
+            build.assert_not_called()
+
+            tracker.add_agent_answer("agent_a", "answer")
+            delta = tracker.publish_status(tmp_path, orchestrator)
+            build.assert_called_once()
+
+        assert delta["agents"]["agent_a"]["answer_count"] == 1
+        assert "agent_b" not in delta["agents"]
+        assert "elapsed_seconds" in delta["meta"]
+
+    def test_emits_status_delta_events(self, tmp_path):
+        from massgen.logger_config import scoped_log_session
+
+        tracker = _init_tracker()
+        emitter = EventEmitter(tmp_path)
+        received = []
+        emitter.add_listener(received.append)
+
+        with scoped_log_session(tmp_path, emitter):
+            tracker.publish_status(tmp_path, _orchestrator())
+            tracker.add_agent_answer("agent_b", "answer")
+            tracker.publish_status(tmp_path, _orchestrator())
+        emitter.close()
+
+        deltas = [e for e in received if e.event_type == EventType.STATUS_DELTA]
+        assert [e.data["seq"] for e in deltas] == [1, 2]
+        assert deltas[0].data["full"] is True
+        assert deltas[1].data["full"] is False
+
+    def test_status_file_write_is_debounced(self, tmp_path):
+        tracker = _init_tracker()
+        orchestrator = _orchestrator()
+
+        assert tracker.flush_status_file(tmp_path) is False  # Nothing published yet
+        tracker.publish_status(tmp_path, orchestrator)
+        assert tracker.flush_status_file(tmp_path) is True
+        assert not (tmp_path / "status.json.tmp").exists()
+
+        tracker.add_agent_answer("agent_a", "answer")
+        tracker.publish_status(tmp_path, orchestrator)
+        assert tracker.flush_status_file(tmp_path, min_interval=60) is False
+        assert tracker.flush_status_file(tmp_path, min_interval=60, force=True) is True
+
+        status = json.loads((tmp_path / "status.json").read_text())
+        assert status["agents"]["agent_a"]["answer_count"] == 1
+
+    def test_transition_bypasses_debounce(self, tmp_path):
+        tracker = _init_tracker()
+        orchestrator = _orchestrator()
+        tracker.publish_status(tmp_path, orchestrator)
+        assert tracker.flush_status_file(tmp_path, min_interval=60) is True
+
+        tracker.add_agent_answer("agent_a", "answer")
+        tracker.start_final_round("agent_a")
+        tracker.publish_status(tmp_path, orchestrator)
+        assert tracker.flush_status_file(tmp_path, min_interval=60) is True
+        assert json.loads((tmp_path / "status.json").read_text())["coordination"]["phase"] == "presentation"
+
+        # Ordinary changes after the transition are debounced again
+        tracker.add_agent_answer("agent_b", "answer")
+        tracker.publish_status(tmp_path, orchestrator)
+        assert tracker.flush_status_file(tmp_path, min_interval=60) is False
+
+    def test_untracked_changes_mark_status_dirty(self, tmp_path):
+        tracker = _init_tracker()
+        orchestrator = _orchestrator()
+        tracker.publish_status(tmp_path, orchestrator)
+
+        tracker.set_user_prompt("new question")
+        assert tracker.publish_status(tmp_path, orchestrator)["meta"]["question"] == "new question"
+
+        orchestrator.is_orchestrator_timeout = True
+        orchestrator.timeout_reason = "Time limit exceeded"
+        tracker.mark_status_dirty(transition=True)
+        assert tracker.publish_status(tmp_path, orchestrator)["finish_reason"] == "timeout"
+
+
+# =============================================================================
+# Manager Tests
+# =============================================================================
+
+
+class TestManagerLiveStatus:
+    """Tests for SubagentManager consuming pushed status deltas."""
+
+    @pytest.mark.asyncio
+    async def test_live_status_from_deltas(self, tmp_path):
+        from datetime import datetime
+
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="parent",
+            orchestrator_id="orch",
+            parent_agent_configs=[],
+        )
+        config = SubagentConfig.create(task="t", parent_agent_id="parent")
+        manager._subagents[config.id] = SubagentState(config=config, status="running", workspace_path=str(tmp_path), started_at=datetime.now())
+
+        forwarded = []
+
+        async def downstream(event):
+            forwarded.append(event)
+
+        handler = manager._track_status_events(config.id, downstream)
+        full = {"coordination": {"phase": "initial_answer", "completion_percentage": 0}, "costs": {"total_input_tokens": 5}}
+        await handler(MassGenEvent.create(EventType.STATUS_DELTA, seq=1, delta=full, full=True))
+        await handler(MassGenEvent.create(EventType.STATUS_DELTA, seq=2, delta={"coordination": {"completion_percentage": 50}}, full=False))
+
+        status = manager.get_subagent_status(config.id)
+        assert status["phase"] == "initial_answer"
+        assert status["completion_percentage"] == 50
+        assert status["token_usage"]["input_tokens"] == 5
+        assert len(forwarded) == 2
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the structured stream chunk log.
+
+Tests cover:
+- Compact records with interned keys and content offsets
+- Deduplication of repeated payloads
+- Per-type sampling with skipped counts
+- log_stream_chunk routing in the structured and off modes
+"""
+
+import pytest
+
+from massgen import logger_config
+from massgen.logger_config import log_stream_chunk, logger, set_stream_chunk_log_mode
+from massgen.stream_chunk_log import (
+    CONTENT_FILE_NAME,
+    StreamChunkLog,
+    parse_sample_rates,
+    read_stream_chunks,
+)
+
+
+@pytest.fixture
+def restore_chunk_log_mode():
+    yield
+    set_stream_chunk_log_mode("text", sample_rates={})
+    if logger_config._STREAM_CHUNK_LOG is not None:
+        logger_config._STREAM_CHUNK_LOG.close()
+        logger_config._STREAM_CHUNK_LOG = None
+
+
+class TestStreamChunkLog:
+    """Tests for StreamChunkLog records."""
+
+    def test_round_trip(self, tmp_path):
+        chunk_log = StreamChunkLog(tmp_path)
+        chunk_log.record("backend.a", "content", "Hello ", "agent_a")
+        chunk_log.record("backend.a", "content", "world", "agent_a")
+        chunk_log.record("backend.a", "done", None, "agent_a")
+        chunk_log.record("orchestrator", "tool_calls", [{"name": "read_file"}])
+        chunk_log.close()
+
+        chunks = read_stream_chunks(tmp_path)
+        assert [(c["source"], c["agent_id"], c["chunk_type"]) for c in chunks[:3]] == [("backend.a", "agent_a", "content")] * 2 + [("backend.a", "agent_a", "done")]
+        assert [c["content"] for c in chunks] == ["Hello ", "world", None, '[{"name": "read_file"}]']
+
+    def test_repeated_payloads_are_stored_once(self, tmp_path):
+        payload = {"message": "Agent is working on the task " * 4}
+        chunk_log = StreamChunkLog(tmp_path)
+        for _ in range(5):
+            chunk_log.record("orchestrator", "status", payload, "agent_a")
+        chunk_log.close()
+
+        content_size = (tmp_path / CONTENT_FILE_NAME).stat().st_size
+        chunks = read_stream_chunks(tmp_path)
+        assert len(chunks) == 5
+        assert len({c["content"] for c in chunks}) == 1
+        assert content_size == len(chunks[0]["content"].encode("utf-8"))
+
+    def test_sampling(self, tmp_path):
+        chunk_log = StreamChunkLog(tmp_path, sample_rates={"content": 3})
+        for i in range(7):
+            chunk_log.record("backend.a", "content", f"t{i}", "agent_a")
+        chunk_log.record("backend.a", "done", None, "agent_a")
+        chunk_log.close()
+
+        chunks = read_stream_chunks(tmp_path)
+        assert [(c["content"], c["skipped"]) for c in chunks] == [("t2", 2), ("t5", 2), (None, 0)]
+
+    def test_set_log_dir(self, tmp_path):
+        chunk_log = StreamChunkLog(tmp_path / "attempt_1")
+        chunk_log.record("backend.a", "content", "one", "agent_a")
+        chunk_log.set_log_dir(tmp_path / "attempt_2")
+        chunk_log.record("backend.a", "content", "two", "agent_a")
+        chunk_log.close()
+        assert [c["content"] for c in read_stream_chunks(tmp_path / "attempt_1")] == ["one"]
+        assert [c["content"] for c in read_stream_chunks(tmp_path / "attempt_2")] == ["two"]
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("content=10, reasoning=5") == {"content": 10, "reasoning": 5}
+        with pytest.raises(ValueError):
+            parse_sample_rates("content=0")
+
+
+class TestLogStreamChunkModes:
+    """Tests for log_stream_chunk mode routing."""
+
+    def test_structured_mode_keeps_markers_in_main_log(self, tmp_path, restore_chunk_log_mode):
+        messages = []
+        handler_id = logger.add(lambda message: messages.append(message.record["message"]), level="INFO")
+        try:
+            set_stream_chunk_log_mode("structured", log_dir=tmp_path)
+            log_stream_chunk("backend.a", "content", "token", "agent_a")
+            log_stream_chunk("backend.a", "error", "boom", "agent_a")
+            log_stream_chunk("backend.a", "tool_result", {"execution_time": 9.0, "command": "pytest"}, "agent_a")
+            logger_config._STREAM_CHUNK_LOG.flush()
+        finally:
+            logger.remove(handler_id)
+
+        assert [c["chunk_type"] for c in read_stream_chunks(tmp_path)] == ["content"]
+        assert any(m.startswith("[ERROR]") for m in messages)
+        assert any(m.startswith("[SLOW]") for m in messages)
+        assert not any("Stream chunk" in m for m in messages)
+
+    def test_off_mode_drops_chunks(self, tmp_path, restore_chunk_log_mode):
+        set_stream_chunk_log_mode("off", log_dir=tmp_path)
+        log_stream_chunk("backend.a", "content", "token", "agent_a")
+        assert logger_config._STREAM_CHUNK_LOG is None
+        assert read_stream_chunks(tmp_path) == []
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError):
+            set_stream_chunk_log_mode("binary")
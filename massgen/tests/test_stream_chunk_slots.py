@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the slotted StreamChunk and zero-copy chunk forwarding.
+
+Tests cover:
+- StreamChunk has no instance __dict__ and keeps its attribute interface
+- attributed_to() tags unattributed chunks in place and copies otherwise
+- Orchestrator._forward_chunk for StreamChunk and TextStreamChunk inputs
+- SingleAgent forwards content chunks unchanged while accumulating the turn text
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from massgen.backend.base import StreamChunk
+from massgen.chat_agent import SingleAgent
+from massgen.orchestrator import Orchestrator
+from massgen.stream_chunk import ChunkType, TextStreamChunk
+
+
+class TestStreamChunk:
+    """Tests for StreamChunk layout and attribution."""
+
+    def test_slotted_with_attribute_defaults(self):
+        chunk = StreamChunk(type="content", content="hi")
+        assert not hasattr(chunk, "__dict__")
+        assert chunk.tool_calls is None and chunk.display is True
+        assert getattr(chunk, "vote_result", "missing") == "missing"
+        with pytest.raises(AttributeError):
+            chunk.unknown_field = 1
+
+    def test_attributed_to_tags_in_place_or_copies(self):
+        chunk = StreamChunk(type="reasoning", content="think")
+        assert chunk.attributed_to("agent_a") is chunk
+        assert chunk.source == "agent_a"
+        assert chunk.attributed_to("agent_a") is chunk
+
+        copied = chunk.attributed_to("agent_b")
+        assert copied is not chunk
+        assert (copied.source, copied.content, chunk.source) == ("agent_b", "think", "agent_a")
+
+
+class TestChunkForwarding:
+    """Tests for forwarding chunks through the agent and orchestrator."""
+
+    def test_orchestrator_forward_chunk(self):
+        chunk = StreamChunk(type="agent_status", content="working", status="busy")
+        assert Orchestrator._forward_chunk(chunk, "agent_status", "agent_a") is chunk
+
+        typed = TextStreamChunk(type=ChunkType.AGENT_STATUS, content="working", status="busy", timestamp=1.0)
+        forwarded = Orchestrator._forward_chunk(typed, "agent_status", "agent_a")
+        assert isinstance(forwarded, StreamChunk)
+        assert (forwarded.type, forwarded.content, forwarded.status, forwarded.source) == ("agent_status", "working", "busy", "agent_a")
+
+    @pytest.mark.asyncio
+    async def test_single_agent_forwards_content_chunks(self):
+        chunks = [StreamChunk(type="content", content="Hello, "), StreamChunk(type="content", content="world")]
+
+        async def backend_stream():
+            for chunk in chunks:
+                yield chunk
+            yield StreamChunk(type="done")
+
+        agent = SingleAgent(backend=MagicMock(), agent_id="agent_a")
+        received = [chunk async for chunk in agent._process_stream(backend_stream())]
+        assert received[:2] == chunks and all(a is b for a, b in zip(received, chunks))
+        assert agent._current_turn_content == "Hello, world"
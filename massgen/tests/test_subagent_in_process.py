@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for in-process subagent execution.
+
+Tests cover:
+- execution_mode parsing and validation on SubagentOrchestratorConfig
+- Task-scoped log directory and event emitter routing
+- Running a child orchestrator in-process with direct event delivery
+- SubagentManager routing between subprocess and in-process modes
+- execute_with_streaming leaving the caller's config untouched
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from massgen.subagent.models import SubagentOrchestratorConfig, SubagentResult
+
+# =============================================================================
+# Config Tests
+# =============================================================================
+
+
+class TestExecutionModeConfig:
+    """Tests for SubagentOrchestratorConfig.execution_mode."""
+
+    def test_defaults_to_subprocess(self):
+        config = SubagentOrchestratorConfig.from_dict({"enabled": True})
+        assert config.execution_mode == "subprocess"
+        assert "execution_mode" not in config.to_dict()
+
+    def test_in_process_round_trips(self):
+        config = SubagentOrchestratorConfig.from_dict({"execution_mode": "in_process"})
+        assert config.execution_mode == "in_process"
+        assert SubagentOrchestratorConfig.from_dict(config.to_dict()).execution_mode == "in_process"
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError, match="execution_mode"):
+            SubagentOrchestratorConfig(execution_mode="thread")
+
+    def test_config_validator_rejects_invalid_mode(self):
+        from massgen.config_validator import ConfigValidator
+
+        config = {
+            "agents": [{"id": "a", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+            "orchestrator": {
+                "coordination": {"subagent_orchestrator": {"execution_mode": "fork"}},
+            },
+        }
+        result = ConfigValidator().validate_config(config)
+        assert any("execution_mode" in error.message for error in result.errors)
+
+
+# =============================================================================
+# Scoped Logging Tests
+# =============================================================================
+
+
+class TestScopedLogSession:
+    """Tests for task-scoped log directory and event emitter routing."""
+
+    def test_scoped_dirs_and_emitter(self, tmp_path):
+        from massgen.events import EventEmitter
+        from massgen.logger_config import (
+            get_event_emitter,
+            get_log_session_dir,
+            get_log_session_dir_base,
+            get_log_session_root,
+            scoped_log_session,
+        )
+
+        global_dir = get_log_session_dir()
+        child_dir = tmp_path / "log_x" / "turn_1" / "attempt_1"
+        emitter = EventEmitter(child_dir)
+
+        with scoped_log_session(child_dir, emitter):
+            assert get_log_session_dir() == child_dir
+            assert get_log_session_dir_base() == child_dir.parent
+            assert get_log_session_root() == child_dir.parent.parent
+            assert get_event_emitter() is emitter
+
+        assert get_log_session_dir() == global_dir
+        assert get_event_emitter() is not emitter
+        emitter.close()
+
+    @pytest.mark.asyncio
+    async def test_scope_does_not_leak_to_sibling_tasks(self, tmp_path):
+        from massgen.logger_config import get_log_session_dir, scoped_log_session
+
+        child_dir = tmp_path / "child" / "turn_1" / "attempt_1"
+        entered = asyncio.Event()
+        release = asyncio.Event()
+        seen = {}
+
+        async def child():
+            with scoped_log_session(child_dir):
+                entered.set()
+                await release.wait()
+                seen["child"] = get_log_session_dir()
+
+        async def sibling():
+            await entered.wait()
+            seen["sibling"] = get_log_session_dir()
+            release.set()
+
+        await asyncio.gather(child(), sibling())
+        assert seen["child"] == child_dir
+        assert seen["sibling"] != child_dir
+
+
+# =============================================================================
+# In-Process Runner Tests
+# =============================================================================
+
+
+class TestRunSubagentInProcess:
+    """Tests for run_subagent_in_process with a mock-backed orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_runs_child_and_streams_events(self, tmp_path, mock_orchestrator):
+        from massgen.subagent.in_process import run_subagent_in_process
+
+        def factory(subagent_id, subagent_config):
+            orchestrator = mock_orchestrator(num_agents=1)
+            orchestrator.config.skip_voting = True
+            orchestrator.config.skip_final_presentation = True
+            agent = next(iter(orchestrator.agents.values()))
+            agent.backend.tool_call_responses = [
+                [{"name": "new_answer", "arguments": {"content": "in-process answer"}}],
+            ]
+            agent.backend.responses = ["working"]
+            return orchestrator
+
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        answer_file = tmp_path / "answer.txt"
+        result = await run_subagent_in_process(
+            subagent_id="sub_test",
+            subagent_config={},
+            task="Do the thing",
+            workspace=tmp_path,
+            answer_file=answer_file,
+            on_event=on_event,
+            orchestrator_factory=factory,
+        )
+
+        assert "in-process answer" in result.answer
+        assert answer_file.read_text() == result.answer
+        log_dir = Path(result.log_dir)
+        assert log_dir.is_relative_to(tmp_path / ".massgen" / "massgen_logs")
+        assert log_dir.parent.name == "turn_1"
+        assert (log_dir / "events.jsonl").exists()
+        assert events, "expected events to be delivered via the direct callback"
+
+
+# =============================================================================
+# Manager Routing Tests
+# =============================================================================
+
+
+class TestManagerExecutionModeRouting:
+    """Tests for SubagentManager dispatch between execution modes."""
+
+    def _make_manager(self, tmp_path, execution_mode):
+        from massgen.subagent.manager import SubagentManager
+
+        return SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="parent",
+            orchestrator_id="orch",
+            parent_agent_configs=[{"id": "a", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+            subagent_orchestrator_config=SubagentOrchestratorConfig(execution_mode=execution_mode),
+        )
+
+    @pytest.mark.asyncio
+    async def test_in_process_mode_skips_subprocess(self, tmp_path):
+        from massgen.subagent.models import SubagentConfig
+
+        manager = self._make_manager(tmp_path, "in_process")
+        config = SubagentConfig.create(task="t", parent_agent_id="parent")
+        workspace = manager._create_workspace(config.id)
+        (workspace / "CONTEXT.md").write_text("context")
+
+        expected = SubagentResult.create_success(subagent_id=config.id, answer="ok", workspace_path=str(workspace), execution_time_seconds=0.1)
+        with (
+            patch.object(manager, "_execute_in_process", AsyncMock(return_value=expected)) as in_proc,
+            patch.object(manager, "_execute_with_orchestrator", AsyncMock()) as subproc,
+        ):
+            result = await manager._execute_subagent(config, workspace)
+
+        assert result is expected
+        in_proc.assert_awaited_once()
+        subproc.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_subprocess_mode_is_default(self, tmp_path):
+        from massgen.subagent.models import SubagentConfig
+
+        manager = self._make_manager(tmp_path, "subprocess")
+        config = SubagentConfig.create(task="t", parent_agent_id="parent")
+        workspace = manager._create_workspace(config.id)
+
+        expected = SubagentResult.create_success(subagent_id=config.id, answer="ok", workspace_path=str(workspace), execution_time_seconds=0.1)
+        with (
+            patch.object(manager, "_execute_in_process", AsyncMock()) as in_proc,
+            patch.object(manager, "_execute_with_orchestrator", AsyncMock(return_value=expected)) as subproc,
+        ):
+            await manager._execute_subagent(config, workspace)
+
+        subproc.assert_awaited_once()
+        in_proc.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_streaming_refine_does_not_leak_into_caller_config(self, tmp_path):
+        from massgen.subagent.models import SubagentConfig
+
+        manager = self._make_manager(tmp_path, "in_process")
+        config = SubagentConfig.create(task="t", parent_agent_id="parent")
+        config.metadata = {"source": "caller"}
+        workspace = manager._create_workspace(config.id)
+        (workspace / "CONTEXT.md").write_text("context")
+
+        expected = SubagentResult.create_success(subagent_id=config.id, answer="ok", workspace_path=str(workspace), execution_time_seconds=0.1)
+        with patch.object(manager, "_execute_in_process", AsyncMock(return_value=expected)) as in_proc:
+            await manager.execute_with_streaming(config, on_event=AsyncMock(), refine=False)
+
+        assert in_proc.await_args.args[0].metadata == {"source": "caller", "refine": False}
+        assert config.metadata == {"source": "caller"}
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the pre-forked subagent worker pool (zygote).
+
+Tests cover:
+- Spawning tasks in forked workers with subprocess-compatible stdout/stderr
+- Worker recycling after max_tasks_per_worker tasks
+- Environment, log handlers and event emitter not leaking between tasks on one worker
+- Tasks seeing the parent's environment at spawn time, not at fork time
+- Terminating a running task and replacing the worker
+- SubagentManager routing subprocess spawns through the pool
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from massgen.subagent.models import SubagentOrchestratorConfig
+from massgen.subagent.zygote import ZygotePool, zygote_supported
+
+pytestmark = pytest.mark.skipif(not zygote_supported(), reason="zygote requires os.fork and Unix sockets")
+
+ENTRY_POINT = "massgen.tests.test_subagent_zygote:fake_massgen_main"
+
+
+def fake_massgen_main():
+    """Stand-in for ``massgen.cli:cli_main`` run inside zygote workers."""
+    args = sys.argv[1:]
+    if args and args[0] == "sleep":
+        time.sleep(60)
+    if args and args[0] == "fail":
+        print("boom", file=sys.stderr)
+        sys.exit(3)
+    if args and args[0] == "state":
+        from loguru import logger
+
+        from massgen.events import get_event_emitter
+        from massgen.logger_config import setup_logging
+
+        state = {
+            "env": {name: os.environ.get(name) for name in ("ZYGOTE_TASK_ONE", "ZYGOTE_TASK_TWO")},
+            "handlers": len(logger._core.handlers),
+            "emitter": get_event_emitter() is not None,
+            "pid": os.getpid(),
+        }
+        # Leave handlers and an event emitter behind, as a real massgen run does
+        setup_logging()
+        print(json.dumps(state))
+        return
+    print(json.dumps({"args": args, "cwd": os.getcwd(), "pid": os.getpid()}))
+
+
+def _make_pool(pool_size=1, max_tasks_per_worker=4):
+    return ZygotePool(
+        pool_size=pool_size,
+        max_tasks_per_worker=max_tasks_per_worker,
+        entry_point=ENTRY_POINT,
+        preload_modules=("massgen.tests.test_subagent_zygote",),
+    )
+
+
+# =============================================================================
+# Pool Tests
+# =============================================================================
+
+
+class TestZygotePool:
+    """Tests for ZygotePool and ZygoteProcess."""
+
+    @pytest.mark.asyncio
+    async def test_spawn_runs_task_in_worker(self, tmp_path):
+        pool = _make_pool()
+        try:
+            process = await pool.spawn(["--config", "x.yaml", "task"], cwd=str(tmp_path))
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+        finally:
+            await pool.shutdown()
+
+        assert process.returncode == 0
+        output = json.loads(stdout.decode().strip())
+        assert output["args"] == ["--config", "x.yaml", "task"]
+        assert os.path.realpath(output["cwd"]) == os.path.realpath(tmp_path)
+        assert output["pid"] == process.pid
+        assert stderr == b""
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_and_stderr(self, tmp_path):
+        pool = _make_pool()
+        try:
+            process = await pool.spawn(["fail"], cwd=str(tmp_path))
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+        finally:
+            await pool.shutdown()
+
+        assert process.returncode == 3
+        assert stdout == b""
+        assert b"boom" in stderr
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_tasks(self, tmp_path):
+        pool = _make_pool(pool_size=1, max_tasks_per_worker=2)
+        pids = []
+        try:
+            for i in range(3):
+                process = await pool.spawn([f"task{i}"], cwd=str(tmp_path))
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=60)
+                pids.append(json.loads(stdout.decode())["pid"])
+        finally:
+            await pool.shutdown()
+
+        assert pids[0] == pids[1]
+        assert pids[2] != pids[0]
+
+    @pytest.mark.asyncio
+    async def test_task_state_does_not_leak_to_next_task(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MASSGEN_LOG_BASE_DIR", str(tmp_path / "logs"))
+        pool = _make_pool(pool_size=1)
+        states = []
+        try:
+            for env in ({"ZYGOTE_TASK_ONE": "1"}, {"ZYGOTE_TASK_TWO": "2"}):
+                process = await pool.spawn(["state"], cwd=str(tmp_path), env={**os.environ, **env})
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+                assert process.returncode == 0, stderr
+                states.append(json.loads(stdout.decode().strip().splitlines()[-1]))
+        finally:
+            await pool.shutdown()
+
+        first, second = states
+        assert first["pid"] == second["pid"]
+        assert first["env"] == {"ZYGOTE_TASK_ONE": "1", "ZYGOTE_TASK_TWO": None}
+        assert second["env"] == {"ZYGOTE_TASK_ONE": None, "ZYGOTE_TASK_TWO": "2"}
+        assert (second["handlers"], second["emitter"]) == (0, False)
+
+    @pytest.mark.asyncio
+    async def test_task_gets_environment_set_after_fork(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MASSGEN_LOG_BASE_DIR", str(tmp_path / "logs"))
+        monkeypatch.setenv("ZYGOTE_TASK_TWO", "stale")
+        pool = _make_pool(pool_size=1)
+        try:
+            await pool.start()
+            # Changed after the worker was forked
+            monkeypatch.setenv("ZYGOTE_TASK_ONE", "fresh")
+            monkeypatch.delenv("ZYGOTE_TASK_TWO")
+            process = await pool.spawn(["state"], cwd=str(tmp_path), env=dict(os.environ))
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+        finally:
+            await pool.shutdown()
+
+        assert process.returncode == 0, stderr
+        state = json.loads(stdout.decode().strip().splitlines()[-1])
+        assert state["env"] == {"ZYGOTE_TASK_ONE": "fresh", "ZYGOTE_TASK_TWO": None}
+
+    @pytest.mark.asyncio
+    async def test_terminate_replaces_worker(self, tmp_path):
+        pool = _make_pool(pool_size=1)
+        try:
+            process = await pool.spawn(["sleep"], cwd=str(tmp_path))
+            await asyncio.sleep(0.2)
+            process.terminate()
+            returncode = await asyncio.wait_for(process.wait(), timeout=30)
+
+            follow_up = await pool.spawn(["after"], cwd=str(tmp_path))
+            stdout, _ = await asyncio.wait_for(follow_up.communicate(), timeout=60)
+        finally:
+            await pool.shutdown()
+
+        assert returncode < 0
+        assert json.loads(stdout.decode())["args"] == ["after"]
+        assert follow_up.pid != process.pid
+
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            ZygotePool(pool_size=0)
+        with pytest.raises(ValueError):
+            ZygotePool(max_tasks_per_worker=0)
+
+
+# =============================================================================
+# Manager Integration Tests
+# =============================================================================
+
+
+class TestManagerZygoteRouting:
+    """Tests for SubagentManager spawning through the zygote pool."""
+
+    def _make_manager(self, tmp_path, **config_kwargs):
+        from massgen.subagent.manager import SubagentManager
+
+        return SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="parent",
+            orchestrator_id="orch",
+            parent_agent_configs=[{"id": "a", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+            max_concurrent=2,
+            subagent_orchestrator_config=SubagentOrchestratorConfig(**config_kwargs),
+        )
+
+    def test_config_round_trip(self):
+        config = SubagentOrchestratorConfig.from_dict({"use_zygote": True, "zygote_pool_size": 3, "zygote_max_tasks_per_worker": 2})
+        assert config.use_zygote is True
+        restored = SubagentOrchestratorConfig.from_dict(config.to_dict())
+        assert (restored.zygote_pool_size, restored.zygote_max_tasks_per_worker) == (3, 2)
+
+    def test_config_rejects_invalid_pool_size(self):
+        with pytest.raises(ValueError, match="zygote_pool_size"):
+            SubagentOrchestratorConfig(use_zygote=True, zygote_pool_size=0)
+
+    @pytest.mark.asyncio
+    async def test_spawn_uses_pool_when_enabled(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ZYGOTE_PARENT_VAR", "parent")
+        manager = self._make_manager(tmp_path, use_zygote=True)
+        sentinel = object()
+        pool = AsyncMock()
+        pool.spawn.return_value = sentinel
+        with (
+            patch.object(manager, "_get_zygote_pool", return_value=pool),
+            patch("asyncio.create_subprocess_exec", AsyncMock()) as create_exec,
+        ):
+            process = await manager._spawn_massgen_process(["--automation", "task"], tmp_path, env_overrides={"ZYGOTE_TASK_ONE": "1"})
+
+        assert process is sentinel
+        pool.spawn.assert_awaited_once()
+        assert pool.spawn.await_args.args == (["--automation", "task"],)
+        assert pool.spawn.await_args.kwargs["cwd"] == str(tmp_path)
+        env = pool.spawn.await_args.kwargs["env"]
+        assert (env["ZYGOTE_PARENT_VAR"], env["ZYGOTE_TASK_ONE"]) == ("parent", "1")
+        create_exec.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_spawn_falls_back_to_subprocess(self, tmp_path):
+        manager = self._make_manager(tmp_path, use_zygote=True)
+        pool = AsyncMock()
+        pool.spawn.side_effect = RuntimeError("zygote down")
+        with (
+            patch.object(manager, "_get_zygote_pool", return_value=pool),
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value="proc")) as create_exec,
+        ):
+            process = await manager._spawn_massgen_process(["task"], tmp_path)
+
+        assert process == "proc"
+        assert list(create_exec.await_args.args) == ["uv", "run", "massgen", "task"]
+
+    @pytest.mark.asyncio
+    async def test_spawn_defaults_to_subprocess(self, tmp_path):
+        manager = self._make_manager(tmp_path)
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value="proc")) as create_exec:
+            await manager._spawn_massgen_process(["task"], tmp_path)
+
+        create_exec.assert_awaited_once()
+        assert manager._zygote_pool is None
+
+    def test_config_validator_rejects_invalid_pool_size(self):
+        from massgen.config_validator import ConfigValidator
+
+        config = {
+            "agents": [{"id": "a", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+            "orchestrator": {
+                "coordination": {"subagent_orchestrator": {"use_zygote": True, "zygote_pool_size": 0}},
+            },
+        }
+        result = ConfigValidator().validate_config(config)
+        assert any("zygote_pool_size" in error.message for error in result.errors)
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TaskPlan's incremental ready queue and append-only plan persistence.
+
+Tests cover:
+- Ready/blocked sets maintained across status transitions and direct edits
+- Only directly edited tasks re-indexed between queries
+- Incremental cycle checks
+- Change log entries drained from the plan
+- PlanFileStore snapshot, append, replay and compaction
+- Flushing pending changes at round end and on shutdown
+- Compaction from another process never drops concurrent appends
+- Planning MCP server save/load through the change log
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from massgen.mcp_tools.planning.plan_store import (
+    PlanFileStore,
+    change_log_path,
+    compact_plan_log,
+    flush_all,
+    load_plan_data,
+)
+from massgen.mcp_tools.planning.planning_dataclasses import TaskPlan
+
+
+def _diamond_plan() -> TaskPlan:
+    plan = TaskPlan(agent_id="test:agent")
+    plan.add_task("Root", task_id="root")
+    plan.add_task("Left", task_id="left", depends_on=["root"])
+    plan.add_task("Right", task_id="right", depends_on=["root"])
+    plan.add_task("Join", task_id="join", depends_on=["left", "right"])
+    return plan
+
+
+class TestReadyQueue:
+    """Tests for the reverse-dependency index and unmet counters."""
+
+    def test_status_transitions_update_ready_set(self):
+        plan = _diamond_plan()
+        assert [t.id for t in plan.get_ready_tasks()] == ["root"]
+        assert [t.id for t in plan.get_blocked_tasks()] == ["left", "right", "join"]
+
+        result = plan.update_task_status("root", "completed")
+        assert result["newly_ready_tasks"] and [t["id"] for t in result["newly_ready_tasks"]] == ["left", "right"]
+
+        plan.update_task_status("left", "verified")
+        assert [t.id for t in plan.get_ready_tasks()] == ["right"]
+        assert not plan.can_start_task("join")
+
+        plan.update_task_status("right", "completed")
+        assert plan.can_start_task("join")
+
+        # Reopening a dependency blocks its dependents again
+        plan.update_task_status("right", "in_progress")
+        assert [t.id for t in plan.get_blocked_tasks()] == ["join"]
+
+    def test_direct_edits_keep_indexes_current(self):
+        plan = _diamond_plan()
+        plan.get_task("root").status = "completed"
+        assert {t.id for t in plan.get_ready_tasks()} == {"left", "right"}
+
+        plan.get_task("left").dependencies.append("right")
+        assert [t.id for t in plan.get_ready_tasks()] == ["right"]
+
+        plan.get_task("left").dependencies = ["root"]
+        assert {t.id for t in plan.get_ready_tasks()} == {"left", "right"}
+
+    def test_only_edited_tasks_are_reindexed(self):
+        plan = _diamond_plan()
+        plan.get_ready_tasks()
+        assert not plan._dirty
+
+        plan.tasks[0].status = "completed"
+        assert plan._dirty == {"root"}
+        assert {t.id for t in plan.get_ready_tasks()} == {"left", "right"}
+        assert not plan._dirty
+
+        # Deleted tasks stop reporting edits to the plan
+        task = plan.get_task("join")
+        plan.delete_task("join")
+        task.status = "completed"
+        assert not plan._dirty
+
+    def test_direct_edits_are_recorded_as_changes(self):
+        plan = _diamond_plan()
+        plan.drain_changes()
+        plan.get_task("root").status = "completed"
+        plan.get_task("join").dependencies.remove("right")
+
+        changes = plan.drain_changes()
+        assert [(c["op"], c["task"]["id"]) for c in changes] == [("upsert", "root"), ("upsert", "join")]
+        assert changes[1]["task"]["dependencies"] == ["left"]
+        assert plan.drain_changes() == []
+
+    def test_delete_task_updates_indexes(self):
+        plan = _diamond_plan()
+        with pytest.raises(ValueError):
+            plan.delete_task("right")
+
+        plan.delete_task("join")
+        plan.delete_task("right")
+        plan.update_task_status("root", "completed")
+        assert [t.id for t in plan.get_ready_tasks()] == ["left"]
+        assert plan.get_blocked_tasks() == []
+
+    def test_cycle_rejected(self):
+        plan = _diamond_plan()
+        with pytest.raises(ValueError):
+            plan.add_task("Self", task_id="loop", depends_on=["loop"])
+
+        plan.get_task("root").dependencies = ["join"]
+        with pytest.raises(ValueError):
+            plan.add_task("Tail", task_id="tail", depends_on=["join"])
+
+    def test_drain_changes_collapses_updates(self):
+        plan = _diamond_plan()
+        plan.drain_changes()
+
+        plan.update_task_status("root", "in_progress")
+        plan.update_task_status("root", "completed")
+        plan.delete_task("join")
+        changes = plan.drain_changes()
+
+        assert [c["op"] for c in changes] == ["upsert", "delete"]
+        assert changes[0]["task"]["status"] == "completed"
+        assert plan.drain_changes() == []
+
+
+class TestPlanFileStore:
+    """Tests for snapshot + change log persistence."""
+
+    def test_append_and_replay(self, tmp_path):
+        plan_file = tmp_path / "tasks" / "plan.json"
+        store = PlanFileStore(plan_file, compact_delay=60)
+        plan = _diamond_plan()
+        store.save(plan)
+        assert not change_log_path(plan_file).exists()
+
+        plan.update_task_status("root", "completed")
+        plan.add_task("Extra", task_id="extra", after_task_id="root")
+        store.save(plan)
+
+        # The snapshot is untouched until compaction; readers replay the log
+        assert json.loads(plan_file.read_text())["tasks"][0]["status"] == "pending"
+        data = load_plan_data(plan_file)
+        assert [t["id"] for t in data["tasks"]] == ["root", "extra", "left", "right", "join"]
+        assert data["tasks"][0]["status"] == "completed"
+
+        store.compact()
+        assert not change_log_path(plan_file).exists()
+        assert json.loads(plan_file.read_text()) == data
+
+    def test_compacts_at_threshold(self, tmp_path):
+        plan_file = tmp_path / "plan.json"
+        store = PlanFileStore(plan_file, compact_every=2, compact_delay=60)
+        plan = _diamond_plan()
+        store.save(plan)
+
+        plan.update_task_status("root", "in_progress")
+        store.save(plan)
+        assert change_log_path(plan_file).exists()
+
+        plan.update_task_status("root", "completed")
+        store.save(plan)
+        assert not change_log_path(plan_file).exists()
+        assert json.loads(plan_file.read_text())["tasks"][0]["status"] == "completed"
+
+    def test_torn_log_line_is_skipped(self, tmp_path):
+        plan_file = tmp_path / "plan.json"
+        store = PlanFileStore(plan_file, compact_delay=60)
+        plan = _diamond_plan()
+        store.save(plan)
+        plan.update_task_status("root", "completed")
+        store.save(plan)
+
+        with open(change_log_path(plan_file), "a") as f:
+            f.write('{"op": "upsert", "task": {"id"')
+        assert load_plan_data(plan_file)["tasks"][0]["status"] == "completed"
+
+    def test_compact_plan_log_folds_pending_changes(self, tmp_path):
+        plan_file = tmp_path / "tasks" / "plan.json"
+        store = PlanFileStore(plan_file, compact_delay=60)
+        plan = _diamond_plan()
+        store.save(plan)
+        assert compact_plan_log(plan_file) is False
+
+        plan.update_task_status("root", "completed")
+        store.save(plan)
+        assert compact_plan_log(plan_file) is True
+        assert not change_log_path(plan_file).exists()
+        assert json.loads(plan_file.read_text())["tasks"][0]["status"] == "completed"
+
+        # The store keeps appending after an external compaction
+        plan.update_task_status("left", "completed")
+        store.save(plan)
+        store.flush()
+        assert not change_log_path(plan_file).exists()
+        assert json.loads(plan_file.read_text())["tasks"][1]["status"] == "completed"
+
+    def test_flush_all_compacts_live_stores(self, tmp_path):
+        plan_file = tmp_path / "plan.json"
+        store = PlanFileStore(plan_file, compact_delay=60)
+        plan = _diamond_plan()
+        store.save(plan)
+        plan.update_task_status("root", "completed")
+        store.save(plan)
+        assert change_log_path(plan_file).exists()
+
+        flush_all()
+        assert not change_log_path(plan_file).exists()
+        assert json.loads(plan_file.read_text())["tasks"][0]["status"] == "completed"
+
+
+def _append_statuses(plan_file, count):
+    store = PlanFileStore(plan_file, compact_every=10**6, compact_delay=60)
+    plan = TaskPlan(agent_id="test:writer")
+    for i in range(count):
+        plan.add_task(f"Task {i}", task_id=f"t{i}")
+    store.save(plan)
+    for i in range(count):
+        plan.update_task_status(f"t{i}", "completed")
+        store.save(plan)
+    store._cancel_timer()
+
+
+class TestPlanLogLocking:
+    """Tests for compaction racing appends from another process."""
+
+    def test_compaction_keeps_concurrent_appends(self, tmp_path):
+        plan_file = tmp_path / "tasks" / "plan.json"
+        count = 200
+        _append_statuses(plan_file, 0)
+
+        writer = multiprocessing.get_context("spawn").Process(target=_append_statuses, args=(plan_file, count))
+        writer.start()
+        while writer.is_alive():
+            compact_plan_log(plan_file)
+        writer.join()
+        assert writer.exitcode == 0
+
+        data = load_plan_data(plan_file)
+        assert len(data["tasks"]) == count
+        assert all(t["status"] == "completed" for t in data["tasks"])
+
+
+class TestPlanningServerPersistence:
+    """Tests for the planning MCP server's use of the change log."""
+
+    def test_server_round_trip(self, tmp_path):
+        from massgen.mcp_tools.planning import _planning_mcp_server as server
+
+        original_workspace = server._workspace_path
+        original_plans = server._task_plans.copy()
+        try:
+            server._workspace_path = tmp_path
+            server._task_plans.clear()
+
+            plan = server._get_or_create_plan("agent_a", "test")
+            plan.add_task("Root", task_id="root")
+            plan.add_task("Child", task_id="child", depends_on=["root"])
+            server._save_plan_to_filesystem(plan)
+            plan.update_task_status("root", "completed")
+            server._save_plan_to_filesystem(plan)
+            assert change_log_path(tmp_path / "tasks" / "plan.json").exists()
+
+            server._flush_plan_stores()
+            assert not change_log_path(tmp_path / "tasks" / "plan.json").exists()
+
+            server._task_plans.clear()
+            loaded = server._get_or_create_plan("agent_a", "test")
+            assert loaded.get_task("root").status == "completed"
+            assert [t.id for t in loaded.get_ready_tasks()] == ["child"]
+        finally:
+            for store in server._plan_stores.values():
+                store.clear()
+            server._plan_stores.clear()
+            server._workspace_path = original_workspace
+            server._task_plans.clear()
+            server._task_plans.update(original_plans)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the chunked TextBuffer used to accumulate streamed deltas.
+
+Tests cover:
+- Appending, lazy join, length and comparisons
+- tail()/endswith() without joining, before and after spilling
+- Spill-to-file keeps the full content with bounded in-memory parts
+- Streaming buffer mixin and execution trace accumulation through TextBuffer
+"""
+
+from massgen.backend._streaming_buffer_mixin import StreamingBufferMixin
+from massgen.execution_trace import ExecutionTraceWriter
+from massgen.utils.text_buffer import TextBuffer
+
+
+class TestTextBuffer:
+    """Tests for TextBuffer."""
+
+    def test_append_and_join(self):
+        buffer = TextBuffer()
+        assert not buffer and buffer == ""
+        for delta in ("Hello", "", None, ", ", "world"):
+            buffer.append(delta)
+        buffer += "!"
+        assert len(buffer) == 13
+        assert buffer == "Hello, world!"
+        assert str(buffer) == "Hello, world!"
+        assert "world" in buffer
+        assert buffer.endswith("d!") and not buffer.endswith("?")
+        assert buffer.tail(100) == "Hello, world!"
+
+    def test_spill_to_file(self):
+        buffer = TextBuffer(spill_threshold=10)
+        deltas = [f"delta {i};" for i in range(100)]
+        for delta in deltas:
+            buffer.append(delta)
+        assert buffer.spilled
+        assert len(buffer._parts) <= 2
+        expected = "".join(deltas)
+        assert buffer.getvalue() == expected
+        assert buffer.tail(25) == expected[-25:]
+        assert buffer.endswith("delta 99;")
+
+        buffer.append("tail")
+        assert buffer.getvalue() == expected + "tail"
+        buffer.clear()
+        assert not buffer.spilled and buffer == ""
+
+    def test_tail_reads_file_when_needed(self):
+        buffer = TextBuffer(spill_threshold=5000)
+        text = "".join(chr(ord("a") + i % 26) for i in range(12000))
+        buffer.append(text[:6000])
+        buffer.append(text[6000:])
+        assert buffer.tail(9000) == text[-9000:]
+
+
+class TestStreamingAccumulation:
+    """Tests for the accumulation sites that use TextBuffer."""
+
+    def test_streaming_buffer_mixin(self):
+        obj = StreamingBufferMixin()
+        obj._append_to_streaming_buffer("answer")
+        obj._append_reasoning_to_buffer("think")
+        obj._append_reasoning_to_buffer("ing")
+        assert obj._streaming_buffer == "answer\n\n[Reasoning]\nthinking"
+        assert obj._get_streaming_buffer() == obj._streaming_buffer
+
+        obj._streaming_buffer = "replaced"
+        obj._append_to_streaming_buffer(" text")
+        assert obj._get_streaming_buffer() == "replaced text"
+
+    def test_execution_trace_entries_hold_strings(self):
+        writer = ExecutionTraceWriter(agent_id="agent_a", model="m")
+        for token in ("The ", "answer"):
+            writer.add_reasoning(token)
+        for token in ("Out", "put"):
+            writer.add_content(token)
+        writer.add_tool_call(name="Read", args={})
+        writer.add_content("!")
+        writer.to_markdown()  # closes the open content block
+
+        assert [entry.content.get("reasoning", entry.content.get("text")) for entry in writer.entries[:2]] == ["The answer", "Output!"]
@@ -6,6 +6,7 @@ Provides unified token estimation and cost calculation for all backends.
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Union
 
@@ -334,54 +335,81 @@ class TokenCostCalculator:
         },
     }
 
+    # LiteLLM pricing database, shared by all calculators in the process
+    _litellm_cache: Optional[Dict] = None
+    _litellm_cache_time: float = 0.0
+    _litellm_failed_at: Optional[float] = None
+    _litellm_lock = threading.Lock()
+    # tiktoken encoder, loaded once per process
+    _shared_tiktoken_encoder = None
+    _tiktoken_attempted = False
+    _tiktoken_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the calculator with optional tiktoken for accurate estimation."""
         self.tiktoken_encoder = None
         self._try_init_tiktoken()
-        self._litellm_cache = None  # Cache for LiteLLM pricing database
-        self._litellm_cache_time = None  # When cache was last refreshed
 
     def _try_init_tiktoken(self):
-        """Try to initialize tiktoken encoder for more accurate token counting."""
-        try:
-            import tiktoken
+        """Try to initialize tiktoken encoder for more accurate token counting.
 
-            # Use cl100k_base encoder (GPT-4/GPT-3.5-turbo tokenizer)
-            self.tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
-            logger.debug("Tiktoken encoder initialized for accurate token counting")
-        except ImportError:
-            logger.debug("Tiktoken not available, using simple estimation")
-        except Exception as e:
-            logger.warning(f"Failed to initialize tiktoken: {e}")
+        The encoder is loaded once per process; a failed load (e.g. no network
+        to download the encoding) is not retried for every new calculator.
+        """
+        cls = type(self)
+        with cls._tiktoken_lock:
+            if not cls._tiktoken_attempted:
+                cls._tiktoken_attempted = True
+                try:
+                    import tiktoken
+
+                    # Use cl100k_base encoder (GPT-4/GPT-3.5-turbo tokenizer)
+                    cls._shared_tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
+                    logger.debug("Tiktoken encoder initialized for accurate token counting")
+                except ImportError:
+                    logger.debug("Tiktoken not available, using simple estimation")
+                except Exception as e:
+                    logger.warning(f"Failed to initialize tiktoken: {e}")
+        self.tiktoken_encoder = cls._shared_tiktoken_encoder
 
     def _fetch_litellm_pricing(self) -> Optional[Dict]:
         """Fetch pricing database from LiteLLM (cached for 1 hour).
 
+        The cache is process-wide: every backend owns a calculator, and a batch
+        run creates fresh backends per question, so a per-instance cache meant a
+        blocking download per backend. Failed fetches are also remembered for a
+        few minutes so an offline process doesn't wait on the timeout every time.
+
         Returns:
             Dictionary of model pricing data or None if fetch fails
         """
         import time
 
-        # Check cache (1 hour expiry)
-        if self._litellm_cache is not None and self._litellm_cache_time is not None:
-            if time.time() - self._litellm_cache_time < 3600:
-                return self._litellm_cache
-
-        try:
-            import requests
-
-            url = "https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-
-            self._litellm_cache = response.json()
-            self._litellm_cache_time = time.time()
-            logger.debug("Fetched LiteLLM pricing database (500+ models)")
-            return self._litellm_cache
-
-        except Exception as e:
-            logger.debug(f"Failed to fetch LiteLLM pricing database: {e}")
-            return None
+        cls = type(self)
+        with cls._litellm_lock:
+            now = time.time()
+            if cls._litellm_cache is not None and now - cls._litellm_cache_time < 3600:
+                return cls._litellm_cache
+            if cls._litellm_failed_at is not None and now - cls._litellm_failed_at < 300:
+                return None
+
+            try:
+                import requests
+
+                url = "https://raw.githubusercontent.com/BerriAI/litellm/main/model_prices_and_context_window.json"
+                response = requests.get(url, timeout=5)
+                response.raise_for_status()
+
+                cls._litellm_cache = response.json()
+                cls._litellm_cache_time = time.time()
+                cls._litellm_failed_at = None
+                logger.debug("Fetched LiteLLM pricing database (500+ models)")
+                return cls._litellm_cache
+
+            except Exception as e:
+                cls._litellm_failed_at = time.time()
+                logger.debug(f"Failed to fetch LiteLLM pricing database: {e}")
+                return None
 
     def estimate_tokens(self, text: Union[str, List[Dict[str, Any]]], method: str = "auto") -> int:
         """
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Append-only text buffer for accumulating streamed deltas.
+
+``text += delta`` on an attribute (or on a local that is also stored
+elsewhere) copies the whole accumulated string on every delta, which is
+quadratic over long reasoning streams. ``TextBuffer`` keeps the deltas as a
+list of parts with a cached length and joins them only when the value is
+read; the join result replaces the parts, so repeated reads stay cheap.
+
+Once the in-memory parts exceed ``spill_threshold`` characters they are
+written to an anonymous temporary file, which bounds the memory held by
+very large outputs. Reading the value of a spilled buffer reads the file back.
+"""
+
+import tempfile
+from typing import IO, List, Optional
+
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024  # characters held in memory before spilling
+_SPILL_TAIL_CHARS = 4096  # kept in memory after a spill for tail()/endswith()
+
+
+class TextBuffer:
+    """List-of-parts text buffer with lazy join and spill-to-file.
+
+    Args:
+        initial: Initial content
+        spill_threshold: Characters kept in memory before spilling to a
+            temporary file (None disables spilling)
+    """
+
+    __slots__ = ("_parts", "_length", "_memory_chars", "_spill_threshold", "_spill_file", "_spill_tail")
+
+    def __init__(self, initial: str = "", spill_threshold: Optional[int] = DEFAULT_SPILL_THRESHOLD):
+        self._parts: List[str] = []
+        self._length = 0
+        self._memory_chars = 0
+        self._spill_threshold = spill_threshold
+        self._spill_file: Optional[IO[str]] = None
+        self._spill_tail = ""
+        if initial:
+            self.append(initial)
+
+    def append(self, text: str) -> None:
+        """Append text (empty strings and None are ignored).
+
+        Args:
+            text: Text to append
+        """
+        if not text:
+            return
+        self._parts.append(text)
+        size = len(text)
+        self._length += size
+        self._memory_chars += size
+        if self._spill_threshold is not None and self._memory_chars > self._spill_threshold:
+            self._spill()
+
+    def __iadd__(self, text: str) -> "TextBuffer":
+        self.append(text)
+        return self
+
+    def getvalue(self) -> str:
+        """Return the accumulated text."""
+        parts = self._parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        in_memory = parts[0] if parts else ""
+        if self._spill_file is None:
+            return in_memory
+        self._spill_file.seek(0)
+        spilled = self._spill_file.read()
+        return spilled + in_memory
+
+    def tail(self, size: int) -> str:
+        """Return the last ``size`` characters without joining the whole buffer.
+
+        Args:
+            size: Number of characters
+
+        Returns:
+            The last ``size`` characters (fewer if the buffer is shorter)
+        """
+        if size <= 0:
+            return ""
+        collected = []
+        total = 0
+        for part in reversed(self._parts):
+            collected.append(part)
+            total += len(part)
+            if total >= size:
+                break
+        if total < size and self._spill_file is not None:
+            if total + len(self._spill_tail) < size and self._length > total + len(self._spill_tail):
+                return self.getvalue()[-size:]
+            collected.append(self._spill_tail)
+        return "".join(reversed(collected))[-size:]
+
+    def endswith(self, suffix: str) -> bool:
+        """Whether the accumulated text ends with ``suffix``."""
+        return self.tail(len(suffix)).endswith(suffix)
+
+    def clear(self) -> None:
+        """Drop all content (and the spill file, if any)."""
+        self._parts = []
+        self._length = 0
+        self._memory_chars = 0
+        self._spill_tail = ""
+        self.close()
+
+    def close(self) -> None:
+        """Close the spill file; in-memory content is kept."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    @property
+    def spilled(self) -> bool:
+        """Whether part of the content lives in the spill file."""
+        return self._spill_file is not None
+
+    def _spill(self) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+        chunk = "".join(self._parts)
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(chunk)
+        self._spill_file.flush()
+        self._spill_tail = (self._spill_tail + chunk[-_SPILL_TAIL_CHARS:])[-_SPILL_TAIL_CHARS:]
+        self._parts = []
+        self._memory_chars = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __repr__(self) -> str:
+        return f"TextBuffer(length={self._length}, spilled={self.spilled})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TextBuffer):
+            return self._length == other._length and self.getvalue() == other.getvalue()
+        if isinstance(other, str):
+            return self._length == len(other) and self.getvalue() == other
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __contains__(self, text: str) -> bool:
+        return text in self.getvalue()
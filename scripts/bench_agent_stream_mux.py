@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark chunk throughput of the coordination loop's agent stream handling.
+
+Synthetic agents each stream ``--chunks`` content chunks (yielding to the
+event loop between chunks, like a backend reading from a socket). Two ways of
+consuming them are compared:
+
+  task-per-chunk  — previous coordination loop: one ``asyncio.Task`` wrapping
+                    ``__anext__`` per chunk per agent, ``asyncio.wait`` with
+                    FIRST_COMPLETED over all pending tasks
+  multiplexed     — ``AgentStreamMultiplexer``: one pump task per agent feeding
+                    a shared bounded queue, consumed in batches
+
+Usage:
+    uv run python scripts/bench_agent_stream_mux.py [--agents 10] [--chunks 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+async def _agent_stream(count: int):
+    for i in range(count):
+        yield ("content", "token ")
+        if i % 8 == 0:
+            await asyncio.sleep(0)
+
+
+async def _next_chunk(stream) -> tuple:
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return ("done", None)
+
+
+async def run_task_per_chunk(agents: int, chunks: int) -> int:
+    streams = {f"agent_{i}": _agent_stream(chunks) for i in range(agents)}
+    tasks = {}
+    received = 0
+    while streams:
+        for agent_id, stream in streams.items():
+            if agent_id not in tasks:
+                tasks[agent_id] = asyncio.create_task(_next_chunk(stream))
+        done, _ = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            agent_id = next(aid for aid, t in tasks.items() if t is task)
+            del tasks[agent_id]
+            chunk = await task
+            if chunk[0] == "done":
+                del streams[agent_id]
+            else:
+                received += 1
+    return received
+
+
+async def run_multiplexed(agents: int, chunks: int) -> int:
+    from massgen._agent_stream_mux import AgentStreamMultiplexer
+
+    mux = AgentStreamMultiplexer(_next_chunk)
+    open_agents = set()
+    for i in range(agents):
+        mux.attach(f"agent_{i}", _agent_stream(chunks))
+        open_agents.add(f"agent_{i}")
+    received = 0
+    while open_agents:
+        for agent_id, chunk in await mux.next_batch():
+            if chunk[0] == "done":
+                open_agents.discard(agent_id)
+                await mux.detach(agent_id)
+            else:
+                received += 1
+    return received
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=10, help="Number of synthetic agents")
+    parser.add_argument("--chunks", type=int, default=50000, help="Chunks streamed per agent")
+    args = parser.parse_args()
+
+    total = args.agents * args.chunks
+    print(f"{args.agents} agents x {args.chunks} chunks = {total} chunks")
+    results = {}
+    for label, runner in (("task-per-chunk", run_task_per_chunk), ("multiplexed", run_multiplexed)):
+        start = time.perf_counter()
+        received = asyncio.run(runner(args.agents, args.chunks))
+        seconds = time.perf_counter() - start
+        assert received == total, f"{label}: received {received} of {total} chunks"
+        results[label] = seconds
+        print(f"{label:<15} {seconds:7.2f} s  {total / seconds:12,.0f} chunks/s  {seconds / total * 1e6:6.2f} us/chunk")
+    print(f"speedup {results['task-per-chunk'] / results['multiplexed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark message formatting across a growing tool-loop history.
+
+Simulates a tool loop that reaches ``--messages`` messages: every iteration
+appends an assistant tool call and its result, then formats the full history
+again (what each backend does before every API call). Tool call arguments
+are JSON strings, as streamed by the APIs. The history starts with a system
+prompt and a user message carrying an inline base64 image.
+
+Each formatter that converts through the cache (Claude, Response) runs twice:
+
+  uncached  — every message converted on every call (previous behavior)
+  cached    — per-message conversion cache; only new messages are converted
+
+Usage:
+    uv run python scripts/bench_formatter_tool_loop.py [--messages 300] [--image-kb 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _build_history(count: int, image_kb: int) -> list:
+    image = base64.b64encode(os.urandom(image_kb * 1024)).decode("ascii")
+    messages = [
+        {"role": "system", "content": "You are a coding agent. " * 200},
+        {"role": "user", "content": [{"type": "text", "text": "Fix the failing tests shown in the screenshot."}, {"type": "image", "base64": image, "mime_type": "image/png"}]},
+    ]
+    i = 0
+    while len(messages) < count:
+        arguments = {"path": f"src/module_{i}.py", "content": "def f():\n    return 1\n" * 20}
+        messages.append(
+            {"role": "assistant", "content": f"Editing module {i}.", "tool_calls": [{"id": f"call_{i}", "type": "function", "function": {"name": "write_file", "arguments": json.dumps(arguments)}}]}
+        )
+        messages.append({"role": "tool", "tool_call_id": f"call_{i}", "content": f"Wrote src/module_{i}.py\n" + "ok\n" * 50})
+        i += 1
+    return messages[:count]
+
+
+def _run_loop(format_fn, history: list) -> float:
+    start = time.perf_counter()
+    for end in range(3, len(history) + 1, 2):
+        format_fn(history[:end])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=300, help="History length at the end of the loop")
+    parser.add_argument("--image-kb", type=int, default=256, help="Size of the inline image in the first user message")
+    args = parser.parse_args()
+
+    from massgen.formatter._claude_formatter import ClaudeFormatter
+    from massgen.formatter._response_formatter import ResponseFormatter
+
+    history = _build_history(args.messages, args.image_kb)
+    calls = len(range(3, len(history) + 1, 2))
+    print(f"Tool loop: {calls} formatting calls, history growing to {len(history)} messages ({args.image_kb} KiB inline image)")
+
+    for label, formatter_cls, method in (
+        ("claude", ClaudeFormatter, "format_messages_and_system"),
+        ("response", ResponseFormatter, "format_messages"),
+    ):
+        uncached = formatter_cls()
+        uncached._convert_messages = lambda messages, converter, variants=None: [converter(m) if variants is None else converter(m, v) for m, v in zip(messages, variants or messages)]
+        cached = formatter_cls()
+
+        uncached_seconds = _run_loop(getattr(uncached, method), history)
+        cached_seconds = _run_loop(getattr(cached, method), history)
+        print(
+            f"{label:<17} uncached {uncached_seconds * 1000 / calls:7.3f} ms/call  "
+            f"cached {cached_seconds * 1000 / calls:7.3f} ms/call  ({uncached_seconds / cached_seconds:4.1f}x, "
+            f"hit rate {cached.message_cache.hits / max(cached.message_cache.hits + cached.message_cache.misses, 1):.0%})",
+        )
+
+
+if __name__ == "__main__":
+    main()
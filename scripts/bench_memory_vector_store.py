@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark persistent memory vector store latency: Qdrant vs embedded store.
+
+Runs the same workload through mem0's vector store interface, without any
+embedding or LLM calls (random unit vectors stand in for embeddings):
+
+  qdrant    — mem0's Qdrant store on a local ``QdrantClient(path=...)``, the
+              in-process stand-in for the Qdrant server (a real server adds a
+              network round trip on top of every call)
+  embedded  — ``EmbeddedVectorStore`` (memory-mapped numpy array, exact search;
+              HNSW above ``--ann-threshold`` when hnswlib is installed)
+
+Workload: insert ``--count`` vectors in batches of ``--batch``, then run
+``--queries`` filtered top-k searches (the filter mirrors mem0's agent/run
+scoping).
+
+Usage:
+    uv run python scripts/bench_memory_vector_store.py [--count 5000] [--dims 1536] [--queries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _make_qdrant(path: Path, dims: int):
+    from mem0.vector_stores.qdrant import Qdrant
+    from qdrant_client import QdrantClient
+
+    return Qdrant(collection_name="bench", embedding_model_dims=dims, client=QdrantClient(path=str(path)))
+
+
+def _make_embedded(path: Path, dims: int, ann_threshold: int):
+    from massgen.memory._embedded_vector_store import EmbeddedVectorStore
+
+    return EmbeddedVectorStore(collection_name="bench", path=str(path), embedding_model_dims=dims, ann_threshold=ann_threshold)
+
+
+def run_workload(store, vectors: np.ndarray, queries: np.ndarray, batch: int, top_k: int) -> dict:
+    """Insert all vectors in batches, then time filtered searches."""
+    insert_start = time.perf_counter()
+    for start in range(0, len(vectors), batch):
+        chunk = vectors[start : start + batch]
+        store.insert(
+            vectors=chunk.tolist(),
+            payloads=[{"data": f"memory {start + i}", "agent_id": f"agent_{(start + i) % 4}", "run_id": "bench"} for i in range(len(chunk))],
+            ids=[str(uuid.uuid4()) for _ in range(len(chunk))],
+        )
+    insert_seconds = time.perf_counter() - insert_start
+
+    latencies = []
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        store.search(query="", vectors=query.tolist(), top_k=top_k, filters={"agent_id": f"agent_{i % 4}", "run_id": "bench"})
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "insert_per_vector_ms": insert_seconds / len(vectors) * 1000,
+        "search_p50_ms": statistics.median(latencies) * 1000,
+        "search_p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000, help="Vectors to insert")
+    parser.add_argument("--dims", type=int, default=1536, help="Vector size (text-embedding-3-small is 1536)")
+    parser.add_argument("--batch", type=int, default=16, help="Vectors per insert call")
+    parser.add_argument("--queries", type=int, default=200, help="Searches to time")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per search")
+    parser.add_argument("--ann-threshold", type=int, default=20000, help="Embedded store HNSW switch-over size")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.count, args.dims)).astype(np.float32)
+    queries = rng.standard_normal((args.queries, args.dims)).astype(np.float32)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="massgen_bench_vectors_") as tmp:
+        try:
+            results["qdrant"] = run_workload(_make_qdrant(Path(tmp) / "qdrant", args.dims), vectors, queries, args.batch, args.top_k)
+        except ImportError as e:
+            print(f"Skipping qdrant: {e}")
+        results["embedded"] = run_workload(_make_embedded(Path(tmp) / "embedded", args.dims, args.ann_threshold), vectors, queries, args.batch, args.top_k)
+
+    print(f"Vector store latency: {args.count} x {args.dims}d vectors, batches of {args.batch}, {args.queries} filtered top-{args.top_k} searches")
+    for label, stats in results.items():
+        print(f"{label:<10} insert {stats['insert_per_vector_ms']:7.3f} ms/vector  " f"search p50 {stats['search_p50_ms']:7.2f} ms  p95 {stats['search_p95_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark StreamChunk memory and allocation cost.
+
+Compares the previous ``StreamChunk`` layout (a plain dataclass with an
+instance ``__dict__``, rebuilt from the same fields) with the slotted one:
+
+  retained    — memory held by ``--chunks`` content chunks kept alive
+                (e.g. buffered by a display), measured with tracemalloc
+  construct   — time to create one content chunk
+  forward     — a backend chunk passed through the agent and attributed to
+                the agent by the orchestrator: previously re-wrapped into a
+                new chunk (two allocations per token), now tagged in place via
+                ``attributed_to`` (one)
+
+Usage:
+    uv run python scripts/bench_stream_chunk_alloc.py [--chunks 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _legacy_class(slotted_cls):
+    fields = [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(slotted_cls)]
+    return dataclasses.make_dataclass("LegacyStreamChunk", fields)
+
+
+def _retained_bytes(cls, tokens: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    chunks = [cls(type="content", content=token) for token in tokens]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del chunks
+    return (after - before) / len(tokens)
+
+
+def _construct_seconds(cls, tokens: list) -> float:
+    start = time.perf_counter()
+    for token in tokens:
+        cls(type="content", content=token)
+    return (time.perf_counter() - start) / len(tokens)
+
+
+def _forward_rewrap(cls, tokens: list) -> None:
+    for token in tokens:
+        chunk = cls(type="content", content=token)
+        cls(type=chunk.type, content=chunk.content, source="agent_a")
+
+
+def _forward_attributed(cls, tokens: list) -> None:
+    for token in tokens:
+        chunk = cls(type="content", content=token)
+        chunk.attributed_to("agent_a")
+
+
+def _forward_seconds(fn, cls, tokens: list) -> float:
+    start = time.perf_counter()
+    fn(cls, tokens)
+    return (time.perf_counter() - start) / len(tokens)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=200_000, help="Chunks per measurement")
+    args = parser.parse_args()
+
+    from massgen.backend.base import StreamChunk
+
+    legacy = _legacy_class(StreamChunk)
+    tokens = [f"tok{i} " for i in range(args.chunks)]
+
+    print(f"{args.chunks} content chunks")
+    for label, cls in (("dict dataclass", legacy), ("slotted", StreamChunk)):
+        retained = _retained_bytes(cls, tokens)
+        construct = _construct_seconds(cls, tokens)
+        print(f"{label:<15} retained {retained:6.1f} B/chunk  construct {construct * 1e9:6.0f} ns/chunk")
+
+    rewrap = _forward_seconds(_forward_rewrap, legacy, tokens)
+    attributed = _forward_seconds(_forward_attributed, StreamChunk, tokens)
+    print(f"forward re-wrap, dict dataclass   {rewrap * 1e9:6.0f} ns/chunk")
+    print(f"forward attributed_to, slotted    {attributed * 1e9:6.0f} ns/chunk  ({rewrap / attributed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark per-chunk overhead of ``log_stream_chunk`` in each log mode.
+
+Streams a synthetic mix of chunks (mostly short content/reasoning tokens with
+occasional tool call and status payloads) through ``log_stream_chunk``:
+
+  text        — formatted massgen.log lines through a queued loguru file sink
+                (the default, matching ``setup_logging``)
+  structured  — compact stream_chunks.jsonl records with deduplicated content
+  sampled     — structured, keeping 1 in ``--sample`` content/reasoning records
+  off         — chunks dropped
+
+Reports the caller-visible cost per chunk and the total time including
+draining the loguru queue / flushing files, plus bytes written.
+
+Usage:
+    uv run python scripts/bench_stream_chunk_logging.py [--chunks 50000] [--sample 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _workload(count: int) -> list:
+    tool_calls = [{"id": "call_1", "function": {"name": "read_file", "arguments": '{"path": "/workspace/src/main.py"}'}}]
+    chunks = []
+    for i in range(count):
+        if i % 50 == 0:
+            chunks.append(("tool_calls", tool_calls))
+        elif i % 25 == 0:
+            chunks.append(("status", "Agent is working on the task and streaming its answer"))
+        elif i % 3 == 0:
+            chunks.append(("reasoning", f"thinking {i} "))
+        else:
+            chunks.append(("content", f"token{i} "))
+    return chunks
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def run_mode(mode: str, chunks: list, log_dir: Path, sample: int) -> dict:
+    from massgen import logger_config
+    from massgen.logger_config import (
+        log_stream_chunk,
+        logger,
+        set_stream_chunk_log_mode,
+    )
+
+    log_dir.mkdir(parents=True)
+    handler_id = None
+    if mode == "text":
+        set_stream_chunk_log_mode("text")
+        handler_id = logger.add(
+            str(log_dir / "massgen.log"),
+            format="{time:HH:mm:ss} | {level: <8} | {message}",
+            level="INFO",
+            enqueue=True,
+            colorize=False,
+        )
+    else:
+        sample_rates = {"content": sample, "reasoning": sample} if mode == "sampled" else {}
+        set_stream_chunk_log_mode("off" if mode == "off" else "structured", sample_rates=sample_rates, log_dir=log_dir)
+
+    start = time.perf_counter()
+    for chunk_type, content in chunks:
+        log_stream_chunk("backend.bench", chunk_type, content, "agent_a")
+    call_seconds = time.perf_counter() - start
+
+    if handler_id is not None:
+        logger.complete()
+        logger.remove(handler_id)
+    elif logger_config._STREAM_CHUNK_LOG is not None:
+        logger_config._STREAM_CHUNK_LOG.close()
+    total_seconds = time.perf_counter() - start
+    set_stream_chunk_log_mode("text", sample_rates={})
+
+    return {
+        "call_us": call_seconds / len(chunks) * 1e6,
+        "total_us": total_seconds / len(chunks) * 1e6,
+        "bytes": _dir_size(log_dir),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=50000, help="Chunks to log per mode")
+    parser.add_argument("--sample", type=int, default=10, help="Keep 1 in N content/reasoning records in sampled mode")
+    args = parser.parse_args()
+
+    from massgen.logger_config import logger
+
+    logger.remove()
+    chunks = _workload(args.chunks)
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="massgen_bench_chunks_") as tmp:
+        for mode in ("text", "structured", "sampled", "off"):
+            results[mode] = run_mode(mode, chunks, Path(tmp) / mode, args.sample)
+
+    baseline = results["text"]["call_us"]
+    print(f"log_stream_chunk overhead: {args.chunks} chunks per mode")
+    for mode, stats in results.items():
+        print(f"{mode:<11} call {stats['call_us']:7.2f} us/chunk ({baseline / stats['call_us']:5.1f}x)  " f"incl. drain {stats['total_us']:7.2f} us/chunk  written {stats['bytes'] / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark subagent spawn latency: subprocess vs in-process execution.
+
+Measures the wall time until N parallel subagents are ready to start
+coordinating, without calling any LLM API:
+
+  subprocess  — N concurrent interpreters importing ``massgen.cli`` (the
+                startup bill every ``massgen`` subagent subprocess pays before
+                reading its YAML)
+  in_process  — N child orchestrators built via ``create_orchestrator`` on the
+                current event loop from the same generated subagent configs
+
+Usage:
+    uv run python scripts/bench_subagent_spawn.py [--count 10] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+async def spawn_subprocesses(count: int) -> float:
+    """Time N concurrent interpreters importing the CLI module."""
+    start = time.perf_counter()
+    processes = [
+        await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import massgen.cli",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        for _ in range(count)
+    ]
+    await asyncio.gather(*(p.wait() for p in processes))
+    return time.perf_counter() - start
+
+
+async def spawn_in_process(count: int, base_dir: Path) -> float:
+    """Time N child orchestrators built in-process from generated subagent configs."""
+    from massgen.subagent.in_process import build_subagent_orchestrator
+    from massgen.subagent.manager import SubagentManager
+    from massgen.subagent.models import SubagentConfig, SubagentOrchestratorConfig
+
+    manager = SubagentManager(
+        parent_workspace=str(base_dir),
+        parent_agent_id="bench_parent",
+        orchestrator_id="bench",
+        parent_agent_configs=[{"id": "bench_agent", "backend": {"type": "openai", "model": "gpt-4o-mini"}}],
+        max_concurrent=count,
+        subagent_orchestrator_config=SubagentOrchestratorConfig(execution_mode="in_process"),
+    )
+
+    async def build_one(index: int):
+        config = SubagentConfig.create(task=f"bench task {index}", parent_agent_id="bench_parent")
+        workspace = manager._create_workspace(config.id).resolve()
+        subagent_config = manager._generate_subagent_yaml_config(config, workspace, [])
+        return build_subagent_orchestrator(config.id, subagent_config)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(build_one(i) for i in range(count)))
+    return time.perf_counter() - start
+
+
+def _summarize(label: str, samples: list[float], count: int) -> None:
+    median = statistics.median(samples)
+    print(f"{label:<12} median {median * 1000:8.1f} ms  " f"min {min(samples) * 1000:8.1f} ms  per-subagent {median / count * 1000:7.1f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10, help="Parallel subagents per sample")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per mode")
+    args = parser.parse_args()
+
+    # Backends are constructed but never called; a placeholder key avoids config errors
+    os.environ.setdefault("OPENAI_API_KEY", "bench-placeholder")
+
+    with tempfile.TemporaryDirectory(prefix="massgen_bench_spawn_") as tmp:
+        # Warm the parent's imports once; in-process mode pays them only at parent startup
+        await spawn_in_process(1, Path(tmp) / "warmup")
+
+        subprocess_samples = [await spawn_subprocesses(args.count) for _ in range(args.repeat)]
+        in_process_samples = [await spawn_in_process(args.count, Path(tmp) / f"run_{i}") for i in range(args.repeat)]
+
+    print(f"Spawn latency for {args.count} parallel subagents ({args.repeat} samples)")
+    _summarize("subprocess", subprocess_samples, args.count)
+    _summarize("in_process", in_process_samples, args.count)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
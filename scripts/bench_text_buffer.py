@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark accumulation of long delta streams.
+
+Accumulates ``--deltas`` short deltas the way streaming backends do, with the
+previous ``str`` accumulation and with ``TextBuffer``:
+
+  attribute        — ``self.buffer += delta`` on an instance attribute
+                     (StreamingBufferMixin)
+  shared local     — ``content += delta`` on a local that is also stored on
+                     the instance after every delta (Chat Completions
+                     interrupted-stream tracking)
+  trace entry      — ``entry.content["reasoning"] += delta`` (ExecutionTraceWriter)
+
+The string variants are quadratic: each delta copies everything accumulated
+so far, so they run on the first ``--str-deltas`` deltas only (1M deltas
+takes hours); per-delta costs are reported for both.
+
+Usage:
+    uv run python scripts/bench_text_buffer.py [--deltas 1000000] [--str-deltas 100000] [--delta-size 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class _Holder:
+    pass
+
+
+def str_attribute(deltas: list) -> int:
+    holder = _Holder()
+    holder.buffer = ""
+    for delta in deltas:
+        holder.buffer += delta
+    return len(holder.buffer)
+
+
+def str_shared_local(deltas: list) -> int:
+    holder = _Holder()
+    content = ""
+    for delta in deltas:
+        content += delta
+        holder.tracked = content
+    return len(content)
+
+
+def str_trace_entry(deltas: list) -> int:
+    entry = {"reasoning": ""}
+    for delta in deltas:
+        entry["reasoning"] += delta
+    return len(entry["reasoning"])
+
+
+def text_buffer(deltas: list) -> int:
+    from massgen.utils.text_buffer import TextBuffer
+
+    holder = _Holder()
+    holder.buffer = TextBuffer()
+    for delta in deltas:
+        holder.buffer.append(delta)
+    return len(holder.buffer.getvalue())
+
+
+def text_buffer_mixin(deltas: list) -> int:
+    from massgen.backend._streaming_buffer_mixin import StreamingBufferMixin
+
+    backend = StreamingBufferMixin()
+    for delta in deltas:
+        backend._append_reasoning_to_buffer(delta)
+    return len(backend._get_streaming_buffer())
+
+
+def text_buffer_trace(deltas: list) -> int:
+    from massgen.execution_trace import ExecutionTraceWriter
+
+    writer = ExecutionTraceWriter(agent_id="bench", model="bench")
+    for delta in deltas:
+        writer.add_reasoning(delta)
+    writer.finalize_reasoning()
+    return len(writer.entries[0].content["reasoning"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--deltas", type=int, default=1_000_000, help="Deltas per stream")
+    parser.add_argument("--delta-size", type=int, default=8, help="Characters per delta")
+    parser.add_argument("--str-deltas", type=int, default=100_000, help="Deltas for the quadratic str variants (0 skips them)")
+    args = parser.parse_args()
+
+    deltas = [f"{i:0{args.delta_size}d}"[-args.delta_size :] for i in range(args.deltas)]
+    total = args.deltas * args.delta_size
+    print(f"{args.deltas} deltas x {args.delta_size} chars = {total / 1e6:.1f}M chars")
+
+    cases = [
+        ("str attribute", str_attribute),
+        ("str shared local", str_shared_local),
+        ("str trace entry", str_trace_entry),
+        ("TextBuffer", text_buffer),
+        ("mixin (reasoning)", text_buffer_mixin),
+        ("execution trace", text_buffer_trace),
+    ]
+    for label, fn in cases:
+        stream = deltas
+        if label.startswith("str"):
+            if args.str_deltas <= 0:
+                continue
+            stream = deltas[: args.str_deltas]
+        start = time.perf_counter()
+        length = fn(stream)
+        seconds = time.perf_counter() - start
+        print(f"{label:<18} {len(stream):>9} deltas {seconds:8.3f} s  {seconds / len(stream) * 1e9:9.1f} ns/delta  ({length} chars)")
+
+
+if __name__ == "__main__":
+    main()